@@ -1,8 +1,11 @@
 import random
 import json
+from functools import cached_property
+import numpy as np
 import pandas as pd
 from core.utils import normalize_name, normalize_team_abbr_to_name
 from core.project_hr_pa import project_hr_pa
+from core.simulation_context import DEFAULT_CONTEXT
 from assets.probable_pitchers import fetch_probable_pitchers
 
 
@@ -16,22 +19,25 @@ def safe_float(val, fallback=0.0):
         return fallback
 
 
-def build_bullpen_for_team(team_abbr, pitcher_stats, reliever_depth_chart=None, max_relievers=6):
+def build_bullpen_for_team(team_abbr, pitcher_stats, reliever_depth_chart=None, max_relievers=6, starters=None):
     """
     Constructs a bullpen for a team from a depth chart (if available) or raw pitcher stats.
     Excludes today's starters and relievers with missing Stuff+/HR-FB data.
     Prioritizes relievers based on scoring formula.
+    ``starters`` is the set of normalized starter names to exclude; when omitted
+    it is taken from ``fetch_probable_pitchers()``.
     """
     bullpen = []
-    used_names = set()
+    used_names = set(starters or ())
     
     # Exclude today's starters
-    matchups = fetch_probable_pitchers()
-    for game in matchups.values():
-        for side in ["home", "away"]:
-            starter = game.get(side, {}).get("name")
-            if starter:
-                used_names.add(normalize_name(starter))
+    if starters is None:
+        matchups = fetch_probable_pitchers()
+        for game in matchups.values():
+            for side in ["home", "away"]:
+                starter = game.get(side, {}).get("name")
+                if starter:
+                    used_names.add(normalize_name(starter))
 
     mapped_team = normalize_team_abbr_to_name(team_abbr)
 
@@ -103,53 +109,155 @@ def build_bullpen_for_team(team_abbr, pitcher_stats, reliever_depth_chart=None,
     bullpen.sort(key=lambda x: x["score"], reverse=True)
     return bullpen[:max_relievers]
 
-RELIEVER_USAGE_COUNTS = {"home": {}, "away": {}}  # optional: track usage across sims
+# Usage counts of the default context, used when no ``SimulationContext`` is passed
+RELIEVER_USAGE_COUNTS = DEFAULT_CONTEXT.reliever_usage
 
-def simulate_reliever_chain(bullpen, num_needed=1, side="home", sim_index=None, debug=False, max_uses_per_reliever=3):
+
+def reset_reliever_usage(sim_context=None):
+    """Clear reliever usage (``RELIEVER_USAGE_COUNTS`` when no context is given)."""
+    (sim_context or DEFAULT_CONTEXT).reset_relievers()
+
+def _uniform_index(n, rng=None):
+    """Draw a uniform index in ``[0, n)`` from ``rng`` or ``random``."""
+    if rng is None:
+        return random.randrange(n)
+    return int(rng.integers(n))
+
+
+class BullpenSampler:
+    """Precomputed IP-weighted reliever sampler for one bullpen.
+
+    Names, IP weights and the cumulative weight table are built once per game
+    (or once per run when the same bullpen is reused), so a pitching change is
+    a single uniform draw and a short cumulative search.  Relievers already
+    used are tracked as a bitmask (bit ``i`` is ``relievers[i]``) instead of
+    copying and filtering the bullpen list.
+    """
+
+    def __init__(self, bullpen):
+        self.relievers = list(bullpen or [])
+        self.names = [rp.get("name", "Unknown") for rp in self.relievers]
+        self.index = {}
+        for i, name in enumerate(self.names):
+            self.index.setdefault(name, i)
+        weights = [max(safe_float(rp.get("IP", 1), 1.0), 0.0) for rp in self.relievers]
+        if weights and sum(weights) <= 0:
+            weights = [1.0] * len(weights)
+        self._weights = weights
+
+    def __len__(self):
+        return len(self.relievers)
+
+    @cached_property
+    def weights(self):
+        return np.array(self._weights, dtype=float)
+
+    @cached_property
+    def cum(self):
+        """Normalized cumulative IP weights (``None`` for an empty bullpen)."""
+        if not self._weights:
+            return None
+        return np.cumsum(self.weights) / self.weights.sum()
+
+    def weights_for(self, counts=None, used=0, max_uses=3):
+        """Return ``(eligible, weights)`` after fatigue and usage suppression.
+
+        ``counts`` are run-level usage counts per reliever; relievers used
+        ``max_uses`` times or set in the ``used`` bitmask are not eligible.
+        """
+        eligible = []
+        weights = []
+        for i, ip in enumerate(self._weights):
+            if used >> i & 1:
+                continue
+            count = counts[i] if counts is not None else 0
+            if count >= max_uses:
+                continue
+            eligible.append(i)
+            weights.append(ip * max(0.25, 1 - 0.005 * count))  # 0.5 penalty after ~100 uses
+        return eligible, weights
+
+    def draw(self, rng=None, counts=None, used=0, max_uses=3):
+        """Draw one reliever index using ``rng`` (a NumPy Generator) or ``random``.
+
+        When no reliever is eligible the pick is uniform over the unused ones
+        (or the whole bullpen once every bit of ``used`` is set).
+        """
+        eligible, weights = self.weights_for(counts, used, max_uses)
+        if not eligible:
+            n = len(self.relievers)
+            available = [i for i in range(n) if not used >> i & 1] or list(range(n))
+            return available[_uniform_index(len(available), rng)]
+        total = sum(weights)
+        if total == 0:
+            return eligible[_uniform_index(len(eligible), rng)]
+        target = (random.random() if rng is None else rng.random()) * total
+        cum = 0.0
+        for i, w in zip(eligible, weights):
+            cum += w
+            if cum > target:
+                return i
+        return eligible[-1]
+
+    def draw_many(self, u, used=None):
+        """Vectorized draws for many simulations from the uniforms ``u``.
+
+        ``used`` is an optional integer array of per-sim bitmasks; masked
+        relievers get zero weight (a sim with every reliever masked draws
+        from the whole bullpen).  Fatigue is not applied.  Returns an index
+        array the shape of ``u``.
+        """
+        u = np.asarray(u, dtype=float)
+        last = len(self.relievers) - 1
+        if used is None:
+            return np.minimum(np.searchsorted(self.cum, u, side="right"), last)
+        bits = (np.asarray(used, dtype=np.int64)[:, None] >> np.arange(last + 1)) & 1
+        w = np.where(bits == 1, 0.0, self.weights)
+        w[w.sum(axis=1) == 0] = self.weights
+        cum = np.cumsum(w, axis=1)
+        return np.minimum((cum <= u[:, None] * cum[:, -1:]).sum(axis=1), last)
+
+
+def as_bullpen_sampler(bullpen):
+    """Return ``bullpen`` as a ``BullpenSampler`` (``None`` when it is empty)."""
+    if isinstance(bullpen, BullpenSampler):
+        return bullpen if len(bullpen) else None
+    return BullpenSampler(bullpen) if bullpen else None
+
+
+def simulate_reliever_chain(bullpen, num_needed=1, side="home", sim_index=None, debug=False, max_uses_per_reliever=3, rng=None, sim_context=None):
     """
     Selects relievers using IP-weighted probability with optional fatigue suppression.
     Logs reliever weights and picks if debug is enabled.
     Relievers already used `max_uses_per_reliever` times in this sim are skipped.
+    Draws come from ``rng`` (a NumPy Generator) when given, else from ``random``.
+    Usage counts live in ``sim_context`` (a ``SimulationContext``), falling back
+    to ``RELIEVER_USAGE_COUNTS``.
+    ``bullpen`` is a list of reliever dicts or a prebuilt ``BullpenSampler``.
     """
-    if not bullpen or num_needed <= 0:
+    sampler = as_bullpen_sampler(bullpen)
+    if sampler is None or num_needed <= 0:
         return []
 
+    usage = (sim_context or DEFAULT_CONTEXT).reliever_counts(side)
+    counts = [usage.get(name, 0) for name in sampler.names]
+
     selected = []
-    available = bullpen.copy()
+    used = 0
 
     for slot in range(num_needed):
-        weights = []
-        names = []
-
-        usable = [r for r in available if RELIEVER_USAGE_COUNTS[side].get(r.get("name", "Unknown"), 0) < max_uses_per_reliever]
-
-        for rp in usable:
-            ip = rp.get("IP", 1)
-            name = rp.get("name", "Unknown")
-            usage_count = RELIEVER_USAGE_COUNTS[side].get(name, 0)
-            fatigue_penalty = max(0.25, 1 - 0.005 * usage_count)  # 0.5 penalty after ~100 uses
-            weight = ip * fatigue_penalty
-
-            weights.append(weight)
-            names.append(name)
-
         if debug and sim_index is not None and slot == 0:
             print(f"\n🎯 Sim {sim_index+1} — {side.title()} Bullpen Draw:")
-            for n, w in zip(names, weights):
-                print(f"    - {n:20} | Weight (IP x fatigue): {w:.2f}")
-
-        if not usable:
-            pick = random.choice(available)
-        elif sum(weights) == 0:
-            pick = random.choice(usable)
-        else:
-            pick = random.choices(usable, weights=weights, k=1)[0]
+            for i, w in zip(*sampler.weights_for(counts, used, max_uses_per_reliever)):
+                print(f"    - {sampler.names[i]:20} | Weight (IP x fatigue): {w:.2f}")
 
-        selected.append(pick)
-        available = [r for r in available if r["name"] != pick["name"]]
+        i = sampler.draw(rng, counts, used, max_uses_per_reliever)
+        selected.append(sampler.relievers[i])
+        used |= 1 << i
 
         # Track usage for fatigue suppression
-        name = pick.get("name", "Unknown")
-        RELIEVER_USAGE_COUNTS[side][name] = RELIEVER_USAGE_COUNTS[side].get(name, 0) + 1
+        name = sampler.names[i]
+        usage[name] = usage.get(name, 0) + 1
+        counts[i] += 1
 
     return selected
@@ -34,7 +34,7 @@ def get_park_name(game_id):
         "NYY": "Yankee Stadium"
     }
     try:
-        home_abbr = game_id.split('@')[1].upper()
+        home_abbr = game_id.split('@')[1].split('-')[0].upper()
         return park_by_home_team.get(home_abbr, "League Average")
     except Exception as e:
         print(f"[WARNING] Could not extract park from game_id '{game_id}': {e}")
@@ -61,64 +61,68 @@ def get_weather_hr_mult(weather_profile):
     else:
         return 1.0
 
-def get_noaa_weather(park_name):
-    domes = {
-        "Rogers Centre",        # TOR
-        "Tropicana Field",      # TB
-        "Chase Field",          # ARI
-        "Globe Life Field",     # TEX (retractable roof)
-        "loanDepot Park",       # MIA
-        "Minute Maid Park",     # HOU
-        "American Family Field" # MIL
+# Closed or retractable roofs: no NOAA fetch, neutral indoor conditions
+DOME_PARKS = {
+    "Rogers Centre",        # TOR
+    "Tropicana Field",      # TB
+    "Chase Field",          # ARI
+    "Globe Life Field",     # TEX (retractable roof)
+    "loanDepot Park",       # MIA
+    "Minute Maid Park",     # HOU
+    "American Family Field" # MIL
+}
+DOME_WEATHER = {"wind_direction": "none", "wind_speed": 0, "temperature": 72, "humidity": 50}
+NEUTRAL_WEATHER = {"wind_direction": "none", "wind_speed": 0, "temperature": 70, "humidity": 50}
+
+def fetch_noaa_weather(park_name, session=None, timeout=5):
+    """Fetch the next-hour NOAA forecast for ``park_name``; raises on any failure.
+
+    ``session`` is an optional ``requests.Session`` so concurrent fetches can
+    share a connection pool.
+    """
+    if park_name in DOME_PARKS:
+        return dict(DOME_WEATHER)
+
+    http = session or requests
+    with open("data/stadium_locations.json") as f:
+        stadiums = json.load(f)
+
+    location = stadiums.get(park_name, stadiums["League Average"])
+    lat, lon = location["lat"], location["lon"]
+
+    metadata_url = f"https://api.weather.gov/points/{lat},{lon}"
+    meta_response = http.get(metadata_url, timeout=timeout)
+    meta_response.raise_for_status()
+    grid_info = meta_response.json()["properties"]
+    forecast_url = grid_info["forecastHourly"]
+
+    forecast_response = http.get(forecast_url, timeout=timeout)
+    forecast_response.raise_for_status()
+    forecast_data = forecast_response.json()["properties"]["periods"][0]
+
+    wind_dir = forecast_data.get("windDirection", "none")
+    wind_speed = int(forecast_data.get("windSpeed", "0 mph").split()[0])
+    temperature = int(forecast_data.get("temperature", 70))
+
+    humidity = 50  # fallback since NOAA doesn't expose it
+
+    return {
+        "wind_direction": wind_dir.lower(),
+        "wind_speed": wind_speed,
+        "temperature": temperature,
+        "humidity": humidity
     }
 
-    if park_name in domes:
+def get_noaa_weather(park_name):
+    if park_name in DOME_PARKS:
         print(f"[🌐] Skipping NOAA fetch for dome stadium: {park_name}")
-        return {
-            "wind_direction": "none",
-            "wind_speed": 0,
-            "temperature": 72,
-            "humidity": 50
-        }
+        return dict(DOME_WEATHER)
 
     try:
-        with open("data/stadium_locations.json") as f:
-            stadiums = json.load(f)
-
-        location = stadiums.get(park_name, stadiums["League Average"])
-        lat, lon = location["lat"], location["lon"]
-
-        metadata_url = f"https://api.weather.gov/points/{lat},{lon}"
-        meta_response = requests.get(metadata_url, timeout=5)
-        meta_response.raise_for_status()
-        grid_info = meta_response.json()["properties"]
-        forecast_url = grid_info["forecastHourly"]
-
-        forecast_response = requests.get(forecast_url, timeout=5)
-        forecast_response.raise_for_status()
-        forecast_data = forecast_response.json()["properties"]["periods"][0]
-
-        wind_dir = forecast_data.get("windDirection", "none")
-        wind_speed = int(forecast_data.get("windSpeed", "0 mph").split()[0])
-        temperature = int(forecast_data.get("temperature", 70))
-
-        humidity = 50  # fallback since NOAA doesn't expose it
-
-        return {
-            "wind_direction": wind_dir.lower(),
-            "wind_speed": wind_speed,
-            "temperature": temperature,
-            "humidity": humidity
-        }
-
+        return fetch_noaa_weather(park_name)
     except Exception as e:
         print(f"[ERROR] NOAA weather fetch failed for {park_name}: {e}")
-        return {
-            "wind_direction": "none",
-            "wind_speed": 0,
-            "temperature": 70,
-            "humidity": 50
-        }
+        return dict(NEUTRAL_WEATHER)
 
 def compute_weather_multipliers(weather, hitter_side="R", park_orientation="center"):
     temp = weather.get("temperature", 70)
@@ -0,0 +1,249 @@
+# lineup_source.py
+"""Daily lineups from FantasyData: HTTP first, cached, browser as a fallback.
+
+``fetch_lineups`` returns ``{team_abbr: [{"name", "handedness"}, ...]}`` for
+a date.  It tries, in order:
+
+1. ``data/lineup_cache/<date>.json`` when younger than the TTL
+   (``DEFAULT_TTL``; override with ``MLB_LINEUP_TTL`` in minutes);
+2. a plain HTTP GET of the lineups page parsed with BeautifulSoup;
+3. the long-lived headless Chrome in ``assets.lineup_scraper_selenium``,
+   only when the HTTP page carries no lineup blocks or the request fails.
+
+Each entry records a content hash of the parsed lineups.  A refetch that
+parses to the same lineups keeps its ``changed_at`` time, and the lineups
+themselves are identical, so downstream sim fingerprints still match and
+games are not re-simulated.  When every source fails the last cached
+lineups are returned however old.
+
+``parse_lineups_html`` takes the page HTML and has no network or browser
+dependency, so it is tested against saved pages in ``tests/fixtures``.
+"""
+
+from core.config import DEBUG_MODE, VERBOSE_MODE
+import hashlib
+import json
+import os
+import re
+import time
+from datetime import datetime
+
+import requests
+from bs4 import BeautifulSoup
+
+from core.utils import normalize_name
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+LINEUPS_URL = "https://fantasydata.com/mlb/daily-lineups?date={date}"
+LINEUP_CACHE_DIR = os.path.join("data", "lineup_cache")
+DEFAULT_TTL = 10 * 60
+TTL_ENV = "MLB_LINEUP_TTL"
+HTTP_TIMEOUT = 10
+HTTP_HEADERS = {"User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"}
+
+# Map full team names to official MLB abbreviations
+TEAM_ABBR_MAP = {
+    "angels": "LAA",
+    "astros": "HOU",
+    "athletics": "OAK",
+    "blue jays": "TOR",
+    "braves": "ATL",
+    "brewers": "MIL",
+    "cardinals": "STL",
+    "cubs": "CHC",
+    "diamondbacks": "ARI",
+    "dodgers": "LAD",
+    "giants": "SF",
+    "guardians": "CLE",
+    "mariners": "SEA",
+    "marlins": "MIA",
+    "mets": "NYM",
+    "nationals": "WSH",
+    "orioles": "BAL",
+    "padres": "SD",
+    "phillies": "PHI",
+    "pirates": "PIT",
+    "rangers": "TEX",
+    "rays": "TB",
+    "reds": "CIN",
+    "red sox": "BOS",
+    "rockies": "COL",
+    "royals": "KC",
+    "tigers": "DET",
+    "twins": "MIN",
+    "white sox": "CHW",
+    "yankees": "NYY"
+}
+
+def fuzzy_team_match(name):
+    name_clean = re.sub(r"[^\w\s]", "", name).lower().strip()
+
+    if name_clean in TEAM_ABBR_MAP:
+        return TEAM_ABBR_MAP[name_clean]
+
+    for key, abbr in TEAM_ABBR_MAP.items():
+        if key in name_clean:
+            return abbr
+
+    print(f"⚠️ Unmatched team name: '{name}' — using fallback abbreviation.")
+    return name.strip()[:3].upper()
+
+
+def _extract_batters(team_div):
+    batters = []
+    rows = team_div.find_all("div", recursive=False)
+    for row in rows:
+        row_text = row.get_text(" ", strip=True)
+        match = re.search(r"^\d+\.\s*(.*?)\s+\((R|L|S)\)", row_text)
+        if match:
+            name = normalize_name(match.group(1).strip())
+            hand = match.group(2)
+            batters.append({"name": name, "handedness": hand})
+        if len(batters) == 9:
+            break
+    return batters
+
+
+def parse_lineups_html(html, verbose=True):
+    """Parse a FantasyData daily-lineups page into ``{team_abbr: batters}``.
+
+    Returns ``{}`` when the page has no matchup blocks (e.g. the bare
+    JavaScript shell served before rendering).
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    matchups = soup.select("#lineups > div")
+    if verbose:
+        if not matchups:
+            print("⚠️ No matchups found — selector may have changed.")
+        else:
+            print(f"Found {len(matchups)} matchup blocks.\n")
+
+    lineups = {}
+
+    for matchup in matchups:
+        header = matchup.select_one(".header .info div")
+        if not header or "@" not in header.get_text():
+            continue
+
+        away_team, home_team = header.get_text(strip=True).split("@")
+        away_abbr = fuzzy_team_match(away_team)
+        home_abbr = fuzzy_team_match(home_team)
+
+        for abbr, selector, side in ((away_abbr, "div.lineup > div.away", "Away"), (home_abbr, "div.lineup > div.home", "Home")):
+            block = matchup.select_one(selector)
+            if not block:
+                continue
+            batters = _extract_batters(block)
+            lineups[abbr] = batters
+            if verbose:
+                print(f"{side} lineup for {abbr}: {len(batters)} batters")
+                if len(batters) < 9:
+                    print(f"⚠️ Incomplete lineup: {abbr} has only {len(batters)} batters")
+
+    return lineups
+
+
+def lineups_hash(lineups):
+    """Short content hash of parsed lineups (order-insensitive across teams)."""
+    payload = json.dumps(lineups, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def lineup_ttl():
+    try:
+        return float(os.environ[TTL_ENV]) * 60
+    except KeyError:
+        return DEFAULT_TTL
+    except ValueError:
+        logger.warning("⚠️ Ignoring %s=%r; expected minutes", TTL_ENV, os.environ[TTL_ENV])
+        return DEFAULT_TTL
+
+
+def cache_path(for_date, cache_dir=LINEUP_CACHE_DIR):
+    return os.path.join(cache_dir, f"{for_date}.json")
+
+
+def read_cached_lineups(for_date, cache_dir=LINEUP_CACHE_DIR):
+    """Return the cache entry for ``for_date`` or ``None``."""
+    try:
+        with open(cache_path(for_date, cache_dir)) as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return entry if isinstance(entry, dict) and isinstance(entry.get("lineups"), dict) else None
+
+
+def write_cached_lineups(for_date, lineups, source, previous=None, cache_dir=LINEUP_CACHE_DIR):
+    """Store ``lineups`` for ``for_date``, keeping ``changed_at`` when the content hash is unchanged."""
+    now = time.time()
+    digest = lineups_hash(lineups)
+    unchanged = previous is not None and previous.get("hash") == digest
+    entry = {
+        "date": for_date,
+        "source": source,
+        "fetched_at": now,
+        "changed_at": previous.get("changed_at", now) if unchanged else now,
+        "hash": digest,
+        "lineups": lineups,
+    }
+    os.makedirs(cache_dir, exist_ok=True)
+    path = cache_path(for_date, cache_dir)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(entry, f, indent=2)
+    os.replace(tmp_path, path)
+    if DEBUG_MODE:
+        logger.debug("📋 Lineups for %s %s (%s via %s)", for_date, "unchanged" if unchanged else "updated", digest, source)
+    return entry
+
+
+def fetch_lineups_http(for_date, session=None, timeout=HTTP_TIMEOUT):
+    """GET the lineups page and parse it; ``{}`` when it carries no lineup blocks."""
+    http = session or requests
+    resp = http.get(LINEUPS_URL.format(date=for_date), headers=HTTP_HEADERS, timeout=timeout)
+    resp.raise_for_status()
+    return parse_lineups_html(resp.text, verbose=VERBOSE_MODE)
+
+
+def fetch_lineups_browser(for_date):
+    """Render the lineups page in the shared headless browser and parse it."""
+    from assets.lineup_scraper_selenium import fetch_page_source
+
+    return parse_lineups_html(fetch_page_source(LINEUPS_URL.format(date=for_date)))
+
+
+def fetch_lineups(for_date=None, use_cache=True, ttl=None, session=None, cache_dir=LINEUP_CACHE_DIR,
+                  http_fetch=fetch_lineups_http, browser_fetch=fetch_lineups_browser):
+    """Return ``{team_abbr: batters}`` for ``for_date`` (default today).
+
+    See the module docstring for the cache → HTTP → browser order.
+    ``http_fetch``/``browser_fetch`` take the date and return parsed lineups.
+    """
+    if not for_date:
+        for_date = datetime.today().strftime("%Y-%m-%d")
+    ttl = lineup_ttl() if ttl is None else ttl
+
+    entry = read_cached_lineups(for_date, cache_dir)
+    if use_cache and entry and time.time() - entry.get("fetched_at", 0) < ttl:
+        print(f"📋 Using cached lineups for {for_date} ({entry.get('source')}, {len(entry['lineups'])} teams)")
+        return entry["lineups"]
+
+    print(f"🌐 Loading FantasyData daily lineups for: {for_date}")
+    for source, fetch in (("http", lambda: http_fetch(for_date, session=session)), ("browser", lambda: browser_fetch(for_date))):
+        try:
+            lineups = fetch()
+        except Exception as e:
+            logger.warning("⚠️ Lineup %s fetch failed for %s: %s", source, for_date, e)
+            continue
+        if lineups:
+            write_cached_lineups(for_date, lineups, source, previous=entry, cache_dir=cache_dir)
+            print(f"✅ Lineups for {for_date} via {source}: {list(lineups.keys())}")
+            return lineups
+        logger.info("ℹ️ Lineup %s fetch for %s had no lineups", source, for_date)
+
+    if entry:
+        logger.warning("⚠️ Using stale cached lineups for %s", for_date)
+        return entry["lineups"]
+    return {}
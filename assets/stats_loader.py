@@ -4,6 +4,38 @@ import json
 from core.utils import normalize_name
 from core.project_hr_pa import project_hr_pa
 
+PITCHER_ALIAS_FILE = "pitcher_alias_map.json"
+BATTER_ALIAS_FILE = "batter_alias_map.json"
+NAME_COLUMNS = ["Name", "player_name", "last_name, first_name"]
+
+# Pitcher dict fields in output order: (key, merged column, fallback)
+PITCHER_FIELDS = [
+    ("k_rate", "K_pct", 0.225),
+    ("bb_rate", "BB_pct", 0.082),
+    ("hr_fb_rate", "HR_FB_pct", 0.115),
+    ("gb_rate", "GB_pct", 40.0),
+    ("fb_rate", "FB_pct", 40.0),
+    ("iso_allowed", "ISO", 0.14),
+    ("stuff_plus", "stuff_plus", 100),
+    ("location_plus", "location_plus", 100),
+    ("command_plus", "location_plus", 100),
+    ("barrel_batted_rate", "barrel_batted_rate", 0.06),
+    ("hardhit_percent", "hardhit_percent", 0.35),
+    ("exit_velocity_avg", "exit_velocity_avg", 88.0),
+    ("launch_angle_avg", "launch_angle_avg", 13.0),
+    ("xiso", "ISO", 0.14),
+    ("xwobacon", "xwobacon", 0.320),
+    ("xSLG", "xslg", 0.0),
+    ("xSLG_diff", "xslgdiff", 0.0),
+    ("xwOBAcon", "xwobacon", 0.0),
+    ("wOBAdiff", "wobadiff", 0.0),
+    ("sweet_spot_pct", "sweet_spot_percent", 0.32),
+    ("HR", "HR", 0),
+    ("TBF", "TBF", 1),
+    ("IP", "IP", 1),
+    ("FIP", "FIP", 4.00),
+]
+
 # === Safe float fallback ===
 def safe_float(val, fallback=0.0):
     try:
@@ -21,10 +53,49 @@ def safe_float(val, fallback=0.0):
     return result
 
 
-# === Pitcher Stats Loader ===
-def load_pitcher_stats(pitcher_file, stuff_file, statcast_file, patch_hrfb=False, verbose=False):
-    pitcher_stats = {}
+# === Column helpers ===
+def float_column(df, col, fallback):
+    """Column-wise ``safe_float``: non-numeric or missing values (or a missing column) become ``fallback``."""
+    if col not in df.columns:
+        return pd.Series(float(fallback), index=df.index)
+    values = df[col]
+    if values.dtype == object:
+        # Mixed columns go value by value so numeric strings parse exactly as ``float`` does
+        values = values.map(lambda val: safe_float(val, np.nan))
+    return values.astype(float).fillna(fallback)
+
+
+def as_fraction(col):
+    """Scale percentages given as 0-100 down to 0-1, leaving fractions and NaNs alone."""
+    return col.mask(col > 1.0, col / 100.0)
+
+
+def normalize_names(names):
+    """``normalize_name`` over a column, called once per distinct value."""
+    unique = pd.unique(names)
+    return names.map(pd.Series([normalize_name(n) for n in unique], index=unique, dtype=object))
+
+
+def load_alias_map(path):
+    """Return the normalized ``{alias: name}`` map in ``path``; raises ``FileNotFoundError`` if absent."""
+    with open(path) as f:
+        raw = json.load(f)
+    return {normalize_name(k): normalize_name(v) for k, v in raw.items()}
+
+
+def last_row_per_name(df, key):
+    """Index ``df`` by ``key``, keeping each name's last row in order of first appearance.
 
+    Matches filling a dict row by row, where a repeated name overwrites the
+    earlier values but keeps its original position.
+    """
+    order = pd.unique(df[key])
+    return df.drop_duplicates(key, keep="last").set_index(key).loc[order]
+
+
+# === Pitcher Stats Loader ===
+def pitcher_table(pitcher_file, stuff_file, statcast_file, verbose=False, alias_file=PITCHER_ALIAS_FILE):
+    """Read and merge the pitcher CSVs into one row of dict fields per pitcher, indexed by normalized name."""
     p_df = pd.read_csv(pitcher_file)
     s_df = pd.read_csv(stuff_file)
     x_df = pd.read_csv(statcast_file)
@@ -34,39 +105,37 @@ def load_pitcher_stats(pitcher_file, stuff_file, statcast_file, patch_hrfb=False
 
     # Normalize Statcast percentages
     if "barrel_batted_rate" in x_df.columns:
-        x_df["barrel_batted_rate"] = x_df["barrel_batted_rate"].apply(lambda x: x / 100.0 if pd.notna(x) and x > 1.0 else x)
-        x_df["barrel_batted_rate"] = x_df["barrel_batted_rate"].apply(lambda x: max(x, 0.005) if pd.notna(x) else x)
+        barrel = as_fraction(x_df["barrel_batted_rate"])
+        x_df["barrel_batted_rate"] = barrel.mask(barrel < 0.005, 0.005)
     if "fb_rate" in x_df.columns:
-        x_df["fb_rate"] = x_df["fb_rate"].apply(lambda x: x / 100.0 if pd.notna(x) and x > 1.0 else x)
+        x_df["fb_rate"] = as_fraction(x_df["fb_rate"])
     if "hardhit_percent" in x_df.columns:
-        x_df["hardhit_percent"] = x_df["hardhit_percent"].apply(lambda x: x / 100.0 if pd.notna(x) and x > 1.0 else x)
+        x_df["hardhit_percent"] = as_fraction(x_df["hardhit_percent"])
 
-    for col in ["Name", "player_name", "last_name, first_name"]:
+    for col in NAME_COLUMNS:
         if col in p_df.columns:
-            p_df["norm_name"] = p_df[col].apply(normalize_name)
+            p_df["norm_name"] = normalize_names(p_df[col])
             break
     else:
         raise KeyError("[❌] No valid name column in Pitchers.csv")
 
-    for col in ["Name", "player_name", "last_name, first_name"]:
+    for col in NAME_COLUMNS:
         if col in s_df.columns:
-            s_df["norm_name"] = s_df[col].apply(normalize_name)
+            s_df["norm_name"] = normalize_names(s_df[col])
             break
     s_df = s_df.rename(columns={"Stuff+": "stuff_plus", "Location+": "location_plus"})
 
     if "first_name" in x_df.columns and "last_name" in x_df.columns:
-        x_df["norm_name"] = (x_df["first_name"].astype(str) + " " + x_df["last_name"].astype(str)).apply(normalize_name)
+        x_df["norm_name"] = normalize_names(x_df["first_name"].astype(str) + " " + x_df["last_name"].astype(str))
     else:
-        for col in ["Name", "player_name", "last_name, first_name"]:
+        for col in NAME_COLUMNS:
             if col in x_df.columns:
-                x_df["norm_name"] = x_df[col].apply(normalize_name)
+                x_df["norm_name"] = normalize_names(x_df[col])
                 break
 
     try:
-        with open("pitcher_alias_map.json") as f:
-            alias_map_raw = json.load(f)
-            alias_map = {normalize_name(k): normalize_name(v) for k, v in alias_map_raw.items()}
-        x_df["norm_name"] = x_df["norm_name"].apply(lambda name: alias_map.get(name, name))
+        alias_map = load_alias_map(alias_file)
+        x_df["norm_name"] = x_df["norm_name"].map(alias_map).fillna(x_df["norm_name"])
     except FileNotFoundError:
         if verbose:
             print("[⚠️] No pitcher alias map found — skipping alias correction.")
@@ -78,9 +147,7 @@ def load_pitcher_stats(pitcher_file, stuff_file, statcast_file, patch_hrfb=False
         if verbose:
             print("[🧠] Using xISO as fallback for ISO")
     if "hardhit_percent" not in x_df.columns and "exit_velocity_avg" in x_df.columns:
-        x_df["hardhit_percent"] = x_df["exit_velocity_avg"].apply(
-            lambda ev: (35.0 + ((ev - 88) * 1.25)) / 100.0 if pd.notna(ev) else 0.35
-        )
+        x_df["hardhit_percent"] = ((35.0 + (x_df["exit_velocity_avg"] - 88) * 1.25) / 100.0).fillna(0.35)
 
     # Optional debug output
     if verbose:
@@ -98,8 +165,6 @@ def load_pitcher_stats(pitcher_file, stuff_file, statcast_file, patch_hrfb=False
     ]
     x_df = x_df[[col for col in x_cols_to_merge if col in x_df.columns]]
 
-
-
     merged = p_df.merge(
         s_df[["norm_name", "stuff_plus", "location_plus"]],
         on="norm_name", how="left"
@@ -110,41 +175,50 @@ def load_pitcher_stats(pitcher_file, stuff_file, statcast_file, patch_hrfb=False
 
     merged = merged.dropna(subset=["K_pct", "BB_pct"])
 
-    for _, row in merged.iterrows():
-        n = row["norm_name"]
-        hr_fb_val = safe_float(row.get("HR_FB_pct"), 0.115)
-        if hr_fb_val is not None and hr_fb_val > 0.5:
-            print(f"[⚠️] Suspicious HR/FB rate for {n}: {hr_fb_val:.2%}")
+    table = pd.DataFrame({key: float_column(merged, col, fallback) for key, col, fallback in PITCHER_FIELDS})
+    # clamp derived hardhit fallback to prevent extreme values
+    table["hardhit_percent"] = table["hardhit_percent"].clip(0.3, 0.5)
+    table["TBF"] = table["TBF"].clip(lower=1)
+    table["name"] = merged["norm_name"]
 
-        pitcher_stats[n] = {
-            "k_rate": safe_float(row.get("K_pct"), 0.225),
-            "bb_rate": safe_float(row.get("BB_pct"), 0.082),
-            "hr_fb_rate": hr_fb_val,
-            "gb_rate": safe_float(row.get("GB_pct"), 40.0),
-            "fb_rate": safe_float(row.get("FB_pct"), 40.0),
-            "iso_allowed": safe_float(row.get("ISO"), 0.14),
-            "stuff_plus": safe_float(row.get("stuff_plus"), 100),
-            "location_plus": safe_float(row.get("location_plus"), 100),
-            "command_plus": safe_float(row.get("location_plus"), 100),
-            "barrel_batted_rate": safe_float(row.get("barrel_batted_rate"), 0.06),
-            "hardhit_percent": safe_float(row.get("hardhit_percent"), 0.35),
-            "exit_velocity_avg": safe_float(row.get("exit_velocity_avg"), 88.0),
-            "launch_angle_avg": safe_float(row.get("launch_angle_avg"), 13.0),
-            "xiso": safe_float(row.get("ISO"), 0.14),
-            "xwobacon": safe_float(row.get("xwobacon"), 0.320),
-            "xSLG": safe_float(row.get("xslg"), 0.0),
-            "xSLG_diff": safe_float(row.get("xslgdiff"), 0.0),
-            "xwOBAcon": safe_float(row.get("xwobacon"), 0.0),
-            "wOBAdiff": safe_float(row.get("wobadiff"), 0.0),
-            "sweet_spot_pct": safe_float(row.get("sweet_spot_percent"), 0.32),
-            "HR": safe_float(row.get("HR"), 0),
-            "TBF": max(safe_float(row.get("TBF"), 1), 1),
-            "IP": safe_float(row.get("IP"), 1),
-            "FIP": safe_float(row.get("FIP"), 4.00),  # add if available
-            "name": n
-        }
-
-    for name, stats in pitcher_stats.items():
+    for n, hr_fb_val in table.loc[table["hr_fb_rate"] > 0.5, ["name", "hr_fb_rate"]].itertuples(index=False):
+        print(f"[⚠️] Suspicious HR/FB rate for {n}: {hr_fb_val:.2%}")
+
+    # ✅ MOVE THIS INSIDE FUNCTION
+    if verbose:
+        print("\n[DEBUG] Columns in p_df:", p_df.columns.tolist())
+        print("[DEBUG] Columns in s_df:", s_df.columns.tolist())
+        print("[DEBUG] Columns in x_df:", x_df.columns.tolist())
+        print("[DEBUG] Sample norm_names in p_df:", p_df['norm_name'].head(5).tolist())
+        print("[DEBUG] Sample norm_names in s_df:", s_df.get("norm_name", pd.Series()).head(5).tolist())
+        print("[DEBUG] Sample norm_names in x_df:", x_df.get("norm_name", pd.Series()).head(5).tolist())
+
+    table = last_row_per_name(table.assign(norm_name=table["name"]), "norm_name")
+    table.index.name = None
+    return table
+
+
+def enrich_pitchers(table, previous=None, verbose=False):
+    """Turn a ``pitcher_table`` into pitcher dicts with their ``hr_pa`` projection.
+
+    Each row is fingerprinted; a pitcher whose row digest matches the one in
+    ``previous`` (a ``{"stats", "rows"}`` dict from an earlier call) keeps its
+    earlier enriched dict instead of being re-projected.  Returns
+    ``(pitcher_stats, row_digests, n_enriched)``.
+    """
+    previous = previous or {}
+    previous_stats = previous.get("stats") or {}
+    previous_rows = previous.get("rows") or {}
+    digests = pd.util.hash_pandas_object(table, index=True).to_numpy()
+
+    pitcher_stats, rows, n_enriched = {}, {}, 0
+    for (name, stats), digest in zip(table.to_dict("index").items(), digests):
+        digest = int(digest)
+        rows[name] = digest
+        if previous_rows.get(name) == digest and name in previous_stats:
+            pitcher_stats[name] = previous_stats[name]
+            continue
+
         try:
             proj = project_hr_pa(stats)
             stats["hr_pa"] = proj
@@ -156,20 +230,19 @@ def load_pitcher_stats(pitcher_file, stuff_file, statcast_file, patch_hrfb=False
                 missing = [k for k in ("HR", "TBF", "IP", "exit_velocity_avg", "launch_angle_avg") if stats.get(k) is None or pd.isna(stats.get(k))]
                 print(f"[⚠️] {name} missing: {missing} → enriched=False")
                 print(f"[❌] HR/PA projection failed for {name} → check input completeness")
+        pitcher_stats[name] = stats
+        n_enriched += 1
+
+    return pitcher_stats, rows, n_enriched
 
-    # ✅ MOVE THIS INSIDE FUNCTION
-    if verbose:
-        print("\n[DEBUG] Columns in p_df:", p_df.columns.tolist())
-        print("[DEBUG] Columns in s_df:", s_df.columns.tolist())
-        print("[DEBUG] Columns in x_df:", x_df.columns.tolist())
-        print("[DEBUG] Sample norm_names in p_df:", p_df['norm_name'].head(5).tolist())
-        print("[DEBUG] Sample norm_names in s_df:", s_df.get("norm_name", pd.Series()).head(5).tolist())
-        print("[DEBUG] Sample norm_names in x_df:", x_df.get("norm_name", pd.Series()).head(5).tolist())
 
+def load_pitcher_stats(pitcher_file, stuff_file, statcast_file, patch_hrfb=False, verbose=False, alias_file=PITCHER_ALIAS_FILE):
+    table = pitcher_table(pitcher_file, stuff_file, statcast_file, verbose=verbose, alias_file=alias_file)
+    pitcher_stats, _, _ = enrich_pitchers(table, verbose=verbose)
     return pitcher_stats
 
 # === Batter Stats Loader ===
-def load_batter_stats(batter_file, verbose=False):
+def load_batter_stats(batter_file, verbose=False, alias_file=BATTER_ALIAS_FILE):
     df = pd.read_csv(batter_file)
     df.columns = df.columns.str.strip()
     df = df.rename(columns={"K%": "K_pct", "BB%": "BB_pct", "ISO": "ISO", "AVG": "AVG", "wOBA": "wOBA"})
@@ -180,30 +253,31 @@ def load_batter_stats(batter_file, verbose=False):
     df = df.dropna(subset=["Name", "K_pct", "BB_pct"])
 
     try:
-        with open("batter_alias_map.json") as f:
-            raw = json.load(f)
-            alias_map = {normalize_name(k): normalize_name(v) for k, v in raw.items()}
+        alias_map = load_alias_map(alias_file)
     except FileNotFoundError:
         alias_map = {}
         if verbose:
             print("[⚠️] No batter alias map found — proceeding without alias correction.")
 
     fallback = {"b": "brayan"}
-    batter_stats = {}
-    for _, row in df.iterrows():
-        raw = row["Name"]
+
+    def batter_name(raw):
         norm = normalize_name(raw)
         if norm.split()[0] in fallback:
             norm = fallback[norm.split()[0]] + " " + " ".join(norm.split()[1:])
         final = alias_map.get(norm, norm)
-        name = normalize_name(final)
-        batter_stats[name] = {
-            "k_rate": row["K_pct"],
-            "bb_rate": row["BB_pct"],
-            "iso":     row.get("ISO", 0.15),
-            "avg":     row.get("AVG", 0.25),
-            "woba":    row.get("wOBA", 0.32)
-        }
+        return normalize_name(final)
+
+    unique = pd.unique(df["Name"])
+    table = pd.DataFrame({
+        "name": df["Name"].map(pd.Series([batter_name(raw) for raw in unique], index=unique, dtype=object)),
+        "k_rate": df["K_pct"],
+        "bb_rate": df["BB_pct"],
+        "iso": df["ISO"],
+        "avg": df["AVG"],
+        "woba": df["wOBA"],
+    })
+    batter_stats = last_row_per_name(table, "name").to_dict("index")
 
     if verbose:
         print(f"\n[🧠] Loaded batter stats: {len(batter_stats)} names post-alias.")
@@ -18,6 +18,14 @@ parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 parser.add_argument(
     "--verbose", action="store_true", help="Enable verbose logging"
 )
+parser.add_argument(
+    "--profile",
+    nargs="?",
+    const="timing",
+    default=None,
+    metavar="MODES",
+    help="Write per-cycle stage timings to logs/perf/ (MODES: timing,cprofile,tracemalloc,all)",
+)
 args = parser.parse_args()
 
 config.DEBUG_MODE = args.debug
@@ -34,6 +42,11 @@ from core.utils import now_eastern, safe_load_json, to_eastern
 from utils.quiet_hours import is_within_quiet_hours
 from cli.log_betting_evals import process_quiet_hour_queue
 from core.odds_fetcher import fetch_all_market_odds, save_market_odds_to_file
+from core import perf
+
+# Subprocesses inherit MLB_PERF from the environment
+if args.profile:
+    perf.configure(args.profile)
 
 EDGE_THRESHOLD = 0.05
 MIN_EV = 0.05
@@ -269,6 +282,12 @@ def ensure_early_monitor_running() -> bool:
     return restarted
 
 
+def start_perf_cycle(label) -> None:
+    """Tag perf reports written by this process and its subprocesses with ``label``."""
+    if perf.enabled():
+        os.environ[perf.CYCLE_ENV] = label
+
+
 def get_date_strings():
     now = now_eastern()
     today_str = now.strftime("%Y-%m-%d")
@@ -413,6 +432,7 @@ logger.info(
     "🟢 [%s] First-time launch → fetching odds and dispatching logs",
     now_eastern(),
 )
+start_perf_cycle(f"{now_eastern():%Y%m%dT%H%M%S}-0")
 initial_odds = fetch_and_cache_odds_snapshot()
 if initial_odds:
     last_snapshot_time = time.time()
@@ -437,9 +457,12 @@ if not initial_odds:
     last_log_dt = now_eastern()
     last_sim_time = start_time
 
+perf.write_report()
+
 while True:
     now = time.time()
     loop_count += 1
+    start_perf_cycle(f"{now_eastern():%Y%m%dT%H%M%S}-{loop_count}")
 
     logger.debug(
         "Loop tick → now: %s, log Δ: %.1f",
@@ -552,6 +575,9 @@ while True:
 
     breakdown = ", ".join(parts) if parts else "none"
     logger.info("Active processes: %s (%s)", total, breakdown)
+    perf_path = perf.write_report()
+    if perf_path:
+        logger.info("⏱️ Wrote performance report → %s", perf_path)
     logger.info("⏱ Sleeping for 10 seconds...\n")
 
     time.sleep(10)
\ No newline at end of file
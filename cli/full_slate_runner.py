@@ -5,6 +5,8 @@ from core.bootstrap import *  # noqa
 from core.config import DEBUG_MODE, VERBOSE_MODE
 import json
 import re
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import date
 
 
@@ -14,6 +16,10 @@ logger = get_logger(__name__)
 # === Core Modules ===
 from assets.probable_pitchers import fetch_probable_pitchers
 from cli.run_distribution_simulator import simulate_distribution
+from core.data_loader import load_all_stats
+from core.game_asset_builder import build_slate_context
+from core.weather_cache import WeatherCache, slate_first_pitches
+from core import perf
 from core.utils import canonical_game_id
 
 
@@ -36,11 +42,18 @@ Options:
   --days-ahead=INT         Look ahead days when listing games (default: 1)
   --export-folder=PATH     Override JSON export root folder
   --safe                   Skip games that fail to simulate instead of exiting
+  --workers=INT            Simulate games in parallel across INT processes (default: 1)
+  --seed=INT               Seed the slate; each game gets its own spawned stream
+  --se-tol=FLOAT           Adaptive sim count: stop once every market's SE is below FLOAT (about 0.25/FLOAT^2 sims)
+  --no-cache               Re-simulate even when a game's inputs are unchanged
+  --profile[=MODES]        Write stage timings to logs/perf/ (MODES: timing,cprofile,tracemalloc,all)
   --help                   Show this help message and exit
 
 Examples:
   python {os.path.basename(__file__)} 2025-04-17 --debug --edge-threshold=0.04 --line=8.5
   python {os.path.basename(__file__)} --days-ahead=2
+  python {os.path.basename(__file__)} 2025-04-17 --workers=8 --safe
+  python {os.path.basename(__file__)} 2025-04-17 --se-tol=0.0075
 """
 )
 
@@ -61,6 +74,10 @@ def parse_args():
     days_ahead = 1
     export_folder = None
     safe_mode = False
+    workers = 1
+    seed = None
+    se_tolerance = None
+    use_cache = True
 
     for arg in args:
         if arg == "--debug":
@@ -86,6 +103,25 @@ def parse_args():
             export_folder = arg.split("=", 1)[1]
         elif arg == "--safe":
             safe_mode = True
+        elif arg == "--no-cache":
+            use_cache = False
+        elif arg.startswith("--workers="):
+            try:
+                workers = max(1, int(arg.split("=", 1)[1]))
+            except ValueError:
+                pass
+        elif arg.startswith("--seed="):
+            try:
+                seed = int(arg.split("=", 1)[1])
+            except ValueError:
+                pass
+        elif arg.startswith("--se-tol="):
+            try:
+                se_tolerance = float(arg.split("=", 1)[1])
+            except ValueError:
+                pass
+        elif arg == "--profile" or arg.startswith("--profile="):
+            perf.configure_from_argv([arg])
         else:
             date_arg = arg
 
@@ -100,9 +136,117 @@ def parse_args():
         line,
         days_ahead,
         export_folder,
+        use_cache,
+        se_tolerance,
         safe_mode,
+        workers,
+        seed,
     )
 
+
+def spawn_game_seeds(game_ids, seed=None):
+    """Return one independent ``SeedSequence`` per game, or ``None`` for each when unseeded.
+
+    Streams are assigned by position in the sorted slate, so a game's draws
+    do not depend on which worker runs it or in what order.
+    """
+    if seed is None:
+        return {gid: None for gid in game_ids}
+    children = np.random.SeedSequence(seed).spawn(len(game_ids))
+    return dict(zip(game_ids, children))
+
+# ----------------------------
+# Worker Process Helpers
+# ----------------------------
+_WORKER_STATS = None
+_WORKER_SLATE = None
+
+
+def _init_worker(batter_stats, pitcher_stats, slate=None):
+    """Store the parent's preloaded stats and slate context once per worker process."""
+    global _WORKER_STATS, _WORKER_SLATE
+    _WORKER_STATS = (batter_stats, pitcher_stats)
+    _WORKER_SLATE = slate
+
+
+def _simulate_game_task(game_id, line, debug, no_weather, edge_threshold, export_json, seed=None, se_tolerance=None, use_cache=True):
+    """Simulate one game inside a worker and return ``(game_id, error, perf spans)``."""
+    try:
+        simulate_distribution(
+            game_id=game_id,
+            line=line,
+            debug=debug,
+            no_weather=no_weather,
+            edge_threshold=edge_threshold,
+            export_json=export_json,
+            n_simulations=10000,
+            stats=_WORKER_STATS,
+            seed=seed,
+            se_tolerance=se_tolerance,
+            use_cache=use_cache,
+            slate=_WORKER_SLATE,
+        )
+        return game_id, None, perf.drain()
+    except Exception as e:
+        return game_id, str(e), perf.drain()
+
+
+def resolve_export_path(export_folder, date_str, game_id):
+    """Return the JSON export path for ``game_id`` or ``None`` for the default."""
+    if not export_folder:
+        return None
+    folder_path = os.path.join(export_folder, date_str)
+    os.makedirs(folder_path, exist_ok=True)
+    return os.path.join(folder_path, f"{game_id}.json")
+
+
+def run_parallel(game_ids, date_str, workers, stats, line, debug, no_weather, edge_threshold, export_folder, safe_mode, seed=None, se_tolerance=None, use_cache=True, slate=None):
+    """Simulate ``game_ids`` across a process pool, one game per task.
+
+    ``stats`` is the parent's ``load_all_stats()`` result and ``slate`` its
+    ``SlateContext``; both are handed to each worker once at startup.  A failed game never takes down the others;
+    without ``safe_mode`` the run still exits non-zero once any game fails.
+    """
+    failed = []
+    game_seeds = spawn_game_seeds(game_ids, seed)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(*stats, slate),
+    ) as pool:
+        futures = {
+            pool.submit(
+                _simulate_game_task,
+                gid,
+                line,
+                debug,
+                no_weather,
+                edge_threshold,
+                resolve_export_path(export_folder, date_str, gid),
+                game_seeds[gid],
+                se_tolerance,
+                use_cache,
+            ): gid
+            for gid in game_ids
+        }
+        for future in as_completed(futures):
+            try:
+                gid, error, spans = future.result()
+                perf.merge(spans)
+            except Exception as e:  # worker process died
+                gid, error = futures[future], str(e)
+            if error:
+                logger.warning("Failed to simulate game %s: %s", gid, error)
+                failed.append(gid)
+                if not safe_mode:
+                    for pending in futures:
+                        pending.cancel()
+                    break
+
+    if failed and not safe_mode:
+        sys.exit(1)
+    return failed
+
 # ----------------------------
 # Full Slate Distribution Runner
 # ----------------------------
@@ -115,7 +259,11 @@ def main():
         line,
         days_ahead,
         export_folder,
+        use_cache,
+        se_tolerance,
         safe_mode,
+        workers,
+        seed,
     ) = parse_args()
     logger.info("\n📅 Running full slate distribution for %s...\n", date_str)
 
@@ -131,16 +279,49 @@ def main():
         logger.error("❌ No games found for %s", date_str)
         sys.exit(1)
 
+    # Load projections once and share them across every game on the slate
+    stats = load_all_stats()
+
+    # Fetch lineups, park factors and bullpens once for every game on the slate
+    try:
+        slate = build_slate_context(date_str, *stats, matchups=matchups)
+        slate.warm_bullpens()
+    except Exception as e:
+        logger.warning("⚠️ Could not build the slate context (%s); each game will fetch its own assets", e)
+        slate = None
+
+    # Refresh stale park forecasts for the whole slate at once; games then read them from disk
+    if not no_weather:
+        try:
+            WeatherCache().prefetch(slate_first_pitches(game_ids))
+        except Exception as e:
+            logger.warning("⚠️ Weather prefetch failed (%s); games will fetch their own", e)
+
+    if workers > 1:
+        run_parallel(
+            game_ids,
+            date_str,
+            workers,
+            stats,
+            line,
+            debug,
+            no_weather,
+            edge_threshold,
+            export_folder,
+            safe_mode,
+            seed,
+            se_tolerance,
+            use_cache,
+            slate,
+        )
+        logger.info("\n✅ Simulated %s games for %s.", len(game_ids), date_str)
+        return
+
     # Loop through each game and delegate to the distribution simulator
+    game_seeds = spawn_game_seeds(game_ids, seed)
     for gid in game_ids:
         canonical_id = canonical_game_id(gid)
-
-        # Determine export path
-        export_json = None
-        if export_folder:
-            folder_path = os.path.join(export_folder, date_str)
-            os.makedirs(folder_path, exist_ok=True)
-            export_json = os.path.join(folder_path, f"{canonical_id}.json")
+        export_json = resolve_export_path(export_folder, date_str, canonical_id)
 
         try:
             simulate_distribution(
@@ -151,6 +332,11 @@ def main():
                 edge_threshold=edge_threshold,
                 export_json=export_json,
                 n_simulations=10000,
+                stats=stats,
+                seed=game_seeds[gid],
+                se_tolerance=se_tolerance,
+                use_cache=use_cache,
+                slate=slate,
             )
             if export_json and debug:
                 logger.debug("💾 Exported simulation JSON to %s", export_json)
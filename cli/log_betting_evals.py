@@ -41,6 +41,7 @@ from core.dispatch_clv_snapshot import parse_start_time
 from core.book_helpers import ensure_consensus_books
 from core.book_whitelist import ALLOWED_BOOKS
 from core.micro_topups import load_micro_topups, remove_micro_topup
+from core import perf
 import re
 import warnings
 
@@ -2743,6 +2744,7 @@ def save_skipped_bets(
     return final_path
 
 
+@perf.traced("run_batch_logging")
 def run_batch_logging(
     eval_folder,
     market_odds,
@@ -2968,7 +2970,7 @@ def run_batch_logging(
         skipped_bets=summary_candidates,
         webhook_url=DISCORD_SUMMARY_WEBHOOK_URL,
         market_evals_df=market_evals_df,
-        snapshot_ev=args.min_ev,
+        snapshot_ev=min_ev,
         image=image,
         output_dir=output_dir,
         force_log=force_log,
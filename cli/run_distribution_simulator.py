@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # cli/run_distribution_simulator.py
 # Fully revised script: simulates run distributions, builds derivative segments,
-# provides CLI with --debug, --no-weather, --edge-threshold, --export-json, and --list
+# provides CLI with --debug, --no-weather, --edge-threshold, --export-json, --list and the sim options (see --help)
 # Source base: run_distribution_simulator.py citeturn0file0
 
 from core.config import DEBUG_MODE, VERBOSE_MODE
@@ -11,7 +11,6 @@ import os
 from core.bootstrap import *  # noqa
 import json
 import numpy as np
-import tempfile
 import matplotlib.pyplot as plt
 from collections import Counter
 from datetime import datetime
@@ -19,21 +18,30 @@ from datetime import datetime
 from core.logger import get_logger
 logger = get_logger(__name__)
 
-from core.game_simulator import simulate_game
+from core.game_simulator import simulate_games_summary
+from core.batch_game_simulator import simulate_games_batch
+from core.pa_tables import build_game_pa_tables
+from core.adaptive_simulation import simulate_games_adaptive, convergence_report
+from core.variance_reduction import simulate_games_vr, parse_methods
+from core.sim_export import write_sim_export
+from core.sim_cache import sim_fingerprint, is_cached_export, touch_export
+from core.weather_cache import default_weather_cache
+from core import perf
+from core.markov_solver import solve_game, analytic_market_probs, compare_with_simulation
 from core.pricing_engine import MLBPricingEngine
 
 SNAPSHOT_PATH = os.path.join("backtest", "last_table_snapshot.json")
 from core.game_asset_builder import build_game_assets
 from core.data_loader import load_all_stats
 from assets.probable_pitchers import fetch_probable_pitchers
-from core.stats_tools import summarize_pmf, calculate_tail_probability
+from core.simulation_context import SimulationContext
+from core.stats_tools import DiscretePMF
 from core.market_pricer import compute_moneyline, to_american_odds
 from core.market_pricer import print_market_summary
 from assets.env_builder import (
     get_park_name,
     get_park_factors,
     get_weather_hr_mult,
-    get_noaa_weather,
     compute_weather_multipliers
 )
 from core.utils import (
@@ -93,9 +101,54 @@ def apply_segment_scaling(values, target_mean=None, target_sd=None):
 
 
 
+def scale_game_scores(raw_home_scores, raw_away_scores, benchmark, pricing_engine):
+    """Return ``(scaled_totals, scaled_diffs, home_scores, away_scores)`` as the full game is priced.
+
+    Totals are scaled to the benchmark mean and SD and run differentials to
+    its SD; the team scores split them back out with the calibrated
+    team-total scaling applied.
+    """
+    raw_home = np.asarray(raw_home_scores)
+    raw_away = np.asarray(raw_away_scores)
+    scaled_totals = scale_distribution(
+        raw_home + raw_away,
+        target_mean=benchmark["mean_total"],
+        target_sd=benchmark["std_total"],
+    )
+    scaled_diffs = scale_distribution(
+        raw_home - raw_away,
+        target_sd=benchmark["std_total"],
+    )
+    home_scores = (np.array(scaled_totals) + np.array(scaled_diffs)) / 2
+    away_scores = (np.array(scaled_totals) - np.array(scaled_diffs)) / 2
+    home_scores = np.round(pricing_engine.apply_team_total_scaling(home_scores, is_home=True), 1)
+    away_scores = np.round(pricing_engine.apply_team_total_scaling(away_scores, is_home=False), 1)
+    return scaled_totals, scaled_diffs, home_scores, away_scores
+
+
+def priced_market_samples(raw_home_scores, raw_away_scores, benchmark, pricing_engine):
+    """Return the ``(home, away, totals, diffs)`` samples the full-game markets are priced from.
+
+    Totals are the sum of the scaled team scores and the runline reads the
+    scaled differentials (see ``core.adaptive_simulation.market_indicators``).
+    """
+    _, scaled_diffs, home_scores, away_scores = scale_game_scores(
+        raw_home_scores, raw_away_scores, benchmark, pricing_engine
+    )
+    return home_scores, away_scores, home_scores + away_scores, np.array(scaled_diffs)
+
+
+def full_game_total_probs(pmf, lines):
+    """Return ``(overs, unders)`` lists for the full-game total ``lines``.
+
+    Push handling for integer lines happens inside ``DiscretePMF.push_adjusted``.
+    """
+    overs, unders = pmf.push_adjusted(lines)
+    return overs.tolist(), unders.tolist()
+
+
 def extract_universal_markets(game_id, full_game_market, derivative_segments, run_distribution=None):
     from core.market_pricer import to_american_odds, adjust_for_push
-    from core.stats_tools import calculate_tail_probability
     from core.utils import normalize_to_abbreviation
 
     def build_entry(market, side, prob, odds):
@@ -128,22 +181,17 @@ def extract_universal_markets(game_id, full_game_market, derivative_segments, ru
 
     # === Totals
     if run_distribution is not None:
-        for line in [x / 2 for x in range(13, 26)]:  # 6.5 to 12.5
-            for side in ["Over", "Under"]:
-                label = f"{side} {line}"
-                prob = calculate_tail_probability(run_distribution, line, direction=side.lower())
-                odds = to_american_odds(prob)
-
-                # Handle push adjustment for integer totals
-                if line % 1 == 0:
-                    push_prob = calculate_tail_probability(run_distribution, line, direction="exact")
-                    over = calculate_tail_probability(run_distribution, line, direction="over")
-                    under = calculate_tail_probability(run_distribution, line, direction="under")
-                    adj_over, adj_under = adjust_for_push(over, under)
-                    prob = adj_over if side == "Over" else adj_under
-                    odds = to_american_odds(prob)
-
-                entries.append(build_entry("totals", label, prob, odds))
+        if not isinstance(run_distribution, DiscretePMF):
+            run_distribution = DiscretePMF.from_dict(run_distribution)
+        lines = [x / 2 for x in range(13, 26)]  # 6.5 to 12.5
+        overs = run_distribution.over(lines).tolist()
+        unders = run_distribution.under(lines).tolist()
+        for line, over, under in zip(lines, overs, unders):
+            # Handle push adjustment for integer totals
+            if line % 1 == 0:
+                over, under = adjust_for_push(over, under)
+            for side, prob in [("Over", over), ("Under", under)]:
+                entries.append(build_entry("totals", f"{side} {line}", prob, to_american_odds(prob)))
 
     # === Team Totals
     for raw_label, obj in full_game_market.get("team_totals", {}).items():
@@ -192,7 +240,40 @@ def extract_universal_markets(game_id, full_game_market, derivative_segments, ru
     return entries
 
 
-def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_threshold=None, export_json=None, n_simulations=10000):
+@perf.traced("simulate_distribution", game_arg="game_id")
+def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_threshold=None, export_json=None, n_simulations=10000, engine="batch", stats=None, seed=None, analytic=False, se_tolerance=None, variance_reduction=None, use_cache=True, slate=None):
+    """Simulate ``game_id`` and export priced markets.
+
+    ``engine="batch"`` advances all simulations together with the vectorized
+    engine; ``engine="legacy"`` runs ``simulate_game`` once per simulation in
+    summary-only mode.  Either way only the ``(n_sims, innings, 2)`` per-inning
+    run matrix and reliever-usage counters are kept per simulation.
+    ``stats`` may carry a preloaded ``(batter_stats, pitcher_stats)`` pair from
+    ``load_all_stats`` so slate runners only read the CSVs once.
+    ``seed`` (an int or ``SeedSequence``) seeds the single ``Generator`` used
+    for every draw, making repeated runs bit-identical.
+    ``analytic=True`` also solves the game exactly with ``core.markov_solver``
+    and stores the analytic vs simulated raw probabilities under
+    ``analytic_check`` in the export.
+    ``se_tolerance`` switches the batch engine to adaptive mode: games are
+    simulated in chunks until every priced market's standard error is within
+    the tolerance (``n_simulations`` is then ignored).  Some total line always
+    sits near 50%, so a game stops at about ``0.25 / se_tolerance**2`` sims
+    (see ``core.adaptive_simulation``).  The achieved standard errors are
+    exported under ``convergence`` either way; like the stopping rule, they
+    are taken on the scaled scores the markets are priced from.
+    ``variance_reduction`` names ``core.variance_reduction`` methods
+    (``"antithetic,stratified,control"`` or ``"all"``) for the batch engine;
+    every market is then priced from weighted PMFs and the per-market
+    standard errors and effective sample sizes are exported under
+    ``variance_reduction``.
+    With ``use_cache`` the run is skipped when the export at the target path
+    was produced from identical inputs (see ``core.sim_cache``); the existing
+    export is only re-touched.
+    ``slate`` is a ``core.game_asset_builder.SlateContext`` for the game's
+    date, shared by slate runners so the schedule, lineups, bullpens and
+    park factors are fetched once per slate rather than once per game.
+    """
     from core.market_pricer import to_american_odds
 
     benchmark_totals = {
@@ -249,9 +330,9 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
         dt = game_id_to_dt(game_id)
         start_time_iso = dt.isoformat() if dt else None
 
-    batter_stats, pitcher_stats = load_all_stats()
+    batter_stats, pitcher_stats = stats if stats is not None else load_all_stats()
     try:
-        assets = build_game_assets(game_id, batter_stats, pitcher_stats)
+        assets = build_game_assets(game_id, batter_stats, pitcher_stats, slate=slate)
         if assets is None:
             print(f"❌ build_game_assets() returned None.")
             return
@@ -311,19 +392,11 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
 
     # Environment
     park_name = get_park_name(game_id)
-    park_factors = get_park_factors(park_name)
-    cache_path = f"data/weather_cache/{park_name.replace(' ', '_')}.json"
+    park_factors = slate.park_factors_for(park_name) if slate is not None else get_park_factors(park_name)
     if not no_weather:
         try:
-            if os.path.exists(cache_path):
-                weather_profile = safe_load_json(cache_path)
-            else:
-                weather_profile = get_noaa_weather(park_name)
-            if not isinstance(weather_profile, dict):
-                weather_profile = get_noaa_weather(park_name)
-            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-            with open(cache_path, "w") as f:
-                json.dump(weather_profile, f, indent=2)
+            # Cached per park with a TTL that shortens as first pitch nears (see core.weather_cache)
+            weather_profile = default_weather_cache().get(park_name, start_time_iso)
         except Exception:
             weather_profile = {"wind_direction": "none", "wind_speed": 0, "temperature": 70, "humidity": 50}
     else:
@@ -364,37 +437,135 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
         f"   - Team Totals (Away): mean x{pricing_engine.away_mean_factor:.4f}, sd x{pricing_engine.away_std_factor:.4f}"
     )
 
+    vr_methods = parse_methods(variance_reduction)
+    if vr_methods and (engine == "legacy" or se_tolerance is not None):
+        logger.warning("⚠️ Variance reduction only applies to fixed-size batch runs — ignoring %s", ",".join(vr_methods))
+        vr_methods = ()
+
+    # Skip the run when the existing export was built from identical inputs
+    date_tag = "-".join(game_id.split("-")[:3])
+    target_path = export_json or os.path.join("backtest", "sims", date_tag, f"{game_id}.json")
+    fingerprint = sim_fingerprint(
+        assets,
+        env,
+        calibration,
+        n_simulations,
+        options={
+            "line": line,
+            "engine": engine,
+            "seed": seed,
+            "se_tolerance": se_tolerance,
+            "variance_reduction": list(vr_methods),
+            "analytic": analytic,
+            "weather": weather_profile,
+            "start_time_iso": start_time_iso,
+        },
+    )
+    if use_cache and is_cached_export(target_path, fingerprint):
+        touch_export(target_path)
+        print(f"\n♻️ Inputs unchanged — reusing {target_path}")
+        return
+
     # Run simulations
-    raw_home_scores, raw_away_scores, all_results = [], [], []
-    for i in range(n_simulations):
-        result = simulate_game(
-            home_lineup=lineups["home"],
-            away_lineup=lineups["away"],
-            home_pitcher=pitcher_data["home"],
-            away_pitcher=pitcher_data["away"],
+    sim_span = perf.begin("sim_loop", game_id)
+    rng = np.random.default_rng(seed)
+    if engine == "legacy":
+        sim_context = SimulationContext(rng)
+        pa_tables = build_game_pa_tables(
+            lineups["home"],
+            lineups["away"],
+            pitcher_data["home"],
+            pitcher_data["away"],
+            home_bullpen,
+            away_bullpen,
+            env,
+        )
+        batch = simulate_games_summary(
+            n_simulations,
+            lineups=lineups,
+            pitchers=pitcher_data,
+            bullpens={"home": home_bullpen, "away": away_bullpen},
+            env=env,
+            pa_tables=pa_tables,
+            sim_context=sim_context,
+        )
+    elif se_tolerance is not None:
+        batch = simulate_games_adaptive(
+            lineups,
+            pitcher_data,
+            {"home": home_bullpen, "away": away_bullpen},
+            env,
+            seed=rng,
+            tolerance=se_tolerance,
+            scale=lambda home, away: priced_market_samples(
+                home, away, benchmark_totals["full_game"], pricing_engine
+            ),
+        )
+        n_simulations = batch["convergence"]["n_simulations"]
+        print(f"🎯 Adaptive run stopped at {n_simulations} sims (max SE {batch['convergence']['max_standard_error']:.4f})")
+    elif vr_methods:
+        batch = simulate_games_vr(
+            n_simulations,
+            lineups=lineups,
+            pitchers=pitcher_data,
+            bullpens={"home": home_bullpen, "away": away_bullpen},
             env=env,
-            home_bullpen=home_bullpen,
-            away_bullpen=away_bullpen,
-            use_noise=True
+            seed=rng,
+            methods=vr_methods,
         )
-        raw_home_scores.append(result["home_score"])
-        raw_away_scores.append(result["away_score"])
-        all_results.append(result)
-
-        if i < 5:
-            print(f"\n🧪 Simulation #{i + 1}")
-            print(f"  ➤ Score: {away_abbr} {result['away_score']} — {home_abbr} {result['home_score']}")
-            print(f"  ➤ Innings played: {len(result['innings'])}")
-            print(f"  ➤ Away relievers used: {', '.join(result.get('used_away_relievers', [])) or 'None'}")
-            print(f"  ➤ Home relievers used: {', '.join(result.get('used_home_relievers', [])) or 'None'}")
-
-    # 🔁 Track reliever usage
+        report = batch["variance_reduction"]
+        n_simulations = report["n_simulations"]
+        print(
+            f"📉 Variance reduction ({'+'.join(report['methods']) or 'none'}): median x{report['median_variance_reduction']:.2f}, "
+            f"min effective sample size {report['min_effective_sample_size']} from {n_simulations} sims"
+        )
+    else:
+        batch = simulate_games_batch(
+            n_simulations,
+            lineups=lineups,
+            pitchers=pitcher_data,
+            bullpens={"home": home_bullpen, "away": away_bullpen},
+            env=env,
+            seed=rng,
+        )
+    sim_span.end()
+
+    # Market extraction: scaling, PMFs, pricing and summaries
+    extract_span = perf.begin("market_extraction", game_id)
+
+    # Per-inning runs (away=0, home=1) and reliever counters are all that is kept per sim
+    inning_runs = batch["inning_runs"]
+    # Per-sim pricing weights from variance reduction (None prices every sim equally)
+    sim_weights = batch.get("weights") if vr_methods else None
+    raw_home_scores = batch["home_score"].tolist()
+    raw_away_scores = batch["away_score"].tolist()
+
+    bullpen_names = {
+        "home": [rp.get("name", "Unknown") for rp in home_bullpen],
+        "away": [rp.get("name", "Unknown") for rp in away_bullpen],
+    }
+
+    def relievers_used(side, i):
+        counts = batch[f"{side}_reliever_usage"][i]
+        return [name for name, count in zip(bullpen_names[side], counts) for _ in range(count)]
+
+    for i in range(min(5, len(raw_home_scores))):
+        print(f"\n🧪 Simulation #{i + 1}")
+        print(f"  ➤ Score: {away_abbr} {raw_away_scores[i]} — {home_abbr} {raw_home_scores[i]}")
+        print(f"  ➤ Innings played: {int(batch['innings_played'][i])}")
+        print(f"  ➤ Away relievers used: {', '.join(relievers_used('away', i)) or 'None'}")
+        print(f"  ➤ Home relievers used: {', '.join(relievers_used('home', i)) or 'None'}")
+
+    # 🔁 Track reliever usage (number of sims in which each reliever appeared)
     reliever_usage = {"home": {}, "away": {}}
-    for res in all_results:
-        for side in ["home", "away"]:
-            used = res.get(f"used_{side}_relievers", [])
-            for name in set(used):
-                reliever_usage[side][name] = reliever_usage[side].get(name, 0) + 1
+    for side in ["home", "away"]:
+        usage = batch[f"{side}_reliever_usage"]
+        names = bullpen_names[side]
+        for name in dict.fromkeys(names):
+            cols = [j for j, other in enumerate(names) if other == name]
+            count = int((usage[:, cols] > 0).any(axis=1).sum())
+            if count:
+                reliever_usage[side][name] = count
 
     print("\n📊 Reliever Usage Summary:")
     for side in ["home", "away"]:
@@ -409,18 +580,17 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
             pct = 100 * count / n_simulations
             print(f"    - {name:20} → {pct:.1f}% of sims")
 
-    # Extract raw segment scores before calibration
+    # Extract raw segment scores before calibration; every segment market,
+    # team total and summary below reads from these
+    cum_runs = cumulative_runs(inning_runs)
     segment_raw = {}
     for cap, key in [(1, "f1"), (3, "f3"), (5, "f5"), (7, "f7")]:
-        home_seg = [sum(inn["home_runs"] for inn in r["innings"] if inn["inning"] <= cap) for r in all_results]
-        away_seg = [sum(inn["away_runs"] for inn in r["innings"] if inn["inning"] <= cap) for r in all_results]
-        totals_seg = [h + a for h, a in zip(home_seg, away_seg)]
-        diffs_seg = [h - a for h, a in zip(home_seg, away_seg)]
+        home_seg, away_seg = segment_scores(cum_runs, cap)
         segment_raw[key] = {
-            "total": totals_seg,
-            "diff": diffs_seg,
-            "home": home_seg,
-            "away": away_seg,
+            "total": (home_seg + away_seg).tolist(),
+            "diff": (home_seg - away_seg).tolist(),
+            "home": home_seg.tolist(),
+            "away": away_seg.tolist(),
         }
 
     # Raw distributions
@@ -449,14 +619,8 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
             "std": float(np.std(data["diff"])),
         }
 
-    scaled_totals = scale_distribution(
-        raw_totals,
-        target_mean=benchmark_totals["full_game"]["mean_total"],
-        target_sd=benchmark_totals["full_game"]["std_total"],
-    )
-    scaled_diffs = scale_distribution(
-        raw_diffs,
-        target_sd=benchmark_totals["full_game"]["std_total"],
+    scaled_totals, scaled_diffs, home_scores, away_scores = scale_game_scores(
+        raw_home_scores, raw_away_scores, benchmark_totals["full_game"], pricing_engine
     )
     scaled_distributions = {
         "totals": {
@@ -482,13 +646,6 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
         f"Raw SD: {np.std(raw_distributions['run_diffs']['values']):.2f} → Scaled SD: {np.std(scaled_distributions['run_diffs']['values']):.2f}"
     )
 
-    home_scores = [(t + d) / 2 for t, d in zip(scaled_totals, scaled_diffs)]
-    away_scores = [(t - d) / 2 for t, d in zip(scaled_totals, scaled_diffs)]
-    home_scores = pricing_engine.apply_team_total_scaling(home_scores, is_home=True)
-    away_scores = pricing_engine.apply_team_total_scaling(away_scores, is_home=False)
-    home_scores = [round(x, 1) for x in home_scores]
-    away_scores = [round(x, 1) for x in away_scores]
-
     # Print basic summary
     print(f"\n🎯 Scaled Output:")
     print(f"   - Home Mean Score:  {np.mean(home_scores):.2f}")
@@ -498,21 +655,28 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
     # Compute PMFs
     total = np.array(home_scores) + np.array(away_scores)
     run_diff = np.array(scaled_distributions["run_diffs"]["values"])
-    run_pmf_rounded = summarize_pmf(np.round(total).astype(int))
-    run_pmf_raw = summarize_pmf(np.round(raw_distributions["totals"]["values"]).astype(int))
-    run_diff_pmf = summarize_pmf(np.round(run_diff).astype(int))
+    run_pmf_rounded = DiscretePMF.from_values(total, weights=sim_weights)
+    run_pmf_raw = DiscretePMF.from_values(raw_distributions["totals"]["values"], weights=sim_weights)
+    run_diff_pmf = DiscretePMF.from_values(run_diff, weights=sim_weights)
+
+    # Standard errors of the priced (scaled) markets; adaptive runs already
+    # computed them on the same samples when deciding to stop
+    if engine != "legacy" and se_tolerance is not None:
+        convergence = batch["convergence"]
+    else:
+        convergence = convergence_report(home_scores, away_scores, totals=total, diffs=run_diff)
 
     pmfs = {
         "totals": {
             "full_game": {
-                "raw": summarize_pmf(np.round(raw_distributions["totals"]["values"]).astype(int)),
-                "scaled": run_pmf_rounded,
+                "raw": run_pmf_raw.to_dict(),
+                "scaled": run_pmf_rounded.to_dict(),
             }
         },
         "spreads": {
             "full_game": {
-                "raw": summarize_pmf(np.round(raw_distributions["run_diffs"]["values"]).astype(int)),
-                "scaled": run_diff_pmf,
+                "raw": DiscretePMF.from_values(raw_distributions["run_diffs"]["values"], weights=sim_weights).to_dict(),
+                "scaled": run_diff_pmf.to_dict(),
             }
         },
     }
@@ -520,9 +684,10 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
     # === Build Full-Game Market with Alt Lines ===
     runline_dict = {}
     spread_lines = [-2.5, -1.5, -0.5, 0.5, 1.5, 2.5]
-    for line in spread_lines:
+    home_minus_probs = run_diff_pmf.over(spread_lines).tolist()
+    away_minus_probs = run_diff_pmf.under([-x for x in spread_lines]).tolist()
+    for line, prob_home_minus, prob_away_minus in zip(spread_lines, home_minus_probs, away_minus_probs):
         # Home -line (covering spread)
-        prob_home_minus = calculate_tail_probability(run_diff_pmf, line, direction="over")
         prob_away_plus = 1 - prob_home_minus
 
         runline_dict[f"{home_abbr} -{line}"] = {
@@ -535,7 +700,6 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
         }
 
         # Away -line (covering spread)
-        prob_away_minus = calculate_tail_probability(run_diff_pmf, -line, direction="under")
         prob_home_plus = 1 - prob_away_minus
 
         runline_dict[f"{away_abbr} -{line}"] = {
@@ -550,15 +714,8 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
 
 
     total_dict = {}
-    for line in [x / 2 for x in range(13, 26)]:  # 6.5 to 12.5
-        over = calculate_tail_probability(run_pmf_rounded, line, direction="over")
-        under = 1 - over
-        if line % 1 == 0:
-            # Push handling for integer lines
-            push = calculate_tail_probability(run_pmf_rounded, line, direction="exact")
-            denom = max(1.0 - push, 1e-6)
-            over /= denom
-            under /= denom
+    total_lines = [x / 2 for x in range(13, 26)]  # 6.5 to 12.5
+    for line, over, under in zip(total_lines, *full_game_total_probs(run_pmf_rounded, total_lines)):
         total_dict[f"Over {line}"] = {
             "prob": round(over, 4),
             "odds": to_american_odds(over)
@@ -568,7 +725,7 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
             "odds": to_american_odds(under)
         }
 
-    moneyline = compute_moneyline(home_scores, away_scores)
+    moneyline = compute_moneyline(home_scores, away_scores, weights=sim_weights)
     moneyline_dict = {
         away_abbr: {
             "prob": moneyline["away"]["prob"],
@@ -579,17 +736,21 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
             "odds": to_american_odds(moneyline["home"]["prob"])
         }
     }
-    prob_over = calculate_tail_probability(run_pmf_rounded, threshold=line, direction="over")
+    prob_over = run_pmf_rounded.over(line)
 
     # === Team Totals — Full Game ===
     team_totals_dict = {}
     full_home_scores = home_scores
     full_away_scores = away_scores
 
-    for line in [1.5, 2.5, 3.5, 4.5, 5.5, 6.5]:
-        for team_abbr, scores in [(home_abbr, full_home_scores), (away_abbr, full_away_scores)]:
-            pmf = summarize_pmf(np.round(scores).astype(int))
-            p_over = calculate_tail_probability(pmf, line, direction="over")
+    team_total_lines = [1.5, 2.5, 3.5, 4.5, 5.5, 6.5]
+    team_overs = {
+        team_abbr: DiscretePMF.from_values(scores, weights=sim_weights).over(team_total_lines).tolist()
+        for team_abbr, scores in [(home_abbr, full_home_scores), (away_abbr, full_away_scores)]
+    }
+    for i, line in enumerate(team_total_lines):
+        for team_abbr in [home_abbr, away_abbr]:
+            p_over = team_overs[team_abbr][i]
             p_under = 1 - p_over
             over_label = normalize_label_for_odds(f"{team_abbr} Over", "team_totals", line)
             under_label = normalize_label_for_odds(f"{team_abbr} Under", "team_totals", line)
@@ -657,7 +818,7 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
     for seg_key, config in segment_configs.items():
         label = config["label"]
         innings_cap = config["innings"]
-        stats = compute_partial_derivatives(all_results, innings_cap)
+        stats = compute_partial_derivatives(cum_runs, innings_cap, weights=sim_weights)
         seg = {"label": label, "markets": {}}
 
         seg_id = key_map.get(seg_key)
@@ -686,16 +847,16 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
             "std": float(np.std(seg_diffs_scaled)),
         }
 
-        pmf_total_seg = summarize_pmf(np.round(scaled_distributions[f"totals_{seg_key_name}"]["values"]).astype(int))
-        pmf_diff_seg = summarize_pmf(np.round(scaled_distributions[f"run_diffs_{seg_key_name}"]["values"]).astype(int))
+        pmf_total_seg = DiscretePMF.from_values(scaled_distributions[f"totals_{seg_key_name}"]["values"], weights=sim_weights)
+        pmf_diff_seg = DiscretePMF.from_values(scaled_distributions[f"run_diffs_{seg_key_name}"]["values"], weights=sim_weights)
 
         pmfs["totals"][seg_key_name] = {
-            "raw": summarize_pmf(np.round(raw_distributions[f"totals_{seg_key_name}"]["values"]).astype(int)),
-            "scaled": pmf_total_seg,
+            "raw": DiscretePMF.from_values(raw_distributions[f"totals_{seg_key_name}"]["values"], weights=sim_weights).to_dict(),
+            "scaled": pmf_total_seg.to_dict(),
         }
         pmfs["spreads"][seg_key_name] = {
-            "raw": summarize_pmf(np.round(raw_distributions[f"run_diffs_{seg_key_name}"]["values"]).astype(int)),
-            "scaled": pmf_diff_seg,
+            "raw": DiscretePMF.from_values(raw_distributions[f"run_diffs_{seg_key_name}"]["values"], weights=sim_weights).to_dict(),
+            "scaled": pmf_diff_seg.to_dict(),
         }
 
         print(f"\n📊 PMF: totals_{seg_key_name}")
@@ -711,8 +872,8 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
         )
 
         totals = {}
-        for line in config.get("total_lines", []):
-            over_prob = calculate_tail_probability(pmf_total_seg, line, direction="over")
+        seg_total_lines = config.get("total_lines", [])
+        for line, over_prob in zip(seg_total_lines, pmf_total_seg.over(seg_total_lines).tolist()):
             under_prob = 1 - over_prob
             totals[f"Over {line}"] = {"prob": round(over_prob, 4), "fair_odds": to_american_odds(over_prob)}
             totals[f"Under {line}"] = {"prob": round(under_prob, 4), "fair_odds": to_american_odds(under_prob)}
@@ -720,7 +881,7 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
 
         if seg_key == "F1":
             # Special case: "Score in 1st inning"
-            p = calculate_tail_probability(pmf_total_seg, 0.5, direction="over")
+            p = pmf_total_seg.over(0.5)
             seg["markets"]["totals"] = {
                 "Over 0.5": {"prob": p, "fair_odds": to_american_odds(p)},
                 "Under 0.5": {"prob": 1 - p, "fair_odds": to_american_odds(1 - p)}
@@ -735,9 +896,11 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
 
             # Spreads
             spreads = {}
-            for line in config.get("spread_lines", []):
+            seg_spread_lines = config.get("spread_lines", [])
+            home_minus_probs = pmf_diff_seg.over(seg_spread_lines).tolist()
+            away_minus_probs = pmf_diff_seg.under([-x for x in seg_spread_lines]).tolist()
+            for line, prob_home_minus, prob_away_minus in zip(seg_spread_lines, home_minus_probs, away_minus_probs):
                 # Home -line
-                prob_home_minus = calculate_tail_probability(pmf_diff_seg, line, direction="over")
                 prob_away_plus = 1 - prob_home_minus
 
                 spreads[f"{home_abbr} -{line}"] = {
@@ -750,7 +913,6 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
                 }
 
                 # Away -line
-                prob_away_minus = calculate_tail_probability(pmf_diff_seg, -line, direction="under")
                 prob_home_plus = 1 - prob_away_minus
 
                 spreads[f"{away_abbr} -{line}"] = {
@@ -767,15 +929,15 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
 
             # Team Totals
             team_totals = {}
-            home_scores = [sum(inn["home_runs"] for inn in r["innings"] if inn["inning"] <= innings_cap) for r in all_results]
-            away_scores = [sum(inn["away_runs"] for inn in r["innings"] if inn["inning"] <= innings_cap) for r in all_results]
-            home_scores = pricing_engine.apply_team_total_scaling(home_scores, is_home=True)
-            away_scores = pricing_engine.apply_team_total_scaling(away_scores, is_home=False)
-
-            for line in config.get("team_total_lines", []):
-                for team_abbr, scores in [(home_abbr, home_scores), (away_abbr, away_scores)]:
-                    pmf = summarize_pmf(np.round(scores).astype(int))
-                    p_over = calculate_tail_probability(pmf, line, direction="over")
+            seg_team_lines = config.get("team_total_lines", [])
+            team_overs = {
+                home_abbr: pricing_engine.team_total_pmf(segment_raw[seg_id]["home"], is_home=True, weights=sim_weights).over(seg_team_lines).tolist(),
+                away_abbr: pricing_engine.team_total_pmf(segment_raw[seg_id]["away"], is_home=False, weights=sim_weights).over(seg_team_lines).tolist(),
+            }
+
+            for i, line in enumerate(seg_team_lines):
+                for team_abbr in [home_abbr, away_abbr]:
+                    p_over = team_overs[team_abbr][i]
                     p_under = 1 - p_over
                     over_label = normalize_label_for_odds(f"{team_abbr} Over", "team_totals", line)
                     under_label = normalize_label_for_odds(f"{team_abbr} Under", "team_totals", line)
@@ -793,24 +955,18 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
 
         derivative_segments[label] = seg
 
-    # === Output JSON ===
-    date_tag = "-".join(game_id.split("-")[:3])
-    target_path = export_json or os.path.join("backtest", "sims", date_tag, f"{game_id}.json")
-
     # 📊 Segment-level summaries
-    def inning_summary(inning_cap, label, benchmark=None):
-        home = [sum(inn["home_runs"] for inn in r["innings"] if inn["inning"] <= inning_cap) for r in all_results]
-        away = [sum(inn["away_runs"] for inn in r["innings"] if inn["inning"] <= inning_cap) for r in all_results]
-        home = pricing_engine.apply_team_total_scaling(home, is_home=True)
-        away = pricing_engine.apply_team_total_scaling(away, is_home=False)
+    def inning_summary(seg_id, label, benchmark=None):
+        home = pricing_engine.apply_team_total_scaling(segment_raw[seg_id]["home"], is_home=True)
+        away = pricing_engine.apply_team_total_scaling(segment_raw[seg_id]["away"], is_home=False)
         summary = summarize_distribution(home, away, label, benchmark=benchmark)
         return summary, home, away
 
     summary_full = summarize_distribution(raw_home_scores, raw_away_scores, label="Full Game", benchmark=benchmark_totals["full_game"])
-    summary_f1, home_f1, away_f1 = inning_summary(1, "First Inning", benchmark=benchmark_totals["f1"])
-    summary_f3, home_f3, away_f3 = inning_summary(3, "First 3 Innings", benchmark=benchmark_totals["f3"])
-    summary_f5, home_f5, away_f5 = inning_summary(5, "First 5 Innings", benchmark=benchmark_totals["f5"])
-    summary_f7, home_f7, away_f7 = inning_summary(7, "First 7 Innings", benchmark=benchmark_totals["f7"])
+    summary_f1, home_f1, away_f1 = inning_summary("f1", "First Inning", benchmark=benchmark_totals["f1"])
+    summary_f3, home_f3, away_f3 = inning_summary("f3", "First 3 Innings", benchmark=benchmark_totals["f3"])
+    summary_f5, home_f5, away_f5 = inning_summary("f5", "First 5 Innings", benchmark=benchmark_totals["f5"])
+    summary_f7, home_f7, away_f7 = inning_summary("f7", "First 7 Innings", benchmark=benchmark_totals["f7"])
 
     # ✅ Extract markets into memory first
     markets_debug = extract_universal_markets(
@@ -821,18 +977,21 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
     )
 
     print(f"\n🧪 Market Entries Extracted: {len(markets_debug)}")
+    extract_span.end()
 
     output = {
         "home_score": float(np.mean(raw_home_scores)),
         "away_score": float(np.mean(raw_away_scores)),
         "start_time_iso": start_time_iso,
-        "run_distribution": run_pmf_rounded,
-        "run_distribution_raw": run_pmf_raw,
-        "run_diff_distribution": run_diff_pmf,
+        "run_distribution": run_pmf_rounded.to_dict(),
+        "run_distribution_raw": run_pmf_raw.to_dict(),
+        "run_diff_distribution": run_diff_pmf.to_dict(),
         "pmfs": pmfs,
         "raw_distributions": raw_distributions,
         "scaled_distributions": scaled_distributions,
         "markets": markets_debug,
+        "convergence": convergence,
+        "sim_fingerprint": fingerprint,
         "summary_metrics": {
             "full_game": summary_full,
             "f1": summary_f1,
@@ -841,22 +1000,35 @@ def simulate_distribution(game_id, line, debug=False, no_weather=False, edge_thr
             "f7": summary_f7
         }
     }
-
-    # ✅ Save output atomically
-    os.makedirs(os.path.dirname(target_path), exist_ok=True)
-    with tempfile.NamedTemporaryFile("w", dir=os.path.dirname(target_path), delete=False, suffix=".tmp") as tmpf:
-        json.dump(output, tmpf, indent=2)
-        temp_path = tmpf.name
-    os.replace(temp_path, target_path)
-
-    # Write simplified snapshot for downstream comparison
-    snapshot_dict = {
-        f"{e['market']}:{e['side']}": {"fair_odds": e.get('fair_odds'), "ev_percent": e.get('ev_percent')}
-        for e in markets_debug
-    }
-    os.makedirs(os.path.dirname(SNAPSHOT_PATH), exist_ok=True)
-    with open(SNAPSHOT_PATH, "w") as f:
-        json.dump(snapshot_dict, f, indent=2)
+    if vr_methods:
+        output["variance_reduction"] = batch["variance_reduction"]
+
+    if analytic:
+        solution = solve_game(
+            lineups,
+            pitcher_data,
+            {"home": home_bullpen, "away": away_bullpen},
+            env,
+        )
+        output["analytic_check"] = compare_with_simulation(
+            analytic_market_probs(solution), raw_home_scores, raw_away_scores
+        )
+        print("\n🧮 Analytic vs Simulated (raw):")
+        for key, row in output["analytic_check"].items():
+            print(f"  ➤ {key:24} analytic={row['analytic']:.4f}  sim={row['simulated']:.4f}  Δ={row['diff']:+.4f}")
+
+    with perf.span("export", game_id):
+        # ✅ Save manifest + distribution sidecar atomically
+        write_sim_export(output, target_path)
+
+        # Write simplified snapshot for downstream comparison
+        snapshot_dict = {
+            f"{e['market']}:{e['side']}": {"fair_odds": e.get('fair_odds'), "ev_percent": e.get('ev_percent')}
+            for e in markets_debug
+        }
+        os.makedirs(os.path.dirname(SNAPSHOT_PATH), exist_ok=True)
+        with open(SNAPSHOT_PATH, "w") as f:
+            json.dump(snapshot_dict, f, indent=2)
 
     # 🧠 Fatigue debug summary
     print_fatigue_summary(pitcher_data["home"], f"{pitcher_data['home']['name']} (Home Starter)")
@@ -908,30 +1080,109 @@ def summarize_distribution(home_scores, away_scores, label="Full Game", benchmar
 
 
 
+# ----------------------------
+# CLI HELP
+# ----------------------------
+def print_help():
+    print(f"""
+Usage: python {os.path.basename(__file__)} GAME_ID [LINE] [options]
+       python {os.path.basename(__file__)} --list [--days-ahead=INT]
+
+Options:
+  GAME_ID                       Game to simulate (e.g. 2025-06-09-MIL@CIN-T1905)
+  LINE                          Total line (default: 9.5)
+  --list                        List upcoming game IDs and exit
+  --days-ahead=INT              Look ahead days when listing games (default: 1)
+  --debug                       Enable debug output
+  --no-weather                  Disable weather adjustments
+  --edge-threshold=FLOAT        Minimum edge threshold (e.g., 0.05)
+  --export-json=PATH            Write the sim export to PATH
+  --seed=INT                    Seed the run for bit-identical repeats
+  --se-tol=FLOAT                Adaptive sim count: stop once every market's SE is below FLOAT (about 0.25/FLOAT^2 sims)
+  --variance-reduction=METHODS  Price from variance-reduced weights (antithetic,stratified,control or all)
+  --analytic                    Cross-check raw probabilities against the exact Markov solver
+  --legacy-engine               Use the per-game simulator instead of the batch engine
+  --no-cache                    Re-simulate even when the game's inputs are unchanged
+  --mode full_slate             Run by date: a leading YYYY-MM-DD argument, else today
+  --help                        Show this help message and exit
+"""
+)
+
+
+def _usage_error(message):
+    print(f"❌ {message}")
+    print_help()
+    sys.exit(2)
+
+
 # ----------------------------
 # CLI ARG PARSING
 # ----------------------------
 def resolve_game_id_from_args():
+    """Parse ``sys.argv``; unknown flags and malformed values exit with usage.
+
+    Returns ``(game_id, debug, no_weather, line, edge_threshold, export_json,
+    export_folder, seed, se_tolerance, engine, analytic, variance_reduction,
+    use_cache)``.
+    """
     import datetime
     import re
     args = sys.argv[1:]
+    if "--help" in args:
+        print_help()
+        sys.exit(0)
+
     debug = "--debug" in args
     no_weather = "--no-weather" in args
+    engine = "legacy" if "--legacy-engine" in args else "batch"
+    analytic = "--analytic" in args
+    use_cache = "--no-cache" not in args
     export_json = None
     export_folder = "backtest/sims"  # default folder path
     edge_threshold = None
     days_ahead = 1
-
-    # Handle optional argument values like --export-json=path or --edge-threshold=0.05
+    seed = None
+    se_tolerance = None
+    variance_reduction = None
+    flags = {"--debug", "--no-weather", "--legacy-engine", "--analytic", "--no-cache", "--list", "--mode"}
+
+    # Valued options take ``--name=value``
+    valued = {
+        "--export-json": str,
+        "--edge-threshold": float,
+        "--days-ahead": int,
+        "--seed": int,
+        "--se-tol": float,
+        "--variance-reduction": str,
+    }
+    values = {}
+    cleaned = []
     for arg in args:
-        if arg.startswith("--export-json="):
-            export_json = arg.split("=")[1]
-        elif arg.startswith("--edge-threshold="):
-            edge_threshold = float(arg.split("=")[1])
-        elif arg.startswith("--days-ahead="):
-            days_ahead = int(arg.split("=")[1])
-
-    cleaned = [arg for arg in args if not arg.startswith("--")]
+        name, has_value, value = arg.partition("=")
+        if name in valued and has_value:
+            try:
+                values[name] = valued[name](value)
+            except ValueError:
+                _usage_error(f"Invalid value for {name}: {value!r}")
+        elif name in valued:
+            _usage_error(f"{name} expects {name}=VALUE")
+        elif arg.startswith("-") and arg not in flags:
+            _usage_error(f"Unknown option: {arg}")
+        elif not arg.startswith("--"):
+            cleaned.append(arg)
+
+    export_json = values.get("--export-json", export_json)
+    edge_threshold = values.get("--edge-threshold", edge_threshold)
+    days_ahead = values.get("--days-ahead", days_ahead)
+    seed = values.get("--seed", seed)
+    se_tolerance = values.get("--se-tol", se_tolerance)
+    variance_reduction = values.get("--variance-reduction", variance_reduction)
+    if variance_reduction is not None:
+        try:
+            parse_methods(variance_reduction)
+        except ValueError as e:
+            _usage_error(str(e))
+    options = (seed, se_tolerance, engine, analytic, variance_reduction, use_cache)
 
     # ✅ Handle --list or no args provided
     if "--list" in args or (not cleaned and "--mode" not in args):
@@ -945,16 +1196,19 @@ def resolve_game_id_from_args():
     # ✅ Full slate mode (by date)
     if "--mode" in args and "full_slate" in args:
         if len(cleaned) >= 1 and re.match(r"^\d{4}-\d{2}-\d{2}$", cleaned[0]):
-            return cleaned[0], debug, no_weather, 9.5, edge_threshold, export_json, export_folder
+            return (cleaned[0], debug, no_weather, 9.5, edge_threshold, export_json, export_folder) + options
         else:
             today = str(datetime.date.today())
-            return today, debug, no_weather, 9.5, edge_threshold, export_json, export_folder
+            return (today, debug, no_weather, 9.5, edge_threshold, export_json, export_folder) + options
 
     # ✅ Distribution mode (expects game ID + optional line)
     gid = cleaned[0] if cleaned else None
-    line = float(cleaned[1]) if len(cleaned) > 1 else 9.5
+    try:
+        line = float(cleaned[1]) if len(cleaned) > 1 else 9.5
+    except ValueError:
+        _usage_error(f"Invalid total line: {cleaned[1]!r}")
 
-    return gid, debug, no_weather, line, edge_threshold, export_json, export_folder
+    return (gid, debug, no_weather, line, edge_threshold, export_json, export_folder) + options
 
 
 
@@ -962,31 +1216,46 @@ def resolve_game_id_from_args():
 # ----------------------------
 # PARTIAL DERIVATIVES
 # ----------------------------
-def compute_partial_derivatives(all_results, innings_range):
-    total_runs=[]; wh=0; wa=0; pushes=0; rl_away=0
-    for res in all_results:
-        h=a=0
-        for inn in res['innings']:
-            if inn['inning']>innings_range: break
-            h+=inn['home_runs']; a+=inn['away_runs']
-        total_runs.append(h+a)
-        if h>a: wh+=1
-        elif a>h: wa+=1
-        else: pushes+=1
-        if a+0.5>h: rl_away+=1
-    sims=len(all_results)
-    return {"avg_total":round(np.mean(total_runs),2),
-            "moneyline":{"home":round(wh/sims,3),"away":round(wa/sims,3),"push":round(pushes/sims,3)},
-            "total_overs":{"{:.1f}".format(np.floor(np.mean(total_runs))+0.5):round(np.mean(np.array(total_runs)>(np.floor(np.mean(total_runs))+0.5)),3)},
-            "runline":{"away_plus_half":round(rl_away/sims,3)},
-            "score_1plus":round(np.mean(np.array(total_runs)>0),3)}
+def cumulative_runs(inning_runs):
+    """Return running away/home scores after each inning.
+
+    ``inning_runs`` is the ``(n_sims, innings, 2)`` matrix returned by the
+    game engines (away runs at index 0, home at index 1); the result has the
+    same shape with ``[:, k - 1]`` holding the score through ``k`` innings.
+    """
+    return np.cumsum(inning_runs, axis=1, dtype=np.int16)
+
+
+def segment_scores(cum_runs, innings_cap):
+    """Return ``(home, away)`` score arrays through ``innings_cap`` innings."""
+    if not cum_runs.shape[1]:
+        zeros = np.zeros(cum_runs.shape[0], dtype=cum_runs.dtype)
+        return zeros, zeros
+    col = cum_runs[:, min(innings_cap, cum_runs.shape[1]) - 1]
+    return col[:, 1], col[:, 0]
+
+
+def compute_partial_derivatives(cum_runs, innings_range, weights=None):
+    h, a = segment_scores(cum_runs, innings_range)
+    total_runs = h.astype(np.int64) + a
+    share = lambda hits: round(float(np.average(hits, weights=weights)), 3)
+    avg_total = np.average(total_runs, weights=weights)
+    over_line = np.floor(avg_total) + 0.5
+    return {"avg_total":round(avg_total,2),
+            "moneyline":{"home":share(h > a),"away":share(a > h),"push":share(h == a)},
+            "total_overs":{"{:.1f}".format(over_line):share(total_runs > over_line)},
+            "runline":{"away_plus_half":share(a + 0.5 > h)},
+            "score_1plus":share(total_runs > 0)}
 
 
 # ----------------------------
 # MAIN ENTRYPOINT
 # ----------------------------
 if __name__ == "__main__":
-    gid, debug, no_weather, line, edge_threshold, export_json, export_folder = resolve_game_id_from_args()
+    (
+        gid, debug, no_weather, line, edge_threshold, export_json, export_folder,
+        seed, se_tolerance, engine, analytic, variance_reduction, use_cache,
+    ) = resolve_game_id_from_args()
 
     simulate_distribution(
         game_id=gid,
@@ -994,5 +1263,11 @@ if __name__ == "__main__":
         debug=debug,
         no_weather=no_weather,
         edge_threshold=edge_threshold,
-        export_json=export_json
-    )
\ No newline at end of file
+        export_json=export_json,
+        engine=engine,
+        seed=seed,
+        analytic=analytic,
+        se_tolerance=se_tolerance,
+        variance_reduction=variance_reduction,
+        use_cache=use_cache,
+    )
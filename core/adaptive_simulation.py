@@ -0,0 +1,170 @@
+# adaptive_simulation.py
+"""Convergence-based simulation counts for the batch engine.
+
+Instead of a fixed number of games, ``simulate_games_adaptive`` simulates in
+chunks and stops once the standard error of every priced binary market
+(moneyline, full-game totals, runlines and team totals) is within a
+probability tolerance.  With a ``scale`` callback the standard errors are
+taken on the scaled samples that are actually priced rather than the raw
+scores.
+
+A market at probability ``p`` needs about ``p(1-p) / tolerance**2`` games,
+and ``TOTAL_LINES`` (6.5 to 12.5) always puts one total line near 50%.  So
+the stopping count is close to ``0.25 / tolerance**2`` for nearly every
+game, lopsided or not: about 4,400 at ``DEFAULT_SE_TOLERANCE`` (0.0075),
+10,000 at 0.005 (the precision of the old fixed count) and 2,500 at 0.01.
+Work is saved by accepting a looser, guaranteed precision, not by stopping
+early on particular games.
+"""
+
+from core.config import DEBUG_MODE, VERBOSE_MODE
+import numpy as np
+
+from core.batch_game_simulator import simulate_games_batch
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+TOTAL_LINES = [x / 2 for x in range(13, 26)]            # 6.5 to 12.5
+SPREAD_LINES = [-2.5, -1.5, -0.5, 0.5, 1.5, 2.5]
+TEAM_TOTAL_LINES = [1.5, 2.5, 3.5, 4.5, 5.5, 6.5]
+DEFAULT_SE_TOLERANCE = 0.0075                           # ~4,400 sims for any game
+CHUNK_SIZE = 2000
+MIN_SIMULATIONS = 2000
+MAX_SIMULATIONS = 50000
+
+
+def market_indicators(home_scores, away_scores, totals=None, diffs=None):
+    """Return ``(keys, hits)`` for every priced binary market.
+
+    ``hits`` is an ``(n_sims, len(keys))`` boolean array marking the sims in
+    which each market's listed side wins.  Keys follow
+    ``compare_with_simulation``: ``h2h_home``, ``over_<line>``,
+    ``home_margin_over_<line>`` and ``<side>_over_<line>`` for team totals.
+
+    ``totals`` and ``diffs`` default to the sum and difference of the scores;
+    pass them when they are scaled separately.  Totals, margins and team
+    scores are rounded to whole runs the way ``DiscretePMF.from_values``
+    prices them, while the moneyline compares the unrounded scores like
+    ``compute_moneyline``.
+    """
+    home = np.asarray(home_scores)
+    away = np.asarray(away_scores)
+    totals = np.round(home + away if totals is None else np.asarray(totals))
+    diffs = np.round(home - away if diffs is None else np.asarray(diffs))
+
+    keys = ["h2h_home"]
+    columns = [(home > away)[:, None]]
+    keys += [f"over_{line}" for line in TOTAL_LINES]
+    columns.append(totals[:, None] > np.array(TOTAL_LINES))
+    keys += [f"home_margin_over_{line}" for line in SPREAD_LINES]
+    columns.append(diffs[:, None] > np.array(SPREAD_LINES))
+    for side, scores in (("home", np.round(home)), ("away", np.round(away))):
+        keys += [f"{side}_over_{line}" for line in TEAM_TOTAL_LINES]
+        columns.append(scores[:, None] > np.array(TEAM_TOTAL_LINES))
+    return keys, np.hstack(columns)
+
+
+def market_probabilities(home_scores, away_scores, totals=None, diffs=None):
+    """Return ``{market_key: probability}`` for every priced binary market.
+
+    The complementary side of each market shares its standard error, so only
+    one side is listed (see ``market_indicators``).
+    """
+    keys, hits = market_indicators(home_scores, away_scores, totals, diffs)
+    return {key: float(p) for key, p in zip(keys, hits.mean(axis=0))}
+
+
+def market_standard_errors(home_scores, away_scores, totals=None, diffs=None):
+    """Return ``{market_key: standard error}`` of each simulated market probability."""
+    n = len(home_scores)
+    if not n:
+        return {}
+    return {
+        key: float(np.sqrt(p * (1 - p) / n))
+        for key, p in market_probabilities(home_scores, away_scores, totals, diffs).items()
+    }
+
+
+def convergence_report(home_scores, away_scores, tolerance=None, totals=None, diffs=None):
+    """Return the per-market standard-error summary stored in sim exports.
+
+    ``converged`` is ``None`` when no ``tolerance`` applies (fixed-count runs).
+    ``totals``/``diffs`` are as for ``market_indicators``.
+    """
+    errors = market_standard_errors(home_scores, away_scores, totals, diffs)
+    worst = max(errors, key=errors.get)
+    return {
+        "n_simulations": len(home_scores),
+        "tolerance": tolerance,
+        "converged": None if tolerance is None else errors[worst] <= tolerance,
+        "max_standard_error": round(errors[worst], 5),
+        "worst_market": worst,
+        "standard_errors": {key: round(se, 5) for key, se in errors.items()},
+    }
+
+
+def concat_batches(batches):
+    """Join ``simulate_games_batch`` results, padding ``inning_runs`` to the widest chunk."""
+    width = max(b["inning_runs"].shape[1] for b in batches)
+    inning_runs = np.concatenate([
+        np.pad(b["inning_runs"], ((0, 0), (0, width - b["inning_runs"].shape[1]), (0, 0)))
+        for b in batches
+    ])
+    joined = {"inning_runs": inning_runs}
+    for key in ("home_score", "away_score", "innings_played", "home_reliever_usage", "away_reliever_usage"):
+        joined[key] = np.concatenate([b[key] for b in batches])
+    return joined
+
+
+def simulate_games_adaptive(
+    lineups,
+    pitchers,
+    bullpens=None,
+    env=None,
+    seed=None,
+    tolerance=DEFAULT_SE_TOLERANCE,
+    chunk_size=CHUNK_SIZE,
+    min_simulations=MIN_SIMULATIONS,
+    max_simulations=MAX_SIMULATIONS,
+    scale=None,
+):
+    """Simulate in chunks until every market's standard error is within ``tolerance``.
+
+    Arguments before ``tolerance`` mirror ``simulate_games_batch``; a single
+    ``Generator`` built from ``seed`` feeds every chunk, so seeded runs stop at
+    the same count with identical draws.  ``scale`` optionally maps the raw
+    ``(home, away)`` final scores of all games so far to the ``(home, away,
+    totals, diffs)`` samples that get priced (see ``market_indicators``); the
+    stopping rule and the report then use those.  Returns the joined batch
+    dict with an extra ``convergence`` entry from ``convergence_report``.
+    """
+    rng = np.random.default_rng(seed)
+    batches = []
+    n = 0
+    while n < max_simulations:
+        size = min(chunk_size, max_simulations - n)
+        batches.append(simulate_games_batch(size, lineups, pitchers, bullpens, env, seed=rng))
+        n += size
+        home = np.concatenate([b["home_score"] for b in batches])
+        away = np.concatenate([b["away_score"] for b in batches])
+        totals = diffs = None
+        if scale is not None:
+            home, away, totals, diffs = scale(home, away)
+        if n >= min_simulations and max(market_standard_errors(home, away, totals, diffs).values()) <= tolerance:
+            break
+
+    result = concat_batches(batches)
+    report = convergence_report(home, away, tolerance, totals, diffs)
+    if not report["converged"]:
+        logger.warning(
+            "⚠️ Stopped at %d sims with SE %.4f on %s (tolerance %.4f)",
+            n, report["max_standard_error"], report["worst_market"], tolerance,
+        )
+    elif DEBUG_MODE:
+        logger.debug(
+            "✅ Converged after %d sims (max SE %.4f on %s)",
+            n, report["max_standard_error"], report["worst_market"],
+        )
+    result["convergence"] = report
+    return result
@@ -0,0 +1,423 @@
+# batch_game_simulator.py
+"""Vectorized game engine that advances ``n`` simulated games together.
+
+The scalar path (``simulate_game`` → ``simulate_half_inning`` → ``simulate_pa``)
+walks one plate appearance at a time through Python dicts.  This module keeps
+the same outcome model but stores base state, outs, batter index and pitcher
+state as NumPy arrays so every simulated game takes its next plate appearance
+in a single vectorized step.
+"""
+
+from core.config import DEBUG_MODE, VERBOSE_MODE
+import numpy as np
+
+from core.half_inning_simulator import (
+    enumerate_transitions,
+    MISC_RUN_RATE,
+    GHOST_RUN_RATE,
+    MAX_PA_PER_HALF,
+)
+from core.pa_tables import (
+    build_pa_table,
+    OUTCOMES,
+    TTO_BUCKETS,
+    FATIGUE_START,
+    FATIGUE_BUCKETS,
+)
+from assets.bullpen_utils import BullpenSampler
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+MAX_INNINGS = 30
+
+# Outcomes from worst to best for the offense.  Antithetic runs sample PAs in
+# this order so a low draw and its mirror land on opposite ends of run value.
+VALUE_ORDER = np.array([OUTCOMES.index(o) for o in ("K", "OUT", "BB", "1B", "2B", "3B", "HR")])
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+
+
+def _splitmix64(x):
+    x = x ^ (x >> np.uint64(30))
+    x = x * _MIX1
+    x = x ^ (x >> np.uint64(27))
+    x = x * _MIX2
+    return x ^ (x >> np.uint64(31))
+
+
+class SimStreams:
+    """One counter-based (splitmix64) uniform stream per simulation.
+
+    The ``k``-th draw of a sim does not depend on which other sims are still
+    active, so two runs built from identically seeded ``rng``s feed sim ``i``
+    the same uniforms even after their games diverge (common random numbers).
+    Sims ``i`` and ``i + streams`` share a key when ``streams < n``.
+    """
+
+    def __init__(self, n, rng, streams=None):
+        self.streams = n if streams is None else streams
+        self.keys = rng.integers(0, np.iinfo(np.int64).max, size=self.streams, dtype=np.int64).astype(np.uint64)
+        self.counters = np.zeros(n, dtype=np.uint64)
+        self.mirrored = np.zeros(n, dtype=bool)
+
+    def random(self, rows, sims):
+        """Return ``(rows, len(sims))`` uniforms and advance those sims' streams."""
+        steps = self.counters[sims][None, :] + np.arange(rows, dtype=np.uint64)[:, None]
+        with np.errstate(over="ignore"):
+            bits = _splitmix64(self.keys[sims % self.streams][None, :] + steps * _GOLDEN)
+        u = (bits >> np.uint64(11)).astype(np.float64) * 2.0 ** -53
+        self.counters[sims] += np.uint64(rows)
+        return np.where(self.mirrored[sims], 1.0 - u, u)
+
+
+class AntitheticUniforms(SimStreams):
+    """Per-simulation uniform streams where sim ``i + pairs`` mirrors sim ``i``.
+
+    The second half of the sims uses ``1 - u`` of its partner's stream,
+    which makes paired games negatively correlated while each game on its
+    own stays a plain Monte Carlo draw.
+    """
+
+    def __init__(self, n, rng):
+        super().__init__(n, rng, streams=(n + 1) // 2)
+        self.pairs = self.streams
+        self.mirrored = np.arange(n) >= self.pairs
+
+
+def _uniforms(rng, rows, sims):
+    """Draw ``(rows, len(sims))`` uniforms from a ``Generator`` or ``SimStreams``."""
+    if isinstance(rng, SimStreams):
+        return rng.random(rows, sims)
+    return rng.random((rows, sims.size))
+
+
+def build_transition_table():
+    """Return padded transition arrays indexed by ``[outcome, outs, base_mask, branch]``.
+
+    Returns a dict with cumulative branch probabilities (``cum_prob``) and the
+    resulting base mask, runs and outs added for every branch.
+    """
+    branch_lists = {
+        (o, outs, mask): enumerate_transitions(OUTCOMES[o], mask, outs)
+        for o in range(len(OUTCOMES))
+        for outs in range(3)
+        for mask in range(8)
+    }
+    n_branches = max(len(b) for b in branch_lists.values())
+    shape = (len(OUTCOMES), 3, 8, n_branches)
+    cum_prob = np.ones(shape)
+    new_mask = np.zeros(shape, dtype=np.int8)
+    runs = np.zeros(shape, dtype=np.int8)
+    outs_added = np.zeros(shape, dtype=np.int8)
+
+    for (o, outs, mask), branches in branch_lists.items():
+        total = 0.0
+        for b, (prob, dest, scored, added) in enumerate(branches):
+            total += prob
+            cum_prob[o, outs, mask, b] = total
+            new_mask[o, outs, mask, b] = dest
+            runs[o, outs, mask, b] = scored
+            outs_added[o, outs, mask, b] = added
+        # Pad unused branches with the last real branch so a draw of 1.0 is safe
+        last = len(branches) - 1
+        new_mask[o, outs, mask, last + 1:] = new_mask[o, outs, mask, last]
+        runs[o, outs, mask, last + 1:] = runs[o, outs, mask, last]
+        outs_added[o, outs, mask, last + 1:] = outs_added[o, outs, mask, last]
+
+    return {"cum_prob": cum_prob, "new_mask": new_mask, "runs": runs, "outs_added": outs_added}
+
+
+_TRANSITIONS = build_transition_table()
+
+
+def build_matchup_tables(lineup, starter, bullpen=None, env=None):
+    """Precompute the PA outcome table and reliever weights for one batting lineup.
+
+    Pitcher index ``0`` is the starter and ``1..len(bullpen)`` are relievers.
+    """
+    pitchers = [starter] + list(bullpen or [])
+    pa_table = build_pa_table(lineup, pitchers, env)
+    relievers = BullpenSampler(bullpen)
+
+    return {
+        "cum_probs": pa_table["cum_probs"],
+        "relievers": relievers,
+        "reliever_cum": relievers.cum,
+        "lineup_size": len(lineup),
+    }
+
+
+def value_ordered(tables):
+    """Return ``tables`` with PA outcomes re-cumulated in ``VALUE_ORDER``."""
+    probs = np.diff(tables["cum_probs"], axis=-1, prepend=0.0)
+    return dict(tables, cum_probs=np.cumsum(probs[..., VALUE_ORDER], axis=-1), outcome_order=VALUE_ORDER)
+
+
+def _simulate_half_innings(sims, tables, batter_idx, pitcher, rng, pa_counts=None):
+    """Play one half inning for every sim in ``sims`` and return runs scored.
+
+    ``batter_idx`` is the batting team's next-batter array and ``pitcher`` the
+    fielding team's state dict (``index``, ``pitch_count``, ``tto_count``);
+    both are updated in place.  PA outcomes are tallied into the batting
+    team's ``(n, len(OUTCOMES))`` ``pa_counts`` when given.
+    """
+    m = sims.size
+    lineup_size = tables["lineup_size"]
+
+    local_idx = batter_idx[sims].astype(np.int64)
+    outs = np.zeros(m, dtype=np.int8)
+    runs = np.zeros(m, dtype=np.int16)
+    bases = np.zeros(m, dtype=np.int8)
+    reached = np.zeros(m, dtype=bool)
+    pa_count = np.zeros(m, dtype=np.int16)
+
+    active = np.arange(m)
+    while active.size:
+        g = sims[active]
+        idx = local_idx[active]
+        slot = idx % lineup_size
+
+        wrapped = (idx > 0) & (slot == 0)
+        pitcher["tto_count"][g] += wrapped
+
+        tto_b = np.clip(pitcher["tto_count"][g], 1, TTO_BUCKETS) - 1
+        fatigue_b = np.clip(pitcher["pitch_count"][g] - FATIGUE_START, 0, FATIGUE_BUCKETS - 1)
+        row = tables["cum_probs"][slot, pitcher["index"][g], tto_b, fatigue_b]
+
+        draws = _uniforms(rng, 2, g)
+        outcome = np.minimum((draws[0][:, None] >= row).sum(axis=1), len(OUTCOMES) - 1)
+        if "outcome_order" in tables:
+            outcome = tables["outcome_order"][outcome]
+        if pa_counts is not None:
+            pa_counts[g, outcome] += 1
+
+        cur_outs = outs[active]
+        cur_bases = bases[active]
+        branch = (draws[1][:, None] >= _TRANSITIONS["cum_prob"][outcome, cur_outs, cur_bases]).sum(axis=1)
+        branch = np.minimum(branch, _TRANSITIONS["cum_prob"].shape[-1] - 1)
+        new_bases = _TRANSITIONS["new_mask"][outcome, cur_outs, cur_bases, branch]
+        scored = _TRANSITIONS["runs"][outcome, cur_outs, cur_bases, branch]
+        new_outs = cur_outs + _TRANSITIONS["outs_added"][outcome, cur_outs, cur_bases, branch]
+        scored = np.where(new_outs >= 3, 0, scored)
+
+        outs[active] = new_outs
+        bases[active] = new_bases
+        runs[active] += scored
+        reached[active] |= (scored > 0) | (new_bases != 0)
+        pa_count[active] += 1
+        local_idx[active] += 1
+        pitcher["batters_faced"][g] += 1
+        pitcher["pitch_count"][g] += 1
+
+        active = active[(new_outs < 3) & (pa_count[active] < MAX_PA_PER_HALF)]
+
+    extra = _uniforms(rng, 2, sims)
+    runs += reached & (runs == 0) & (extra[0] < MISC_RUN_RATE)
+    runs += reached & (extra[1] < GHOST_RUN_RATE)
+
+    batter_idx[sims] = local_idx % lineup_size
+    return runs
+
+
+def _maybe_replace_pitchers(sims, tables, pitcher, usage, rng, pitch_limit=90, tto_limit=3):
+    """Bring in a reliever for sims whose pitcher crossed the fatigue limits."""
+    if tables["reliever_cum"] is None or not sims.size:
+        return
+    tired = sims[(pitcher["pitch_count"][sims] > pitch_limit) | (pitcher["tto_count"][sims] >= tto_limit)]
+    if not tired.size:
+        return
+    picks = tables["relievers"].draw_many(_uniforms(rng, 1, tired)[0])
+    pitcher["index"][tired] = picks + 1
+    pitcher["batters_faced"][tired] = 0
+    pitcher["pitch_count"][tired] = 0
+    pitcher["tto_count"][tired] = 1
+    np.add.at(usage, (tired, picks), 1)
+
+
+def _half_expectation(expectation, sims, batter_idx, pitcher):
+    """Expected runs of the half inning ``sims`` are about to play."""
+    return expectation(batter_idx[sims], pitcher["index"][sims], pitcher["tto_count"][sims], pitcher["pitch_count"][sims])
+
+
+def _new_pitcher_state(n):
+    return {
+        "index": np.zeros(n, dtype=np.int64),
+        "batters_faced": np.zeros(n, dtype=np.int64),
+        "pitch_count": np.zeros(n, dtype=np.int64),
+        "tto_count": np.ones(n, dtype=np.int64),
+    }
+
+
+def simulate_games_batch(
+    n,
+    lineups,
+    pitchers,
+    bullpens=None,
+    env=None,
+    seed=None,
+    max_innings=MAX_INNINGS,
+    antithetic=False,
+    run_expectancy=None,
+    common_streams=False,
+    track_pa=False,
+):
+    """Simulate ``n`` games at once and return per-inning run matrices.
+
+    Parameters mirror ``build_game_assets`` output: ``lineups``, ``pitchers``
+    and ``bullpens`` are dicts keyed by ``"home"``/``"away"``.  ``seed`` may be
+    an int, a ``SeedSequence`` or a ``numpy.random.Generator``.  Plate
+    appearances are sampled from ``core.pa_tables``, which already integrates
+    the per-PA Beta noise of ``simulate_pa``.
+
+    Returns a dict with:
+      - ``inning_runs``: ``int8`` array of shape ``(n, innings, 2)`` holding
+        away (index 0) and home (index 1) runs per inning; unplayed halves are 0.
+      - ``home_score`` / ``away_score``: final scores, shape ``(n,)``.
+      - ``innings_played``: number of innings each game lasted.
+      - ``home_reliever_usage`` / ``away_reliever_usage``: ``(n, len(bullpen))``
+        counts of how often each reliever entered.
+
+    Games still tied after ``max_innings`` stop there and are reported tied.
+
+    ``antithetic=True`` pairs sim ``i`` with sim ``i + ceil(n/2)`` through
+    ``AntitheticUniforms``.  ``run_expectancy`` maps ``"home"``/``"away"`` to
+    a callable ``(slot, pitcher, tto_count, pitch_count) -> expected runs``
+    for the batting side's half innings (see
+    ``core.variance_reduction.RunExpectancy``); each half's expectation at
+    its start state is summed into an extra ``expected_runs`` ``(n, 2)``
+    array (away, home).
+
+    ``common_streams=True`` gives every sim its own ``SimStreams`` stream, so
+    runs with the same ``seed`` but different inputs share common random
+    numbers sim by sim (see ``core.param_sweep``).  ``track_pa=True`` adds
+    ``pa_counts``, an ``(n, 2, len(OUTCOMES))`` tally of PA outcomes per sim
+    (away, home batting).
+    """
+    rng = np.random.default_rng(seed)
+    if antithetic:
+        rng = AntitheticUniforms(n, rng)
+    elif common_streams:
+        rng = SimStreams(n, rng)
+    bullpens = bullpens or {}
+    home_bullpen = bullpens.get("home") or []
+    away_bullpen = bullpens.get("away") or []
+
+    # Tables are keyed by the fielding team's pitchers facing the batting lineup
+    vs_away = build_matchup_tables(lineups["away"], pitchers["home"], home_bullpen, env)
+    vs_home = build_matchup_tables(lineups["home"], pitchers["away"], away_bullpen, env)
+    if antithetic or common_streams:
+        vs_away, vs_home = value_ordered(vs_away), value_ordered(vs_home)
+    expected_runs = np.zeros((n, 2)) if run_expectancy else None
+    pa_counts = np.zeros((n, 2, len(OUTCOMES)), dtype=np.int32) if track_pa else None
+
+    home_pitcher = _new_pitcher_state(n)
+    away_pitcher = _new_pitcher_state(n)
+    home_batter_idx = np.zeros(n, dtype=np.int64)
+    away_batter_idx = np.zeros(n, dtype=np.int64)
+    home_score = np.zeros(n, dtype=np.int64)
+    away_score = np.zeros(n, dtype=np.int64)
+    innings_played = np.zeros(n, dtype=np.int64)
+    home_usage = np.zeros((n, len(home_bullpen)), dtype=np.int16)
+    away_usage = np.zeros((n, len(away_bullpen)), dtype=np.int16)
+    inning_runs = np.zeros((n, max_innings, 2), dtype=np.int8)
+
+    alive = np.arange(n)
+    inning = 1
+    while alive.size and inning <= max_innings:
+        _maybe_replace_pitchers(alive, vs_away, home_pitcher, home_usage, rng)
+        if run_expectancy:
+            expected_runs[alive, 0] += _half_expectation(run_expectancy["away"], alive, away_batter_idx, home_pitcher)
+        top_runs = _simulate_half_innings(
+            alive, vs_away, away_batter_idx, home_pitcher, rng, None if pa_counts is None else pa_counts[:, 0]
+        )
+        away_score[alive] += top_runs
+        inning_runs[alive, inning - 1, 0] = top_runs
+
+        if inning == 9:
+            bottom = alive[~(home_score[alive] > away_score[alive])]
+        else:
+            bottom = alive
+        _maybe_replace_pitchers(bottom, vs_home, away_pitcher, away_usage, rng)
+        if bottom.size:
+            if run_expectancy:
+                expected_runs[bottom, 1] += _half_expectation(run_expectancy["home"], bottom, home_batter_idx, away_pitcher)
+            bottom_runs = _simulate_half_innings(
+                bottom, vs_home, home_batter_idx, away_pitcher, rng, None if pa_counts is None else pa_counts[:, 1]
+            )
+            home_score[bottom] += bottom_runs
+            inning_runs[bottom, inning - 1, 1] = bottom_runs
+
+        innings_played[alive] = inning
+        if inning >= 9:
+            alive = alive[home_score[alive] == away_score[alive]]
+        inning += 1
+
+    if alive.size:
+        logger.debug("⚠️ %d games still tied after %d innings", alive.size, max_innings)
+
+    played = int(innings_played.max()) if n else 0
+    result = {
+        "inning_runs": inning_runs[:, :played, :],
+        "home_score": home_score,
+        "away_score": away_score,
+        "innings_played": innings_played,
+        "home_reliever_usage": home_usage,
+        "away_reliever_usage": away_usage,
+    }
+    if run_expectancy:
+        result["expected_runs"] = expected_runs
+    if track_pa:
+        result["pa_counts"] = pa_counts
+    return result
+
+
+def batch_to_game_results(batch, home_bullpen=None, away_bullpen=None):
+    """Expand a batch result into ``simulate_game``-style result dicts.
+
+    Only the fields consumed by downstream pricing are populated: scores,
+    per-inning runs and the names of relievers used.
+    """
+    home_names = [rp.get("name", "Unknown") for rp in (home_bullpen or [])]
+    away_names = [rp.get("name", "Unknown") for rp in (away_bullpen or [])]
+    inning_runs = batch["inning_runs"].tolist()
+    results = []
+    for i, played in enumerate(batch["innings_played"].tolist()):
+        runs = inning_runs[i]
+        results.append({
+            "home_score": int(batch["home_score"][i]),
+            "away_score": int(batch["away_score"][i]),
+            "innings": [
+                {"inning": inn + 1, "away_runs": runs[inn][0], "home_runs": runs[inn][1]}
+                for inn in range(played)
+            ],
+            "used_home_relievers": [
+                name for name, count in zip(home_names, batch["home_reliever_usage"][i]) for _ in range(count)
+            ],
+            "used_away_relievers": [
+                name for name, count in zip(away_names, batch["away_reliever_usage"][i]) for _ in range(count)
+            ],
+        })
+    return results
+
+
+if __name__ == '__main__':
+    import time
+    from core.game_simulator import build_sample_lineup, build_sample_pitcher
+
+    sample_lineups = {"home": build_sample_lineup(), "away": build_sample_lineup()}
+    sample_pitchers = {"home": build_sample_pitcher(), "away": build_sample_pitcher()}
+    sample_bullpens = {
+        "home": [build_sample_pitcher() for _ in range(3)],
+        "away": [build_sample_pitcher() for _ in range(3)],
+    }
+    sample_env = {"umpire": {"K": 1.0, "BB": 1.0}}
+
+    start = time.perf_counter()
+    batch = simulate_games_batch(10000, sample_lineups, sample_pitchers, sample_bullpens, sample_env, seed=42)
+    elapsed = time.perf_counter() - start
+    totals = batch["home_score"] + batch["away_score"]
+    print(f"Simulated 10000 games in {elapsed:.2f}s")
+    print(f"Mean total: {totals.mean():.2f} | SD: {totals.std():.2f} | Home win%: {(batch['home_score'] > batch['away_score']).mean():.3f}")
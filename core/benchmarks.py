@@ -0,0 +1,422 @@
+# benchmarks.py
+"""Throughput benchmarks for the simulation and logging hot paths.
+
+Every benchmark runs on fixed seeds and fixtures so numbers are comparable
+between runs on the same machine:
+
+- ``pa``, ``half_inning``, ``game``: the scalar engine (``simulate_pa``,
+  ``simulate_half_inning``, ``simulate_game``) on the sample lineups and
+  pitchers from ``core.game_simulator``.
+- ``distribution``: wall time of ``simulate_distribution`` at 10k sims with
+  the sample assets, no weather and no export cache.
+- ``snapshot``: ``snapshot_core.build_snapshot_rows`` over every
+  ``data/market_odds/*.json`` file, with sim markets derived from the
+  odds and start times moved into the future so no game is skipped.
+- ``consensus``: ``calculate_consensus_prob`` over every priced label.
+- ``batch_logging``: a dry run of ``run_batch_logging`` on the same slate.
+
+Benchmarks run inside a scratch working directory so trackers and exports
+they write never touch ``logs/`` or ``data/``.  Each result is the best of
+``repeat`` timings.  ``compare_to_baseline`` flags any metric that is worse
+than the stored baseline by more than ``threshold``.
+"""
+
+from core.config import DEBUG_MODE, VERBOSE_MODE
+import contextlib
+import glob
+import io
+import json
+import logging
+import os
+import platform
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import numpy as np
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BASELINE_PATH = os.path.join(ROOT, "data", "benchmarks", "baseline.json")
+MARKET_ODDS_GLOB = os.path.join(ROOT, "data", "market_odds", "*.json")
+CALIBRATION_PATH = os.path.join(ROOT, "logs", "calibration_offset.json")
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_REPEAT = 3
+SEED = 20250617
+BENCH_GAME_ID = "2025-06-17-ARI@TOR-T1907"
+
+SIZES = {
+    "pa": 20000,
+    "half_inning": 3000,
+    "game": 200,
+    "distribution": 10000,
+}
+
+
+# ----------------------------
+# Fixtures
+# ----------------------------
+def _sample_assets():
+    from core.game_simulator import build_sample_lineup, build_sample_pitcher
+
+    lineup = build_sample_lineup()
+    return {
+        "lineups": {"home": [dict(b, name=f"H{i}") for i, b in enumerate(lineup)], "away": [dict(b, name=f"A{i}") for i, b in enumerate(lineup)]},
+        "pitchers": {"home": dict(build_sample_pitcher(), name="Home SP"), "away": dict(build_sample_pitcher(), name="Away SP", k_rate=0.26)},
+        "bullpens": {
+            side: [dict(build_sample_pitcher(), name=f"{side} RP {i}", role="RP", IP=10 + i) for i in range(4)]
+            for side in ("home", "away")
+        },
+    }
+
+
+def _implied_prob(price):
+    return 100 / (price + 100) if price > 0 else -price / (-price + 100)
+
+
+def load_odds_fixtures(pattern=MARKET_ODDS_GLOB):
+    """Return every odds snapshot matching ``pattern`` with start times shifted to start 2h from now."""
+    snapshots = []
+    anchor = datetime.now(timezone.utc) + timedelta(hours=2)
+    for path in sorted(glob.glob(pattern)):
+        with open(path) as f:
+            odds = json.load(f)
+        starts = [datetime.fromisoformat(g["start_time"]) for g in odds.values() if isinstance(g, dict) and g.get("start_time")]
+        if starts:
+            first = min(starts)
+            for game in odds.values():
+                if isinstance(game, dict) and game.get("start_time"):
+                    game["start_time"] = (anchor + (datetime.fromisoformat(game["start_time"]) - first)).isoformat()
+        snapshots.append(odds)
+    return snapshots
+
+
+def sim_markets_from_odds(odds, seed=SEED):
+    """Return ``({game_id: sim export}, [(game_id, market, label)])`` for an odds snapshot.
+
+    Each priced label gets a sim probability near its implied probability,
+    so the snapshot builder sees a realistic mix of +EV and -EV rows.
+    """
+    from core.market_pricer import to_american_odds
+
+    rng = np.random.default_rng(seed)
+    sims, labels = {}, []
+    for game_id, game in odds.items():
+        if not isinstance(game, dict):
+            continue
+        markets = []
+        for market_key, market in game.items():
+            if not isinstance(market, dict):
+                continue
+            for label, entry in market.items():
+                price = entry.get("price") if isinstance(entry, dict) else None
+                if not isinstance(price, (int, float)) or price == 0:
+                    continue
+                p = float(np.clip(_implied_prob(price) + rng.normal(0, 0.04), 0.02, 0.98))
+                markets.append({
+                    "market": market_key,
+                    "side": label,
+                    "sim_prob": round(p, 4),
+                    "fair_odds": round(to_american_odds(p), 2),
+                    "source": "simulator",
+                })
+                labels.append((game_id, market_key, label))
+        sims[game_id] = {"start_time_iso": game.get("start_time"), "markets": markets}
+    return sims, labels
+
+
+@contextlib.contextmanager
+def _scratch_dir():
+    """Run in a temporary working directory with ``logs/`` (holding the active calibration) and ``backtest/``."""
+    cwd = os.getcwd()
+    tmp = tempfile.mkdtemp(prefix="mlb_bench_")
+    for folder in ("logs", "backtest"):
+        os.makedirs(os.path.join(tmp, folder))
+    if os.path.exists(CALIBRATION_PATH):
+        shutil.copy(CALIBRATION_PATH, os.path.join(tmp, "logs", "calibration_offset.json"))
+    os.chdir(tmp)
+    try:
+        yield tmp
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Silence prints and log records below ERROR while timing."""
+    logging.disable(logging.WARNING)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def _best_time(fn, repeat):
+    """Return ``(best elapsed seconds, last return value)`` over ``repeat`` calls."""
+    best, value = float("inf"), None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        value = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, value
+
+
+def _rate(count, seconds, unit):
+    return {"value": round(count / seconds, 2), "unit": unit, "higher_is_better": True, "n": count, "seconds": round(seconds, 4)}
+
+
+def _wall_time(seconds, n):
+    return {"value": round(seconds, 4), "unit": "s", "higher_is_better": False, "n": n, "seconds": round(seconds, 4)}
+
+
+# ----------------------------
+# Benchmarks
+# ----------------------------
+def bench_pa(repeat=DEFAULT_REPEAT, n=None):
+    from core.pa_simulator import simulate_pa
+    from core.simulation_context import SimulationContext
+
+    n = n or SIZES["pa"]
+    assets = _sample_assets()
+    batters = assets["lineups"]["home"]
+    pitcher = assets["pitchers"]["away"]
+    umpire = {"k_mod": 1.0, "bb_mod": 1.0}
+
+    def run():
+        ctx = SimulationContext(SEED)
+        for i in range(n):
+            simulate_pa(batters[i % 9], pitcher, umpire_modifiers=umpire, batters_faced=i % 27, sim_context=ctx)
+
+    seconds, _ = _best_time(run, repeat)
+    return _rate(n, seconds, "PA/s")
+
+
+def bench_half_inning(repeat=DEFAULT_REPEAT, n=None):
+    from core.half_inning_simulator import simulate_half_inning
+    from core.simulation_context import SimulationContext
+
+    n = n or SIZES["half_inning"]
+    assets = _sample_assets()
+    lineup = assets["lineups"]["home"]
+    pitcher = assets["pitchers"]["away"]
+    env = {"umpire": {"k_mod": 1.0, "bb_mod": 1.0}}
+
+    def run():
+        ctx = SimulationContext(SEED)
+        batter = 0
+        for i in range(n):
+            state = {"batters_faced": 0, "pitch_count": 0, "tto_count": 1}
+            half = simulate_half_inning(lineup, pitcher, env, start_batter_index=batter, pitcher_state=state, inning=1 + i % 9, env=env, sim_context=ctx)
+            batter = half.get("next_batter_index", 0) % len(lineup)
+
+    seconds, _ = _best_time(run, repeat)
+    return _rate(n, seconds, "half-innings/s")
+
+
+def bench_game(repeat=DEFAULT_REPEAT, n=None):
+    from core.game_simulator import simulate_game
+    from core.simulation_context import SimulationContext
+
+    n = n or SIZES["game"]
+    assets = _sample_assets()
+    env = {"umpire": {"k_mod": 1.0, "bb_mod": 1.0}}
+
+    def run():
+        ctx = SimulationContext(SEED)
+        for _ in range(n):
+            simulate_game(
+                assets["lineups"]["home"],
+                assets["lineups"]["away"],
+                assets["pitchers"]["home"],
+                assets["pitchers"]["away"],
+                env,
+                home_bullpen=assets["bullpens"]["home"],
+                away_bullpen=assets["bullpens"]["away"],
+                sim_context=ctx,
+            )
+
+    seconds, _ = _best_time(run, repeat)
+    return _rate(n, seconds, "games/s")
+
+
+def bench_distribution(repeat=DEFAULT_REPEAT, n=None):
+    import cli.run_distribution_simulator as rds
+
+    n = n or SIZES["distribution"]
+    assets = _sample_assets()
+
+    def run():
+        with mock.patch.object(rds, "build_game_assets", lambda *a, **k: assets):
+            rds.simulate_distribution(
+                BENCH_GAME_ID,
+                8.5,
+                no_weather=True,
+                export_json=os.path.join("logs", "bench_distribution.json"),
+                n_simulations=n,
+                stats=(None, None),
+                seed=SEED,
+                use_cache=False,
+            )
+
+    with _scratch_dir():
+        seconds, _ = _best_time(run, repeat)
+    return _wall_time(seconds, n)
+
+
+def bench_snapshot(repeat=DEFAULT_REPEAT, snapshots=None):
+    from core.snapshot_core import build_snapshot_rows
+
+    snapshots = snapshots if snapshots is not None else load_odds_fixtures()
+    fixtures = [(sim_markets_from_odds(odds)[0], odds) for odds in snapshots]
+
+    def run():
+        return sum(len(build_snapshot_rows(sims, odds, min_ev=0.01)) for sims, odds in fixtures)
+
+    with _scratch_dir():
+        seconds, rows = _best_time(run, repeat)
+    if not rows:
+        raise RuntimeError("build_snapshot_rows produced no rows from the odds fixtures")
+    return _rate(rows, seconds, "rows/s")
+
+
+def bench_consensus(repeat=DEFAULT_REPEAT, snapshots=None):
+    from core.consensus_pricer import calculate_consensus_prob
+
+    snapshots = snapshots if snapshots is not None else load_odds_fixtures()
+    fixtures = [(odds, sim_markets_from_odds(odds)[1]) for odds in snapshots]
+    calls = sum(len(labels) for _, labels in fixtures)
+
+    def run():
+        for odds, labels in fixtures:
+            for game_id, market_key, label in labels:
+                calculate_consensus_prob(game_id, odds, market_key, label)
+
+    seconds, _ = _best_time(run, repeat)
+    return _rate(calls, seconds, "calls/s")
+
+
+def bench_batch_logging(repeat=DEFAULT_REPEAT, snapshots=None):
+    import copy
+    import cli.log_betting_evals as lbe
+
+    snapshots = snapshots if snapshots is not None else load_odds_fixtures()
+    odds = snapshots[-1]
+    sims, _ = sim_markets_from_odds(odds)
+
+    with _scratch_dir() as tmp:
+        eval_folder = os.path.join(tmp, "backtest", "sims", BENCH_GAME_ID[:10])
+        os.makedirs(eval_folder, exist_ok=True)
+        for game_id, sim in sims.items():
+            with open(os.path.join(eval_folder, f"{game_id}.json"), "w") as f:
+                json.dump(sim, f)
+
+        def run():
+            lbe.run_batch_logging(
+                eval_folder=eval_folder,
+                market_odds=copy.deepcopy(odds),
+                min_ev=0.05,
+                dry_run=True,
+                no_save_skips=True,
+            )
+
+        seconds, _ = _best_time(run, repeat)
+    return _wall_time(seconds, len(sims))
+
+
+BENCHMARKS = {
+    "pa": bench_pa,
+    "half_inning": bench_half_inning,
+    "game": bench_game,
+    "distribution": bench_distribution,
+    "snapshot": bench_snapshot,
+    "consensus": bench_consensus,
+    "batch_logging": bench_batch_logging,
+}
+
+
+# ----------------------------
+# Runner + baseline
+# ----------------------------
+def machine_info():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run_benchmarks(names=None, repeat=DEFAULT_REPEAT):
+    """Run the named benchmarks (default: all) and return ``{name: result}``."""
+    names = list(names or BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s) {', '.join(unknown)}; choose from {', '.join(BENCHMARKS)}")
+
+    results = {}
+    with _quiet():
+        snapshots = load_odds_fixtures() if {"snapshot", "consensus", "batch_logging"} & set(names) else None
+        for name in names:
+            kwargs = {"snapshots": snapshots} if name in ("snapshot", "consensus", "batch_logging") else {}
+            results[name] = BENCHMARKS[name](repeat=repeat, **kwargs)
+    if DEBUG_MODE:
+        for name, result in results.items():
+            logger.debug("⏱️ %s: %s %s", name, result["value"], result["unit"])
+    return results
+
+
+def load_baseline(path=BASELINE_PATH):
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(results, path=BASELINE_PATH, merge=True):
+    """Store ``results`` as the baseline; with ``merge`` other metrics already stored are kept."""
+    existing = (load_baseline(path) or {}).get("metrics", {}) if merge else {}
+    baseline = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "machine": machine_info(),
+        "metrics": {**existing, **results},
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2)
+    return baseline
+
+
+def compare_to_baseline(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return one row per metric with its relative ``change`` (positive = faster).
+
+    A metric is ``regressed`` when it is more than ``threshold`` slower than
+    its baseline value.  Metrics missing from the baseline are reported with
+    ``change=None``.
+    """
+    stored = (baseline or {}).get("metrics", {})
+    rows = []
+    for name, result in results.items():
+        base = stored.get(name)
+        change = None
+        if base and base.get("value"):
+            if result["higher_is_better"]:
+                change = result["value"] / base["value"] - 1
+            else:
+                change = base["value"] / result["value"] - 1 if result["value"] else 0.0
+        rows.append({
+            "metric": name,
+            "unit": result["unit"],
+            "baseline": base.get("value") if base else None,
+            "current": result["value"],
+            "change": None if change is None else round(change, 4),
+            "regressed": change is not None and change < -threshold,
+        })
+    return rows
@@ -4,9 +4,9 @@ import random
 import numpy as np
 
 
-def resolve_bip(bip_type, ev=None, la=None, batter_speed=50, fielder_rating=50, debug=False):
+def bip_hit_probability(bip_type, ev=None, la=None, batter_speed=50, fielder_rating=50):
     """
-    Resolve a batted ball in play (BIP) into a hit or out based on type and modifiers.
+    Return the probability that a batted ball in play (BIP) of ``bip_type`` falls for a hit.
     """
 
     # Base BABIP by BIP type
@@ -56,8 +56,25 @@ def resolve_bip(bip_type, ev=None, la=None, batter_speed=50, fielder_rating=50,
     # Cap BABIP to avoid extreme overproduction
     prob = max(min(prob, 0.55), 0.05)
 
+    return prob
+
+
+def resolve_bip(bip_type, ev=None, la=None, batter_speed=50, fielder_rating=50, debug=False, rng=None):
+    """
+    Resolve a batted ball in play (BIP) into a hit or out based on type and modifiers.
+    Draws from ``rng`` when given, otherwise from the global ``random`` module.
+    """
+    prob = bip_hit_probability(
+        bip_type,
+        ev=ev,
+        la=la,
+        batter_speed=batter_speed,
+        fielder_rating=fielder_rating,
+    )
+
     if debug:
         print(f"resolve_bip: {bip_type} EV={ev} LA={la} -> prob={prob:.3f}")
 
-    return random.random() < prob
+    rand = rng if rng is not None else random
+    return rand.random() < prob
 
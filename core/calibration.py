@@ -0,0 +1,436 @@
+# calibration.py
+"""Fit the ``MLBPricingEngine`` calibration on the batch engine.
+
+``run_calibration`` simulates a spread of representative matchups (varied
+starters, lineups, bullpens, park/weather and umpire), in parallel and with a
+per-matchup cache, then fits every scaling parameter the pricing engine
+reads:
+
+- ``run_scaling_factor``, ``stddev_scaling_factor``,
+  ``run_diff_scaling_factor`` and ``team_total_scaling`` are solved so the
+  pooled distribution of *scaled* games across all matchups hits the league
+  targets.  The engine rescales each game around its own mean, so the spread
+  between matchup means is accounted for instead of being folded into the
+  per-game factor.
+- ``segment_scaling`` keeps the league run mean/SD targets (the simulator
+  rescales each game's segment totals to them) and fits ``diff_sd`` so the
+  pooled segment run differential hits its target.
+- ``logit_win_pct_calibration`` is a regression of logit market win
+  probability on logit simulated win probability over the h2h rows of
+  ``logs/market_evals.csv`` (as ``tools/fit_logit_win_model.py`` does).
+
+PA outcome rates are compared with the ``MLB Benchmark`` column of
+``logs/calibration_outcomes.csv`` and the table is rewritten with the new
+rates.  Each fit is saved as a versioned file under ``logs/calibration/``
+and promoted to ``logs/calibration_offset.json``.
+
+Simulated matchups are cached under ``data/calibration_cache/`` keyed by
+``core.sim_cache.sim_fingerprint``, which covers the matchup, sim count,
+seed and the simulation source; only matchups whose inputs or model code
+changed are re-simulated.
+"""
+
+from core.config import DEBUG_MODE, VERBOSE_MODE
+import copy
+import csv
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+from scipy.special import logit
+
+from core.batch_game_simulator import simulate_games_batch
+from core.pa_tables import OUTCOMES
+from core.param_sweep import LEAGUE_AVERAGE_BATTER, LEAGUE_AVERAGE_PITCHER, NEUTRAL_ENV
+from core.project_hr_pa import project_hr_pa
+from core.sim_cache import sim_fingerprint, code_version
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+ACTIVE_CALIBRATION_PATH = os.path.join("logs", "calibration_offset.json")
+CALIBRATION_DIR = os.path.join("logs", "calibration")
+OUTCOMES_PATH = os.path.join("logs", "calibration_outcomes.csv")
+MARKET_EVALS_PATH = os.path.join("logs", "market_evals.csv")
+CACHE_DIR = os.path.join("data", "calibration_cache")
+
+DEFAULT_MATCHUPS = 160
+DEFAULT_SIMS = 5000
+MIN_LOGIT_ROWS = 10
+SEGMENTS = {"f1": 1, "f3": 3, "f5": 5, "f7": 7}
+
+DEFAULT_TARGETS = {
+    "run_mean": 8.85,
+    "run_sd": 4.65,
+    "run_diff_sd": 3.0,
+    "home_mean": 4.62,
+    "away_mean": 4.35,
+    "home_sd": 3.35,
+    "away_sd": 3.20,
+    "segments": {
+        "f1": {"run_mean": 1.05, "run_sd": 1.55, "diff_sd": 1.55},
+        "f3": {"run_mean": 3.30, "run_sd": 2.70, "diff_sd": 2.70},
+        "f5": {"run_mean": 5.40, "run_sd": 3.35, "diff_sd": 3.35},
+        "f7": {"run_mean": 7.25, "run_sd": 3.85, "diff_sd": 3.85},
+    },
+}
+
+DEFAULT_PA_BENCHMARKS = {"K": 22.5, "BB": 8.2, "1B": 21.5, "2B": 5.2, "3B": 0.5, "HR": 3.0, "OUT": 39.1}
+PA_REPORT_ORDER = ["K", "BB", "1B", "2B", "3B", "HR", "OUT"]
+
+
+# ----------------------------
+# Matchups
+# ----------------------------
+def _pitcher(rng, name, role="SP"):
+    pitcher = dict(
+        LEAGUE_AVERAGE_PITCHER,
+        name=name,
+        role=role,
+        k_rate=round(float(np.clip(rng.normal(0.225, 0.035), 0.12, 0.36)), 3),
+        bb_rate=round(float(np.clip(rng.normal(0.080, 0.015), 0.04, 0.13)), 3),
+        stuff_plus=round(float(rng.normal(100, 10))),
+        location_plus=round(float(rng.normal(100, 8))),
+        IP=180 if role == "SP" else int(rng.integers(20, 70)),
+    )
+    pitcher["hr_pa"] = project_hr_pa(dict(pitcher))
+    return pitcher
+
+
+def _lineup(rng, side):
+    return [
+        dict(
+            LEAGUE_AVERAGE_BATTER,
+            name=f"{side}_batter_{i + 1}",
+            k_rate=round(float(np.clip(rng.normal(0.225, 0.05), 0.08, 0.38)), 3),
+            bb_rate=round(float(np.clip(rng.normal(0.085, 0.025), 0.03, 0.16)), 3),
+        )
+        for i in range(9)
+    ]
+
+
+def representative_matchups(n=DEFAULT_MATCHUPS, seed=0):
+    """Return ``n`` reproducible matchups spread around league-average inputs.
+
+    Each is a ``{"lineups", "pitchers", "bullpens", "env"}`` dict as taken by
+    ``simulate_games_batch``.  Starter and batter rates, reliever workloads,
+    weather HR multiplier and umpire modifiers vary from matchup to matchup.
+    """
+    rng = np.random.default_rng(seed)
+    matchups = []
+    for m in range(n):
+        env = copy.deepcopy(NEUTRAL_ENV)
+        env["weather_hr"] = round(float(rng.uniform(0.85, 1.15)), 3)
+        env["umpire"] = {
+            "k_mod": round(float(rng.normal(1.0, 0.03)), 3),
+            "bb_mod": round(float(rng.normal(1.0, 0.04)), 3),
+        }
+        matchups.append({
+            "lineups": {side: _lineup(rng, side) for side in ("home", "away")},
+            "pitchers": {side: _pitcher(rng, f"{side}_sp_{m}") for side in ("home", "away")},
+            "bullpens": {side: [_pitcher(rng, f"{side}_rp_{m}_{i}", role="RP") for i in range(5)] for side in ("home", "away")},
+            "env": env,
+        })
+    return matchups
+
+
+# ----------------------------
+# Simulation + cache
+# ----------------------------
+def matchup_seed(assets, seed):
+    """Per-matchup seed derived from its inputs, so reordering the list keeps the cache valid."""
+    digest = hashlib.sha256(json.dumps(assets, sort_keys=True, default=str).encode()).digest()
+    return [int(seed or 0), int.from_bytes(digest[:8], "little")]
+
+
+def simulate_matchup(assets, n_sims, seed):
+    """Simulate one matchup and return its scores, segment runs and PA tally."""
+    batch = simulate_games_batch(
+        n_sims,
+        assets["lineups"],
+        assets["pitchers"],
+        assets.get("bullpens"),
+        assets.get("env"),
+        seed=seed,
+        track_pa=True,
+    )
+    cum = np.cumsum(batch["inning_runs"], axis=1, dtype=np.int16)
+    caps = [min(cap, cum.shape[1]) - 1 for cap in SEGMENTS.values()]
+    return {
+        "home_score": batch["home_score"].astype(np.int16),
+        "away_score": batch["away_score"].astype(np.int16),
+        "segments": cum[:, caps, :],
+        "pa_counts": batch["pa_counts"].sum(axis=(0, 1)),
+    }
+
+
+def _matchup_task(args):
+    assets, n_sims, seed, cache_dir = args
+    seed = matchup_seed(assets, seed)
+    path = None
+    if cache_dir:
+        fingerprint = sim_fingerprint(assets, assets.get("env"), None, n_sims, options={"seed": seed, "job": "calibration"})
+        path = os.path.join(cache_dir, f"{fingerprint[:32]}.npz")
+        if os.path.exists(path):
+            try:
+                with np.load(path) as cached:
+                    return {key: cached[key] for key in cached.files}, True
+            except (OSError, ValueError):
+                logger.warning("⚠️ Ignoring unreadable calibration cache entry %s", path)
+    result = simulate_matchup(assets, n_sims, seed)
+    if path:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez_compressed(tmp_path, **result)
+        os.replace(tmp_path, path)
+    return result, False
+
+
+def simulate_matchups(matchups, n_sims=DEFAULT_SIMS, seed=0, workers=None, cache_dir=CACHE_DIR):
+    """Simulate (or load from cache) every matchup; returns ``(results, cache_hits)``."""
+    tasks = [(assets, n_sims, seed, cache_dir) for assets in matchups]
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            outputs = list(pool.map(_matchup_task, tasks, chunksize=max(1, len(tasks) // (4 * workers))))
+    else:
+        outputs = [_matchup_task(task) for task in tasks]
+    return [result for result, _ in outputs], sum(hit for _, hit in outputs)
+
+
+# ----------------------------
+# Fitting
+# ----------------------------
+def _pooled(samples):
+    """Return ``(grand mean, mean within-matchup variance, variance of matchup means)``."""
+    means = np.array([s.mean() for s in samples])
+    within = np.array([s.var() for s in samples])
+    return float(means.mean()), float(within.mean()), float(means.var())
+
+
+def _spread_factor(target_sd, scale, within, between):
+    """Per-game SD factor ``s`` with ``scale^2 * (s^2 * within + between) == target_sd^2``."""
+    if within <= 0:
+        return 1.0
+    excess = (target_sd / scale) ** 2 - between
+    if excess <= 0:
+        # Matchup means alone already exceed the target spread
+        logger.warning("⚠️ Target SD %.2f is below the spread of matchup means; using the plain ratio", target_sd)
+        return target_sd / (scale * np.sqrt(within + between))
+    return float(np.sqrt(excess / within))
+
+
+def fit_scaling(results, targets=None):
+    """Fit the run, SD, run-diff, team-total and segment parameters.
+
+    Returns ``(calibration, diagnostics)``; ``calibration`` holds the keys
+    ``MLBPricingEngine`` reads (minus the logit fit).
+    """
+    targets = targets or DEFAULT_TARGETS
+    home = [r["home_score"].astype(float) for r in results]
+    away = [r["away_score"].astype(float) for r in results]
+    totals = [h + a for h, a in zip(home, away)]
+    diffs = [h - a for h, a in zip(home, away)]
+
+    total_mean, total_within, total_between = _pooled(totals)
+    run_factor = targets["run_mean"] / total_mean
+    sd_factor = _spread_factor(targets["run_sd"], run_factor, total_within, total_between)
+    _, diff_within, diff_between = _pooled(diffs)
+    diff_factor = _spread_factor(targets["run_diff_sd"], 1.0, diff_within, diff_between)
+
+    team = {}
+    raw = {"total_mean": total_mean, "total_sd": float(np.sqrt(total_within + total_between)),
+           "run_diff_sd": float(np.sqrt(diff_within + diff_between))}
+    for side, scores in (("home", home), ("away", away)):
+        mean, within, between = _pooled(scores)
+        mean_factor = targets[f"{side}_mean"] / mean
+        team[f"{side}_mean_factor"] = round(mean_factor, 4)
+        team[f"{side}_std_factor"] = round(_spread_factor(targets[f"{side}_sd"], mean_factor, within, between), 4)
+        raw[f"{side}_mean"] = mean
+        raw[f"{side}_sd"] = float(np.sqrt(within + between))
+
+    segment_scaling = {}
+    for j, key in enumerate(SEGMENTS):
+        seg_targets = targets["segments"][key]
+        seg_totals = [r["segments"][:, j, :].sum(axis=1).astype(float) for r in results]
+        seg_diffs = [(r["segments"][:, j, 1] - r["segments"][:, j, 0]).astype(float) for r in results]
+        seg_mean, seg_within, seg_between = _pooled(seg_totals)
+        _, d_within, d_between = _pooled(seg_diffs)
+        # Each game's segment diff is rescaled to ``diff_sd`` around its own mean
+        diff_sd = np.sqrt(max(seg_targets["diff_sd"] ** 2 - d_between, 0.25 * seg_targets["diff_sd"] ** 2))
+        segment_scaling[key] = {
+            "run_mean": round(seg_targets["run_mean"], 2),
+            "run_sd": round(seg_targets["run_sd"], 2),
+            "diff_sd": round(float(diff_sd), 2),
+        }
+        raw[f"{key}_mean"] = seg_mean
+        raw[f"{key}_sd"] = float(np.sqrt(seg_within + seg_between))
+        raw[f"{key}_diff_sd"] = float(np.sqrt(d_within + d_between))
+
+    calibration = {
+        "run_scaling_factor": round(run_factor, 4),
+        "stddev_scaling_factor": round(sd_factor, 4),
+        "run_diff_scaling_factor": round(diff_factor, 4),
+        "team_total_scaling": team,
+        "segment_scaling": segment_scaling,
+    }
+    return calibration, {key: round(value, 4) for key, value in raw.items()}
+
+
+def load_logit_pairs(path=MARKET_EVALS_PATH):
+    """Return ``(sim_probs, market_probs)`` from the h2h rows of a market evals CSV."""
+    sim, market = [], []
+    if not os.path.exists(path):
+        return np.array(sim), np.array(market)
+    with open(path, newline="", encoding="utf-8") as fh:
+        for row in csv.DictReader(fh):
+            if (row.get("market") or "").strip() != "h2h":
+                continue
+            try:
+                p_sim = float(row.get("sim_prob"))
+                p_market = float(row.get("market_prob") or row.get("consensus_prob"))
+            except (TypeError, ValueError):
+                continue
+            if 0 < p_sim < 1 and 0 < p_market < 1:
+                sim.append(p_sim)
+                market.append(p_market)
+    return np.array(sim), np.array(market)
+
+
+def fit_logit(sim_probs, market_probs, min_rows=MIN_LOGIT_ROWS):
+    """Fit ``logit(p_market) = a + b * logit(p_sim)``; ``None`` with fewer than ``min_rows`` pairs."""
+    if len(sim_probs) < min_rows:
+        return None
+    x = logit(np.clip(sim_probs, 1e-4, 1 - 1e-4))
+    y = logit(np.clip(market_probs, 1e-4, 1 - 1e-4))
+    b, a = np.polyfit(x, y, 1)
+    return {"a": round(float(a), 4), "b": round(float(b), 4), "n": int(len(x))}
+
+
+def load_pa_benchmarks(path=OUTCOMES_PATH):
+    """Return ``{outcome: benchmark %}`` from the ``MLB Benchmark`` column of ``path``."""
+    benchmarks = dict(DEFAULT_PA_BENCHMARKS)
+    if not os.path.exists(path):
+        return benchmarks
+    with open(path, newline="", encoding="utf-8") as fh:
+        for row in csv.DictReader(fh):
+            try:
+                benchmarks[row["Outcome"]] = float(row["MLB Benchmark"])
+            except (KeyError, TypeError, ValueError):
+                continue
+    return benchmarks
+
+
+def pa_outcome_summary(results, benchmarks=None):
+    """Return per-outcome counts, percentages, per-game rates and benchmarks."""
+    benchmarks = benchmarks or DEFAULT_PA_BENCHMARKS
+    counts = np.sum([r["pa_counts"] for r in results], axis=0)
+    n_games = sum(len(r["home_score"]) for r in results)
+    total = counts.sum()
+    summary = {}
+    for outcome in PA_REPORT_ORDER:
+        count = int(counts[OUTCOMES.index(outcome)])
+        summary[outcome] = {
+            "count": count,
+            "percent": round(100 * count / total, 2) if total else 0.0,
+            "per_game": round(count / n_games, 2) if n_games else 0.0,
+            "benchmark": benchmarks.get(outcome),
+        }
+    return summary
+
+
+def write_pa_outcomes(summary, path=OUTCOMES_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Outcome", "Count", "Percent", "Per Game", "MLB Benchmark"])
+        for outcome, row in summary.items():
+            writer.writerow([outcome, row["count"], f"{row['percent']:.2f}%", f"{row['per_game']:.2f}", row["benchmark"] or ""])
+
+
+# ----------------------------
+# Job
+# ----------------------------
+def run_calibration(
+    n_matchups=DEFAULT_MATCHUPS,
+    n_sims=DEFAULT_SIMS,
+    seed=0,
+    workers=None,
+    targets=None,
+    matchups=None,
+    cache_dir=CACHE_DIR,
+    outcomes_path=OUTCOMES_PATH,
+    market_evals_path=MARKET_EVALS_PATH,
+    previous=None,
+):
+    """Simulate, fit and return a new calibration dict (not yet saved).
+
+    ``matchups`` overrides ``representative_matchups(n_matchups, seed)``.
+    The logit fit falls back to ``previous`` (the active calibration) when
+    the market evals hold too few h2h rows.  The returned dict has the
+    ``MLBPricingEngine`` keys plus a ``metadata`` block with diagnostics.
+    """
+    start = time.perf_counter()
+    targets = targets or DEFAULT_TARGETS
+    matchups = matchups if matchups is not None else representative_matchups(n_matchups, seed)
+    results, cache_hits = simulate_matchups(matchups, n_sims, seed, workers, cache_dir)
+    calibration, raw = fit_scaling(results, targets)
+
+    logit_fit = fit_logit(*load_logit_pairs(market_evals_path))
+    if logit_fit is not None:
+        calibration["logit_win_pct_calibration"] = {"a": logit_fit["a"], "b": logit_fit["b"]}
+        logit_source = f"{market_evals_path} ({logit_fit['n']} h2h rows)"
+    elif previous and previous.get("logit_win_pct_calibration"):
+        calibration["logit_win_pct_calibration"] = dict(previous["logit_win_pct_calibration"])
+        logit_source = "previous calibration"
+    else:
+        calibration["logit_win_pct_calibration"] = {"a": 0.0, "b": 1.0}
+        logit_source = "identity"
+
+    pa_summary = pa_outcome_summary(results, load_pa_benchmarks(outcomes_path))
+    calibration["metadata"] = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "code_version": code_version(),
+        "n_matchups": len(matchups),
+        "n_sims": n_sims,
+        "seed": seed,
+        "cache_hits": cache_hits,
+        "elapsed_seconds": round(time.perf_counter() - start, 2),
+        "targets": targets,
+        "raw": raw,
+        "logit_source": logit_source,
+        "pa_outcomes": pa_summary,
+    }
+    if DEBUG_MODE:
+        logger.debug(
+            "🧮 Calibrated on %d matchups x %d sims (%d cached) in %.1fs",
+            len(matchups), n_sims, cache_hits, calibration["metadata"]["elapsed_seconds"],
+        )
+    return calibration
+
+
+def save_calibration(calibration, out_dir=CALIBRATION_DIR, active_path=ACTIVE_CALIBRATION_PATH, promote=True):
+    """Write ``calibration`` as a new version and optionally make it the active calibration.
+
+    The version id is the creation time plus a hash of the fitted values.
+    The versioned file keeps the ``metadata`` block; the active file holds
+    the engine keys and the ``version`` it came from.  Returns the versioned path.
+    """
+    params = {key: value for key, value in calibration.items() if key != "metadata"}
+    digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:8]
+    created = calibration.get("metadata", {}).get("created") or datetime.now().isoformat(timespec="seconds")
+    version = f"{datetime.fromisoformat(created):%Y%m%dT%H%M%S}-{digest}"
+
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, f"calibration_{version}.json")
+    with open(path, "w") as f:
+        json.dump({"version": version, **calibration}, f, indent=2)
+    if promote:
+        os.makedirs(os.path.dirname(active_path) or ".", exist_ok=True)
+        with open(active_path, "w") as f:
+            json.dump({**params, "version": version}, f, indent=2)
+    return path
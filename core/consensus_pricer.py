@@ -1,6 +1,8 @@
 # consensus_pricer.py (final patch — paired_key fix for spreads)
 
 from core.config import DEBUG_MODE, VERBOSE_MODE
+from functools import lru_cache
+
 from core.market_pricer import implied_prob, to_american_odds
 from core.utils import (
     normalize_label,
@@ -23,6 +25,51 @@ SIM_ONLY = {
 }
 
 
+@lru_cache(maxsize=65536)
+def _cached_normalize(label):
+    return normalize_label(label)
+
+
+def _norm(label):
+    """``normalize_label`` with results cached for string labels."""
+    return _cached_normalize(label) if isinstance(label, str) else normalize_label(label)
+
+
+def _index_market(market):
+    """Return ``{normalized label: raw key}``, keeping the first key per label."""
+    labels = {}
+    if isinstance(market, dict):
+        for key in market:
+            labels.setdefault(_norm(key), key)
+    return labels
+
+
+def _find_key(index, game_odds, mkt_key, normalized):
+    """Return the first key of ``game_odds[mkt_key]`` whose normalized form is ``normalized``.
+
+    ``index`` caches each market's label map, so repeated lookups for one game
+    are dictionary hits instead of scans over the whole market.
+    """
+    labels = index.get(mkt_key)
+    if labels is None:
+        labels = index[mkt_key] = _index_market(game_odds.get(mkt_key, {}))
+    return labels.get(normalized)
+
+
+def build_label_index(game_odds):
+    """Return a label index for one game's odds (``market_odds[game_id]``).
+
+    Pass it as ``index`` to ``calculate_consensus_prob`` to share it across
+    every label of the game.  Markets are indexed on first use; the index must
+    be rebuilt if market keys are added or removed.
+    """
+    return {
+        mkt_key: _index_market(market)
+        for mkt_key, market in (game_odds or {}).items()
+        if isinstance(market, dict)
+    }
+
+
 def calculate_consensus_prob(
     game_id,
     market_odds,
@@ -31,7 +78,20 @@ def calculate_consensus_prob(
     consensus_books=DEFAULT_CONSENSUS_BOOKS,
     debug=False,
     throttle_logs=True,
+    index=None,
 ):
+    """Return ``(result, method)`` with the devigged consensus for one label.
+
+    ``index`` is an optional label index from ``build_label_index`` shared
+    across calls for the same game.
+    """
+    game_odds = market_odds.get(game_id, {})
+    if index is None:
+        index = {}
+
+    def find(mkt_key, target):
+        return _find_key(index, game_odds, mkt_key, _norm(target))
+
     def sim_only(reason):
         if debug:
             print(f"🟡 Devig failed for {label} in {market_key} → {reason}; using sim_only")
@@ -60,7 +120,7 @@ def calculate_consensus_prob(
             base_market_keys.append(market_key.replace("alternate_", ""))
 
     # Normalize incoming label
-    label = normalize_label(label).replace("+0.0", "0.0").replace("-0.0", "0.0").strip()
+    label = _norm(label).replace("+0.0", "0.0").replace("-0.0", "0.0").strip()
 
     label_point = None
     label_split = label.split()
@@ -73,12 +133,12 @@ def calculate_consensus_prob(
         label_point = float(label_split[1])
 
     for mkt_key in base_market_keys:
-        market = market_odds.get(game_id, {}).get(mkt_key, {})
+        market = game_odds.get(mkt_key, {})
         if not isinstance(market, dict):
             continue
 
         # Robust lookup for label key
-        label_key = next((k for k in market if normalize_label(k) == label), None)
+        label_key = _find_key(index, game_odds, mkt_key, label)
 
         # TEAM TOTALS → Over/Under devig logic
         if "team_totals" in mkt_key:
@@ -92,7 +152,7 @@ def calculate_consensus_prob(
                 point = float(point)
                 paired_side = "Under" if side == "Over" else "Over"
                 paired_label = f"{team} {paired_side} {point:.1f}"
-                paired_key = next((k for k in market if normalize_label(k) == normalize_label(paired_label)), None)
+                paired_key = find(mkt_key, paired_label)
                 if not paired_key:
                     return sim_only("missing paired label")
                 books_label = market[label_key].get("per_book", {})
@@ -109,7 +169,7 @@ def calculate_consensus_prob(
             if not label.startswith("Over") and not label.startswith("Under"):
                 return sim_only("unsupported label in totals")
             paired_label = f"{'Under' if label.startswith('Over') else 'Over'} {label_point}"
-            paired_key = next((k for k in market if normalize_label(k) == normalize_label(paired_label)), None)
+            paired_key = find(mkt_key, paired_label)
             if not paired_key:
                 return sim_only("missing paired label")
             books_label = market[label_key].get("per_book", {})
@@ -120,7 +180,7 @@ def calculate_consensus_prob(
             if not label_key:
                 return sim_only("missing label")
             paired_label = get_paired_label(label, mkt_key, game_id)
-            paired_key = next((k for k in market if normalize_label(k) == normalize_label(paired_label)), None)
+            paired_key = find(mkt_key, paired_label)
             if not paired_key:
                 return sim_only("missing paired label")
             books_label = market[label_key].get("per_book", {})
@@ -134,11 +194,11 @@ def calculate_consensus_prob(
 
                 # PK spreads → route to h2h market
                 if line in {"0", "0.0"}:
-                    h2h_market = market_odds.get(game_id, {}).get("h2h", {})
+                    h2h_market = game_odds.get("h2h", {})
                     h2h_label = team
-                    label_key = next((k for k in h2h_market if normalize_label(k) == normalize_label(h2h_label)), None)
+                    label_key = find("h2h", h2h_label)
                     paired_label = get_paired_label(h2h_label, "h2h", game_id)
-                    paired_key = next((k for k in h2h_market if normalize_label(k) == normalize_label(paired_label)), None)
+                    paired_key = find("h2h", paired_label)
                     if not label_key or not paired_key:
                         return sim_only("PK line fallback failed")
                     books_label = h2h_market[label_key].get("per_book", {})
@@ -158,7 +218,7 @@ def calculate_consensus_prob(
                     else:
                         return sim_only("invalid spread line")
 
-                    paired_key = next((k for k in market if normalize_label(k) == normalize_label(paired_label)), None)
+                    paired_key = find(mkt_key, paired_label)
                     source_market = market  # default to current market
 
                     if not paired_key:
@@ -167,8 +227,8 @@ def calculate_consensus_prob(
                             if mkt_key.startswith("spreads")
                             else mkt_key.replace("alternate_spreads", "spreads")
                         )
-                        alt_market = market_odds.get(game_id, {}).get(alt_mkt_key, {})
-                        paired_key = next((k for k in alt_market if normalize_label(k) == normalize_label(paired_label)), None)
+                        alt_market = game_odds.get(alt_mkt_key, {})
+                        paired_key = find(alt_mkt_key, paired_label)
                         source_market = alt_market
 
                         if paired_key:
@@ -205,9 +265,9 @@ def calculate_consensus_prob(
                 if mkt_key.startswith("spreads")
                 else mkt_key.replace("alternate_spreads", "spreads")
             )
-            alt_market = market_odds.get(game_id, {}).get(alt_mkt_key, {})
-            alt_label_key = next((k for k in alt_market if normalize_label(k) == normalize_label(label)), None)
-            alt_paired_key = next((k for k in alt_market if normalize_label(k) == normalize_label(paired_label)), None)
+            alt_market = game_odds.get(alt_mkt_key, {})
+            alt_label_key = find(alt_mkt_key, label)
+            alt_paired_key = find(alt_mkt_key, paired_label)
             if alt_label_key and alt_paired_key:
                 alt_books_label = alt_market[alt_label_key].get("per_book", {})
                 alt_books_pair = alt_market[alt_paired_key].get("per_book", {})
@@ -258,6 +318,39 @@ def calculate_consensus_prob(
     return sim_only("exhausted market keys")
 
 
+def calculate_game_consensus(
+    game_id,
+    game_odds,
+    consensus_books=DEFAULT_CONSENSUS_BOOKS,
+    debug=False,
+):
+    """Return ``{market_key: {label: (result, method)}}`` for every label of a game.
+
+    Equivalent to calling ``calculate_consensus_prob`` for each label, but the
+    label index is built once and shared.  Non-market keys (``start_time``,
+    ``*_source``) are skipped.
+    """
+    market_odds = {game_id: game_odds}
+    index = build_label_index(game_odds)
+    results = {}
+    for mkt_key, market in game_odds.items():
+        if not isinstance(market, dict) or mkt_key.endswith("_source") or mkt_key == "start_time":
+            continue
+        results[mkt_key] = {
+            label: calculate_consensus_prob(
+                game_id=game_id,
+                market_odds=market_odds,
+                market_key=mkt_key,
+                label=label,
+                consensus_books=consensus_books,
+                debug=debug,
+                index=index,
+            )
+            for label in market
+        }
+    return results
+
+
 def get_paired_label(label, market_key, game_id, point=None):
     if label.startswith("Over"):
         return f"Under {point}" if point is not None else label.replace("Over", "Under")
@@ -1,42 +1,64 @@
 from core.config import DEBUG_MODE, VERBOSE_MODE
-from assets.stats_loader import load_pitcher_stats, load_batter_stats
-from core.project_hr_pa import project_hr_pa  # ✅ Added import
+from assets.stats_loader import (
+    BATTER_ALIAS_FILE,
+    PITCHER_ALIAS_FILE,
+    enrich_pitchers,
+    load_batter_stats,
+    pitcher_table,
+)
+from core import perf
+from core.stats_cache import STATS_CACHE_PATH, cached_table, read_cache, write_cache
 import pandas as pd
 import numpy as np
 import os
 
-def load_all_stats(patch_hrfb=False, verbose=False):
+BATTER_FILE = "data/Batters.csv"
+PITCHER_FILES = ("data/Pitchers.csv", "data/Stuff+_Location+.csv", "data/statcast.csv")
+
+@perf.traced("load_all_stats")
+def load_all_stats(patch_hrfb=False, verbose=False, cache_path=STATS_CACHE_PATH):
     """
     Loads batter and pitcher statistics from CSV files.
     Optionally applies HR/FB patch estimation to pitchers.
 
+    The enriched tables are cached in ``cache_path`` (see ``core.stats_cache``);
+    pass ``cache_path=None`` to always rebuild from the CSVs.
+
     Returns:
         (dict, dict): batter_stats, pitcher_stats
     """
+    cache = read_cache(cache_path) if cache_path else {}
+    dirty = False
+
+    def build_batters(previous):
+        return load_batter_stats(BATTER_FILE, verbose=verbose), {}
+
+    def build_pitchers(previous):
+        table = pitcher_table(*PITCHER_FILES, verbose=verbose)
+        stats, rows, n_enriched = enrich_pitchers(table, previous=previous, verbose=verbose)
+        if verbose:
+            print(f"🧪 Re-enriched {n_enriched} of {len(stats)} pitchers")
+        return stats, rows
+
     try:
-        batter_stats = load_batter_stats("data/Batters.csv")
+        batter_stats, changed = cached_table(cache, "batters", [BATTER_FILE, BATTER_ALIAS_FILE], build_batters)
+        dirty |= changed
     except Exception as e:
         print(f"[WARNING] Failed to load Batters.csv: {e}")
         batter_stats = {}
 
     try:
-        pitcher_stats = load_pitcher_stats(
-            "data/Pitchers.csv",
-            "data/Stuff+_Location+.csv",
-            "data/statcast.csv",
-            patch_hrfb=patch_hrfb,
-            verbose=verbose
-        )
+        pitcher_stats, changed = cached_table(cache, "pitchers", [*PITCHER_FILES, PITCHER_ALIAS_FILE], build_pitchers)
+        dirty |= changed
     except Exception as e:
         print(f"[WARNING] Failed to load pitcher stats: {e}")
         pitcher_stats = {}
 
-    # ✅ Apply HR/PA projection to each pitcher
-    for name, stats in pitcher_stats.items():
+    if cache_path and dirty:
         try:
-            stats["hr_pa"] = project_hr_pa(stats)
-        except Exception as e:
-            print(f"[ERROR] Failed to project HR/PA for {name}: {e}")
+            write_cache(cache, cache_path)
+        except OSError as e:
+            print(f"[WARNING] Failed to write stats cache: {e}")
 
     # Bulletproof debug print of enriched pitchers
     enriched_sample = {
@@ -2,11 +2,14 @@ import time
 import requests
 from requests.exceptions import RequestException
 
+from core import perf
+
 # Status codes that are safe to retry. Anything else could result in the
 # message being delivered despite a non-2xx response, so we avoid retries in
 # those cases to prevent duplicate Discord posts.
 RETRY_STATUS_CODES = {500, 502, 503, 504, 429}
 
+@perf.traced("discord_dispatch")
 def post_with_retries(
     url: str,
     logger=None,
@@ -4,6 +4,23 @@ from core.logger import get_logger
 
 logger = get_logger(__name__)
 
+
+def tto_penalty(tto):
+    """Return the times-through-the-order penalty applied to K and BB rates."""
+    if tto == 2:
+        return 0.015
+    elif tto == 3:
+        return 0.035
+    elif tto >= 4:
+        return 0.060
+    return 0.0
+
+
+def fatigue_level(pitch_count):
+    """Return the pitch-count fatigue level (0 until 75 pitches, +1 per 25 after)."""
+    return max(0, (pitch_count - 75) / 25)
+
+
 def apply_fatigue_modifiers(pitcher_stats, pitcher_state):
     """
     Apply fatigue effects to pitcher stats based on pitch count and TTO.
@@ -22,22 +39,14 @@ def apply_fatigue_modifiers(pitcher_stats, pitcher_state):
     tto = pitcher_state.get("tto_count", 1)
     
     # Adjust strikeout and walk rates based on TTO.
-    if tto == 2:
-        tto_penalty = 0.015
-    elif tto == 3:
-        tto_penalty = 0.035
-    elif tto >= 4:
-        tto_penalty = 0.060
-    else:
-        tto_penalty = 0.0
-    
-    adjusted["k_rate"] *= (1 - tto_penalty)
-    adjusted["bb_rate"] *= (1 + tto_penalty)
+    penalty = tto_penalty(tto)
+    adjusted["k_rate"] *= (1 - penalty)
+    adjusted["bb_rate"] *= (1 + penalty)
     
     # Adjust for overall pitch count fatigue.
-    fatigue_level = max(0, (pitch_count - 75) / 25)
-    k_decay = 1.0 - 0.02 * fatigue_level
-    bb_inflate = 1.0 + 0.03 * fatigue_level
+    level = fatigue_level(pitch_count)
+    k_decay = 1.0 - 0.02 * level
+    bb_inflate = 1.0 + 0.03 * level
     
     adjusted["k_rate"] *= k_decay
     adjusted["bb_rate"] *= bb_inflate
@@ -45,7 +54,7 @@ def apply_fatigue_modifiers(pitcher_stats, pitcher_state):
     # Apply fatigue to metrics like stuff, command, and location.
     for key in ["stuff_plus", "command_plus", "location_plus"]:
         if key in adjusted:
-            decay = max(0.85, 1 - 0.015 * fatigue_level)
+            decay = max(0.85, 1 - 0.015 * level)
             adjusted[key] *= decay
     
     # HR/FB is not adjusted in the new model.
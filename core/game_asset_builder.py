@@ -1,14 +1,16 @@
 from core.config import DEBUG_MODE, VERBOSE_MODE
+import copy
 import csv
 from collections import defaultdict
 import json
 from datetime import datetime
 from assets.probable_pitchers import fetch_probable_pitchers
-from assets.lineup_scraper_selenium import fetch_lineups_selenium
+from assets.lineup_source import fetch_lineups
 from assets.stats_loader import load_batter_stats, load_pitcher_stats, normalize_name
 from core.utils import get_teams_from_game_id
 from assets.bullpen_utils import build_bullpen_for_team
 from core.project_hr_pa import project_hr_pa
+from core import perf
 import numpy as np
 
 TEAM_ABBR_FIXES = {
@@ -19,6 +21,10 @@ TEAM_ABBR_FIXES = {
     "ATH": "OAK"
 }
 
+RELIEVER_DEPTH_CHART_PATH = "data/reliever_depth_chart_2025-04-03.json"
+PARK_FACTORS_PATH = "data/park_factors.json"
+DEFAULT_PARK_FACTORS = {"hr_mult": 1.0, "single_mult": 1.0}
+
 def load_projected_lineups_from_csv(path="data/Batters.csv", key_metric="woba", top_n=9):
     from core.utils import TEAM_ABBR_FIXES  # this must be present
 
@@ -64,46 +70,143 @@ def load_projected_lineups_from_csv(path="data/Batters.csv", key_metric="woba",
         return {}
 
 
-def build_game_assets(game_id, batter_stats, pitcher_stats, patch_hrfb=False):
-    try:
-        projected_lineups = load_projected_lineups_from_csv()
-
+class SlateContext:
+    """Inputs shared by every game on one date, fetched once per slate.
+
+    Holds the probable-pitcher schedule, the scraped and projected lineups,
+    the batter alias map, the reliever depth chart and park factors.  Each
+    team's bullpen (with ``hr_pa``) is built on first use and reused for the
+    rest of the slate; ``build_game_assets`` hands every game its own copy.
+    """
+
+    def __init__(self, date, pitcher_stats, matchups, lineups, projected_lineups, batter_alias_map, depth_chart, park_factors=None):
+        self.date = date
+        self.pitcher_stats = pitcher_stats
+        self.matchups = matchups
+        self.lineups = lineups
+        self.projected_lineups = projected_lineups
+        self.batter_alias_map = batter_alias_map
+        self.depth_chart = depth_chart
+        self.park_factors = park_factors
+        # Today's starters are kept out of every bullpen
+        self.starters = {
+            normalize_name(game[side]["name"])
+            for game in matchups.values()
+            for side in ("home", "away")
+            if game.get(side, {}).get("name")
+        }
+        self._bullpens = {}
+
+    def teams(self):
+        """Team abbreviations playing on ``date``."""
+        teams = set()
+        for game_id in self.matchups:
+            if game_id.startswith(self.date):
+                teams.update(abbr.strip().upper() for abbr in get_teams_from_game_id(game_id))
+        return sorted(TEAM_ABBR_FIXES.get(team, team) for team in teams)
+
+    def bullpen(self, team_abbr):
+        """Return a copy of ``team_abbr``'s bullpen, building it on first use."""
+        if team_abbr not in self._bullpens:
+            self._bullpens[team_abbr] = build_bullpen_for_team(
+                team_abbr, self.pitcher_stats, self.depth_chart, starters=self.starters
+            )
+        return copy.deepcopy(self._bullpens[team_abbr])
+
+    def warm_bullpens(self):
+        """Build the bullpen of every team on the slate up front."""
+        for team in self.teams():
+            self.bullpen(team)
+
+    def park_factors_for(self, park_name):
+        """``get_park_factors`` against the park table loaded with the slate."""
+        if not self.park_factors:
+            return dict(DEFAULT_PARK_FACTORS)
+        return self.park_factors.get(park_name, self.park_factors.get("League Average", DEFAULT_PARK_FACTORS))
+
+
+@perf.traced("build_slate_context")
+def build_slate_context(date, batter_stats, pitcher_stats, matchups=None):
+    """Fetch everything the games on ``date`` share into a ``SlateContext``.
+
+    ``matchups`` may carry an already fetched ``fetch_probable_pitchers()``
+    result; otherwise the schedule is fetched here.  The lineup page is
+    fetched once for the whole slate.
+    """
+    if matchups is None:
         matchups = fetch_probable_pitchers()
-        if game_id not in matchups:
-            raise ValueError(f"Game ID '{game_id}' not found.")
 
-        matchup = matchups[game_id]
-        game_date = "-".join(game_id.split("-")[:3])
-        lineup_data = fetch_lineups_selenium(for_date=game_date)
+    lineup_data = fetch_lineups(for_date=date)
 
-        # 🧼 Normalize scraped team keys using TEAM_ABBR_FIXES
-        lineup_data = {
-            TEAM_ABBR_FIXES.get(team, team): batters
-            for team, batters in lineup_data.items()
-        }
-        suggest_missing_aliases_from_lineup(lineup_data, batter_stats)
+    # 🔒 Defensive check — make sure it's a dict
+    if not isinstance(lineup_data, dict):
+        print(f"❌ lineup_data is not a dict! Got type: {type(lineup_data)} — contents: {str(lineup_data)[:200]}")
+        raise TypeError("Scraped lineup data is not a dict")
+
+    # 🧼 Normalize scraped team keys using TEAM_ABBR_FIXES
+    lineup_data = {
+        TEAM_ABBR_FIXES.get(team, team): batters
+        for team, batters in lineup_data.items()
+    }
+    suggest_missing_aliases_from_lineup(lineup_data, batter_stats)
 
+    # 🔍 Helpful keys print for tracing
+    print(f"✅ Lineup data loaded: keys = {list(lineup_data.keys())}")
 
-        # 🔒 Defensive check — make sure it's a dict
-        if not isinstance(lineup_data, dict):
-            print(f"❌ lineup_data is not a dict! Got type: {type(lineup_data)} — contents: {str(lineup_data)[:200]}")
-            return None
+    try:
+        with open("batter_alias_map.json") as f:
+            alias_map_raw = json.load(f)
+            batter_alias_map = {normalize_name(k): normalize_name(v) for k, v in alias_map_raw.items()}
+    except FileNotFoundError:
+        batter_alias_map = {}
 
-        # 🔍 Helpful keys print for tracing
-        print(f"✅ Lineup data loaded: keys = {list(lineup_data.keys())}")
+    with open(RELIEVER_DEPTH_CHART_PATH) as f:
+        reliever_depth_chart = json.load(f)
+
+    try:
+        with open(PARK_FACTORS_PATH) as f:
+            park_factors = json.load(f)
+    except Exception as e:
+        print(f"[ERROR] Failed to load park factors: {e}")
+        park_factors = None
+
+    return SlateContext(
+        date,
+        pitcher_stats,
+        matchups,
+        lineup_data,
+        load_projected_lineups_from_csv(),
+        batter_alias_map,
+        reliever_depth_chart,
+        park_factors,
+    )
+
+
+@perf.traced("build_game_assets", game_arg="game_id")
+def build_game_assets(game_id, batter_stats, pitcher_stats, patch_hrfb=False, slate=None):
+    """Build lineups, starters and bullpens for ``game_id``.
+
+    ``slate`` is the ``SlateContext`` for the game's date; without one (or
+    with one for another date) a context is built for this game alone.
+    """
+    try:
+        game_date = "-".join(game_id.split("-")[:3])
+        if slate is None or slate.date != game_date:
+            slate = build_slate_context(game_date, batter_stats, pitcher_stats)
+
+        matchups = slate.matchups
+        if game_id not in matchups:
+            raise ValueError(f"Game ID '{game_id}' not found.")
+
+        matchup = matchups[game_id]
+        projected_lineups = slate.projected_lineups
+        lineup_data = slate.lineups
+        batter_alias_map = slate.batter_alias_map
 
         away_abbr_raw, home_abbr_raw = get_teams_from_game_id(game_id)
         away_abbr = TEAM_ABBR_FIXES.get(away_abbr_raw.strip().upper(), away_abbr_raw.strip().upper())
         home_abbr = TEAM_ABBR_FIXES.get(home_abbr_raw.strip().upper(), home_abbr_raw.strip().upper())
 
-
-        try:
-            with open("batter_alias_map.json") as f:
-                alias_map_raw = json.load(f)
-                batter_alias_map = {normalize_name(k): normalize_name(v) for k, v in alias_map_raw.items()}
-        except FileNotFoundError:
-            batter_alias_map = {}
-
         fallback_expansions = {"b": "brayan"}
 
         # ✅ Guard inside structure_batter
@@ -245,20 +348,9 @@ def build_game_assets(game_id, batter_stats, pitcher_stats, patch_hrfb=False):
             "away": structure_pitcher(matchup["away"]["name"])
         }
 
-        with open("data/reliever_depth_chart_2025-04-03.json") as f:
-            reliever_depth_chart = json.load(f)
-
-        home_bullpen = build_bullpen_for_team(home_abbr, pitcher_stats, reliever_depth_chart)
-        away_bullpen = build_bullpen_for_team(away_abbr, pitcher_stats, reliever_depth_chart)
-
-
-        for rp in home_bullpen:
-            rp["role"] = "RP"
-            rp["hr_pa"] = project_hr_pa(rp)
-
-        for rp in away_bullpen:
-            rp["role"] = "RP"
-            rp["hr_pa"] = project_hr_pa(rp)
+        # Relievers come back with role "RP" and their hr_pa projection
+        home_bullpen = slate.bullpen(home_abbr)
+        away_bullpen = slate.bullpen(away_abbr)
 
         return {
             "lineups": {"home": home_lineup, "away": away_lineup},
@@ -270,7 +362,7 @@ def build_game_assets(game_id, batter_stats, pitcher_stats, patch_hrfb=False):
         print(f"❌ Error in build_game_assets for {game_id}: {e}")
         return None
 
-    lineup_data = fetch_lineups_selenium(for_date=game_date)
+    lineup_data = fetch_lineups(for_date=game_date)
 
     # 🔒 Defensive check — make sure it's a dict
     if not isinstance(lineup_data, dict):
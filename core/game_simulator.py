@@ -1,6 +1,9 @@
 from core.config import DEBUG_MODE, VERBOSE_MODE
+import numpy as np
 from core.half_inning_simulator import simulate_half_inning
-from assets.bullpen_utils import simulate_reliever_chain
+from core.batch_game_simulator import MAX_INNINGS
+from assets.bullpen_utils import simulate_reliever_chain, as_bullpen_sampler
+from core.simulation_context import SimulationContext
 from core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -21,8 +24,44 @@ def simulate_game(
     away_bullpen=None,
     debug=False,
     return_inning_scores=False,
-    use_noise=True
+    use_noise=True,
+    rng=None,
+    pa_tables=None,
+    inning_runs=None,
+    sim_context=None
 ):
+    """Simulate one game.
+
+    ``rng`` is a ``numpy.random.Generator`` (or anything ``default_rng``
+    accepts, e.g. an int seed or ``SeedSequence``) used for every draw in the
+    game.  When omitted the legacy global ``random``/``np.random`` state is used.
+    ``pa_tables`` from ``core.pa_tables.build_game_pa_tables`` switches every
+    PA to precomputed table lookups; build it once and reuse it across sims.
+
+    ``inning_runs`` switches to summary-only mode: pass a preallocated
+    ``(innings, 2)`` integer array (one row of a ``(n_sims, innings, 2)``
+    matrix) and away/home runs per inning are written into it.  No PA event
+    logs, ``recap`` or ``game_type`` are built and the result only holds
+    scores, ``innings_played`` and relievers used; with ``debug`` the
+    per-inning event logs are still returned under ``innings``.  Games still
+    tied when the array runs out of innings stop there.
+
+    ``sim_context`` is the ``SimulationContext`` holding the PA tally and the
+    reliever usage that drives bullpen fatigue; its RNG is used when ``rng``
+    is omitted.  Without one the legacy module-level counters are used.
+    Bullpens may be passed as prebuilt ``BullpenSampler`` objects to skip the
+    per-game weight precomputation.
+    """
+    pa_tables = pa_tables or {}
+    if rng is None and sim_context is not None:
+        rng = sim_context.rng
+    summary_only = inning_runs is not None
+    record_events = not summary_only or debug
+    if rng is not None and not isinstance(rng, np.random.Generator):
+        rng = np.random.default_rng(rng)
+    home_bullpen = as_bullpen_sampler(home_bullpen)
+    away_bullpen = as_bullpen_sampler(away_bullpen)
+
     home_score = 0
     away_score = 0
     innings_data = []
@@ -47,7 +86,7 @@ def simulate_game(
 
         if should_replace_pitcher(home_pitcher_state):
             if home_bullpen:
-                relievers = simulate_reliever_chain(home_bullpen, num_needed=1)
+                relievers = simulate_reliever_chain(home_bullpen, num_needed=1, side="home", rng=rng, sim_context=sim_context)
                 if relievers:
                     current_home_pitcher = relievers[0]
                     used_home_relievers.append(current_home_pitcher.get("name", "Unknown"))
@@ -63,7 +102,11 @@ def simulate_game(
             half="top",
             env=env,
             debug=debug,
-            use_noise=use_noise
+            use_noise=use_noise,
+            rng=rng,
+            pa_table=pa_tables.get("away"),
+            record_events=record_events,
+            sim_context=sim_context
         )
         away_batter_idx = away_half.get("next_batter_index", 0)
         away_score += away_half.get("runs_scored", 0)
@@ -72,7 +115,7 @@ def simulate_game(
         if not (inning == 9 and home_score > away_score):
             if should_replace_pitcher(away_pitcher_state):
                 if away_bullpen:
-                    relievers = simulate_reliever_chain(away_bullpen, num_needed=1)
+                    relievers = simulate_reliever_chain(away_bullpen, num_needed=1, side="away", rng=rng, sim_context=sim_context)
                     if relievers:
                         current_away_pitcher = relievers[0]
                         used_away_relievers.append(current_away_pitcher.get("name", "Unknown"))
@@ -88,7 +131,11 @@ def simulate_game(
                 half="bottom",
                 env=env,
                 debug=debug,
-                use_noise=use_noise
+                use_noise=use_noise,
+                rng=rng,
+                pa_table=pa_tables.get("home"),
+                record_events=record_events,
+                sim_context=sim_context
             )
             home_batter_idx = home_half.get("next_batter_index", 0)
             home_score += home_half.get("runs_scored", 0)
@@ -96,22 +143,44 @@ def simulate_game(
         else:
             home_half = {"runs_scored": 0, "events": []}
 
-        innings_data.append({
-            "inning": inning,
-            "away_runs": away_half.get("runs_scored", 0),
-            "home_runs": home_half.get("runs_scored", 0),
-            "top_half_events": away_half.get("events", []),
-            "bottom_half_events": home_half.get("events", [])
-        })
+        if summary_only:
+            inning_runs[inning - 1] = (away_half.get("runs_scored", 0), home_half.get("runs_scored", 0))
+        if record_events:
+            innings_data.append({
+                "inning": inning,
+                "away_runs": away_half.get("runs_scored", 0),
+                "home_runs": home_half.get("runs_scored", 0),
+                "top_half_events": away_half.get("events", []),
+                "bottom_half_events": home_half.get("events", [])
+            })
 
         if debug:
             print(f"📊 End of Inning {inning} | Score: Away {away_score} - Home {home_score}")
 
         if inning >= 9 and home_score != away_score:
             break
+        if summary_only and inning >= len(inning_runs):
+            break
 
         inning += 1
 
+    if sim_context is not None:
+        sim_context.counters["games"] += 1
+        sim_context.counters["innings"] += inning
+        sim_context.counters["pitching_changes"] += len(used_home_relievers) + len(used_away_relievers)
+
+    if summary_only:
+        result = {
+            "home_score": home_score,
+            "away_score": away_score,
+            "innings_played": inning,
+            "used_home_relievers": used_home_relievers,
+            "used_away_relievers": used_away_relievers,
+        }
+        if debug:
+            result["innings"] = innings_data
+        return result
+
     recap = {k: 0 for k in ["K", "BB", "1B", "2B", "3B", "HR", "OUT"]}
     for inning_data in innings_data:
         for half_key in ["top_half_events", "bottom_half_events"]:
@@ -156,6 +225,90 @@ def simulate_game(
     return result
 
 
+def simulate_games_summary(
+    n,
+    lineups,
+    pitchers,
+    bullpens=None,
+    env=None,
+    rng=None,
+    pa_tables=None,
+    use_noise=True,
+    debug=False,
+    max_innings=MAX_INNINGS,
+    sim_context=None,
+):
+    """Run ``n`` scalar-engine games in summary-only mode.
+
+    Each game writes its per-inning runs into one row of a preallocated
+    ``int8`` matrix, so memory stays at a few bytes per inning instead of an
+    event log per plate appearance.  Returns the same dict as
+    ``core.batch_game_simulator.simulate_games_batch`` (``inning_runs``,
+    ``home_score``, ``away_score``, ``innings_played`` and per-sim reliever
+    usage counts) plus ``pa_counts``, the run's PA outcome tally from
+    ``SimulationContext.pa_counts``.
+
+    All games share one ``sim_context`` (a fresh ``SimulationContext`` when
+    omitted), so bullpen fatigue accumulates within the run only.
+    """
+    if sim_context is None:
+        sim_context = SimulationContext(rng)
+    if rng is None:
+        rng = sim_context.rng
+    elif not isinstance(rng, np.random.Generator):
+        rng = np.random.default_rng(rng)
+    bullpens = bullpens or {}
+    home_bullpen = bullpens.get("home") or []
+    away_bullpen = bullpens.get("away") or []
+    # Reliever weights are precomputed once and shared by every game
+    samplers = {"home": as_bullpen_sampler(home_bullpen), "away": as_bullpen_sampler(away_bullpen)}
+    reliever_cols = {side: sampler.index if sampler else {} for side, sampler in samplers.items()}
+
+    inning_runs = np.zeros((n, max_innings, 2), dtype=np.int8)
+    home_score = np.zeros(n, dtype=np.int64)
+    away_score = np.zeros(n, dtype=np.int64)
+    innings_played = np.zeros(n, dtype=np.int64)
+    usage = {
+        "home": np.zeros((n, len(home_bullpen)), dtype=np.int16),
+        "away": np.zeros((n, len(away_bullpen)), dtype=np.int16),
+    }
+
+    for i in range(n):
+        result = simulate_game(
+            home_lineup=lineups["home"],
+            away_lineup=lineups["away"],
+            home_pitcher=pitchers["home"],
+            away_pitcher=pitchers["away"],
+            env=env,
+            home_bullpen=samplers["home"],
+            away_bullpen=samplers["away"],
+            debug=debug,
+            use_noise=use_noise,
+            rng=rng,
+            pa_tables=pa_tables,
+            inning_runs=inning_runs[i],
+            sim_context=sim_context,
+        )
+        home_score[i] = result["home_score"]
+        away_score[i] = result["away_score"]
+        innings_played[i] = result["innings_played"]
+        for side in ("home", "away"):
+            for name in result[f"used_{side}_relievers"]:
+                col = reliever_cols[side].get(name)
+                if col is not None:
+                    usage[side][i, col] += 1
+
+    played = int(innings_played.max()) if n else 0
+    return {
+        "inning_runs": inning_runs[:, :played, :],
+        "home_score": home_score,
+        "away_score": away_score,
+        "innings_played": innings_played,
+        "home_reliever_usage": usage["home"],
+        "away_reliever_usage": usage["away"],
+        "pa_counts": sim_context.pa_counts(),
+    }
+
 
 def build_sample_lineup(num_batters=9):
     """
@@ -2,17 +2,29 @@
 from core.config import DEBUG_MODE, VERBOSE_MODE
 import numpy as np
 import random
-from core.pa_simulator import simulate_pa
+from core.pa_simulator import simulate_pa, log_pa_outcome
+from core.pa_tables import sample_pa_outcome
 from core.fatigue_modeling import apply_fatigue_modifiers
 from core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Baserunning and scoring rates shared by the scalar handlers and the
+# table-driven engines built on ``enumerate_transitions``
+DOUBLE_PLAY_RATE = 0.14
+SINGLE_SCORES_FROM_SECOND_RATE = 0.4
+SINGLE_ADVANCES_FROM_FIRST_RATE = 0.8
+TWO_OUT_SCORE_FROM_SECOND_RATE = 0.10
+DOUBLE_SCORES_FROM_FIRST_RATE = 0.4
+MISC_RUN_RATE = 0.011
+GHOST_RUN_RATE = 0.01
+MAX_PA_PER_HALF = 30
+
 
 def maybe_inject_misc_run(runs, runner_reached, rng=None):
     """Occasionally convert a scoreless inning into a one-run frame."""
     rand = rng if rng is not None else random
-    if runner_reached and runs == 0 and rand.random() < 0.011:
+    if runner_reached and runs == 0 and rand.random() < MISC_RUN_RATE:
         return runs + 1
     return runs
 
@@ -20,7 +32,7 @@ def maybe_inject_misc_run(runs, runner_reached, rng=None):
 def maybe_inject_ghost_run(runs, runner_reached, rng=None):
     """Add a possible unearned ghost run if a runner reached base."""
     rand = rng if rng is not None else random
-    if runner_reached and rand.random() < 0.01:
+    if runner_reached and rand.random() < GHOST_RUN_RATE:
         return runs + 1
     return runs
 
@@ -32,7 +44,7 @@ def maybe_score_from_second(before_state, after_state, outs, rng=None):
         outs == 2
         and before_state[1] is not None
         and after_state[2] is not None
-        and rand.random() < 0.10
+        and rand.random() < TWO_OUT_SCORE_FROM_SECOND_RATE
     ):
         after_state[2] = None
         return after_state, 1
@@ -73,7 +85,7 @@ def _advance_bases(base_state, transitions, batter=None, debug=False):
 def _handle_out(base_state, outs, rng=None, debug=False):
     """Handle strikeouts and generic outs."""
     rand = rng if rng is not None else random
-    if base_state[0] and outs < 2 and rand.random() < 0.14:
+    if base_state[0] and outs < 2 and rand.random() < DOUBLE_PLAY_RATE:
         if debug:
             logger.debug("     Double play chance triggered")
         new_state = base_state.copy()
@@ -100,9 +112,9 @@ def _handle_single(base_state, batter, outs, rng=None, debug=False):
     if base_state[2]:
         mapping[2] = "home"
     if base_state[1]:
-        mapping[1] = "home" if rand.random() < 0.4 else 2
+        mapping[1] = "home" if rand.random() < SINGLE_SCORES_FROM_SECOND_RATE else 2
     if base_state[0]:
-        mapping[0] = 1 if rand.random() < 0.8 else 0
+        mapping[0] = 1 if rand.random() < SINGLE_ADVANCES_FROM_FIRST_RATE else 0
     mapping["batter"] = 0
     new_state, runs = _advance_bases(base_state, mapping, batter, debug=debug)
     new_state, extra = maybe_score_from_second(base_state, new_state, outs, rng=rand)
@@ -117,7 +129,7 @@ def _handle_double(base_state, batter, rng=None, debug=False):
     if base_state[1]:
         mapping[1] = "home"
     if base_state[0]:
-        mapping[0] = "home" if rand.random() < 0.4 else 2
+        mapping[0] = "home" if rand.random() < DOUBLE_SCORES_FROM_FIRST_RATE else 2
     mapping["batter"] = 1
     new_state, runs = _advance_bases(base_state, mapping, batter, debug=debug)
     return new_state, runs, 0
@@ -135,6 +147,85 @@ def _handle_home_run(base_state, batter, rng=None, debug=False):
         logger.debug(f"     Home run! {runs} run(s) score")
     return [None, None, None], runs, 0
 
+def _mask_to_bases(base_mask):
+    return ["R" if base_mask >> i & 1 else None for i in range(3)]
+
+
+def _bases_to_mask(base_state):
+    return sum(1 << i for i, runner in enumerate(base_state) if runner)
+
+
+def enumerate_transitions(outcome, base_mask, outs):
+    """Return every result of ``outcome`` from a base/out state with its probability.
+
+    Bases are encoded as a bitmask (bit 0 = 1B, bit 1 = 2B, bit 2 = 3B).  The
+    result is a list of ``(prob, new_base_mask, runs, outs_added)`` tuples that
+    follows the ``_handle_*`` rules exactly, including their runner-collision
+    quirks, so table-driven engines price the same game as ``simulate_half_inning``.
+    """
+    base_state = _mask_to_bases(base_mask)
+    branches = {}
+
+    def add(prob, new_state, runs, outs_added):
+        key = (_bases_to_mask(new_state), runs, outs_added)
+        branches[key] = branches.get(key, 0.0) + prob
+
+    if outcome in ("K", "OUT"):
+        if base_state[0] and outs < 2:
+            dp_state = base_state.copy()
+            dp_state[0] = None
+            add(DOUBLE_PLAY_RATE, dp_state, 0, 2)
+            add(1 - DOUBLE_PLAY_RATE, base_state, 0, 1)
+        else:
+            add(1.0, base_state, 0, 1)
+    elif outcome == "1B":
+        second_options = [("home", SINGLE_SCORES_FROM_SECOND_RATE), (2, 1 - SINGLE_SCORES_FROM_SECOND_RATE)] if base_state[1] else [(None, 1.0)]
+        first_options = [(1, SINGLE_ADVANCES_FROM_FIRST_RATE), (0, 1 - SINGLE_ADVANCES_FROM_FIRST_RATE)] if base_state[0] else [(None, 1.0)]
+        for second_dest, p_second in second_options:
+            for first_dest, p_first in first_options:
+                mapping = {"batter": 0}
+                if base_state[2]:
+                    mapping[2] = "home"
+                if second_dest is not None:
+                    mapping[1] = second_dest
+                if first_dest is not None:
+                    mapping[0] = first_dest
+                new_state, runs = _advance_bases(base_state, mapping, "B")
+                prob = p_second * p_first
+                if outs == 2 and base_state[1] is not None and new_state[2] is not None:
+                    scored_state = new_state.copy()
+                    scored_state[2] = None
+                    add(prob * TWO_OUT_SCORE_FROM_SECOND_RATE, scored_state, runs + 1, 0)
+                    add(prob * (1 - TWO_OUT_SCORE_FROM_SECOND_RATE), new_state, runs, 0)
+                else:
+                    add(prob, new_state, runs, 0)
+    elif outcome == "2B":
+        first_options = [("home", DOUBLE_SCORES_FROM_FIRST_RATE), (2, 1 - DOUBLE_SCORES_FROM_FIRST_RATE)] if base_state[0] else [(None, 1.0)]
+        for first_dest, p_first in first_options:
+            mapping = {"batter": 1}
+            if base_state[2]:
+                mapping[2] = "home"
+            if base_state[1]:
+                mapping[1] = "home"
+            if first_dest is not None:
+                mapping[0] = first_dest
+            new_state, runs = _advance_bases(base_state, mapping, "B")
+            add(p_first, new_state, runs, 0)
+    elif outcome == "BB":
+        new_state, runs, outs_added = _handle_walk(base_state, "B")
+        add(1.0, new_state, runs, outs_added)
+    elif outcome == "3B":
+        new_state, runs, outs_added = _handle_triple(base_state, "B")
+        add(1.0, new_state, runs, outs_added)
+    elif outcome == "HR":
+        new_state, runs, outs_added = _handle_home_run(base_state, "B")
+        add(1.0, new_state, runs, outs_added)
+    else:
+        raise ValueError(f"Unknown outcome: {outcome}")
+
+    return [(prob, mask, runs, outs_added) for (mask, runs, outs_added), prob in branches.items()]
+
+
 def simulate_half_inning(
     lineup,
     pitcher,
@@ -146,9 +237,23 @@ def simulate_half_inning(
     env=None,
     debug=False,
     use_noise=True,
-    rng=None
+    rng=None,
+    pa_table=None,
+    record_events=True,
+    sim_context=None
 ):
-    """Simulate a half inning and return run totals and events."""
+    """Simulate a half inning and return run totals and events.
+
+    When ``pa_table`` (from ``core.pa_tables.build_pa_table``) is given, each
+    PA is sampled with one table lookup and one uniform draw instead of going
+    through ``apply_fatigue_modifiers`` and ``simulate_pa``.
+    With ``record_events=False`` no per-PA event dicts are built (unless
+    ``debug`` is set) and ``events`` is returned empty.
+    PA outcomes are tallied in ``sim_context`` (a ``SimulationContext``), whose
+    RNG is used when ``rng`` is omitted.
+    """
+    if rng is None and sim_context is not None:
+        rng = sim_context.rng
     outs = 0
     runs = 0
     batter_idx = start_batter_index
@@ -157,9 +262,10 @@ def simulate_half_inning(
     runner_reached = False
 
     pitcher_state = pitcher_state or {"batters_faced": 0, "pitch_count": 0, "tto_count": 1}
-    max_pa = 30
+    max_pa = MAX_PA_PER_HALF
     pa_count = 0
     team_key = "AWAY" if half == "top" else "HOME"
+    record_events = record_events or debug
 
     outcome_handlers = {
         "K": _handle_out,
@@ -177,23 +283,36 @@ def simulate_half_inning(
         if batter_idx > 0 and batter_idx % len(lineup) == 0:
             pitcher_state["tto_count"] += 1
 
-        adj_pitcher = apply_fatigue_modifiers(pitcher, pitcher_state)
-
-        result = simulate_pa(
-            batter,
-            adj_pitcher,
-            context.get("umpire", {}),
-            context.get("weather_hr", 1.0),
-            pitcher_state["batters_faced"],
-            env=env,
-            debug=debug,
-            return_probs=True,
-            batting_team=team_key,
-            use_noise=use_noise,
-            rng=rng,
-        )
-
-        outcome = result[0] if isinstance(result, tuple) else result
+        if pa_table is not None:
+            rand = rng if rng is not None else np.random
+            outcome = sample_pa_outcome(
+                pa_table,
+                batter_idx % len(lineup),
+                pa_table["pitcher_index"][id(pitcher)],
+                pitcher_state["tto_count"],
+                pitcher_state["pitch_count"],
+                rand.random(),
+            )
+            log_pa_outcome(team_key, outcome, sim_context)
+        else:
+            adj_pitcher = apply_fatigue_modifiers(pitcher, pitcher_state)
+
+            result = simulate_pa(
+                batter,
+                adj_pitcher,
+                context.get("umpire", {}),
+                context.get("weather_hr", 1.0),
+                pitcher_state["batters_faced"],
+                env=env,
+                debug=debug,
+                return_probs=True,
+                batting_team=team_key,
+                use_noise=use_noise,
+                rng=rng,
+                sim_context=sim_context,
+            )
+
+            outcome = result[0] if isinstance(result, tuple) else result
 
         if debug:
             logger.debug(f"⚾ {half.upper()} {inning} | Batter: {batter['name']} → {outcome}")
@@ -220,16 +339,17 @@ def simulate_half_inning(
         batter_idx += 1
         pa_count += 1
 
-        events.append(
-            {
-                "inning": inning,
-                "half": half,
-                "batter": batter["name"],
-                "pitcher": pitcher["name"],
-                "outcome": outcome,
-                "runs_scored": runs_this_play,
-            }
-        )
+        if record_events:
+            events.append(
+                {
+                    "inning": inning,
+                    "half": half,
+                    "batter": batter["name"],
+                    "pitcher": pitcher["name"],
+                    "outcome": outcome,
+                    "runs_scored": runs_this_play,
+                }
+            )
 
         if debug:
             logger.debug(f"     Runs scored this play: {runs_this_play}")
@@ -241,12 +361,14 @@ def simulate_half_inning(
 
     new_runs = maybe_inject_misc_run(runs, runner_reached, rng=rng)
     if new_runs > runs:
-        events.append({"inning": inning, "half": half, "batter": None, "pitcher": pitcher["name"], "outcome": "MISC_RUN", "runs_scored": 1})
+        if record_events:
+            events.append({"inning": inning, "half": half, "batter": None, "pitcher": pitcher["name"], "outcome": "MISC_RUN", "runs_scored": 1})
         runs = new_runs
 
     new_runs = maybe_inject_ghost_run(runs, runner_reached, rng=rng)
     if new_runs > runs:
-        events.append({"inning": inning, "half": half, "batter": None, "pitcher": pitcher["name"], "outcome": "GHOST_RUN", "runs_scored": 1})
+        if record_events:
+            events.append({"inning": inning, "half": half, "batter": None, "pitcher": pitcher["name"], "outcome": "GHOST_RUN", "runs_scored": 1})
         runs = new_runs
 
     return {
@@ -145,12 +145,13 @@ def prob_to_moneyline(prob):
     return f"{int(to_american_odds(prob)):+}"
 
 # === Moneyline Pricing ===
-def compute_moneyline(home_scores, away_scores):
+def compute_moneyline(home_scores, away_scores, weights=None):
     """
     Given lists of simulated scores, compute win probabilities and fair odds.
+    ``weights`` optionally weights each simulation.
     """
     home_win = np.array(home_scores) > np.array(away_scores)
-    p_home = home_win.mean()
+    p_home = np.average(home_win, weights=weights)
     p_away = 1 - p_home
 
     return {
@@ -0,0 +1,565 @@
+# markov_solver.py
+"""Exact run-distribution solver for the half-inning/game model.
+
+A half inning is a Markov chain over 24 base/out states plus the runs scored.
+This module walks that chain analytically, using the same transition rules as
+``simulate_half_inning`` (via ``enumerate_transitions``) and the same PA
+probabilities as the simulators (via ``core.pa_tables``).  Each offense is then
+chained inning by inning over its lineup/pitcher context (next batter, current
+pitcher, pitch count and times through the order, including reliever entries),
+and the two offenses are combined under the game's end rules into exact score
+distributions.  Results carry no Monte Carlo noise, so they serve as a
+cross-check for ``simulate_distribution`` (its ``analytic_check`` block);
+markets are still priced from the simulated scores.  Carrying the exact
+pitcher state makes a full game take several seconds, far more than a
+10,000-sim batch run.
+
+The solver is exact through regulation and the 10th inning.  From the 11th
+inning on, lineup/pitcher contexts that reach the same tie score along
+different paths are merged, which only affects the rare games still tied
+after 10 innings.  Contexts lighter than ``PRUNE_MASS`` are dropped as the
+chain advances; ``solve_game`` reports the total dropped mass (around 1e-6).
+"""
+
+from core.config import DEBUG_MODE, VERBOSE_MODE
+import numpy as np
+
+from core.half_inning_simulator import (
+    enumerate_transitions,
+    MISC_RUN_RATE,
+    GHOST_RUN_RATE,
+    MAX_PA_PER_HALF,
+)
+from core.pa_tables import OUTCOMES, tto_bucket, fatigue_bucket, FATIGUE_START, FATIGUE_BUCKETS
+from core.batch_game_simulator import build_matchup_tables
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+RUN_POINTS = 64           # cumulative runs tracked per team (mass beyond is dropped)
+MAX_HALF_RUNS = 30        # runs tracked within a single half inning
+MAX_RUNS_PER_PLAY = 4
+MAX_INNINGS = 30          # same cap as the batch engine
+PRUNE_MASS = 1e-10        # contexts lighter than this are dropped
+PRUNE_ENTRY = 1e-15       # individual probabilities below this are treated as zero
+SEGMENT_INNINGS = (1, 3, 5, 7)
+PITCH_LIMIT = 90          # same replacement rule as the simulators
+TTO_LIMIT = 3
+TTO_CAP = 4               # TTO counts past the last bucket behave identically
+PC_CAP = FATIGUE_START + FATIGUE_BUCKETS - 1   # pitch counts past this behave identically
+FRESH_PC = FATIGUE_START - MAX_PA_PER_HALF + 1  # at or below this, no fatigue within a half
+
+# Transient states: 0..23 are (outs * 8 + bases) once a runner has reached;
+# 24..26 are "nobody has reached yet" with 0, 1 or 2 outs and empty bases.
+N_STATES = 27
+UNREACHED = 24
+
+
+def _build_chain():
+    """Return per-outcome transient and absorbing transition arrays.
+
+    ``move[o, r]`` is a ``(N_STATES, N_STATES)`` matrix of probabilities of
+    moving between transient states while scoring ``r`` runs; ``absorb[o]`` is
+    ``(N_STATES, 2)`` giving the probability the inning ends (third out) with
+    the "runner reached" flag unset (column 0) or set (column 1).
+    """
+    move = np.zeros((len(OUTCOMES), MAX_RUNS_PER_PLAY + 1, N_STATES, N_STATES))
+    absorb = np.zeros((len(OUTCOMES), N_STATES, 2))
+    sources = [(s, s // 8, s % 8, True) for s in range(24)]
+    sources += [(UNREACHED + outs, outs, 0, False) for outs in range(3)]
+
+    for o, outcome in enumerate(OUTCOMES):
+        for state, outs, bases, reached in sources:
+            for prob, new_bases, runs, outs_added in enumerate_transitions(outcome, bases, outs):
+                new_outs = outs + outs_added
+                now_reached = reached or runs > 0 or new_bases != 0
+                if new_outs >= 3:
+                    absorb[o, state, int(now_reached)] += prob
+                elif now_reached:
+                    move[o, runs, state, new_outs * 8 + new_bases] += prob
+                else:
+                    move[o, runs, state, UNREACHED + new_outs] += prob
+    return move, absorb
+
+
+_MOVE, _ABSORB = _build_chain()
+
+
+def _pa_step(table, slot, pitcher_idx, tto_count, pitch_count, cache=None):
+    """Return the stacked transition matrix for one PA, mixed over its outcome probabilities.
+
+    Rows ``r * N_STATES + t`` give the probability of moving to transient
+    state ``t`` while scoring ``r`` runs; the last two rows give the
+    probability the inning ends without/with a runner having reached.
+    """
+    key = (slot, pitcher_idx, tto_bucket(tto_count), fatigue_bucket(pitch_count))
+    if cache is not None and key in cache:
+        return cache[key]
+    probs = np.diff(table["cum_probs"][key], prepend=0.0)
+    step = np.vstack([
+        np.einsum("o,oqst->qts", probs, _MOVE).reshape(-1, N_STATES),
+        np.einsum("o,osf->fs", probs, _ABSORB),
+    ])
+    if cache is not None:
+        cache[key] = step
+    return step
+
+
+def count_wraps(start_slot, n_pa, lineup_size):
+    """Return how many times ``tto_count`` increments over ``n_pa`` PAs.
+
+    Mirrors ``simulate_half_inning``: the count goes up when the lineup wraps
+    mid-inning, but not when an inning starts with the leadoff hitter.
+    """
+    if n_pa <= 0:
+        return 0
+    return (start_slot + n_pa - 1) // lineup_size - max(start_slot - 1, 0) // lineup_size
+
+
+def half_inning_distribution(table, start_slot=0, pitcher_idx=0, pitch_count=0, tto_count=1, step_cache=None):
+    """Return the exact joint distribution of (PAs used, runs) for one half inning.
+
+    The result has shape ``(MAX_PA_PER_HALF + 1, MAX_HALF_RUNS + 1)``; row ``k``
+    is the run PMF of half innings that ended after ``k`` plate appearances.
+    Misc and ghost runs are included.  ``step_cache`` is an optional dict
+    reused across calls on the same table.
+    """
+    return _half_inning_batch(table, start_slot, [pitcher_idx], [pitch_count], tto_count, step_cache)[0]
+
+
+def _batch_step(table, slots, pitchers, tto, pitch_counts, step_cache=None):
+    """Return the ``_pa_step`` matrix for each row's PA, shared when all rows agree."""
+    n_pitchers = table["cum_probs"].shape[1]
+    # One context per (slot, pitcher, TTO bucket, fatigue bucket)
+    contexts, inverse = np.unique(
+        ((slots * n_pitchers + pitchers) * TTO_CAP + np.minimum(tto, TTO_CAP) - 1) * FATIGUE_BUCKETS
+        + np.clip(pitch_counts - FATIGUE_START, 0, FATIGUE_BUCKETS - 1),
+        return_inverse=True,
+    )
+    steps = []
+    for c in contexts:
+        c, fatigue = divmod(int(c), FATIGUE_BUCKETS)
+        c, tto_b = divmod(c, TTO_CAP)
+        slot, pitcher = divmod(c, n_pitchers)
+        steps.append(_pa_step(table, slot, pitcher, tto_b + 1, FATIGUE_START + fatigue, step_cache))
+    return steps[0] if len(steps) == 1 else np.stack(steps)[inverse]
+
+
+def _half_inning_batch(table, start_slot, pitcher_idx, pitch_counts, tto_count, step_cache=None):
+    """``half_inning_distribution`` for several (pitcher, starting pitch count) pairs at once.
+
+    ``start_slot`` and ``tto_count`` may also be per-row arrays.
+    """
+    lineup_size = table["lineup_size"]
+    pitch_counts = np.asarray(pitch_counts, dtype=np.int64)
+    n = pitch_counts.size
+    pitchers = np.broadcast_to(np.asarray(pitcher_idx, dtype=np.int64), (n,))
+    slots = np.broadcast_to(np.asarray(start_slot, dtype=np.int64), (n,))
+    tto = np.broadcast_to(np.asarray(tto_count, dtype=np.int64), (n,)).copy()
+    current = np.zeros((n, N_STATES, MAX_HALF_RUNS + 1))
+    current[:, UNREACHED, 0] = 1.0
+    ended = np.zeros((n, MAX_PA_PER_HALF + 1, 2, MAX_HALF_RUNS + 1))
+
+    width = 1    # runs columns that can be nonzero so far
+    for k in range(MAX_PA_PER_HALF):
+        idx = slots + k
+        tto += (idx > 0) & (idx % lineup_size == 0)
+        step = _batch_step(table, idx % lineup_size, pitchers, tto, pitch_counts + k, step_cache)
+        out = step @ current[:, :, :width]
+
+        ended[:, k + 1, :, :width] = out[:, -2:]
+        moved = out[:, :-2].reshape(n, MAX_RUNS_PER_PLAY + 1, N_STATES, width)
+        new_width = min(width + MAX_RUNS_PER_PLAY, MAX_HALF_RUNS + 1)
+        current = np.zeros_like(current)
+        for r in range(MAX_RUNS_PER_PLAY + 1):
+            span = min(width, MAX_HALF_RUNS + 1 - r)
+            current[:, :, r:r + span] += moved[:, r, :, :span]
+        width = new_width
+        if current.sum() < PRUNE_MASS:
+            break
+    else:
+        # PA cap reached: the half ends with whatever has scored so far
+        ended[:, MAX_PA_PER_HALF, 0] += current[:, UNREACHED:].sum(axis=1)
+        ended[:, MAX_PA_PER_HALF, 1] += current[:, :UNREACHED].sum(axis=1)
+
+    reached = ended[:, :, 1].copy()
+    misc = reached[:, :, 0] * MISC_RUN_RATE
+    reached[:, :, 0] -= misc
+    reached[:, :, 1] += misc
+    ghost = reached * GHOST_RUN_RATE
+    reached *= 1 - GHOST_RUN_RATE
+    reached[:, :, 1:] += ghost[:, :, :-1]
+
+    return ended[:, :, 0] + reached
+
+
+def half_inning_expected_runs(table, start_slot, pitcher_idx, pitch_counts, tto_count, step_cache=None):
+    """Exact expected runs (misc and ghost runs included) of half innings from the given starts.
+
+    Arguments are as for ``_half_inning_batch``.  Instead of the full run
+    distribution, each transient state only carries its probability, the
+    expected runs scored so far and the probability nothing has scored yet
+    (which drives the misc-run adjustment), so this is far cheaper.
+    """
+    lineup_size = table["lineup_size"]
+    pitch_counts = np.asarray(pitch_counts, dtype=np.int64)
+    n = pitch_counts.size
+    pitchers = np.broadcast_to(np.asarray(pitcher_idx, dtype=np.int64), (n,))
+    slots = np.broadcast_to(np.asarray(start_slot, dtype=np.int64), (n,))
+    tto = np.broadcast_to(np.asarray(tto_count, dtype=np.int64), (n,)).copy()
+    # Columns: probability, expected runs so far, probability of no runs yet
+    current = np.zeros((n, N_STATES, 3))
+    current[:, UNREACHED, 0] = 1.0
+    current[:, UNREACHED, 2] = 1.0
+    expected = np.zeros(n)
+    reached = np.zeros(n)
+    scoreless_reached = np.zeros(n)
+    play_runs = np.arange(MAX_RUNS_PER_PLAY + 1)
+
+    for k in range(MAX_PA_PER_HALF):
+        idx = slots + k
+        tto += (idx > 0) & (idx % lineup_size == 0)
+        out = _batch_step(table, idx % lineup_size, pitchers, tto, pitch_counts + k, step_cache) @ current
+
+        expected += out[:, -2:, 1].sum(axis=1)
+        reached += out[:, -1, 0]
+        scoreless_reached += out[:, -1, 2]
+        moved = out[:, :-2].reshape(n, MAX_RUNS_PER_PLAY + 1, N_STATES, 3)
+        current = np.stack([
+            moved[..., 0].sum(axis=1),
+            moved[..., 1].sum(axis=1) + np.einsum("r,nrs->ns", play_runs, moved[..., 0]),
+            moved[:, 0, :, 2],
+        ], axis=-1)
+        if current[:, :, 0].sum() < PRUNE_MASS:
+            break
+    else:
+        expected += current[:, :, 1].sum(axis=1)
+        reached += current[:, :UNREACHED, 0].sum(axis=1)
+        scoreless_reached += current[:, :UNREACHED, 2].sum(axis=1)
+
+    return expected + MISC_RUN_RATE * scoreless_reached + GHOST_RUN_RATE * reached
+
+
+# _SHIFT_IDX[x, level] is the level a half scoring x runs started from
+_SHIFT_SRC = np.arange(RUN_POINTS)[None, :] - np.arange(MAX_HALF_RUNS + 1)[:, None]
+_SHIFT_OK = _SHIFT_SRC >= 0
+_SHIFT_IDX = np.where(_SHIFT_OK, _SHIFT_SRC, 0)
+_SHIFT_RUNS = np.broadcast_to(np.arange(MAX_HALF_RUNS + 1)[:, None], _SHIFT_IDX.shape)
+
+
+class _Offense:
+    """Inning-by-inning chain for one batting lineup against one pitching staff.
+
+    The state is a dense array indexed by
+    ``[next slot, pitcher, tto_count - 1, run level, pitch count]``.  Run
+    levels are cumulative runs in regulation and tie scores in extra innings.
+    """
+
+    def __init__(self, tables):
+        self.tables = tables
+        self.lineup_size = tables["lineup_size"]
+        cum = tables["reliever_cum"]
+        self.reliever_probs = np.diff(cum, prepend=0.0) if cum is not None else None
+        self.shape = (self.lineup_size, tables["cum_probs"].shape[1], TTO_CAP, RUN_POINTS, PC_CAP + 1)
+        self._cache = {}
+        self._steps = {}
+
+    def start(self):
+        state = np.zeros(self.shape)
+        state[0, 0, 0, 0, 0] = 1.0
+        return state
+
+    def _halves_for(self, slot, tto, pitchers, pitch_counts):
+        """Return stacked ``(PAs, runs)`` distributions for each (pitcher, pitch count)."""
+        keys = [(slot, p, pc, tto_bucket(tto)) for p, pc in zip(pitchers, pitch_counts)]
+        missing = list(dict.fromkeys(key for key in keys if key not in self._cache))
+        if missing:
+            dists = _half_inning_batch(
+                self.tables, slot, [key[1] for key in missing], [key[2] for key in missing], tto, self._steps
+            )
+            for key, dist in zip(missing, dists):
+                self._cache[key] = np.where(dist > PRUNE_ENTRY, dist, 0.0)
+        return np.stack([self._cache[key] for key in keys])
+
+    def _change_pitchers(self, state):
+        if self.reliever_probs is None:
+            return state
+        state = state.copy()
+        tired = state[:, :, TTO_LIMIT - 1:].sum(axis=(1, 2, 4))
+        tired += state[:, :, :TTO_LIMIT - 1, :, PITCH_LIMIT + 1:].sum(axis=(1, 2, 4))
+        state[:, :, TTO_LIMIT - 1:] = 0.0
+        state[:, :, :TTO_LIMIT - 1, :, PITCH_LIMIT + 1:] = 0.0
+        state[:, 1:, 0, :, 0] += self.reliever_probs[None, :, None] * tired[:, None, :]
+        return state
+
+    def _blocks(self, state):
+        """Yield the next half's work per (slot, TTO) with mass.
+
+        Each item is ``(slot, tto, fresh, tired)``.  ``fresh`` covers pitch
+        counts that cannot reach fatigue within the half, which share one
+        distribution per pitcher: ``(pitchers, pitch counts, block, dists)``
+        with block shape ``(pitchers, levels, pitch counts)``.  ``tired`` covers the remaining
+        (pitcher, pitch count) pairs: ``(pitchers, pitch counts, block, dists)``
+        with block shape ``(pairs, levels)``.  ``dists`` is ``(n, PAs, runs)``.
+        """
+        for slot in range(self.lineup_size):
+            for t in range(TTO_CAP):
+                block = state[slot, :, t]
+                p_idx, pc_idx = np.nonzero(block.sum(axis=1) > PRUNE_MASS)
+                if not p_idx.size:
+                    continue
+                tto = t + 1
+                fresh = tired = None
+                early = pc_idx <= FRESH_PC
+                if early.any():
+                    fresh_p, fresh_pc = np.unique(p_idx[early]), np.unique(pc_idx[early])
+                    dists = self._halves_for(slot, tto, fresh_p, [FRESH_PC] * fresh_p.size)
+                    fresh = (fresh_p, fresh_pc, block[np.ix_(fresh_p, np.arange(RUN_POINTS), fresh_pc)], dists)
+                late = pc_idx > FRESH_PC
+                if late.any():
+                    p_t, pc_t = p_idx[late], pc_idx[late]
+                    tired = (p_t, pc_t, block[p_t, :, pc_t], self._halves_for(slot, tto, p_t, pc_t))
+                yield slot, tto, fresh, tired
+
+    def _destination(self, slot, tto, pa):
+        return (slot + pa) % self.lineup_size, min(tto + count_wraps(slot, pa, self.lineup_size), TTO_CAP) - 1
+
+    def advance(self, state, weights=None):
+        """Return the state after one more half inning.
+
+        ``weights[level, runs]`` optionally scales mass by the run level it
+        starts from and the runs scored in this half.
+        """
+        result = np.zeros(self.shape)
+        if weights is not None:
+            scale = np.where(_SHIFT_OK, weights[_SHIFT_IDX, _SHIFT_RUNS], 0.0)
+        else:
+            scale = _SHIFT_OK.astype(float)
+
+        for slot, tto, fresh, tired in self._blocks(self._change_pitchers(state)):
+            if fresh is not None:
+                pitchers, counts, block, dists = fresh
+                rows, dists, top_in = _trim(dists, block.any(axis=(0, 2)))
+                n_runs = dists.shape[2]
+                top = min(top_in + n_runs - 1, RUN_POINTS)
+                # shifted[p, x, level, pc]: mass reaching ``level`` by scoring x runs
+                shifted = block[:, _SHIFT_IDX[:n_runs, :top]] * scale[None, :n_runs, :top, None]
+                moved = (dists @ shifted.reshape(len(pitchers), n_runs, -1)).reshape(len(pitchers), len(rows), top, -1)
+                for i, pa in enumerate(rows):
+                    dest_slot, dest_t = self._destination(slot, tto, pa)
+                    result[dest_slot, pitchers[:, None], dest_t, :top, counts + pa] += moved[:, i].transpose(0, 2, 1)
+            if tired is not None:
+                pitchers, counts, block, dists = tired
+                rows, dists, top_in = _trim(dists, block.any(axis=0))
+                n_runs = dists.shape[2]
+                top = min(top_in + n_runs - 1, RUN_POINTS)
+                shifted = block[:, _SHIFT_IDX[:n_runs, :top]] * scale[None, :n_runs, :top]
+                moved = dists @ shifted                                            # (pairs, PAs, level)
+                for i, pa in enumerate(rows):
+                    dest_slot, dest_t = self._destination(slot, tto, pa)
+                    new_counts = np.minimum(counts + pa, PC_CAP)
+                    index = (dest_slot, pitchers, dest_t, slice(0, top), new_counts)
+                    if counts[-1] + pa <= PC_CAP:
+                        result[index] += moved[:, i]
+                    else:
+                        np.add.at(result, index, moved[:, i])
+
+        result[result < PRUNE_ENTRY] = 0.0
+        return result
+
+    def runs_by_level(self, state):
+        """Return ``P[level, runs]``: mass at each level times the next half's run PMF."""
+        out = np.zeros((RUN_POINTS, RUN_POINTS))
+        for _, _, fresh, tired in self._blocks(self._change_pitchers(state)):
+            if fresh is not None:
+                _, _, block, dists = fresh
+                runs_pmf = dists.sum(axis=1)
+                out[:, :runs_pmf.shape[1]] += block.sum(axis=2).T @ runs_pmf
+            if tired is not None:
+                _, _, block, dists = tired
+                runs_pmf = dists.sum(axis=1)
+                out[:, :runs_pmf.shape[1]] += block.T @ runs_pmf
+        return out
+
+
+def _trim(dists, level_used):
+    """Drop all-zero PA rows and trailing run columns; return ``(rows, dists, levels in use)``."""
+    rows = np.nonzero(dists.any(axis=(0, 2)))[0]
+    n_runs = np.nonzero(dists.any(axis=(0, 1)))[0][-1] + 1
+    return rows, dists[:, rows, :n_runs], np.nonzero(level_used)[0][-1] + 1
+
+
+def _level_mass(state):
+    return state.sum(axis=(0, 1, 2, 4))
+
+
+def _scale_levels(state, target, current):
+    """Rescale each run level of ``state`` from ``current`` mass to ``target`` mass."""
+    scale = np.divide(target, current, out=np.zeros_like(target), where=current > 0)
+    return state * scale[:, None]
+
+
+def solve_game(lineups, pitchers, bullpens=None, env=None, max_innings=MAX_INNINGS):
+    """Return exact score distributions for a game.
+
+    Arguments mirror ``simulate_games_batch``.  Returns a dict with:
+      - ``final``: ``(RUN_POINTS, RUN_POINTS)`` joint PMF of final
+        ``[away_runs, home_runs]``.
+      - ``segments``: ``{1: joint, 3: joint, 5: joint, 7: joint}`` joint PMFs
+        after that many complete innings.
+      - ``unresolved``: probability mass of games still tied after
+        ``max_innings`` (excluded from ``final``).
+      - ``truncated``: probability mass dropped by pruning and the
+        ``RUN_POINTS`` cap.
+    """
+    bullpens = bullpens or {}
+    away = _Offense(build_matchup_tables(lineups["away"], pitchers["home"], bullpens.get("home"), env))
+    home = _Offense(build_matchup_tables(lineups["home"], pitchers["away"], bullpens.get("away"), env))
+
+    away_states, home_states = away.start(), home.start()
+    segments = {}
+    for inning in range(1, 9):
+        away_states = away.advance(away_states)
+        home_states = home.advance(home_states)
+        if inning in SEGMENT_INNINGS:
+            segments[inning] = np.outer(_level_mass(away_states), _level_mass(home_states))
+
+    # Top of the 9th, then the bottom only when the home team is not ahead
+    away_states = away.advance(away_states)
+    away9 = _level_mass(away_states)
+    home8 = _level_mass(home_states)
+    ninth = home.runs_by_level(home_states)          # [home runs after 8, runs in the 9th]
+    home_states = home.advance(home_states)
+
+    reached = np.zeros((RUN_POINTS, RUN_POINTS))     # [home after 8, home after 9]
+    for x in range(RUN_POINTS):
+        reached[np.arange(RUN_POINTS - x), np.arange(x, RUN_POINTS)] += ninth[:RUN_POINTS - x, x]
+    played = np.cumsum(reached, axis=0)              # played[a, h] = P(h8 <= a, h9 = h)
+
+    final = np.zeros((RUN_POINTS, RUN_POINTS))
+    for a in np.nonzero(away9 > 0)[0]:
+        final[a, a + 1:] += away9[a] * home8[a + 1:]
+        final[a] += away9[a] * played[a]
+    tied = np.diag(final).copy()
+    np.fill_diagonal(final, 0.0)
+
+    # Extra innings.  At each tie level the two sides' contexts are
+    # independent, so each side carries its contexts scaled by the tie mass.
+    away_states = _scale_levels(away_states, tied, away9)
+    home_states = _scale_levels(home_states, tied, _level_mass(home_states))
+    level_idx, gain_idx = np.indices((RUN_POINTS, RUN_POINTS))
+    for inning in range(10, max_innings + 1):
+        if tied.sum() <= PRUNE_MASS:
+            break
+        inv_tied = np.divide(1.0, tied, out=np.zeros_like(tied), where=tied > 0)[:, None]
+        away_runs = away.runs_by_level(away_states) * inv_tied      # P(away runs | tie level)
+        home_runs = home.runs_by_level(home_states) * inv_tied
+        for level in np.nonzero(tied > 0)[0]:
+            joint = tied[level] * np.outer(away_runs[level], home_runs[level])
+            np.fill_diagonal(joint, 0.0)
+            span = RUN_POINTS - level
+            final[level:, level:] += joint[:span, :span]
+
+        # Still tied: both sides scored the same.  Contexts that reach the same
+        # new level from different levels are merged.
+        away_states = away.advance(away_states, weights=home_runs)
+        home_states = home.advance(home_states, weights=away_runs)
+        continuing = tied[:, None] * away_runs * home_runs
+        tied = np.bincount((level_idx + gain_idx).ravel(), weights=continuing.ravel(), minlength=2 * RUN_POINTS)[:RUN_POINTS]
+        tied[tied <= PRUNE_MASS] = 0.0
+
+    unresolved = float(tied.sum())
+    return {
+        "final": final,
+        "segments": segments,
+        "unresolved": unresolved,
+        "truncated": max(0.0, 1.0 - float(final.sum()) - unresolved),
+    }
+
+
+def _score_pmfs(joint):
+    """Return total/diff/home/away PMFs (``summarize_pmf`` format) from a joint PMF."""
+    joint = joint / joint.sum()
+    a_idx, h_idx = np.indices(joint.shape)
+    totals = np.bincount((a_idx + h_idx).ravel(), weights=joint.ravel())
+    diffs = np.bincount((h_idx - a_idx + joint.shape[0]).ravel(), weights=joint.ravel())
+    return {
+        "total": {float(k): float(p) for k, p in enumerate(totals) if p > 0},
+        "diff": {float(k - joint.shape[0]): float(p) for k, p in enumerate(diffs) if p > 0},
+        "home": {float(k): float(p) for k, p in enumerate(joint.sum(axis=0)) if p > 0},
+        "away": {float(k): float(p) for k, p in enumerate(joint.sum(axis=1)) if p > 0},
+    }
+
+
+def analytic_market_probs(solution, total_lines=None, spread_lines=(-1.5, 1.5), team_total_lines=(3.5, 4.5)):
+    """Return raw (uncalibrated) market probabilities from ``solve_game`` output.
+
+    Keys are ``"full_game"`` and ``"f1"``/``"f3"``/``"f5"``/``"f7"``.  Each block
+    holds home/away win (and tie for segments) probabilities, ``P(total > line)``
+    for each total line, ``P(home margin > line)`` for each spread line and
+    ``P(team runs > line)`` per side for team totals.
+    """
+    total_lines = total_lines or [x / 2 for x in range(13, 26)]
+    blocks = {"full_game": (solution["final"], total_lines)}
+    for cap in SEGMENT_INNINGS:
+        seg_lines = [x + 0.5 for x in range(0, cap + 2)]
+        blocks[f"f{cap}"] = (solution["segments"][cap], seg_lines)
+
+    out = {}
+    for name, (joint, lines) in blocks.items():
+        pmfs = _score_pmfs(joint)
+        diff = pmfs["diff"]
+        out[name] = {
+            "home_win": sum(p for d, p in diff.items() if d > 0),
+            "away_win": sum(p for d, p in diff.items() if d < 0),
+            "tie": diff.get(0.0, 0.0),
+            "mean_total": sum(t * p for t, p in pmfs["total"].items()),
+            "totals_over": {line: sum(p for t, p in pmfs["total"].items() if t > line) for line in lines},
+            "spreads_home_over": {line: sum(p for d, p in diff.items() if d > line) for line in spread_lines},
+            "team_totals_over": {
+                side: {line: sum(p for r, p in pmfs[side].items() if r > line) for line in team_total_lines}
+                for side in ("home", "away")
+            },
+        }
+    return out
+
+
+def compare_with_simulation(analytic, home_scores, away_scores):
+    """Return analytic vs simulated raw probabilities for the full-game markets.
+
+    ``home_scores``/``away_scores`` are per-simulation final scores.  Each entry
+    holds ``analytic``, ``simulated`` and their ``diff`` so Monte Carlo drift
+    beyond sampling noise stands out.
+    """
+    home = np.asarray(home_scores)
+    away = np.asarray(away_scores)
+    totals = home + away
+    full = analytic["full_game"]
+    rows = {"h2h_home": (full["home_win"], float(np.mean(home > away)))}
+    for line, p in full["totals_over"].items():
+        rows[f"over_{line}"] = (p, float(np.mean(totals > line)))
+    for line, p in full["spreads_home_over"].items():
+        rows[f"home_margin_over_{line}"] = (p, float(np.mean(home - away > line)))
+    return {
+        key: {"analytic": round(a, 4), "simulated": round(s, 4), "diff": round(s - a, 4)}
+        for key, (a, s) in rows.items()
+    }
+
+
+if __name__ == '__main__':
+    import time
+    from core.game_simulator import build_sample_lineup, build_sample_pitcher
+
+    sample_lineups = {"home": build_sample_lineup(), "away": build_sample_lineup()}
+    sample_pitchers = {"home": build_sample_pitcher(), "away": build_sample_pitcher()}
+    sample_bullpens = {
+        "home": [build_sample_pitcher() for _ in range(3)],
+        "away": [build_sample_pitcher() for _ in range(3)],
+    }
+
+    start = time.perf_counter()
+    solution = solve_game(sample_lineups, sample_pitchers, sample_bullpens, {"umpire": {}})
+    elapsed = time.perf_counter() - start
+    probs = analytic_market_probs(solution)
+    print(f"Solved in {elapsed:.2f}s (unresolved {solution['unresolved']:.2e}, truncated {solution['truncated']:.2e})")
+    print(f"Mean total: {probs['full_game']['mean_total']:.3f} | Home win: {probs['full_game']['home_win']:.4f}")
@@ -0,0 +1,162 @@
+# odds_client.py
+"""Pooled, concurrent HTTP client for the Odds API.
+
+One ``requests.Session`` (with a connection pool sized to the worker count)
+is shared by every request, so a slate's event-odds pull reuses a handful of
+TLS connections instead of paying a handshake per event.  ``get_many`` fans
+requests out over a bounded thread pool; each request retries transient
+failures with exponential backoff, honouring ``Retry-After`` on 429s.
+
+The Odds API reports the remaining monthly quota in the
+``x-requests-remaining`` header.  The client records the latest value and
+stops issuing new requests once the quota left after the requests already in
+flight would fall to ``min_remaining``, so a slate pull never drains the
+quota to zero.
+"""
+
+from core.config import DEBUG_MODE, VERBOSE_MODE
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_TIMEOUT = 10
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+DEFAULT_MIN_REMAINING = 10
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+REMAINING_HEADER = "x-requests-remaining"
+USED_HEADER = "x-requests-used"
+
+
+def _header_int(resp, name):
+    try:
+        return int(float(resp.headers.get(name)))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+class OddsApiClient:
+    """Thread-safe Odds API client with pooling, retries and quota tracking."""
+
+    def __init__(
+        self,
+        session=None,
+        max_workers=DEFAULT_MAX_WORKERS,
+        timeout=DEFAULT_TIMEOUT,
+        retries=DEFAULT_RETRIES,
+        backoff=DEFAULT_BACKOFF,
+        min_remaining=DEFAULT_MIN_REMAINING,
+    ):
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        self.max_workers = max(1, int(max_workers))
+        self.timeout = timeout
+        self.retries = max(1, int(retries))
+        self.backoff = backoff
+        self.min_remaining = min_remaining
+        self.requests_remaining = None
+        self.requests_used = None
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def quota_exhausted(self):
+        """Return ``True`` once the reported quota is at or below ``min_remaining``."""
+        remaining = self.requests_remaining
+        return remaining is not None and remaining <= self.min_remaining
+
+    def _reserve(self):
+        """Claim quota for one request; ``False`` when the guard blocks it."""
+        with self._lock:
+            remaining = self.requests_remaining
+            if remaining is not None and remaining - self._in_flight <= self.min_remaining:
+                return False
+            self._in_flight += 1
+            return True
+
+    def _release(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    def _record_quota(self, resp):
+        remaining = _header_int(resp, REMAINING_HEADER)
+        used = _header_int(resp, USED_HEADER)
+        with self._lock:
+            if remaining is not None:
+                # Responses can finish out of order; keep the lowest value seen
+                if self.requests_remaining is None or remaining < self.requests_remaining:
+                    self.requests_remaining = remaining
+            if used is not None:
+                self.requests_used = max(used, self.requests_used or 0)
+
+    def _retry_delay(self, resp, attempt):
+        retry_after = _header_int(resp, "Retry-After") if resp is not None else None
+        if retry_after is not None:
+            return max(retry_after, 0)
+        return self.backoff * (2 ** attempt)
+
+    def get(self, url, params=None):
+        """GET ``url`` with retries and return the response, or ``None`` on failure.
+
+        Non-retryable statuses are returned as-is so callers can inspect them.
+        ``None`` is also returned without a request when the quota guard is hit.
+        """
+        resp = None
+        for attempt in range(self.retries):
+            if not self._reserve():
+                logger.warning(
+                    "⚠️ Odds API quota guard hit (%s remaining) — skipping %s",
+                    self.requests_remaining,
+                    url,
+                )
+                return None
+            try:
+                resp = self.session.get(url, params=params, timeout=self.timeout)
+            except requests.exceptions.RequestException as e:
+                logger.warning("⚠️ Odds API request failed (attempt %d/%d): %s", attempt + 1, self.retries, e)
+                resp = None
+            else:
+                self._record_quota(resp)
+            finally:
+                self._release()
+            if resp is not None:
+                if resp.status_code not in RETRY_STATUS_CODES:
+                    return resp
+                logger.warning(
+                    "⚠️ Odds API returned %s (attempt %d/%d) for %s",
+                    resp.status_code, attempt + 1, self.retries, url,
+                )
+            if attempt + 1 < self.retries:
+                time.sleep(self._retry_delay(resp, attempt))
+        return resp
+
+    def get_many(self, requests_by_key):
+        """Fetch ``{key: (url, params)}`` concurrently and return ``{key: response}``.
+
+        At most ``max_workers`` requests are in flight at once.  Failed
+        requests map to ``None``; result order follows the input order.
+        """
+        items = list(requests_by_key.items())
+        if not items:
+            return {}
+        start = time.perf_counter()
+        workers = min(self.max_workers, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            responses = list(pool.map(lambda item: self.get(*item[1]), items))
+        if DEBUG_MODE:
+            logger.debug(
+                "🌐 Fetched %d Odds API requests in %.2fs (%s remaining)",
+                len(items), time.perf_counter() - start, self.requests_remaining,
+            )
+        return {key: resp for (key, _), resp in zip(items, responses)}
@@ -13,6 +13,8 @@ from collections import defaultdict
 
 from core.market_pricer import implied_prob, to_american_odds, best_price
 from core.book_whitelist import ALLOWED_BOOKS
+from core.odds_client import OddsApiClient
+from core import perf
 from core.utils import (
     normalize_label,
     normalize_label_for_odds,
@@ -54,6 +56,26 @@ MARKET_KEYS = [
 EVENTS_URL = f"https://api.the-odds-api.com/v4/sports/{SPORT}/events"
 EVENT_ODDS_URL = f"https://api.the-odds-api.com/v4/sports/{SPORT}/events/{{event_id}}/odds"
 
+_ODDS_CLIENT = None
+
+
+def get_odds_client():
+    """Return the process-wide pooled ``OddsApiClient``."""
+    global _ODDS_CLIENT
+    if _ODDS_CLIENT is None:
+        _ODDS_CLIENT = OddsApiClient()
+    return _ODDS_CLIENT
+
+
+def _event_odds_params():
+    return {
+        "apiKey": ODDS_API_KEY,
+        "regions": "us",
+        "markets": ",".join(MARKET_KEYS),
+        "bookmakers": ",".join(BOOKMAKERS),
+        "oddsFormat": "american",
+    }
+
 
 TEAM_ABBR = {
     "Arizona Diamondbacks": "ARI", "Atlanta Braves": "ATL", "Baltimore Orioles": "BAL",
@@ -223,7 +245,7 @@ def fetch_consensus_for_single_game(game_id, lookahead_days=2):
     return normalized
 
 
-def fetch_market_odds_from_api(game_ids, filter_bookmakers=None, lookahead_days=2):
+def fetch_market_odds_from_api(game_ids, filter_bookmakers=None, lookahead_days=2, client=None):
     """Fetch market odds for the provided game IDs.
 
     Parameters
@@ -235,25 +257,19 @@ def fetch_market_odds_from_api(game_ids, filter_bookmakers=None, lookahead_days=
     lookahead_days : int, default 2
         Number of days ahead to request from the Odds API. The default of ``2``
         ensures today's and tomorrow's games are returned.
+    client : OddsApiClient | None
+        Client used for the requests; defaults to the shared pooled client.
+        Event odds are fetched concurrently once all events are matched.
     """
 
     input_game_ids = [canonical_game_id(gid) for gid in game_ids]
     logger.debug(f"🎯 Incoming game_ids from sim folder: {sorted(input_game_ids)}")
     logger.debug(f"[DEBUG] Using ODDS_API_KEY prefix: {ODDS_API_KEY[:4]}*****")
 
-    try:
-        resp = requests.get(
-            EVENTS_URL,
-            params={"apiKey": ODDS_API_KEY, "daysFrom": lookahead_days},
-            timeout=10,
-        )
-    except TypeError:
-        resp = requests.get(
-            EVENTS_URL,
-            params={"apiKey": ODDS_API_KEY, "daysFrom": lookahead_days},
-        )
-    except requests.exceptions.RequestException as e:
-        logger.error("❌ Error fetching events: %s", e)
+    client = client or get_odds_client()
+    resp = client.get(EVENTS_URL, params={"apiKey": ODDS_API_KEY, "daysFrom": lookahead_days})
+    if resp is None:
+        logger.error("❌ Error fetching events")
         return {}
     if resp.status_code != 200:
         logger.debug(f"❌ Failed to fetch events: {resp.text}")
@@ -263,6 +279,7 @@ def fetch_market_odds_from_api(game_ids, filter_bookmakers=None, lookahead_days=
     logger.debug(f"[DEBUG] Received {len(events)} events from Odds API")
 
     odds_data = {}
+    matched = []
 
     for event in events:
         try:
@@ -307,32 +324,22 @@ def fetch_market_odds_from_api(game_ids, filter_bookmakers=None, lookahead_days=
             logger.debug(f"\n✅ Matched event: {away_team} @ {home_team} → {game_id} | Start: {start_time.isoformat()}")
 
 
-            event_id = event["id"]
-            try:
-                odds_resp = requests.get(
-                    EVENT_ODDS_URL.format(event_id=event_id),
-                    params={
-                        "apiKey": ODDS_API_KEY,
-                        "regions": "us",
-                        "markets": ",".join(MARKET_KEYS),
-                        "bookmakers": ",".join(BOOKMAKERS),
-                        "oddsFormat": "american",
-                    },
-                    timeout=10,
-                )
-            except TypeError:
-                odds_resp = requests.get(
-                    EVENT_ODDS_URL.format(event_id=event_id),
-                    params={
-                        "apiKey": ODDS_API_KEY,
-                        "regions": "us",
-                        "markets": ",".join(MARKET_KEYS),
-                        "bookmakers": ",".join(BOOKMAKERS),
-                        "oddsFormat": "american",
-                    },
-                )
-            except requests.exceptions.RequestException as e:
-                logger.error("❌ Error fetching odds for %s: %s", game_id, e)
+            matched.append((event["id"], game_id, start_time))
+
+        except Exception as e:
+            logger.debug(f"💥 Exception while matching {game_id if 'game_id' in locals() else 'event'}: {e}")
+
+    # Pull every matched event's odds concurrently over the shared session
+    odds_responses = client.get_many({
+        i: (EVENT_ODDS_URL.format(event_id=event_id), _event_odds_params())
+        for i, (event_id, _, _) in enumerate(matched)
+    })
+
+    for i, (event_id, game_id, start_time) in enumerate(matched):
+        try:
+            odds_resp = odds_responses.get(i)
+            if odds_resp is None:
+                logger.error("❌ Error fetching odds for %s", game_id)
                 continue
 
             if odds_resp.status_code != 200:
@@ -430,17 +437,9 @@ def fetch_market_odds_from_api(game_ids, filter_bookmakers=None, lookahead_days=
                         normalized[mkt_key][label]["per_book"] = book_prices
 
             # Calculate consensus probabilities using unified logic
-            from core.consensus_pricer import calculate_consensus_prob
-            for mkt_key, market in normalized.items():
-                if not isinstance(market, dict) or mkt_key.endswith("_source") or mkt_key == "start_time":
-                    continue
-                for label in market:
-                    result, _ = calculate_consensus_prob(
-                        game_id=game_id,
-                        market_odds={game_id: normalized},
-                        market_key=mkt_key,
-                        label=label,
-                    )
+            from core.consensus_pricer import calculate_game_consensus
+            for mkt_key, labels in calculate_game_consensus(game_id, normalized).items():
+                for label, (result, _) in labels.items():
                     normalized[mkt_key][label].update(result)
 
             # Ensure all expected market keys exist for downstream tools
@@ -474,24 +473,20 @@ def fetch_market_odds_from_api(game_ids, filter_bookmakers=None, lookahead_days=
     return odds_data
 
 
-def fetch_all_market_odds(lookahead_days=2):
-    """Fetch market odds for all games returned by the Odds API."""
+@perf.traced("fetch_all_market_odds")
+def fetch_all_market_odds(lookahead_days=2, client=None):
+    """Fetch market odds for all games returned by the Odds API.
+
+    Event odds are fetched concurrently through ``client`` (the shared pooled
+    ``OddsApiClient`` by default).
+    """
 
     logger.debug(f"🌐 Fetching all market odds for daysFrom={lookahead_days}")
 
-    try:
-        resp = requests.get(
-            EVENTS_URL,
-            params={"apiKey": ODDS_API_KEY, "daysFrom": lookahead_days},
-            timeout=10,
-        )
-    except TypeError:
-        resp = requests.get(
-            EVENTS_URL,
-            params={"apiKey": ODDS_API_KEY, "daysFrom": lookahead_days},
-        )
-    except requests.exceptions.RequestException as e:
-        logger.error("❌ Error fetching events: %s", e)
+    client = client or get_odds_client()
+    resp = client.get(EVENTS_URL, params={"apiKey": ODDS_API_KEY, "daysFrom": lookahead_days})
+    if resp is None:
+        logger.error("❌ Error fetching events")
         return {}
     if resp.status_code != 200:
         logger.debug(f"❌ Failed to fetch events: {resp.text}")
@@ -501,6 +496,7 @@ def fetch_all_market_odds(lookahead_days=2):
     logger.debug(f"[DEBUG] Received {len(events)} events from Odds API")
 
     odds_data = {}
+    matched = []
 
     for event in events:
         try:
@@ -527,32 +523,22 @@ def fetch_all_market_odds(lookahead_days=2):
                 f"\n🌐 Processing event: {away_team} @ {home_team} → {game_id} | Start: {start_time.isoformat()}"
             )
 
-            event_id = event["id"]
-            try:
-                odds_resp = requests.get(
-                    EVENT_ODDS_URL.format(event_id=event_id),
-                    params={
-                        "apiKey": ODDS_API_KEY,
-                        "regions": "us",
-                        "markets": ",".join(MARKET_KEYS),
-                        "bookmakers": ",".join(BOOKMAKERS),
-                        "oddsFormat": "american",
-                    },
-                    timeout=10,
-                )
-            except TypeError:
-                odds_resp = requests.get(
-                    EVENT_ODDS_URL.format(event_id=event_id),
-                    params={
-                        "apiKey": ODDS_API_KEY,
-                        "regions": "us",
-                        "markets": ",".join(MARKET_KEYS),
-                        "bookmakers": ",".join(BOOKMAKERS),
-                        "oddsFormat": "american",
-                    },
-                )
-            except requests.exceptions.RequestException as e:
-                logger.error("❌ Error fetching odds for %s: %s", game_id, e)
+            matched.append((event["id"], game_id, start_time))
+
+        except Exception as e:
+            logger.debug(f"💥 Exception while matching {game_id if 'game_id' in locals() else 'event'}: {e}")
+
+    # Pull every matched event's odds concurrently over the shared session
+    odds_responses = client.get_many({
+        i: (EVENT_ODDS_URL.format(event_id=event_id), _event_odds_params())
+        for i, (event_id, _, _) in enumerate(matched)
+    })
+
+    for i, (event_id, game_id, start_time) in enumerate(matched):
+        try:
+            odds_resp = odds_responses.get(i)
+            if odds_resp is None:
+                logger.error("❌ Error fetching odds for %s", game_id)
                 continue
 
             if odds_resp.status_code != 200:
@@ -638,17 +624,9 @@ def fetch_all_market_odds(lookahead_days=2):
                     if label in normalized.get(mkt_key, {}):
                         normalized[mkt_key][label]["per_book"] = book_prices
 
-            from core.consensus_pricer import calculate_consensus_prob
-            for mkt_key, market in normalized.items():
-                if not isinstance(market, dict) or mkt_key.endswith("_source") or mkt_key == "start_time":
-                    continue
-                for label in market:
-                    result, _ = calculate_consensus_prob(
-                        game_id=game_id,
-                        market_odds={game_id: normalized},
-                        market_key=mkt_key,
-                        label=label,
-                    )
+            from core.consensus_pricer import calculate_game_consensus
+            for mkt_key, labels in calculate_game_consensus(game_id, normalized).items():
+                for label, (result, _) in labels.items():
                     normalized[mkt_key][label].update(result)
 
             for key in MARKET_KEYS:
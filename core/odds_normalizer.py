@@ -2,7 +2,7 @@ from datetime import datetime
 from zoneinfo import ZoneInfo
 
 from core.market_pricer import best_price
-from core.consensus_pricer import calculate_consensus_prob
+from core.consensus_pricer import calculate_game_consensus
 from core.utils import (
     normalize_label,
     normalize_label_for_odds,
@@ -86,15 +86,9 @@ def normalize_market_odds(odds: dict) -> dict:
             entry["price"] = best_price(list(prices.values()), label)
 
     if game_id:
-        for mkt_key, market in normalized.items():
-            for label in list(market.keys()):
-                result, _ = calculate_consensus_prob(
-                    game_id=game_id,
-                    market_odds={game_id: normalized},
-                    market_key=mkt_key,
-                    label=label,
-                )
-                market[label].update(result)
+        for mkt_key, labels in calculate_game_consensus(game_id, normalized).items():
+            for label, (result, _) in labels.items():
+                normalized[mkt_key][label].update(result)
 
     if start_ts:
         normalized["start_time"] = start_ts.isoformat()
@@ -1,23 +1,27 @@
 from core.config import DEBUG_MODE, VERBOSE_MODE
 import numpy as np
 import random
-from core.bip_resolution import resolve_bip
+from core.bip_resolution import resolve_bip, bip_hit_probability
+from core.simulation_context import DEFAULT_CONTEXT
 from core.logger import get_logger
 
 logger = get_logger(__name__)
 
-# Global outcome log for plate appearances
-PA_RECAP_LOG = {
-    "HOME": {"K": 0, "BB": 0, "1B": 0, "2B": 0, "3B": 0, "HR": 0, "OUT": 0},
-    "AWAY": {"K": 0, "BB": 0, "1B": 0, "2B": 0, "3B": 0, "HR": 0, "OUT": 0}
-}
+# Batted-ball mix and hit-type splits used by ``resolve_contact``
+BIP_TYPES = ["GB", "LD", "FB", "POP"]
+BIP_TYPE_PROBS = [0.28, 0.32, 0.30, 0.10]
+HIT_TYPE_PROBS = [0.76, 0.22, 0.02]  # 1B, 2B, 3B
+INFIELD_HIT_RATE = 0.10
+INFIELD_HIT_PROBS = [0.92, 0.08]  # 1B, 2B
+SINGLE_BOOST = 1.01
+WALK_BOOST = 1.01
 
-def log_pa_outcome(team, outcome):
-    """Safely log outcome to PA_RECAP_LOG."""
-    if team not in PA_RECAP_LOG:
-        PA_RECAP_LOG[team] = {k: 0 for k in ["K", "BB", "1B", "2B", "3B", "HR", "OUT"]}
-    if outcome in PA_RECAP_LOG[team]:
-        PA_RECAP_LOG[team][outcome] += 1
+# Outcome log of the default context, used when no ``SimulationContext`` is passed
+PA_RECAP_LOG = DEFAULT_CONTEXT.pa_recap
+
+def log_pa_outcome(team, outcome, sim_context=None):
+    """Safely log outcome to ``sim_context`` (``PA_RECAP_LOG`` when omitted)."""
+    (sim_context or DEFAULT_CONTEXT).log_pa(team, outcome)
 
 # === NEW: Beta sampling noise for probability variance ===
 def beta_noise(p, weight=30, rng=None):
@@ -51,7 +55,7 @@ def check_home_run(pitcher, weather_mult=1.0, rng=None):
 def resolve_contact(batter, pitcher, debug=False, rng=None):
     """Resolve a ball in play into hit type or out."""
     rand = rng if rng is not None else np.random
-    bip_type = rand.choice(["GB", "LD", "FB", "POP"], p=[0.28, 0.32, 0.30, 0.10])
+    bip_type = rand.choice(BIP_TYPES, p=BIP_TYPE_PROBS)
     if debug:
         print(f"DEBUG: BIP Type: {bip_type}")
 
@@ -62,18 +66,19 @@ def resolve_contact(batter, pitcher, debug=False, rng=None):
         batter_speed=batter.get("speed", 50),
         fielder_rating=pitcher.get("fielder_rating", 50),
         debug=debug,
+        rng=rng,
     )
 
     if is_hit:
-        probs = [0.76, 0.22, 0.02]
-        probs[0] *= 1.01
+        probs = list(HIT_TYPE_PROBS)
+        probs[0] *= SINGLE_BOOST
         total = sum(probs)
         probs = [p / total for p in probs]
         outcome = rand.choice(["1B", "2B", "3B"], p=probs)
     else:
-        if rand.random() < 0.10:
-            fb_probs = [0.92, 0.08]
-            fb_probs[0] *= 1.01
+        if rand.random() < INFIELD_HIT_RATE:
+            fb_probs = list(INFIELD_HIT_PROBS)
+            fb_probs[0] *= SINGLE_BOOST
             total = sum(fb_probs)
             fb_probs = [p / total for p in fb_probs]
             outcome = rand.choice(["1B", "2B"], p=fb_probs)
@@ -88,6 +93,52 @@ def resolve_contact(batter, pitcher, debug=False, rng=None):
     return outcome
 
 
+def _as_float(value):
+    """Return ``value`` as a float or ``None`` for placeholders like ``"N/A"``."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def contact_outcome_probs(batter, pitcher):
+    """Return the 1B/2B/3B/OUT split of a non-HR ball in play.
+
+    This is the closed form of ``resolve_contact`` and is used by engines that
+    sample outcomes from precomputed probabilities instead of walking the
+    batted-ball tree draw by draw.
+    """
+    hit_probs = _boost_singles(HIT_TYPE_PROBS)
+    infield_probs = _boost_singles(INFIELD_HIT_PROBS)
+
+    p_hit = sum(
+        weight * bip_hit_probability(
+            bip_type,
+            ev=_as_float(pitcher.get("exit_velocity_avg")),
+            la=_as_float(pitcher.get("launch_angle_avg")),
+            batter_speed=batter.get("speed", 50),
+            fielder_rating=pitcher.get("fielder_rating", 50),
+        )
+        for bip_type, weight in zip(BIP_TYPES, BIP_TYPE_PROBS)
+    )
+    p_infield = (1 - p_hit) * INFIELD_HIT_RATE
+
+    return {
+        "1B": p_hit * hit_probs[0] + p_infield * infield_probs[0],
+        "2B": p_hit * hit_probs[1] + p_infield * infield_probs[1],
+        "3B": p_hit * hit_probs[2],
+        "OUT": (1 - p_hit) * (1 - INFIELD_HIT_RATE),
+    }
+
+
+def _boost_singles(probs):
+    """Apply ``SINGLE_BOOST`` to the first entry of ``probs`` and renormalize."""
+    boosted = list(probs)
+    boosted[0] *= SINGLE_BOOST
+    total = sum(boosted)
+    return [p / total for p in boosted]
+
+
 def simulate_pa(
     batter,
     pitcher,
@@ -100,9 +151,16 @@ def simulate_pa(
     batting_team="HOME",
     use_noise=False,
     rng=None,
+    sim_context=None,
 ):
-    """Simulate a single plate appearance and return the outcome."""
+    """Simulate a single plate appearance and return the outcome.
+
+    The outcome is tallied in ``sim_context`` (a ``SimulationContext``); its RNG
+    is used when ``rng`` is omitted.
+    """
 
+    if rng is None and sim_context is not None:
+        rng = sim_context.rng
     rand = rng if rng is not None else np.random
 
     k_rate = (batter.get("k_rate", 0.22) + pitcher.get("k_rate", 0.22)) / 2
@@ -116,7 +174,7 @@ def simulate_pa(
     # Normalize and optionally apply noise
     k_prob = beta_noise(k_rate, rng=rand) if use_noise else k_rate
     bb_prob = beta_noise(bb_rate, rng=rand) if use_noise else bb_rate
-    bb_prob *= 1.01
+    bb_prob *= WALK_BOOST
     contact_prob = max(0.0, 1 - k_prob - bb_prob)
 
     result = rand.random() if hasattr(rand, "random") else rand.rand()
@@ -133,7 +191,7 @@ def simulate_pa(
     else:
         outcome = base_outcome
 
-    log_pa_outcome(batting_team, outcome)
+    log_pa_outcome(batting_team, outcome, sim_context)
 
     return (outcome, {
         "K": k_prob,
@@ -0,0 +1,119 @@
+# pa_tables.py
+"""Precomputed plate-appearance outcome tables.
+
+``simulate_pa`` rebuilds blended K/BB rates from the batter and pitcher dicts on
+every plate appearance, and ``simulate_half_inning`` copies the pitcher dict via
+``apply_fatigue_modifiers`` first.  Everything that feeds those rates is known
+before the first pitch, so this module tabulates the cumulative outcome
+probabilities once per game, indexed by
+``(lineup slot, pitcher, TTO bucket, fatigue bucket)``.  Sampling a PA is then a
+single row lookup plus one uniform draw.
+
+The Beta noise ``simulate_pa`` applies with ``use_noise=True`` is drawn
+independently for every PA and has the base rate as its mean, so it integrates
+out of the per-PA outcome distribution; the tables therefore hold the
+expected (noise-free) probabilities.
+"""
+
+from core.config import DEBUG_MODE, VERBOSE_MODE
+import numpy as np
+
+from core.fatigue_modeling import tto_penalty
+from core.pa_simulator import contact_outcome_probs, WALK_BOOST
+
+OUTCOMES = ["K", "BB", "HR", "1B", "2B", "3B", "OUT"]
+CONTACT_OUTCOMES = ["1B", "2B", "3B", "OUT"]
+TTO_BUCKETS = 4           # 1st, 2nd, 3rd and 4th+ time through the order
+FATIGUE_START = 75        # pitch count where fatigue begins
+FATIGUE_BUCKETS = 64      # one bucket per pitch from 75; later counts reuse the last
+
+
+def tto_bucket(tto_count):
+    """Return the TTO bucket index for ``tto_count``."""
+    return min(max(int(tto_count), 1), TTO_BUCKETS) - 1
+
+
+def fatigue_bucket(pitch_count):
+    """Return the fatigue bucket index for ``pitch_count``."""
+    return min(max(int(pitch_count) - FATIGUE_START, 0), FATIGUE_BUCKETS - 1)
+
+
+def _rate(value, default):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _hr_rate(pitcher):
+    hr_pa = pitcher.get("hr_pa") or {}
+    return _rate(hr_pa.get("hr_pa_projected", 0.046), 0.046)
+
+
+def build_pa_table(lineup, pitchers, env=None):
+    """Return the cumulative PA outcome table for ``lineup`` facing ``pitchers``.
+
+    ``env`` is read the same way ``simulate_half_inning`` reads its context
+    (``umpire`` modifiers and ``weather_hr``).  The returned dict holds:
+
+      - ``cum_probs``: array of shape
+        ``(len(lineup), len(pitchers), TTO_BUCKETS, FATIGUE_BUCKETS, 7)`` with
+        cumulative probabilities in ``OUTCOMES`` order.
+      - ``pitcher_index``: maps ``id(pitcher_dict)`` to its table index.
+      - ``lineup_size``: number of batters in ``lineup``.
+    """
+    env = env or {}
+    umpire = env.get("umpire", {}) or {}
+    k_mod = umpire.get("k_mod", 1.0)
+    bb_mod = umpire.get("bb_mod", 1.0)
+    weather_hr = env.get("weather_hr", 1.0)
+
+    levels = np.arange(FATIGUE_BUCKETS) / 25
+    penalties = np.array([tto_penalty(b + 1) for b in range(TTO_BUCKETS)])
+    k_mult = (1 - penalties)[:, None] * (1.0 - 0.02 * levels)[None, :]
+    bb_mult = (1 + penalties)[:, None] * (1.0 + 0.03 * levels)[None, :]
+
+    probs = np.empty((len(lineup), len(pitchers), TTO_BUCKETS, FATIGUE_BUCKETS, len(OUTCOMES)))
+    for p, pitcher in enumerate(pitchers):
+        pitcher_k = _rate(pitcher.get("k_rate", 0.22), 0.22)
+        pitcher_bb = _rate(pitcher.get("bb_rate", 0.08), 0.08)
+        hr = min(max(_hr_rate(pitcher) * weather_hr, 0.0), 1.0)
+        for slot, batter in enumerate(lineup):
+            k = (_rate(batter.get("k_rate", 0.22), 0.22) + pitcher_k * k_mult) / 2 * k_mod
+            bb = (_rate(batter.get("bb_rate", 0.08), 0.08) + pitcher_bb * bb_mult) / 2 * bb_mod * WALK_BOOST
+            k = np.clip(k, 0.0, 1.0)
+            bb = np.clip(bb, 0.0, 1.0 - k)
+            contact = 1.0 - k - bb
+            split = contact_outcome_probs(batter, pitcher)
+
+            probs[slot, p, :, :, 0] = k
+            probs[slot, p, :, :, 1] = bb
+            probs[slot, p, :, :, 2] = contact * hr
+            for i, outcome in enumerate(CONTACT_OUTCOMES, start=3):
+                probs[slot, p, :, :, i] = contact * (1 - hr) * split[outcome]
+
+    cum_probs = np.cumsum(probs, axis=-1)
+    cum_probs[..., -1] = 1.0
+
+    return {
+        "cum_probs": cum_probs,
+        "pitcher_index": {id(pitcher): i for i, pitcher in enumerate(pitchers)},
+        "lineup_size": len(lineup),
+    }
+
+
+def build_game_pa_tables(home_lineup, away_lineup, home_pitcher, away_pitcher, home_bullpen=None, away_bullpen=None, env=None):
+    """Return ``{"home": ..., "away": ...}`` tables keyed by the batting side.
+
+    Pitcher index ``0`` is the opposing starter and ``1..`` its bullpen.
+    """
+    return {
+        "home": build_pa_table(home_lineup, [away_pitcher] + list(away_bullpen or []), env),
+        "away": build_pa_table(away_lineup, [home_pitcher] + list(home_bullpen or []), env),
+    }
+
+
+def sample_pa_outcome(table, slot, pitcher_idx, tto_count, pitch_count, u):
+    """Return the outcome for uniform draw ``u`` from one table row."""
+    row = table["cum_probs"][slot, pitcher_idx, tto_bucket(tto_count), fatigue_bucket(pitch_count)]
+    return OUTCOMES[min(int(np.searchsorted(row, u, side="right")), len(OUTCOMES) - 1)]
@@ -0,0 +1,260 @@
+# param_sweep.py
+"""Parameter sweeps over pitcher, batter and environment fields.
+
+A sweep grid maps ``"target.field"`` keys to the values to try, e.g.
+``{"pitcher.stuff_plus": [85, 100, 115], "env.umpire.k_mod": [0.95, 1.05]}``.
+Targets are ``pitcher`` (both starters and every reliever), ``batter``
+(every batter in both lineups) and ``env``; the field may be a dotted path
+into nested dicts.  Every combination of values is one grid point.
+Swept pitchers get ``hr_pa`` re-projected with ``project_hr_pa`` as
+``build_game_assets`` does, so inputs such as ``stuff_plus`` reach the PA
+model; fields the PA model does not read show up as zero deltas.
+
+All grid points are simulated with the batch engine on the same seed with
+``common_streams=True``: sim ``i`` draws the same uniforms at every point,
+so two points only differ where the parameter change actually flips an
+outcome.  Differences between points are then estimated from paired
+per-sim residuals, whose standard error is typically several times smaller
+than that of two independent runs.  Points are spread over a process pool.
+
+``run_sweep`` returns a tidy list of rows, one per grid point and metric.
+"""
+
+from core.config import DEBUG_MODE, VERBOSE_MODE
+import copy
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+import numpy as np
+
+from core.batch_game_simulator import simulate_games_batch, MAX_INNINGS
+from core.pa_tables import OUTCOMES
+from core.project_hr_pa import project_hr_pa
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+TARGETS = ("pitcher", "batter", "env")
+DEFAULT_SIMS = 3000
+
+LEAGUE_AVERAGE_BATTER = {
+    "name": "avg_batter",
+    "handedness": "R",
+    "k_rate": 0.225,
+    "bb_rate": 0.082,
+    "iso": 0.145,
+    "avg": 0.245,
+    "woba": 0.320,
+}
+
+LEAGUE_AVERAGE_PITCHER = {
+    "name": "avg_pitcher",
+    "throws": "R",
+    "stuff_plus": 100,
+    "command_plus": 100,
+    "location_plus": 100,
+    "k_rate": 0.225,
+    "bb_rate": 0.082,
+    "hr_fb_rate": 0.115,
+    "iso_allowed": 0.140,
+    "HR": 20,
+    "TBF": 650,
+    "IP": 180,
+    "role": "SP",
+}
+
+NEUTRAL_ENV = {
+    "weather_hr": 1.0,
+    "umpire": {"k_mod": 1.0, "bb_mod": 1.0},
+}
+
+
+def _with_hr_pa(pitcher):
+    return dict(pitcher, hr_pa=project_hr_pa(dict(pitcher)))
+
+
+def league_average_assets(lineup_size=9):
+    """Return league-average lineups and starters (no bullpens) in a neutral park."""
+    return {
+        "lineups": {side: [dict(LEAGUE_AVERAGE_BATTER) for _ in range(lineup_size)] for side in ("home", "away")},
+        "pitchers": {side: _with_hr_pa(LEAGUE_AVERAGE_PITCHER) for side in ("home", "away")},
+        "bullpens": {"home": [], "away": []},
+        "env": copy.deepcopy(NEUTRAL_ENV),
+    }
+
+
+def _split_key(key):
+    target, _, path = key.partition(".")
+    if target not in TARGETS or not path:
+        raise ValueError(f"Sweep key {key!r} must look like '<{'|'.join(TARGETS)}>.<field>'")
+    return target, path.split(".")
+
+
+def expand_grid(grid):
+    """Return every combination of a ``{"target.field": [values]}`` grid as a list of points."""
+    keys = list(grid)
+    for key in keys:
+        _split_key(key)
+    return [dict(zip(keys, values)) for values in itertools.product(*(list(grid[k]) for k in keys))]
+
+
+def apply_point(assets, point):
+    """Return a copy of ``assets`` with every ``"target.field": value`` of ``point`` applied."""
+    assets = copy.deepcopy(assets)
+    pitchers = list(assets["pitchers"].values())
+    for bullpen in (assets.get("bullpens") or {}).values():
+        pitchers += list(bullpen or [])
+    swept_pitcher = set_hr_pa = False
+    for key, value in point.items():
+        target, path = _split_key(key)
+        if target == "pitcher":
+            records = pitchers
+            set_hr_pa = set_hr_pa or path[0] == "hr_pa"
+            swept_pitcher = swept_pitcher or path[0] != "hr_pa"
+        elif target == "batter":
+            records = [batter for lineup in assets["lineups"].values() for batter in lineup]
+        else:
+            records = [assets.setdefault("env", {})]
+        for record in records:
+            for part in path[:-1]:
+                record = record.setdefault(part, {})
+            record[path[-1]] = value
+    if swept_pitcher and not set_hr_pa:
+        for pitcher in pitchers:
+            pitcher["hr_pa"] = project_hr_pa(dict(pitcher))
+    return assets
+
+
+def simulate_point(assets, n_sims, seed, max_innings=MAX_INNINGS):
+    """Simulate one grid point and return its per-sim PA tallies and scores."""
+    batch = simulate_games_batch(
+        n_sims,
+        assets["lineups"],
+        assets["pitchers"],
+        assets.get("bullpens"),
+        assets.get("env"),
+        seed=seed,
+        max_innings=max_innings,
+        common_streams=True,
+        track_pa=True,
+    )
+    return {
+        "pa_counts": batch["pa_counts"].sum(axis=1),
+        "home_score": batch["home_score"],
+        "away_score": batch["away_score"],
+    }
+
+
+def metric_residuals(sims):
+    """Return ``{metric: (estimate, per-sim residuals)}`` for one grid point.
+
+    Every metric is a smooth function of per-sim means, so its standard
+    error is ``std(residuals) / sqrt(n)`` (delta method) and the standard
+    error of a difference between two points run on common random numbers
+    is the same expression on the difference of their residuals.
+    ``<outcome>_rate`` metrics are shares of all PAs in ``OUTCOMES`` order.
+    """
+    pa = sims["pa_counts"].astype(float)
+    pa_per_game = pa.sum(axis=1)
+    mean_pa = pa_per_game.mean()
+    metrics = {}
+    for i, outcome in enumerate(OUTCOMES):
+        rate = pa[:, i].sum() / pa_per_game.sum()
+        metrics[f"{outcome}_rate"] = (rate, (pa[:, i] - rate * pa_per_game) / mean_pa)
+
+    total = (sims["home_score"] + sims["away_score"]).astype(float)
+    mean_total = total.mean()
+    metrics["runs_per_game"] = (mean_total, total - mean_total)
+    variance = total.var()
+    sd = np.sqrt(variance)
+    metrics["runs_sd"] = (sd, ((total - mean_total) ** 2 - variance) / (2 * sd) if sd else np.zeros_like(total))
+    home_win = (sims["home_score"] > sims["away_score"]).astype(float)
+    metrics["home_win_pct"] = (home_win.mean(), home_win - home_win.mean())
+    return metrics
+
+
+def _standard_error(residuals):
+    return float(residuals.std(ddof=1) / np.sqrt(residuals.size)) if residuals.size > 1 else 0.0
+
+
+def _simulate_task(args):
+    assets, n_sims, seed, max_innings = args
+    return simulate_point(assets, n_sims, seed, max_innings)
+
+
+def run_sweep(
+    grid,
+    base_assets=None,
+    n_sims=DEFAULT_SIMS,
+    seed=None,
+    workers=None,
+    reference=0,
+    confidence=0.95,
+    max_innings=MAX_INNINGS,
+):
+    """Simulate every point of ``grid`` on common random numbers and return tidy rows.
+
+    ``base_assets`` holds ``lineups``/``pitchers``/``bullpens``/``env`` dicts
+    (default ``league_average_assets()``).  Every point reuses ``seed`` (a
+    random one is drawn when omitted).  ``workers`` processes share the
+    points (default: one per point up to the CPU count; ``1`` runs
+    in-process).  ``reference`` is the index of the point differences are
+    measured against.
+
+    Each row holds the point's swept values plus ``metric``, ``value``,
+    ``se``, ``ci_low``/``ci_high``, the paired ``delta`` to the reference
+    point with its ``delta_se`` and ``delta_ci_low``/``delta_ci_high``, and
+    ``independent_delta_se``, the standard error the same difference would
+    have had from two independent runs.
+    """
+    points = expand_grid(grid)
+    if not points:
+        return []
+    if not 0 <= reference < len(points):
+        raise ValueError(f"reference index {reference} is outside the {len(points)}-point grid")
+    base_assets = base_assets or league_average_assets()
+    if seed is None:
+        seed = int(np.random.SeedSequence().generate_state(1)[0])
+    workers = workers or min(len(points), os.cpu_count() or 1)
+
+    start = time.perf_counter()
+    tasks = [(apply_point(base_assets, point), n_sims, seed, max_innings) for point in points]
+    if workers > 1 and len(points) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(points))) as pool:
+            results = list(pool.map(_simulate_task, tasks))
+    else:
+        results = [_simulate_task(task) for task in tasks]
+    if DEBUG_MODE:
+        logger.debug(
+            "🔬 Swept %d points x %d sims in %.2fs on %d worker(s)",
+            len(points), n_sims, time.perf_counter() - start, workers,
+        )
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    metrics = [metric_residuals(sims) for sims in results]
+    base = metrics[reference]
+    rows = []
+    for point, point_metrics in zip(points, metrics):
+        for name, (value, residuals) in point_metrics.items():
+            base_value, base_residuals = base[name]
+            se = _standard_error(residuals)
+            delta = float(value - base_value)
+            delta_se = _standard_error(residuals - base_residuals)
+            rows.append({
+                **point,
+                "metric": name,
+                "n_sims": n_sims,
+                "value": float(value),
+                "se": se,
+                "ci_low": float(value - z * se),
+                "ci_high": float(value + z * se),
+                "delta": delta,
+                "delta_se": delta_se,
+                "delta_ci_low": delta - z * delta_se,
+                "delta_ci_high": delta + z * delta_se,
+                "independent_delta_se": float(np.hypot(se, _standard_error(base_residuals))),
+            })
+    return rows
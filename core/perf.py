@@ -0,0 +1,393 @@
+# perf.py
+"""Opt-in stage timing for the sim → odds → snapshot → logging pipeline.
+
+Instrumentation is off unless ``MLB_PERF`` is set (or ``configure`` /
+``configure_from_argv`` is called, e.g. via a ``--profile`` flag).  The
+value is a comma-separated list of modes:
+
+- ``1`` / ``on`` / ``timing``: wall time, CPU time and the process max RSS
+  for every span
+- ``tracemalloc``: also the peak traced Python allocation inside each span
+- ``cprofile``: also a ``cProfile`` of each outermost span, summarized as
+  its top functions by cumulative time
+- ``all``: every mode
+
+Stages are recorded with ``span`` (a context manager), ``begin`` (a handle
+whose ``end()`` closes it, for long sequential blocks) or the ``traced``
+decorator.  Spans nest; closing a span closes any child still open.  When
+instrumentation is off these are no-ops.
+
+A process that recorded any span writes ``logs/perf/<timestamp>_<process>_<pid>.json``
+at exit with every span plus per-stage and per-game totals.  Long-running
+processes call ``write_report`` themselves.  The mode is passed to
+subprocesses through the environment.  ``MLB_PERF_CYCLE`` tags every report
+written during one loop cycle.  Pool workers return ``drain()`` to the
+parent, which adds them with ``merge``.
+"""
+
+import atexit
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import resource
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+PERF_ENV = "MLB_PERF"
+CYCLE_ENV = "MLB_PERF_CYCLE"
+PERF_DIR = os.path.join("logs", "perf")
+MODES = ("timing", "tracemalloc", "cprofile")
+PROFILE_TOP_N = 20
+
+
+def parse_modes(value):
+    """Return the enabled modes for an ``MLB_PERF`` value (empty when off)."""
+    value = (value or "").strip().lower()
+    if value in ("", "0", "off", "false", "no"):
+        return frozenset()
+    modes = {"timing"}
+    for part in value.split(","):
+        part = part.strip()
+        if part == "all":
+            modes.update(MODES)
+        elif part in MODES:
+            modes.add(part)
+        elif part not in ("1", "on", "true", "yes"):
+            logger.warning("⚠️ Unknown %s mode %r ignored", PERF_ENV, part)
+    return frozenset(modes)
+
+
+class _Recorder:
+    def __init__(self, modes):
+        self.modes = modes
+        self.pid = os.getpid()
+        self.started = time.time()
+        self.spans = []
+        self.stack = []
+        self.atexit_registered = False
+
+
+_recorder = None
+
+
+def _current():
+    """Return this process's recorder (a fresh one after a fork), or ``None`` when disabled."""
+    global _recorder
+    if _recorder is not None and _recorder.pid != os.getpid():
+        _recorder = _Recorder(_recorder.modes)
+    return _recorder
+
+
+def configure(modes=None):
+    """Enable instrumentation with ``modes`` (an ``MLB_PERF`` string); ``None`` re-reads the environment.
+
+    The value is also exported so subprocesses inherit it.  Empty modes
+    turn instrumentation off.
+    """
+    global _recorder
+    if modes is None:
+        modes = os.environ.get(PERF_ENV)
+    else:
+        os.environ[PERF_ENV] = modes
+    parsed = parse_modes(modes)
+    if not parsed:
+        _recorder = None
+    elif _recorder is None or _recorder.modes != parsed:
+        _recorder = _Recorder(parsed)
+    if "tracemalloc" in parsed and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    return parsed
+
+
+def configure_from_argv(argv):
+    """Apply a ``--profile`` / ``--profile=MODES`` flag from ``argv`` if present."""
+    for arg in argv:
+        if arg == "--profile":
+            return configure(os.environ.get(PERF_ENV) or "timing")
+        if arg.startswith("--profile="):
+            return configure(arg.split("=", 1)[1])
+    return enabled_modes()
+
+
+def enabled():
+    return _current() is not None
+
+
+def enabled_modes():
+    recorder = _current()
+    return recorder.modes if recorder else frozenset()
+
+
+def _max_rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    return round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _profile_summary(profiler):
+    stats = pstats.Stats(profiler, stream=io.StringIO()).sort_stats("cumulative")
+    rows = []
+    for func in stats.fcn_list[:PROFILE_TOP_N]:
+        calls, primitive, tottime, cumtime, _ = stats.stats[func]
+        filename, line, name = func
+        rows.append({
+            "function": f"{os.path.relpath(filename) if os.path.isabs(filename) else filename}:{line}({name})",
+            "ncalls": calls,
+            "tottime_s": round(tottime, 4),
+            "cumtime_s": round(cumtime, 4),
+        })
+    return rows
+
+
+class _NullSpan:
+    def end(self, error=None):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """An open timing span; ``end()`` (or leaving the ``with`` block) records it."""
+
+    def __init__(self, recorder, stage, game_id, meta):
+        self.recorder = recorder
+        self.stage = stage
+        self.game_id = game_id
+        self.meta = meta
+        self.parent = recorder.stack[-1] if recorder.stack else None
+        self.child_peak = 0
+        self.closed = False
+        self.profiler = None
+        if "tracemalloc" in recorder.modes and tracemalloc.is_tracing():
+            if self.parent is not None:
+                self.parent.child_peak = max(self.parent.child_peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        if "cprofile" in recorder.modes and self.parent is None:
+            self.profiler = cProfile.Profile()
+            try:
+                self.profiler.enable()
+            except ValueError:  # another profiler is already active
+                self.profiler = None
+        recorder.stack.append(self)
+        self.start_wall = time.time()
+        self.start = time.perf_counter()
+        self.start_cpu = time.process_time()
+
+    def end(self, error=None):
+        if self.closed:
+            return
+        # Children still open (e.g. after an early return) end with their parent
+        while self.recorder.stack and self.recorder.stack[-1] is not self:
+            self.recorder.stack[-1].end()
+        wall = time.perf_counter() - self.start
+        cpu = time.process_time() - self.start_cpu
+        self.closed = True
+        if self.recorder.stack:
+            self.recorder.stack.pop()
+        record = {
+            "stage": self.stage,
+            "game_id": self.game_id,
+            "parent": self.parent.stage if self.parent else None,
+            "game_root": bool(self.game_id) and (self.parent is None or not self.parent.game_id),
+            "started": datetime.fromtimestamp(self.start_wall).isoformat(timespec="milliseconds"),
+            "wall_s": round(wall, 4),
+            "cpu_s": round(cpu, 4),
+            "max_rss_mb": _max_rss_mb(),
+            "pid": self.recorder.pid,
+        }
+        if "tracemalloc" in self.recorder.modes and tracemalloc.is_tracing():
+            peak = max(tracemalloc.get_traced_memory()[1], self.child_peak)
+            record["peak_traced_mb"] = round(peak / 2 ** 20, 2)
+            if self.parent is not None:
+                self.parent.child_peak = max(self.parent.child_peak, peak)
+            tracemalloc.reset_peak()
+        if self.profiler is not None:
+            self.profiler.disable()
+            record["profile"] = _profile_summary(self.profiler)
+        if error is not None:
+            record["error"] = type(error).__name__
+        if self.meta:
+            record.update(self.meta)
+        self.recorder.spans.append(record)
+        if not self.recorder.atexit_registered:
+            self.recorder.atexit_registered = True
+            atexit.register(_write_at_exit)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end(exc)
+        return False
+
+
+def begin(stage, game_id=None, **meta):
+    """Open a span for ``stage`` and return it; call ``end()`` to record it."""
+    recorder = _current()
+    if recorder is None:
+        return _NULL_SPAN
+    return Span(recorder, stage, game_id, meta)
+
+
+def span(stage, game_id=None, **meta):
+    """Context manager timing ``stage`` (optionally for ``game_id``)."""
+    return begin(stage, game_id, **meta)
+
+
+def traced(stage, game_arg=None):
+    """Decorator recording every call as a ``stage`` span.
+
+    ``game_arg`` names the parameter holding the game id (it is read from
+    the keyword arguments or, failing that, the first positional argument).
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _current() is None:
+                return fn(*args, **kwargs)
+            game_id = None
+            if game_arg:
+                game_id = kwargs.get(game_arg, args[0] if args else None)
+            with begin(stage, game_id):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def drain():
+    """Return and forget every span recorded so far in this process."""
+    recorder = _current()
+    if recorder is None:
+        return []
+    spans, recorder.spans = recorder.spans, []
+    return spans
+
+
+def merge(spans):
+    """Add spans recorded elsewhere (e.g. in a pool worker) to this process's report."""
+    recorder = _current()
+    if recorder is None or not spans:
+        return
+    recorder.spans.extend(spans)
+    if not recorder.atexit_registered:
+        recorder.atexit_registered = True
+        atexit.register(_write_at_exit)
+
+
+def summarize(spans):
+    """Return ``(stages, games)`` totals for a list of span records.
+
+    ``stages`` maps each stage to its call count, total/max wall time,
+    total CPU time and the largest memory figures seen.  ``games`` maps each
+    game id to its wall/CPU time (from its outermost spans) and per-stage
+    wall time, slowest game first.
+    """
+    stages, games = {}, {}
+    for record in spans:
+        stage = stages.setdefault(record["stage"], {"count": 0, "wall_s": 0.0, "cpu_s": 0.0, "max_wall_s": 0.0, "max_rss_mb": 0.0})
+        stage["count"] += 1
+        stage["wall_s"] += record["wall_s"]
+        stage["cpu_s"] += record["cpu_s"]
+        stage["max_wall_s"] = max(stage["max_wall_s"], record["wall_s"])
+        stage["max_rss_mb"] = max(stage["max_rss_mb"], record.get("max_rss_mb", 0.0))
+        if "peak_traced_mb" in record:
+            stage["peak_traced_mb"] = max(stage.get("peak_traced_mb", 0.0), record["peak_traced_mb"])
+        if record.get("game_id"):
+            game = games.setdefault(record["game_id"], {"wall_s": 0.0, "cpu_s": 0.0, "stages": {}})
+            if record.get("game_root"):
+                game["wall_s"] += record["wall_s"]
+                game["cpu_s"] += record["cpu_s"]
+            game["stages"][record["stage"]] = round(game["stages"].get(record["stage"], 0.0) + record["wall_s"], 4)
+    for totals in list(stages.values()) + list(games.values()):
+        totals["wall_s"] = round(totals["wall_s"], 4)
+        totals["cpu_s"] = round(totals["cpu_s"], 4)
+    games = dict(sorted(games.items(), key=lambda item: item[1]["wall_s"], reverse=True))
+    return stages, games
+
+
+def _process_label():
+    main = sys.modules.get("__main__")
+    spec = getattr(main, "__spec__", None)
+    if spec is not None and spec.name:
+        return spec.name.rsplit(".", 1)[-1]
+    return os.path.splitext(os.path.basename(sys.argv[0] or "python"))[0] or "python"
+
+
+def write_report(out_dir=PERF_DIR, reset=True):
+    """Write the spans recorded so far to ``out_dir`` and return the path (``None`` if there were none)."""
+    recorder = _current()
+    if recorder is None or not recorder.spans:
+        return None
+    stages, games = summarize(recorder.spans)
+    now = datetime.now()
+    report = {
+        "created": now.isoformat(timespec="seconds"),
+        "cycle": os.environ.get(CYCLE_ENV),
+        "process": _process_label(),
+        "pid": recorder.pid,
+        "argv": sys.argv,
+        "modes": sorted(recorder.modes),
+        "elapsed_s": round(time.time() - recorder.started, 3),
+        "max_rss_mb": _max_rss_mb(),
+        "stages": stages,
+        "games": games,
+        "spans": recorder.spans,
+    }
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, f"{now:%Y%m%dT%H%M%S%f}_{report['process']}_{recorder.pid}.json")
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    if reset:
+        recorder.spans = []
+        recorder.started = time.time()
+    return path
+
+
+def _write_at_exit():
+    recorder = _current()
+    if recorder is None:
+        return
+    recorder.atexit_registered = False
+    try:
+        path = write_report()
+        if path:
+            logger.info("⏱️ Wrote performance report → %s", path)
+    except Exception as e:
+        logger.warning("⚠️ Failed to write performance report: %s", e)
+
+
+def load_reports(folder=PERF_DIR, cycle=None):
+    """Return every report in ``folder`` (optionally only those of ``cycle``), oldest first."""
+    reports = []
+    if not os.path.isdir(folder):
+        return reports
+    for name in sorted(os.listdir(folder)):
+        if not name.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(folder, name)) as f:
+                report = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if cycle is None or report.get("cycle") == cycle:
+            reports.append(report)
+    return reports
+
+
+configure()
@@ -1,7 +1,17 @@
 import numpy as np
 from scipy.special import logit, expit
 
+from core.stats_tools import DiscretePMF
+
 class MLBPricingEngine:
+    """Calibrated scaling and pricing of simulated distributions.
+
+    Scaling methods accept any sequence and return ``ndarray``; the
+    multi-line pricers compare every sample against every line in one
+    broadcasted step.  Element-wise arithmetic follows the same operation
+    order as the per-sample formulas, so results are unchanged.
+    """
+
     def __init__(self, calibration):
         self.run_scaling_factor = calibration.get("run_scaling_factor", 1.0)
         self.stddev_scaling_factor = calibration.get("stddev_scaling_factor", 1.0)
@@ -21,35 +31,74 @@ class MLBPricingEngine:
         self.logit_b = logit_params.get("b")
 
     def apply_total_scaling(self, raw_totals):
-        mean_total = np.mean(raw_totals)
-        std_scaled = [(r - mean_total) * self.stddev_scaling_factor + mean_total for r in raw_totals]
-        final_scaled = [r * self.run_scaling_factor for r in std_scaled]
-        return final_scaled
+        raw_totals = np.asarray(raw_totals, dtype=float)
+        mean_total = raw_totals.mean()
+        std_scaled = (raw_totals - mean_total) * self.stddev_scaling_factor + mean_total
+        return std_scaled * self.run_scaling_factor
 
     def apply_runline_scaling(self, raw_diffs):
-        mean_diff = np.mean(raw_diffs)
-        return [(d - mean_diff) * self.run_diff_scaling_factor + mean_diff for d in raw_diffs]
+        raw_diffs = np.asarray(raw_diffs, dtype=float)
+        mean_diff = raw_diffs.mean()
+        return (raw_diffs - mean_diff) * self.run_diff_scaling_factor + mean_diff
 
     def calc_prob(self, samples, comparator):
-        return np.mean([1 if comparator(x) else 0 for x in samples])
+        """Share of ``samples`` for which ``comparator`` holds.
 
-    def calc_total_probs(self, scaled_totals, line):
-        p_push = self.calc_prob(scaled_totals, lambda x: round(x) == line)
-        p_over = self.calc_prob(scaled_totals, lambda x: x > line)
+        ``comparator`` is applied to the whole array when it supports that,
+        and per sample otherwise.
+        """
+        samples = np.asarray(samples, dtype=float)
+        try:
+            hits = np.asarray(comparator(samples), dtype=bool)
+        except (TypeError, ValueError):
+            hits = None
+        if hits is None or hits.shape != samples.shape:
+            hits = np.array([bool(comparator(x)) for x in samples], dtype=bool)
+        return np.mean(hits)
+
+    def total_probs(self, scaled_totals, lines):
+        """Return over/under/push arrays for every line in ``lines``.
+
+        ``over`` is ``P(x > line)``, ``push`` is ``P(round(x) == line)`` and
+        ``under`` the remainder.
+        """
+        samples = np.asarray(scaled_totals, dtype=float)[None, :]
+        lines = np.asarray(lines, dtype=float)[:, None]
+        p_push = np.mean(np.round(samples) == lines, axis=1)
+        p_over = np.mean(samples > lines, axis=1)
         p_under = 1 - p_over - p_push
         return {"over": p_over, "under": p_under, "push": p_push}
 
+    def runline_probs(self, run_diffs, thresholds):
+        """Return ``P(diff > threshold)`` for every threshold."""
+        samples = np.asarray(run_diffs, dtype=float)[None, :]
+        thresholds = np.asarray(thresholds, dtype=float)[:, None]
+        return np.mean(samples > thresholds, axis=1)
+
+    def calc_total_probs(self, scaled_totals, line):
+        probs = self.total_probs(scaled_totals, [line])
+        return {key: values[0] for key, values in probs.items()}
+
     def calc_runline_prob(self, run_diffs, threshold):
-        return self.calc_prob(run_diffs, lambda x: x > threshold)
+        return self.runline_probs(run_diffs, [threshold])[0]
+
+    def calibrate_win_pct(self, sim_win_pct):
+        """Apply the logit win-percentage calibration (scalar or array)."""
+        if self.logit_a is None or self.logit_b is None:
+            return sim_win_pct
+        calibrated = expit(self.logit_a + self.logit_b * logit(sim_win_pct))
+        return float(calibrated) if np.ndim(calibrated) == 0 else calibrated
 
     def price_moneyline(self, sim_win_pct):
-        if self.logit_a is not None and self.logit_b is not None:
-            sim_win_pct = float(expit(self.logit_a + self.logit_b * logit(sim_win_pct)))
-        dec_odds = 1 / sim_win_pct
-        if sim_win_pct >= 0.5:
-            return -100 * (sim_win_pct / (1 - sim_win_pct))
-        else:
-            return 100 * ((1 - sim_win_pct) / sim_win_pct)
+        sim_win_pct = self.calibrate_win_pct(sim_win_pct)
+        if np.ndim(sim_win_pct) == 0:
+            if sim_win_pct >= 0.5:
+                return -100 * (sim_win_pct / (1 - sim_win_pct))
+            else:
+                return 100 * ((1 - sim_win_pct) / sim_win_pct)
+        p = np.asarray(sim_win_pct, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(p >= 0.5, -100 * (p / (1 - p)), 100 * ((1 - p) / p))
 
     def implied_prob(self, odds):
         if odds < 0:
@@ -62,23 +111,32 @@ class MLBPricingEngine:
         return p * payout - (1 - p)
 
     def summarize_alt_totals(self, totals, lines):
-        scaled_totals = self.apply_total_scaling(totals)
+        probs = self.total_probs(self.apply_total_scaling(totals), lines)
         return {
-            line: self.calc_total_probs(scaled_totals, line)
-            for line in lines
+            line: {key: values[i] for key, values in probs.items()}
+            for i, line in enumerate(lines)
         }
 
     def summarize_alt_runlines(self, run_diffs, lines):
-        scaled_diffs = self.apply_runline_scaling(run_diffs)
+        probs = self.runline_probs(self.apply_runline_scaling(run_diffs), lines)
+        return {line: probs[i] for i, line in enumerate(lines)}
+
+    def summarize_alt_team_totals(self, scores, lines, is_home=True):
+        probs = self.total_probs(self.apply_team_total_scaling(scores, is_home=is_home), lines)
         return {
-            line: self.calc_runline_prob(scaled_diffs, line)
-            for line in lines
+            line: {key: values[i] for key, values in probs.items()}
+            for i, line in enumerate(lines)
         }
 
     def apply_team_total_scaling(self, scores, is_home=True):
         mean_factor = self.home_mean_factor if is_home else self.away_mean_factor
         std_factor = self.home_std_factor if is_home else self.away_std_factor
 
-        mean_score = np.mean(scores)
-        std_scaled = [(s - mean_score) * std_factor + mean_score for s in scores]
-        return [s * mean_factor for s in std_scaled]
+        scores = np.asarray(scores, dtype=float)
+        mean_score = scores.mean()
+        std_scaled = (scores - mean_score) * std_factor + mean_score
+        return std_scaled * mean_factor
+
+    def team_total_pmf(self, scores, is_home=True, weights=None):
+        """Return the rounded ``DiscretePMF`` of team-total-scaled scores."""
+        return DiscretePMF.from_values(self.apply_team_total_scaling(scores, is_home=is_home), weights=weights)
@@ -0,0 +1,174 @@
+# sim_cache.py
+"""Content-hash cache for per-game simulation exports.
+
+``simulate_distribution`` fingerprints everything that determines its output
+(game assets, simulation environment, calibration, simulation settings and
+the source of every repo module the simulation/pricing entry points import).
+The fingerprint is stored in the export manifest; when a later run computes
+the same fingerprint and the export is still on disk, the simulation is
+skipped and the export is only re-touched so freshness checks keep seeing it
+as current.
+"""
+
+from core.config import DEBUG_MODE, VERBOSE_MODE
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
+
+import numpy as np
+
+from core.logger import get_logger
+from core.sim_export import sidecar_path
+
+logger = get_logger(__name__)
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Entry points of a game's simulation and pricing.  Every repo module they
+# import (directly, inside functions, or transitively) is part of the code version.
+SIM_ENTRY_FILES = [
+    "cli/run_distribution_simulator.py",
+    "core/batch_game_simulator.py",
+]
+
+# ``from x import (a, b)`` / ``import x, y`` anywhere in a file.  A text scan
+# rather than ``ast`` so the hash never depends on the running Python parsing
+# every module.
+_FROM_IMPORT = re.compile(r"^[ \t]*from[ \t]+(\.*[\w.]*)[ \t]+import[ \t]+(\([^)]*\)|[^\n#]*)", re.M)
+_IMPORT = re.compile(r"^[ \t]*import[ \t]+([\w., \t]+)", re.M)
+
+
+def _module_file(module):
+    """Return the repo-relative file for dotted ``module``, or ``None`` outside the repo."""
+    base = os.path.join(*module.split("."))
+    for candidate in (base + ".py", os.path.join(base, "__init__.py")):
+        if os.path.isfile(os.path.join(ROOT_DIR, candidate)):
+            return candidate.replace(os.sep, "/")
+    return None
+
+
+def _imported_modules(rel_path):
+    """Return the dotted names ``rel_path`` imports, including ``from pkg import module`` names."""
+    with open(os.path.join(ROOT_DIR, rel_path), "r", encoding="utf-8", errors="replace") as fh:
+        source = fh.read()
+    package = os.path.dirname(rel_path).replace("/", ".")
+    names = set()
+    for module, imported in _FROM_IMPORT.findall(source):
+        if module.startswith("."):
+            # Relative import: one dot is this package, each further dot a parent
+            rest = module.lstrip(".")
+            parts = package.split(".") if package else []
+            parts = parts[: len(parts) - (len(module) - len(rest) - 1)]
+            module = ".".join(parts + ([rest] if rest else []))
+        if not module:
+            continue
+        names.add(module)
+        names.update(f"{module}.{name}" for name in re.findall(r"\w+", imported) if name != "as")
+    for imported in _IMPORT.findall(source):
+        names.update(part.split(" as ")[0].strip() for part in imported.split(","))
+    return names
+
+
+def _package_inits(rel_path):
+    """Return the ``__init__.py`` of each package enclosing ``rel_path``, up to ``ROOT_DIR``."""
+    inits = []
+    package = os.path.dirname(rel_path)
+    while package:
+        init = f"{package}/__init__.py"
+        if os.path.isfile(os.path.join(ROOT_DIR, init)):
+            inits.append(init)
+        package = os.path.dirname(package)
+    return inits
+
+
+@lru_cache(maxsize=1)
+def sim_code_files():
+    """Return every repo module reachable by imports from ``SIM_ENTRY_FILES``, sorted.
+
+    Importing a module also runs its enclosing packages' ``__init__.py``, so
+    those are included too.
+    """
+    seen = set()
+    pending = list(SIM_ENTRY_FILES)
+    while pending:
+        rel_path = pending.pop()
+        if rel_path in seen:
+            continue
+        seen.add(rel_path)
+        pending.extend(init for init in _package_inits(rel_path) if init not in seen)
+        for module in _imported_modules(rel_path):
+            found = _module_file(module)
+            if found and found not in seen:
+                pending.append(found)
+    return sorted(seen)
+
+
+@lru_cache(maxsize=1)
+def code_version():
+    """Return a short hash of the simulation/pricing source files."""
+    digest = hashlib.sha256()
+    for rel_path in sim_code_files():
+        digest.update(rel_path.encode())
+        try:
+            with open(os.path.join(ROOT_DIR, rel_path), "rb") as fh:
+                digest.update(fh.read())
+        except OSError:
+            digest.update(b"<missing>")
+    return digest.hexdigest()[:16]
+
+
+def _json_default(obj):
+    if isinstance(obj, np.random.SeedSequence):
+        return {"entropy": obj.entropy, "spawn_key": list(obj.spawn_key)}
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=str)
+    return str(obj)
+
+
+def sim_fingerprint(assets, env, calibration, n_simulations, options=None):
+    """Return the SHA-256 fingerprint of a simulation's inputs.
+
+    ``options`` holds any further settings that change the export (total
+    line, engine, seed, weather profile, ...).
+    """
+    payload = {
+        "assets": assets,
+        "env": env,
+        "calibration": calibration,
+        "n_simulations": n_simulations,
+        "options": options or {},
+        "code_version": code_version(),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=_json_default)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def is_cached_export(target_path, fingerprint):
+    """Return ``True`` when ``target_path`` holds an export for ``fingerprint``."""
+    if not os.path.exists(target_path):
+        return False
+    try:
+        with open(target_path, "r", encoding="utf-8") as fh:
+            manifest = json.load(fh)
+    except (OSError, ValueError):
+        return False
+    if not isinstance(manifest, dict) or manifest.get("sim_fingerprint") != fingerprint:
+        return False
+    if manifest.get("distributions_file") and not os.path.exists(sidecar_path(target_path)):
+        return False
+    return True
+
+
+def touch_export(target_path):
+    """Refresh the modification time of an export and its sidecar."""
+    for path in (target_path, sidecar_path(target_path)):
+        if os.path.exists(path):
+            os.utime(path, None)
+    if DEBUG_MODE:
+        logger.debug("♻️ Touched cached export %s", target_path)
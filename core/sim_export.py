@@ -0,0 +1,133 @@
+# sim_export.py
+"""Compact on-disk format for ``simulate_distribution`` exports.
+
+Each game is written as two files:
+
+  - ``<game_id>.json``: the manifest.  It is the same export as before
+    (``markets``, ``summary_metrics``, PMFs, ...) except that every entry of
+    ``raw_distributions``/``scaled_distributions`` keeps only its summary stats
+    (``mean``/``std``) and drops the per-simulation ``values`` list.
+  - ``<game_id>.npz``: the per-simulation value arrays.
+
+Snapshot, logging and dispatch code only needs the manifest, so it keeps
+reading ``<game_id>.json`` exactly as before.  ``load_sim_distributions``
+reattaches the arrays for the tools that need them.
+
+Simulated values take few distinct levels (scores are integers and the
+scaled arrays are linear transforms of them), so each array is stored as its
+sorted unique levels plus small integer codes; reconstruction is exact.
+"""
+
+from core.config import DEBUG_MODE, VERBOSE_MODE
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+DISTRIBUTION_KEYS = ("raw_distributions", "scaled_distributions")
+SIDECAR_SUFFIX = ".npz"
+
+
+def sidecar_path(manifest_path):
+    """Return the ``.npz`` path that belongs to ``manifest_path``."""
+    return os.path.splitext(manifest_path)[0] + SIDECAR_SUFFIX
+
+
+def _encode(values):
+    """Return ``(levels, codes)`` for ``values``, or ``(values, None)`` when too varied."""
+    arr = np.asarray(values)
+    levels, codes = np.unique(arr, return_inverse=True)
+    if len(levels) <= np.iinfo(np.uint8).max + 1:
+        return levels, codes.astype(np.uint8)
+    if len(levels) <= np.iinfo(np.uint16).max + 1:
+        return levels, codes.astype(np.uint16)
+    return arr, None
+
+
+def split_distributions(output):
+    """Return ``(manifest, arrays)`` for a ``simulate_distribution`` output dict.
+
+    ``manifest`` is a shallow copy of ``output`` with the ``values`` lists
+    removed; ``arrays`` maps ``npz`` entry names to encoded arrays.
+    """
+    manifest = dict(output)
+    arrays = {}
+    for group in DISTRIBUTION_KEYS:
+        if group not in output:
+            continue
+        manifest[group] = {}
+        for name, dist in output[group].items():
+            manifest[group][name] = {k: v for k, v in dist.items() if k != "values"}
+            if "values" not in dist:
+                continue
+            levels, codes = _encode(dist["values"])
+            if codes is None:
+                arrays[f"{group}__{name}__values"] = levels
+            else:
+                arrays[f"{group}__{name}__levels"] = levels
+                arrays[f"{group}__{name}__codes"] = codes
+    return manifest, arrays
+
+
+def _atomic_write(target_path, write, mode):
+    folder = os.path.dirname(target_path) or "."
+    os.makedirs(folder, exist_ok=True)
+    with tempfile.NamedTemporaryFile(mode, dir=folder, delete=False, suffix=".tmp") as tmpf:
+        write(tmpf)
+        temp_path = tmpf.name
+    os.replace(temp_path, target_path)
+
+
+def write_sim_export(output, target_path):
+    """Write ``output`` as a manifest at ``target_path`` plus its ``.npz`` sidecar.
+
+    The sidecar is written first so a manifest never points at missing arrays.
+    Both writes are atomic.
+    """
+    manifest, arrays = split_distributions(output)
+    npz_path = sidecar_path(target_path)
+    if arrays:
+        _atomic_write(npz_path, lambda fh: np.savez(fh, **arrays), "wb")
+        manifest["distributions_file"] = os.path.basename(npz_path)
+    _atomic_write(target_path, lambda fh: json.dump(manifest, fh, indent=2), "w")
+    if DEBUG_MODE:
+        logger.debug("💾 Wrote %s (+ %d arrays → %s)", target_path, len(arrays), npz_path)
+    return manifest
+
+
+def load_sim_distributions(manifest_path, manifest=None):
+    """Return ``raw_distributions``/``scaled_distributions`` with ``values`` restored.
+
+    ``manifest`` may be passed when already loaded.  Older exports that still
+    carry inline ``values`` are returned as stored.  Missing sidecars leave the
+    entries without ``values``.
+    """
+    if manifest is None:
+        with open(manifest_path, "r", encoding="utf-8") as fh:
+            manifest = json.load(fh)
+    result = {group: {name: dict(dist) for name, dist in manifest.get(group, {}).items()} for group in DISTRIBUTION_KEYS}
+
+    filename = manifest.get("distributions_file")
+    if not filename:
+        return result
+    npz_path = os.path.join(os.path.dirname(manifest_path), filename)
+    if not os.path.exists(npz_path):
+        logger.warning("⚠️ Distribution sidecar missing: %s", npz_path)
+        return result
+
+    with np.load(npz_path) as data:
+        for key in data.files:
+            group, name, kind = key.split("__")
+            if kind == "codes":
+                continue
+            entry = result.setdefault(group, {}).setdefault(name, {})
+            if kind == "values":
+                entry["values"] = data[key]
+            else:
+                entry["values"] = data[key][data[f"{group}__{name}__codes"]]
+    return result
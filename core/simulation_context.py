@@ -0,0 +1,85 @@
+# simulation_context.py
+"""Per-run state for the scalar game engine.
+
+A ``SimulationContext`` carries everything a run of ``simulate_game`` calls
+mutates: the RNG, the plate-appearance outcome tally, the reliever usage
+counts that drive bullpen fatigue and a few instrumentation counters.  It is
+passed explicitly through ``simulate_game`` → ``simulate_half_inning`` →
+``simulate_pa``, so concurrent runs in one process never share counters.
+
+``DEFAULT_CONTEXT`` backs the legacy module globals
+(``core.pa_simulator.PA_RECAP_LOG`` and
+``assets.bullpen_utils.RELIEVER_USAGE_COUNTS``) for callers that do not pass
+a context.
+"""
+
+from core.config import DEBUG_MODE, VERBOSE_MODE
+from collections import Counter
+
+import numpy as np
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+PA_OUTCOMES = ["K", "BB", "1B", "2B", "3B", "HR", "OUT"]
+PA_TEAMS = ["AWAY", "HOME"]
+
+
+def _empty_recap():
+    return {outcome: 0 for outcome in PA_OUTCOMES}
+
+
+class SimulationContext:
+    """Counters, RNG and instrumentation for one simulation run."""
+
+    def __init__(self, rng=None):
+        if rng is not None and not isinstance(rng, np.random.Generator):
+            rng = np.random.default_rng(rng)
+        self.rng = rng
+        self.pa_recap = {"HOME": _empty_recap(), "AWAY": _empty_recap()}
+        self.reliever_usage = {"home": {}, "away": {}}
+        self.counters = Counter()
+
+    def log_pa(self, team, outcome):
+        recap = self.pa_recap.get(team)
+        if recap is None:
+            recap = self.pa_recap[team] = _empty_recap()
+        if outcome in recap:
+            recap[outcome] += 1
+
+    def reset_pa_recap(self):
+        for recap in self.pa_recap.values():
+            for outcome in recap:
+                recap[outcome] = 0
+
+    def reliever_counts(self, side):
+        """Return the mutable ``{name: uses}`` map for ``side``."""
+        return self.reliever_usage.setdefault(side, {})
+
+    def reset_relievers(self):
+        for counts in self.reliever_usage.values():
+            counts.clear()
+
+    def pa_counts(self):
+        """Return PA outcome counts as an ``(2, len(PA_OUTCOMES))`` array (away, home)."""
+        return np.array(
+            [[self.pa_recap.get(team, {}).get(outcome, 0) for outcome in PA_OUTCOMES] for team in PA_TEAMS],
+            dtype=np.int64,
+        )
+
+    def reliever_usage_counts(self, side, names):
+        """Return how often each of ``names`` was used by ``side`` as an array."""
+        counts = self.reliever_usage.get(side, {})
+        return np.array([counts.get(name, 0) for name in names], dtype=np.int64)
+
+    def summary(self):
+        """Aggregate the run into plain arrays and dicts."""
+        return {
+            "pa_outcomes": list(PA_OUTCOMES),
+            "pa_counts": self.pa_counts(),
+            "counters": dict(self.counters),
+        }
+
+
+DEFAULT_CONTEXT = SimulationContext()
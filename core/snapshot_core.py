@@ -35,6 +35,7 @@ from core.utils import (
     fuzzy_match_game_id,
 )
 from core.time_utils import compute_hours_to_game
+from core import perf
 from core.dispatch_clv_snapshot import parse_start_time
 from core.should_log_bet import get_theme, get_theme_key
 from core.market_pricer import (
@@ -683,6 +684,7 @@ def load_simulations(sim_dir: str) -> dict:
     return sims
 
 
+@perf.traced("build_snapshot_rows")
 def build_snapshot_rows(
     sim_data: dict, odds_data: dict, min_ev: float, debug_log=None
 ) -> list:
@@ -1177,6 +1179,7 @@ def export_market_snapshots(df: pd.DataFrame, snapshot_paths: Dict[str, str]) ->
             print(f"❌ Failed to export {market} snapshot to {path}: {e}")
 
 
+@perf.traced("expand_snapshot_rows_with_kelly")
 def expand_snapshot_rows_with_kelly(
     rows: List[dict],
     allowed_books: List[str] | None = None,
@@ -0,0 +1,127 @@
+# stats_cache.py
+"""Binary cache for the enriched batter and pitcher tables.
+
+``core.data_loader.load_all_stats`` keeps one pickle holding each table's
+enriched dicts together with the key they were built from: the mtime, size
+and SHA-256 of every source CSV and alias map, plus a hash of the loader
+source.  A load whose key matches is a single deserialize.  An unchanged
+mtime and size skips re-hashing a file; a file that was only touched still
+hits on its hash.
+
+When a table is stale its rows are rebuilt (the vectorized part is cheap),
+and pitchers whose merged input row hashes the same as last time keep their
+cached ``hr_pa`` projection instead of being enriched again.
+"""
+
+from core.config import DEBUG_MODE, VERBOSE_MODE
+import hashlib
+import os
+import pickle
+from functools import lru_cache
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+STATS_CACHE_PATH = os.path.join("data", "stats_cache", "enriched_stats.pkl")
+CACHE_FORMAT = 1
+
+# Modules whose source determines the enriched tables
+LOADER_CODE_FILES = [
+    "assets/stats_loader.py",
+    "core/project_hr_pa.py",
+    "core/utils.py",
+]
+
+
+@lru_cache(maxsize=1)
+def loader_version():
+    """Return a short hash of the stats loader source files."""
+    digest = hashlib.sha256()
+    for rel_path in LOADER_CODE_FILES:
+        digest.update(rel_path.encode())
+        try:
+            with open(os.path.join(ROOT_DIR, rel_path), "rb") as fh:
+                digest.update(fh.read())
+        except OSError:
+            digest.update(b"<missing>")
+    return digest.hexdigest()[:16]
+
+
+def file_signature(path, known=None):
+    """Return ``{"mtime_ns", "size", "sha256"}`` for ``path``, or ``None`` if it does not exist.
+
+    The hash is taken from ``known`` (an earlier signature) when the mtime
+    and size still match, so unchanged files are not re-read.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    if known and known.get("mtime_ns") == stat.st_mtime_ns and known.get("size") == stat.st_size:
+        return dict(known)
+    with open(path, "rb") as fh:
+        sha256 = hashlib.sha256(fh.read()).hexdigest()
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": sha256}
+
+
+def table_key(sources, known=None):
+    """Return the cache key for a table built from ``sources`` (CSV and alias map paths)."""
+    known_files = (known or {}).get("files") or {}
+    return {
+        "format": CACHE_FORMAT,
+        "code": loader_version(),
+        "files": {path: file_signature(path, known_files.get(path)) for path in sources},
+    }
+
+
+def _content(key):
+    return (
+        key.get("format"),
+        key.get("code"),
+        {path: sig and sig["sha256"] for path, sig in (key.get("files") or {}).items()},
+    )
+
+
+def read_cache(path=STATS_CACHE_PATH):
+    """Return the cached tables in ``path``, or ``{}`` if absent or unreadable."""
+    try:
+        with open(path, "rb") as fh:
+            cache = pickle.load(fh)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning("⚠️ Ignoring unreadable stats cache %s: %s", path, e)
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def write_cache(cache, path=STATS_CACHE_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as fh:
+        pickle.dump(cache, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def cached_table(cache, table, sources, build):
+    """Return ``(stats, changed)`` for ``table``, from ``cache`` when its key still matches.
+
+    Otherwise ``build(previous)`` is called with the stale entry (or ``{}``)
+    and must return ``(stats, rows)``; ``rows`` maps each name to its source
+    row digest so the next rebuild can reuse unchanged rows.  ``cache`` is
+    updated in place and ``changed`` says whether it needs writing back.
+    """
+    entry = cache.get(table) or {}
+    key = table_key(sources, entry.get("key"))
+    if entry.get("key") and _content(key) == _content(entry["key"]):
+        if DEBUG_MODE:
+            logger.debug("📦 %s stats loaded from cache", table)
+        changed = key != entry["key"]
+        entry["key"] = key
+        return entry["stats"], changed
+
+    stats, rows = build(entry)
+    cache[table] = {"key": key, "stats": stats, "rows": rows}
+    return stats, True
@@ -11,6 +11,9 @@ def calculate_std_dev(pmf):
     return math.sqrt(variance)
 
 def calculate_tail_probability(pmf, threshold, direction="over"):
+    if isinstance(pmf, DiscretePMF):
+        return pmf.tail(threshold, direction)
+
     def safe_key(x):
         try:
             return float(x)
@@ -50,3 +53,118 @@ def summarize_pmf(values):
         pmf[key] = float(v) / total
     return pmf
 
+
+class DiscretePMF:
+    """PMF over consecutive integers backed by a count array.
+
+    ``counts[i]`` is the weight of ``offset + i``; ``cum`` holds the running
+    sum so tail queries are a couple of array lookups instead of a scan over
+    a ``summarize_pmf`` dict.  Query methods accept a scalar line (returning
+    a float) or a sequence of lines (returning an array).
+    """
+
+    def __init__(self, counts, offset=0):
+        self.counts = np.asarray(counts)
+        self.offset = int(offset)
+        self.cum = np.cumsum(self.counts)
+        self.total = self.cum[-1] if self.counts.size else 0
+
+    @classmethod
+    def from_values(cls, values, weights=None):
+        """Build from simulated values, rounding non-integers to the nearest integer.
+
+        ``weights`` optionally gives each value a weight instead of a count
+        (e.g. the per-sim weights of ``core.variance_reduction``).
+        """
+        values = np.asarray(values)
+        if not np.issubdtype(values.dtype, np.integer):
+            values = np.round(values).astype(np.int64)
+        if not values.size:
+            return cls(np.zeros(0, dtype=np.int64))
+        low = int(values.min())
+        return cls(np.bincount(values - low, weights=weights), offset=low)
+
+    @classmethod
+    def from_dict(cls, pmf):
+        """Build from a ``summarize_pmf``-style ``{value: probability}`` dict."""
+        if not pmf:
+            return cls(np.zeros(0))
+        keys = [int(round(float(k))) for k in pmf]
+        low = min(keys)
+        weights = np.zeros(max(keys) - low + 1)
+        for key, p in zip(keys, pmf.values()):
+            weights[key - low] += p
+        return cls(weights, offset=low)
+
+    @property
+    def support(self):
+        return np.arange(self.offset, self.offset + self.counts.size)
+
+    @property
+    def probs(self):
+        return self.counts / self.total if self.total else np.zeros(self.counts.size)
+
+    def mean(self):
+        return float(self.support @ self.probs)
+
+    def std(self):
+        return float(math.sqrt(((self.support - self.mean()) ** 2) @ self.probs))
+
+    def _at_most(self, k):
+        """Total weight of values ``<= k`` for integer array ``k``."""
+        idx = k - self.offset
+        if not self.counts.size:
+            return np.zeros(idx.shape)
+        inside = self.cum[np.clip(idx, 0, self.counts.size - 1)]
+        return np.where(idx < 0, 0, np.where(idx >= self.counts.size, self.total, inside))
+
+    def _query(self, lines, fn):
+        arr = np.asarray(lines, dtype=float)
+        if not self.total:
+            result = np.zeros(arr.shape)
+        else:
+            result = fn(arr) / self.total
+        return float(result) if result.ndim == 0 else result
+
+    def over(self, lines):
+        """P(X > line)."""
+        return self._query(lines, lambda x: self.total - self._at_most(np.floor(x).astype(np.int64)))
+
+    def under(self, lines):
+        """P(X < line)."""
+        return self._query(lines, lambda x: self._at_most(np.ceil(x).astype(np.int64) - 1))
+
+    def exact(self, lines):
+        """P(X == line); zero for non-integer lines."""
+        def weight(x):
+            k = np.floor(x).astype(np.int64)
+            return np.where(k == x, self._at_most(k) - self._at_most(k - 1), 0)
+        return self._query(lines, weight)
+
+    def push_adjusted(self, lines):
+        """Return ``(over, under)`` priced the way the full-game total dict is.
+
+        Under is ``1 - over``; both sides are then divided by ``1 - P(push)``,
+        which only differs from 1 at integer lines.
+        """
+        over = self.over(lines)
+        denom = np.maximum(1.0 - self.exact(lines), 1e-6)
+        return over / denom, (1.0 - over) / denom
+
+    def tail(self, threshold, direction="over"):
+        """``calculate_tail_probability``-compatible query."""
+        if direction == "over":
+            return self.over(threshold)
+        if direction == "under":
+            return self.under(threshold)
+        if direction == "exact":
+            return self.exact(threshold)
+        raise ValueError("Direction must be 'over', 'under', or 'exact'")
+
+    def to_dict(self):
+        """Return a JSON-compatible ``{float(value): probability}`` dict (nonzero values only)."""
+        return {
+            float(value): float(p)
+            for value, p in zip(self.support.tolist(), self.probs.tolist())
+            if p
+        }
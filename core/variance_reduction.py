@@ -0,0 +1,288 @@
+# variance_reduction.py
+"""Variance-reduced estimates of simulated market probabilities.
+
+A plain run prices every market as the share of independent games in which
+it wins.  Three optional methods reach the same standard error with fewer
+games:
+
+- ``antithetic``: games are simulated in mirrored pairs through
+  ``AntitheticUniforms`` (sim ``i + n/2`` uses ``1 - u`` of sim ``i``'s
+  draws), with PA outcomes sampled from worst to best for the offense so a
+  mirrored draw swaps an out for a hit.
+- ``stratified``: post-stratification on the first-inning state.  Runs
+  scored in the top and bottom of the 1st (0, 1, 2, 3+) have exact
+  probabilities from ``core.markov_solver.half_inning_distribution``; the
+  sample is reweighted so each cell carries its exact share.
+- ``control``: each team's runs minus the exact expected runs of every half
+  inning it played (``RunExpectancy``, evaluated at the half's starting
+  lineup slot, pitcher, times through the order and pitch count).  The
+  difference has mean zero and tracks most of the noise in totals, team
+  totals and run lines.
+
+Stratum indicators and run-expectancy residuals are both controls with known
+means, so they share one regression estimator.  Its per-market coefficients
+fold into one set of per-sim ``weights``: ``mean(weights * f)`` is the
+regression estimate of ``E[f]`` for any market ``f``, so weighted PMFs price
+every market with the same estimator.  ``variance_report`` gives the standard
+error, variance reduction and effective sample size per market.  A negative
+weight cannot go into a PMF; when any sim gets one the regression is dropped
+and the run is priced (and reported) as plain or antithetic Monte Carlo, with
+the count recorded as ``clipped_weights``.
+"""
+
+from core.config import DEBUG_MODE, VERBOSE_MODE
+import numpy as np
+
+from core.adaptive_simulation import market_indicators
+from core.batch_game_simulator import build_matchup_tables, simulate_games_batch, MAX_INNINGS
+from core.markov_solver import half_inning_distribution, half_inning_expected_runs, FRESH_PC, PC_CAP, TTO_CAP
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+METHODS = ("antithetic", "stratified", "control")
+STRATA_RUNS = 3     # first-inning runs are bucketed as 0, 1, 2 and 3+
+
+
+def parse_methods(spec):
+    """Return the methods named in ``spec`` (``"antithetic,control"``, ``"all"`` or a list)."""
+    if not spec:
+        return ()
+    if isinstance(spec, str):
+        spec = spec.replace("+", ",").split(",")
+    names = {name.strip().lower() for name in spec if name.strip()}
+    if "all" in names:
+        return METHODS
+    unknown = names - set(METHODS)
+    if unknown:
+        raise ValueError(f"Unknown variance reduction method(s): {', '.join(sorted(unknown))}")
+    return tuple(m for m in METHODS if m in names)
+
+
+class RunExpectancy:
+    """Exact expected runs of a half inning from its starting state.
+
+    Called by ``simulate_games_batch`` with arrays of the batting lineup slot,
+    pitcher index, ``tto_count`` and ``pitch_count``.  Starting pitch counts
+    at or below ``FRESH_PC`` (no fatigue possible within the half) and above
+    ``PC_CAP`` share one value.  Every fresh state is solved up front with
+    ``core.markov_solver.half_inning_expected_runs`` in one batch; the rarer
+    tired states are solved and memoized as they come up.
+    """
+
+    def __init__(self, tables):
+        self.tables = tables
+        n_pitchers = tables["cum_probs"].shape[1]
+        self.values = np.full((tables["lineup_size"], n_pitchers, TTO_CAP, PC_CAP - FRESH_PC + 1), np.nan)
+        self._steps = {}
+        slot, pitcher, tto = np.indices(self.values.shape[:3]).reshape(3, -1)
+        self._solve(slot, pitcher, tto, np.zeros_like(slot))
+
+    def __call__(self, slot, pitcher, tto_count, pitch_count):
+        index = (
+            np.asarray(slot),
+            np.asarray(pitcher),
+            np.clip(tto_count, 1, TTO_CAP) - 1,
+            np.clip(pitch_count, FRESH_PC, PC_CAP) - FRESH_PC,
+        )
+        values = self.values[index]
+        missing = np.isnan(values)
+        if missing.any():
+            self._solve(*np.unique(np.stack([part[missing] for part in index]), axis=1))
+            values = self.values[index]
+        return values
+
+    def _solve(self, slot, pitcher, tto, pc):
+        self.values[slot, pitcher, tto, pc] = half_inning_expected_runs(
+            self.tables, slot, pitcher, pc + FRESH_PC, tto + 1, self._steps
+        )
+
+
+def first_inning_strata(vs_away, vs_home):
+    """Return exact ``[away runs, home runs]`` cell probabilities for the 1st inning.
+
+    ``vs_away``/``vs_home`` are ``build_matchup_tables`` results for each
+    batting lineup; runs are bucketed as 0, 1, 2 and ``STRATA_RUNS``+.
+    """
+    sides = []
+    for tables in (vs_away, vs_home):
+        runs = half_inning_distribution(tables).sum(axis=0)
+        runs = runs / runs.sum()
+        sides.append(np.append(runs[:STRATA_RUNS], runs[STRATA_RUNS:].sum()))
+    return np.outer(*sides)
+
+
+def control_variates(batch, strata=None):
+    """Return the per-sim control matrix ``(n, k)`` and the controls' known means.
+
+    Stratum indicators are used when ``strata`` (from ``first_inning_strata``)
+    is given; run-expectancy residuals when ``batch`` holds ``expected_runs``.
+    """
+    columns = []
+    means = []
+    if strata is not None:
+        first = np.minimum(batch["inning_runs"][:, 0, :], STRATA_RUNS).astype(np.int64)
+        cell = first[:, 0] * (STRATA_RUNS + 1) + first[:, 1]
+        flat = strata.ravel()
+        # The (0, 0) cell is implied by the others
+        for c in range(1, flat.size):
+            columns.append(cell == c)
+            means.append(flat[c])
+    if "expected_runs" in batch:
+        scores = np.stack([batch["away_score"], batch["home_score"]], axis=1)
+        residuals = scores - batch["expected_runs"]
+        columns += [residuals[:, 0], residuals[:, 1]]
+        means += [0.0, 0.0]
+    return np.column_stack(columns).astype(float), np.array(means)
+
+
+def regression_weights(controls, means):
+    """Return per-sim weights ``w`` with ``mean(w * f)`` the regression estimate of ``E[f]``.
+
+    With controls ``C`` of known mean ``mu``, the estimate
+    ``mean(f) - beta_f . (mean(C) - mu)`` equals ``mean(w * f)`` for
+    ``w = 1 - n/(n-1) (C - mean(C)) S^-1 (mean(C) - mu)``, whatever ``f`` is.
+    The weights average exactly 1 but are not clipped, so some can be
+    negative; callers must check before building PMFs from them.
+    """
+    n = controls.shape[0]
+    centered = controls - controls.mean(axis=0)
+    cov = centered.T @ centered / (n - 1)
+    shift = np.linalg.lstsq(cov, controls.mean(axis=0) - means, rcond=None)[0]
+    return 1.0 - n / (n - 1) * (centered @ shift)
+
+
+def _mean_variance(residuals, pairs=None):
+    """Variance of the column means of ``residuals``, treating sims ``i``/``i + pairs`` as pairs."""
+    n = residuals.shape[0]
+    if pairs:
+        units = (residuals[:pairs] + residuals[pairs:2 * pairs]) / 2
+        return units.var(axis=0, ddof=1) / pairs
+    return residuals.var(axis=0, ddof=1) / n
+
+
+def variance_report(home_scores, away_scores, methods=(), controls=None, weights=None, pairs=None):
+    """Return standard errors, variance reduction and effective sample size per market.
+
+    Markets follow ``core.adaptive_simulation.market_indicators``.  For each,
+    ``probability`` is the variance-reduced estimate (``mean(weights * f)``),
+    ``plain_probability`` the raw share of wins, ``variance_reduction`` the
+    plain Monte Carlo variance ``p(1-p)/n`` over the achieved variance and
+    ``effective_sample_size`` the number of independent games that would
+    give the same standard error.
+    """
+    keys, hits = market_indicators(home_scores, away_scores)
+    f = hits.astype(float)
+    n = f.shape[0]
+    plain = f.mean(axis=0)
+    residuals = f - plain
+    estimate = plain
+    if controls is not None:
+        centered = controls - controls.mean(axis=0)
+        beta = np.linalg.lstsq(centered, residuals, rcond=None)[0]
+        residuals = residuals - centered @ beta
+    if weights is not None:
+        estimate = weights @ f / n
+    variance = _mean_variance(residuals, pairs)
+    plain_variance = plain * (1 - plain) / n
+
+    markets = {}
+    for i, key in enumerate(keys):
+        ratio = plain_variance[i] / variance[i] if variance[i] > 0 else 1.0
+        markets[key] = {
+            "probability": round(float(estimate[i]), 5),
+            "plain_probability": round(float(plain[i]), 5),
+            "standard_error": round(float(np.sqrt(variance[i])), 5),
+            "plain_standard_error": round(float(np.sqrt(plain_variance[i])), 5),
+            "variance_reduction": round(float(ratio), 3),
+            "effective_sample_size": int(round(n * ratio)),
+        }
+    ess = [m["effective_sample_size"] for m in markets.values()]
+    return {
+        "methods": list(methods),
+        "n_simulations": n,
+        "min_effective_sample_size": min(ess),
+        "median_variance_reduction": round(float(np.median([m["variance_reduction"] for m in markets.values()])), 3),
+        "markets": markets,
+    }
+
+
+def simulate_games_vr(
+    n,
+    lineups,
+    pitchers,
+    bullpens=None,
+    env=None,
+    seed=None,
+    methods=METHODS,
+    max_innings=MAX_INNINGS,
+):
+    """Simulate ``n`` games with the variance-reduction ``methods`` applied.
+
+    Arguments before ``methods`` mirror ``simulate_games_batch``; antithetic
+    runs round ``n`` up to an even count.  Returns the batch dict plus
+    ``weights`` (per-sim weights for pricing, ``None`` when only antithetic
+    sampling is used or the regression weights had to be dropped) and a
+    ``variance_reduction`` entry from ``variance_report``.  Its ``methods``
+    are the methods actually applied and ``clipped_weights`` counts the
+    negative weights that forced a fallback.
+    """
+    methods = parse_methods(methods)
+    bullpens = bullpens or {}
+    antithetic = "antithetic" in methods
+    if antithetic and n % 2:
+        n += 1
+
+    run_expectancy = None
+    strata = None
+    if "stratified" in methods or "control" in methods:
+        vs_away = build_matchup_tables(lineups["away"], pitchers["home"], bullpens.get("home"), env)
+        vs_home = build_matchup_tables(lineups["home"], pitchers["away"], bullpens.get("away"), env)
+        if "control" in methods:
+            run_expectancy = {"away": RunExpectancy(vs_away), "home": RunExpectancy(vs_home)}
+        if "stratified" in methods:
+            strata = first_inning_strata(vs_away, vs_home)
+
+    batch = simulate_games_batch(
+        n,
+        lineups,
+        pitchers,
+        bullpens,
+        env,
+        seed=seed,
+        max_innings=max_innings,
+        antithetic=antithetic,
+        run_expectancy=run_expectancy,
+    )
+
+    controls = weights = None
+    clipped = 0
+    if strata is not None or run_expectancy:
+        controls, means = control_variates(batch, strata)
+        weights = regression_weights(controls, means)
+        clipped = int(np.count_nonzero(weights < 0))
+        if clipped:
+            # The regression estimate needs those weights; price the run without it instead
+            logger.warning(
+                "⚠️ %d of %d regression weights are negative; pricing without %s",
+                clipped, n, "/".join(m for m in methods if m != "antithetic"),
+            )
+            methods = tuple(m for m in methods if m == "antithetic")
+            controls = weights = None
+    report = variance_report(
+        batch["home_score"],
+        batch["away_score"],
+        methods,
+        controls=controls,
+        weights=weights,
+        pairs=n // 2 if antithetic else None,
+    )
+    if DEBUG_MODE:
+        logger.debug(
+            "📉 Variance reduction (%s): min ESS %d from %d sims, median x%.2f",
+            "+".join(methods), report["min_effective_sample_size"], n, report["median_variance_reduction"],
+        )
+    report["clipped_weights"] = clipped
+    batch["weights"] = weights
+    batch["variance_reduction"] = report
+    return batch
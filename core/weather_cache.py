@@ -0,0 +1,217 @@
+# weather_cache.py
+"""TTL disk cache and concurrent prefetch for NOAA park weather.
+
+Each park's forecast is stored in ``data/weather_cache/<Park>.json`` with
+the time it was fetched.  An entry is fresh while its age is below a TTL
+that shrinks as first pitch approaches (``TTL_SCHEDULE``; override with
+``MLB_WEATHER_TTL``, e.g. ``"3=30,12=120,48=360,*=720"`` in hours=minutes).
+Entries written before timestamps were stored fall back to the file mtime.
+
+``WeatherCache.prefetch`` refreshes every stale non-dome park on a slate at
+once over a thread pool sharing one ``requests.Session``, so games read
+their weather from disk instead of making two blocking requests each.  A
+failed fetch keeps serving the last cached forecast, however old.
+"""
+
+from core.config import DEBUG_MODE, VERBOSE_MODE
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from assets.env_builder import DOME_PARKS, DOME_WEATHER, NEUTRAL_WEATHER, fetch_noaa_weather, get_park_name
+from core.utils import game_id_to_dt
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+WEATHER_CACHE_DIR = os.path.join("data", "weather_cache")
+DEFAULT_MAX_WORKERS = 8
+TTL_ENV = "MLB_WEATHER_TTL"
+
+# (hours to first pitch up to, TTL in seconds); ``None`` covers anything later
+TTL_SCHEDULE = (
+    (3, 30 * 60),
+    (12, 2 * 3600),
+    (48, 6 * 3600),
+    (None, 12 * 3600),
+)
+# Used when a game's start time is unknown
+UNKNOWN_START_TTL = 2 * 3600
+
+
+def parse_ttl_schedule(text):
+    """Parse ``"3=30,12=120,*=720"`` (hours=minutes, ``*`` for the rest) into a schedule."""
+    schedule = []
+    for item in text.split(","):
+        hours, _, minutes = item.strip().partition("=")
+        if not minutes:
+            raise ValueError(f"Bad weather TTL entry {item!r}; expected HOURS=MINUTES")
+        schedule.append((None if hours.strip() == "*" else float(hours), float(minutes) * 60))
+    schedule.sort(key=lambda step: float("inf") if step[0] is None else step[0])
+    if schedule[-1][0] is not None:
+        schedule.append((None, schedule[-1][1]))
+    return tuple(schedule)
+
+
+def ttl_schedule_from_env():
+    text = os.environ.get(TTL_ENV)
+    if not text:
+        return TTL_SCHEDULE
+    try:
+        return parse_ttl_schedule(text)
+    except ValueError as e:
+        logger.warning("⚠️ Ignoring %s: %s", TTL_ENV, e)
+        return TTL_SCHEDULE
+
+
+def weather_ttl(hours_to_first_pitch, schedule=TTL_SCHEDULE):
+    """Seconds a forecast stays fresh for a game ``hours_to_first_pitch`` away."""
+    if hours_to_first_pitch is None:
+        return UNKNOWN_START_TTL
+    for max_hours, ttl in schedule:
+        if max_hours is None or hours_to_first_pitch <= max_hours:
+            return ttl
+    return schedule[-1][1]
+
+
+def hours_until(first_pitch, now=None):
+    """Hours from ``now`` to ``first_pitch`` (an aware datetime or ISO string), or ``None``."""
+    if first_pitch is None:
+        return None
+    if isinstance(first_pitch, str):
+        try:
+            first_pitch = datetime.fromisoformat(first_pitch.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if first_pitch.tzinfo is None:
+        return None
+    now = now if now is not None else time.time()
+    return (first_pitch.timestamp() - now) / 3600
+
+
+class WeatherCache:
+    """Per-park NOAA forecasts on disk with start-time-dependent TTLs."""
+
+    def __init__(self, cache_dir=WEATHER_CACHE_DIR, ttl_schedule=None, session=None, max_workers=DEFAULT_MAX_WORKERS, fetch=fetch_noaa_weather):
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.cache_dir = cache_dir
+        self.ttl_schedule = ttl_schedule or ttl_schedule_from_env()
+        self.session = session
+        self.max_workers = max(1, int(max_workers))
+        self.fetch = fetch
+
+    def path(self, park_name):
+        return os.path.join(self.cache_dir, f"{park_name.replace(' ', '_')}.json")
+
+    def read(self, park_name):
+        """Return ``{"fetched_at", "weather"}`` for ``park_name`` or ``None``."""
+        path = self.path(park_name)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict):
+            return None
+        if "weather" not in entry:
+            # Bare profile from before fetch times were stored
+            return {"fetched_at": os.path.getmtime(path), "weather": entry}
+        return entry
+
+    def write(self, park_name, weather, fetched_at=None):
+        entry = {
+            "park": park_name,
+            "fetched_at": fetched_at if fetched_at is not None else time.time(),
+            "weather": weather,
+        }
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path(park_name)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f, indent=2)
+        os.replace(tmp_path, path)
+        return entry
+
+    def is_fresh(self, entry, first_pitch=None, now=None):
+        if not entry:
+            return False
+        now = now if now is not None else time.time()
+        ttl = weather_ttl(hours_until(first_pitch, now), self.ttl_schedule)
+        return now - entry.get("fetched_at", 0) < ttl
+
+    def refresh(self, park_name, entry=None):
+        """Fetch ``park_name`` now; on failure return the stale ``entry`` weather (or neutral)."""
+        try:
+            weather = self.fetch(park_name, session=self.session)
+        except Exception as e:
+            if entry:
+                age_hours = (time.time() - entry.get("fetched_at", 0)) / 3600
+                logger.warning("⚠️ NOAA fetch failed for %s (%s); using %.1fh-old forecast", park_name, e, age_hours)
+                return entry["weather"]
+            logger.warning("⚠️ NOAA fetch failed for %s (%s); using neutral weather", park_name, e)
+            return dict(NEUTRAL_WEATHER)
+        self.write(park_name, weather)
+        return weather
+
+    def get(self, park_name, first_pitch=None, now=None):
+        """Return the weather for ``park_name``, fetching only when the cached entry is stale."""
+        if park_name in DOME_PARKS:
+            return dict(DOME_WEATHER)
+        entry = self.read(park_name)
+        if self.is_fresh(entry, first_pitch, now):
+            return entry["weather"]
+        return self.refresh(park_name, entry)
+
+    def prefetch(self, first_pitches, now=None):
+        """Refresh every stale non-dome park in ``{park_name: first_pitch}`` concurrently.
+
+        Returns ``{park_name: weather}`` for every park passed in.
+        """
+        results, stale = {}, {}
+        for park_name, first_pitch in first_pitches.items():
+            if park_name in DOME_PARKS:
+                results[park_name] = dict(DOME_WEATHER)
+                continue
+            entry = self.read(park_name)
+            if self.is_fresh(entry, first_pitch, now):
+                results[park_name] = entry["weather"]
+            else:
+                stale[park_name] = entry
+
+        if stale:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(stale))) as pool:
+                futures = {park: pool.submit(self.refresh, park, entry) for park, entry in stale.items()}
+                for park, future in futures.items():
+                    results[park] = future.result()
+        if DEBUG_MODE:
+            logger.debug("🌦️ Weather prefetch: %d parks, %d refreshed", len(first_pitches), len(stale))
+        return results
+
+
+@lru_cache(maxsize=1)
+def default_weather_cache():
+    """Process-wide ``WeatherCache`` for callers that do not bring their own."""
+    return WeatherCache()
+
+
+def slate_first_pitches(game_ids):
+    """Return ``{park_name: earliest first pitch}`` for the games in ``game_ids``."""
+    first_pitches = {}
+    for game_id in game_ids:
+        park_name = get_park_name(game_id)
+        start = game_id_to_dt(game_id)
+        if park_name not in first_pitches:
+            first_pitches[park_name] = start
+        elif start is not None and (first_pitches[park_name] is None or start < first_pitches[park_name]):
+            first_pitches[park_name] = start
+    return first_pitches
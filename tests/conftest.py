@@ -0,0 +1,12 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _scratch_cwd(monkeypatch, tmp_path):
+    """Run every test from a scratch directory.
+
+    Trackers and queues (``logs/pending_bets.json``, ``logs/micro_topups_pending.json``,
+    ``data/trackers/market_eval_tracker.json``, ...) default to paths relative to the
+    working directory, so a test that reaches them writes here instead of the repo.
+    """
+    monkeypatch.chdir(tmp_path)
@@ -0,0 +1,103 @@
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.adaptive_simulation import (
+    market_probabilities,
+    market_standard_errors,
+    convergence_report,
+    concat_batches,
+    simulate_games_adaptive,
+)
+from core.game_simulator import build_sample_lineup, build_sample_pitcher
+
+
+ENV = {"umpire": {}}
+
+
+def _assets():
+    lineups = {"home": build_sample_lineup(), "away": build_sample_lineup()}
+    pitchers = {"home": build_sample_pitcher(), "away": build_sample_pitcher()}
+    bullpens = {"home": [build_sample_pitcher()], "away": [build_sample_pitcher()]}
+    return lineups, pitchers, bullpens
+
+
+def test_market_standard_errors():
+    home = np.array([5, 2, 7, 4])
+    away = np.array([3, 6, 1, 5])
+    probs = market_probabilities(home, away)
+    assert probs["h2h_home"] == 0.5
+    assert probs["over_8.5"] == 0.25
+    assert probs["home_margin_over_-0.5"] == 0.5
+    assert probs["away_over_3.5"] == 0.5
+    errors = market_standard_errors(home, away)
+    assert errors["h2h_home"] == np.sqrt(0.25 / 4)
+    assert errors["over_12.5"] == 0.0
+
+
+def test_indicators_take_scaled_totals_and_diffs():
+    # Totals/margins/team scores round to whole runs like DiscretePMF; h2h compares unrounded scores
+    home = np.array([4.4, 2.6])
+    away = np.array([4.6, 3.4])
+    probs = market_probabilities(home, away, totals=[9.4, 5.6], diffs=[-0.4, -0.6])
+    assert probs["h2h_home"] == 0.0
+    assert probs["over_8.5"] == 0.5
+    assert probs["home_margin_over_-0.5"] == 0.5
+    assert probs["home_over_3.5"] == 0.5
+    assert probs["away_over_3.5"] == 0.5
+
+
+def test_fixed_run_report_has_no_verdict():
+    report = convergence_report([5, 2, 7], [3, 6, 1])
+    assert report["n_simulations"] == 3
+    assert report["converged"] is None
+    assert report["max_standard_error"] == max(report["standard_errors"].values())
+
+
+def test_concat_pads_inning_runs():
+    short = {
+        "inning_runs": np.ones((2, 9, 2), dtype=np.int8),
+        "home_score": np.zeros(2), "away_score": np.zeros(2), "innings_played": np.full(2, 9),
+        "home_reliever_usage": np.zeros((2, 1)), "away_reliever_usage": np.zeros((2, 1)),
+    }
+    long = dict(short, inning_runs=np.ones((3, 11, 2), dtype=np.int8), home_score=np.zeros(3))
+    joined = concat_batches([short, long])
+    assert joined["inning_runs"].shape == (5, 11, 2)
+    assert joined["inning_runs"][:2, 9:].sum() == 0
+    assert len(joined["home_score"]) == 5
+
+
+def test_adaptive_stops_at_tolerance():
+    lineups, pitchers, bullpens = _assets()
+    result = simulate_games_adaptive(lineups, pitchers, bullpens, ENV, seed=3, tolerance=0.01, chunk_size=500, min_simulations=500)
+    report = result["convergence"]
+    assert report["converged"] is True
+    assert report["max_standard_error"] <= 0.01
+    assert report["n_simulations"] == len(result["home_score"]) < 5000
+    assert report["n_simulations"] % 500 == 0
+
+
+def test_adaptive_reports_cap_and_is_reproducible():
+    lineups, pitchers, bullpens = _assets()
+    runs = [
+        simulate_games_adaptive(lineups, pitchers, bullpens, ENV, seed=9, tolerance=0.001, chunk_size=300, max_simulations=600)
+        for _ in range(2)
+    ]
+    assert runs[0]["convergence"]["converged"] is False
+    assert runs[0]["convergence"]["n_simulations"] == 600
+    assert np.array_equal(runs[0]["inning_runs"], runs[1]["inning_runs"])
+
+
+def test_adaptive_stops_on_scaled_samples():
+    lineups, pitchers, bullpens = _assets()
+
+    def scale(home, away):
+        return home * 1.2, away * 0.8, home * 1.2 + away * 0.8, (home - away) * 1.5
+
+    result = simulate_games_adaptive(lineups, pitchers, bullpens, ENV, seed=3, tolerance=0.01, chunk_size=500, min_simulations=500, scale=scale)
+    home, away, totals, diffs = scale(result["home_score"], result["away_score"])
+    expected = convergence_report(home, away, 0.01, totals, diffs)
+    assert result["convergence"] == expected
+    assert result["convergence"]["converged"] is True
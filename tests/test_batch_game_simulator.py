@@ -0,0 +1,103 @@
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.batch_game_simulator import simulate_games_batch, batch_to_game_results
+from core.game_simulator import simulate_game, simulate_games_summary, build_sample_lineup, build_sample_pitcher
+from assets.bullpen_utils import reset_reliever_usage
+from core.half_inning_simulator import enumerate_transitions, _handle_walk
+
+
+ENV = {"umpire": {"K": 1.0, "BB": 1.0}}
+
+
+def _assets():
+    lineups = {"home": build_sample_lineup(), "away": build_sample_lineup()}
+    pitchers = {"home": build_sample_pitcher(), "away": build_sample_pitcher()}
+    bullpens = {
+        "home": [dict(build_sample_pitcher(), name=f"Home RP {i}") for i in range(3)],
+        "away": [dict(build_sample_pitcher(), name=f"Away RP {i}") for i in range(3)],
+    }
+    return lineups, pitchers, bullpens
+
+
+def test_transition_probabilities_sum_to_one():
+    for outcome in ["K", "OUT", "BB", "1B", "2B", "3B", "HR"]:
+        for outs in range(3):
+            for mask in range(8):
+                branches = enumerate_transitions(outcome, mask, outs)
+                assert abs(sum(p for p, *_ in branches) - 1.0) < 1e-12
+
+
+def test_walk_transition_matches_handler():
+    # Runners on 2nd and 3rd: the handler's collision drops the runner from 2nd
+    state, runs, outs_added = _handle_walk([None, "R", "R"], "B")
+    branches = enumerate_transitions("BB", 0b110, 0)
+    assert branches == [(1.0, 0b101, runs, outs_added)]
+    assert state == ["B", None, "R"]
+
+
+def test_batch_scores_match_inning_runs():
+    lineups, pitchers, bullpens = _assets()
+    batch = simulate_games_batch(500, lineups, pitchers, bullpens, ENV, seed=7)
+    inning_runs = batch["inning_runs"].astype(int)
+    assert inning_runs.shape[0] == 500 and inning_runs.shape[2] == 2
+    assert np.array_equal(inning_runs[:, :, 0].sum(axis=1), batch["away_score"])
+    assert np.array_equal(inning_runs[:, :, 1].sum(axis=1), batch["home_score"])
+    assert (batch["innings_played"] >= 9).all()
+    assert (batch["home_score"] != batch["away_score"]).all()
+
+
+def test_batch_is_reproducible_with_seed():
+    lineups, pitchers, bullpens = _assets()
+    first = simulate_games_batch(200, lineups, pitchers, bullpens, ENV, seed=11)
+    second = simulate_games_batch(200, lineups, pitchers, bullpens, ENV, seed=11)
+    assert np.array_equal(first["inning_runs"], second["inning_runs"])
+
+
+def test_batch_matches_scalar_engine():
+    lineups, pitchers, bullpens = _assets()
+    scalar = [
+        simulate_game(lineups["home"], lineups["away"], pitchers["home"], pitchers["away"], ENV, bullpens["home"], bullpens["away"])
+        for _ in range(400)
+    ]
+    scalar_totals = np.array([r["home_score"] + r["away_score"] for r in scalar])
+    batch = simulate_games_batch(20000, lineups, pitchers, bullpens, ENV, seed=3)
+    batch_totals = batch["home_score"] + batch["away_score"]
+
+    se = scalar_totals.std() / np.sqrt(len(scalar_totals))
+    assert abs(scalar_totals.mean() - batch_totals.mean()) < 4 * se
+    assert abs(scalar_totals.std() - batch_totals.std()) < 0.6
+
+
+def test_batch_to_game_results_shape():
+    lineups, pitchers, bullpens = _assets()
+    batch = simulate_games_batch(50, lineups, pitchers, bullpens, ENV, seed=5)
+    results = batch_to_game_results(batch, bullpens["home"], bullpens["away"])
+    assert len(results) == 50
+    for res, played in zip(results, batch["innings_played"]):
+        assert len(res["innings"]) == played
+        assert sum(inn["home_runs"] for inn in res["innings"]) == res["home_score"]
+        assert all(name.startswith("Home RP") for name in res["used_home_relievers"])
+
+
+def test_summary_mode_matches_full_games():
+    lineups, pitchers, bullpens = _assets()
+    reset_reliever_usage()
+    rng = np.random.default_rng(21)
+    full = [
+        simulate_game(lineups["home"], lineups["away"], pitchers["home"], pitchers["away"], ENV, bullpens["home"], bullpens["away"], rng=rng)
+        for _ in range(30)
+    ]
+    reset_reliever_usage()
+    summary = simulate_games_summary(30, lineups, pitchers, bullpens, ENV, rng=np.random.default_rng(21))
+
+    assert summary["inning_runs"].dtype == np.int8
+    for i, res in enumerate(full):
+        played = len(res["innings"])
+        assert summary["innings_played"][i] == played
+        assert summary["home_score"][i] == res["home_score"]
+        assert summary["inning_runs"][i, :played, 0].tolist() == [inn["away_runs"] for inn in res["innings"]]
+        assert summary["home_reliever_usage"][i].sum() == len(res["used_home_relievers"])
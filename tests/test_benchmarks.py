@@ -0,0 +1,49 @@
+import os
+import sys
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.benchmarks import bench_pa, compare_to_baseline, load_baseline, save_baseline, sim_markets_from_odds
+
+
+def test_compare_to_baseline_flags_regressions():
+    baseline = {"metrics": {
+        "pa": {"value": 1000.0, "higher_is_better": True},
+        "distribution": {"value": 2.0, "higher_is_better": False},
+    }}
+    results = {
+        "pa": {"value": 700.0, "unit": "PA/s", "higher_is_better": True},
+        "distribution": {"value": 1.0, "unit": "s", "higher_is_better": False},
+        "game": {"value": 50.0, "unit": "games/s", "higher_is_better": True},
+    }
+    rows = {row["metric"]: row for row in compare_to_baseline(results, baseline, threshold=0.2)}
+    assert rows["pa"]["change"] == pytest.approx(-0.3) and rows["pa"]["regressed"]
+    assert rows["distribution"]["change"] == pytest.approx(1.0) and not rows["distribution"]["regressed"]
+    assert rows["game"]["change"] is None and not rows["game"]["regressed"]
+    assert not compare_to_baseline(results, baseline, threshold=0.35)[0]["regressed"]
+
+
+def test_save_baseline_merges_metrics(tmp_path):
+    path = str(tmp_path / "baseline.json")
+    assert load_baseline(path) is None
+    save_baseline({"pa": {"value": 1.0}}, path)
+    save_baseline({"game": {"value": 2.0}}, path)
+    baseline = load_baseline(path)
+    assert set(baseline["metrics"]) == {"pa", "game"}
+    assert baseline["machine"]["cpu_count"] == os.cpu_count()
+
+
+def test_fixtures_and_small_benchmark():
+    odds = {"2025-06-17-ARI@TOR-T1907": {
+        "start_time": "2025-06-17T23:07:00Z",
+        "h2h": {"ARI": {"price": 120}, "TOR": {"price": -140}},
+        "totals": {"Over 8.5": {"price": -110}, "Under 8.5": {"price": "n/a"}},
+    }}
+    sims, labels = sim_markets_from_odds(odds)
+    assert [m["side"] for m in sims["2025-06-17-ARI@TOR-T1907"]["markets"]] == ["ARI", "TOR", "Over 8.5"]
+    assert len(labels) == 3
+    assert sim_markets_from_odds(odds)[0] == sims
+
+    result = bench_pa(repeat=1, n=500)
+    assert result["n"] == 500 and result["value"] > 0 and result["higher_is_better"]
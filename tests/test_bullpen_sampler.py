@@ -0,0 +1,56 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from assets.bullpen_utils import BullpenSampler, simulate_reliever_chain
+from core.simulation_context import SimulationContext
+
+BULLPEN = [
+    {"name": "Closer", "IP": 60},
+    {"name": "Setup", "IP": 30},
+    {"name": "Long Man", "IP": 10},
+]
+
+
+def test_draws_follow_ip_weights():
+    sampler = BullpenSampler(BULLPEN)
+    rng = np.random.default_rng(5)
+    picks = np.bincount([sampler.draw(rng, max_uses=10**9) for _ in range(20000)], minlength=3)
+    assert np.allclose(picks / picks.sum(), [0.6, 0.3, 0.1], atol=0.015)
+
+    many = np.bincount(sampler.draw_many(rng.random(50000)), minlength=3)
+    assert np.allclose(many / many.sum(), [0.6, 0.3, 0.1], atol=0.01)
+
+
+def test_bitmask_excludes_used_relievers():
+    sampler = BullpenSampler(BULLPEN)
+    rng = np.random.default_rng(1)
+    assert {sampler.draw(rng, used=0b011) for _ in range(50)} == {2}
+    # Every reliever used: fall back to the whole bullpen
+    assert sampler.draw(rng, used=0b111) in (0, 1, 2)
+
+    used = np.array([0b001, 0b110, 0b111, 0])
+    picks = np.array([sampler.draw_many(rng.random(4), used) for _ in range(200)])
+    assert not (picks[:, 0] == 0).any()
+    assert (picks[:, 1] == 0).all()
+    assert set(picks[:, 2]) <= {0, 1, 2}
+
+
+def test_chain_respects_max_uses_and_context():
+    ctx = SimulationContext(np.random.default_rng(3))
+    sampler = BullpenSampler(BULLPEN)
+    picks = [simulate_reliever_chain(sampler, side="away", rng=ctx.rng, sim_context=ctx)[0]["name"] for _ in range(9)]
+    assert sorted(picks) == sorted(["Closer", "Setup", "Long Man"] * 3)
+    assert ctx.reliever_counts("away") == {"Closer": 3, "Setup": 3, "Long Man": 3}
+
+    chain = simulate_reliever_chain(BULLPEN, num_needed=3, rng=np.random.default_rng(0), sim_context=SimulationContext())
+    assert sorted(rp["name"] for rp in chain) == ["Closer", "Long Man", "Setup"]
+
+
+def test_zero_ip_bullpen_is_uniform():
+    sampler = BullpenSampler([{"name": "A", "IP": 0}, {"name": "B", "IP": 0}])
+    assert np.allclose(sampler.cum, [0.5, 1.0])
+    assert BullpenSampler([]).cum is None
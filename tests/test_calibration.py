@@ -0,0 +1,93 @@
+import json
+import os
+import sys
+import numpy as np
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.calibration import DEFAULT_TARGETS, SEGMENTS, fit_logit, fit_scaling, representative_matchups, run_calibration, save_calibration
+from core.pricing_engine import MLBPricingEngine
+from core.scaling_utils import scale_distribution
+
+
+def _synthetic_results(n_matchups=40, n_sims=4000, seed=0):
+    rng = np.random.default_rng(seed)
+    results = []
+    for _ in range(n_matchups):
+        home_lam, away_lam = rng.uniform(3.5, 5.5, size=2)
+        innings = np.stack([rng.poisson(away_lam / 9, size=(n_sims, 9)), rng.poisson(home_lam / 9, size=(n_sims, 9))], axis=2)
+        cum = np.cumsum(innings, axis=1)
+        results.append({
+            "home_score": cum[:, -1, 1],
+            "away_score": cum[:, -1, 0],
+            "segments": cum[:, [cap - 1 for cap in SEGMENTS.values()], :],
+            "pa_counts": np.zeros(7, dtype=int),
+        })
+    return results
+
+
+def test_fit_scaling_hits_pooled_targets():
+    results = _synthetic_results()
+    calibration, _ = fit_scaling(results, DEFAULT_TARGETS)
+    engine = MLBPricingEngine(calibration=calibration)
+
+    totals, diffs, home = [], [], []
+    for r in results:
+        totals.append(engine.apply_total_scaling(r["home_score"] + r["away_score"]))
+        diffs.append(engine.apply_runline_scaling(r["home_score"] - r["away_score"]))
+        home.append(engine.apply_team_total_scaling(r["home_score"], is_home=True))
+    totals, diffs, home = np.concatenate(totals), np.concatenate(diffs), np.concatenate(home)
+    assert totals.mean() == pytest.approx(DEFAULT_TARGETS["run_mean"], rel=1e-3)
+    assert totals.std() == pytest.approx(DEFAULT_TARGETS["run_sd"], rel=1e-3)
+    assert diffs.std() == pytest.approx(DEFAULT_TARGETS["run_diff_sd"], rel=1e-3)
+    assert home.mean() == pytest.approx(DEFAULT_TARGETS["home_mean"], rel=1e-3)
+    assert home.std() == pytest.approx(DEFAULT_TARGETS["home_sd"], rel=1e-3)
+
+    f5 = calibration["segment_scaling"]["f5"]
+    seg_diffs = np.concatenate([
+        scale_distribution(r["segments"][:, 2, 1] - r["segments"][:, 2, 0], target_sd=f5["diff_sd"]) for r in results
+    ])
+    assert seg_diffs.std() == pytest.approx(DEFAULT_TARGETS["segments"]["f5"]["diff_sd"], abs=0.01)
+
+
+def test_fit_logit_recovers_parameters():
+    rng = np.random.default_rng(1)
+    sim = rng.uniform(0.3, 0.7, size=200)
+    x = np.log(sim / (1 - sim))
+    market = 1 / (1 + np.exp(-(-0.1 + 0.8 * x + rng.normal(0, 0.01, size=200))))
+    fit = fit_logit(sim, market)
+    assert fit["a"] == pytest.approx(-0.1, abs=0.01)
+    assert fit["b"] == pytest.approx(0.8, abs=0.02)
+    assert fit_logit(sim[:3], market[:3]) is None
+
+
+def test_run_calibration_caches_and_saves(tmp_path):
+    kwargs = dict(
+        matchups=representative_matchups(3, seed=2),
+        n_sims=200,
+        seed=2,
+        workers=1,
+        cache_dir=str(tmp_path / "cache"),
+        outcomes_path=str(tmp_path / "missing.csv"),
+        market_evals_path=str(tmp_path / "missing.csv"),
+        previous={"logit_win_pct_calibration": {"a": 0.1, "b": 0.9}},
+    )
+    first = run_calibration(**kwargs)
+    second = run_calibration(**kwargs)
+    assert first["metadata"]["cache_hits"] == 0
+    assert second["metadata"]["cache_hits"] == 3
+    assert second["run_scaling_factor"] == first["run_scaling_factor"]
+    assert second["segment_scaling"] == first["segment_scaling"]
+    assert second["logit_win_pct_calibration"] == {"a": 0.1, "b": 0.9}
+
+    active = tmp_path / "calibration_offset.json"
+    path = save_calibration(second, out_dir=str(tmp_path / "versions"), active_path=str(active))
+    with open(path) as f:
+        saved = json.load(f)
+    with open(active) as f:
+        promoted = json.load(f)
+    assert saved["metadata"]["cache_hits"] == 3
+    assert promoted["version"] == saved["version"]
+    assert "metadata" not in promoted
+    assert MLBPricingEngine(calibration=promoted).run_scaling_factor == second["run_scaling_factor"]
@@ -0,0 +1,68 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.consensus_pricer import (
+    build_label_index,
+    calculate_consensus_prob,
+    calculate_game_consensus,
+)
+
+GAME_ID = "2025-06-09-MIL@CIN-T1305"
+
+
+def _game():
+    return {
+        "h2h": {
+            "MIL": {"per_book": {"fanduel": 120, "draftkings": 115}},
+            "CIN": {"per_book": {"fanduel": -140, "draftkings": -135}},
+        },
+        "spreads": {
+            "Milwaukee Brewers +1.5": {"per_book": {"fanduel": -160, "betmgm": -155}},
+            "Cincinnati Reds -1.5": {"per_book": {"fanduel": 135, "betmgm": 130}},
+            "Milwaukee Brewers 0.0": {"per_book": {"fanduel": 118}},
+        },
+        "alternate_spreads": {
+            "Milwaukee Brewers -2.5": {"per_book": {"fanduel": 260}},
+            "Cincinnati Reds +2.5": {"per_book": {"fanduel": -340}},
+            "Cincinnati Reds +1.5": {"per_book": {"draftkings": -200}},
+        },
+        "totals": {
+            "Over 8.5": {"per_book": {"fanduel": -110, "draftkings": -105}},
+            "Under 8.5": {"per_book": {"fanduel": -110, "draftkings": -115}},
+            "Over 9.5": {"per_book": {"fanduel": 130}},
+        },
+        "team_totals": {
+            "Milwaukee Brewers Over 3.5": {"per_book": {"fanduel": -120}},
+            "Milwaukee Brewers Under 3.5": {"per_book": {"fanduel": -110}},
+        },
+        "start_time": "2025-06-09T13:05:00-04:00",
+    }
+
+
+def test_game_consensus_matches_per_label_calls():
+    game = _game()
+    results = calculate_game_consensus(GAME_ID, game)
+    assert "start_time" not in results
+    for mkt_key, labels in results.items():
+        assert list(labels) == list(game[mkt_key])
+        for label, result in labels.items():
+            assert result == calculate_consensus_prob(
+                game_id=GAME_ID,
+                market_odds={GAME_ID: game},
+                market_key=mkt_key,
+                label=label,
+            )
+
+    assert results["h2h"]["MIL"][1] == "devig"
+    assert results["totals"]["Over 8.5"][1] == "devig"
+    assert results["totals"]["Over 9.5"][1] == "sim_only"
+    assert results["spreads"]["Milwaukee Brewers 0.0"][0]["books_used"] == ["fanduel", "draftkings"]
+
+
+def test_label_index_keeps_first_matching_key():
+    game = {"totals": {"Over 8.5": {}, "over 8.5": {}}, "start_time": "x"}
+    index = build_label_index(game)
+    assert list(index) == ["totals"]
+    assert index["totals"]["Over 8.5"] == "Over 8.5"
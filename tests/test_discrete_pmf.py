@@ -0,0 +1,51 @@
+import os
+import sys
+import numpy as np
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.stats_tools import DiscretePMF, summarize_pmf, calculate_tail_probability
+
+
+def test_queries_match_dict_pmf():
+    values = np.random.default_rng(3).poisson(8.6, 5000)
+    legacy = summarize_pmf(values)
+    pmf = DiscretePMF.from_values(values)
+
+    lines = np.arange(-1.0, 25.0, 0.5)
+    overs = pmf.over(lines)
+    unders = pmf.under(lines)
+    for line, over, under in zip(lines, overs, unders):
+        assert over == pytest.approx(calculate_tail_probability(legacy, line, "over"), abs=1e-12)
+        assert under == pytest.approx(calculate_tail_probability(legacy, line, "under"), abs=1e-12)
+    assert pmf.exact(9) == pytest.approx(legacy[9.0])
+    assert pmf.exact(9.5) == 0.0
+    assert pmf.mean() == pytest.approx(values.mean())
+    assert pmf.to_dict() == pytest.approx(legacy)
+    assert calculate_tail_probability(pmf, 8.5, "over") == pmf.over(8.5)
+
+
+def test_push_adjusted_and_rounding():
+    pmf = DiscretePMF.from_values([6.6, 7.2, 7.4, 8.0, 9.1])
+    assert pmf.offset == 7
+    assert pmf.to_dict() == {7.0: 0.6, 8.0: 0.2, 9.0: 0.2}
+    over, under = pmf.push_adjusted([8, 8.5])
+    # Under is 1 - over, then both sides are divided by 1 - P(push) at integer lines
+    assert over.tolist() == pytest.approx([0.25, 0.2])
+    assert under.tolist() == pytest.approx([1.0, 0.8])
+
+
+def test_from_dict_and_empty():
+    pmf = DiscretePMF.from_dict({"3.0": 0.25, 5.0: 0.75})
+    assert pmf.over(4) == pytest.approx(0.75)
+    assert DiscretePMF.from_values([]).over([1.5, 2.5]).tolist() == [0.0, 0.0]
+
+
+def test_full_game_total_probs_integer_lines():
+    from cli.run_distribution_simulator import full_game_total_probs
+
+    pmf = DiscretePMF.from_values([6.6, 7.2, 7.4, 8.0, 9.1])
+    overs, unders = full_game_total_probs(pmf, [7.5, 8.0, 8.5])
+    assert overs == pytest.approx([0.4, 0.25, 0.2])
+    assert unders == pytest.approx([0.6, 1.0, 0.8])
@@ -0,0 +1,59 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import cli.full_slate_runner as fsr
+
+
+def fake_simulate_distribution(game_id, stats=None, **kwargs):
+    if game_id.endswith("BAD"):
+        raise RuntimeError("boom")
+    assert stats == ({"batter": 1}, {"pitcher": 2})
+
+
+def test_parse_args_workers(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["full_slate_runner.py", "2025-04-17", "--workers=4", "--safe", "--seed=7"])
+    args = fsr.parse_args()
+    assert args[0] == "2025-04-17"
+    assert args[-3] is True
+    assert args[-2] == 4
+    assert args[-1] == 7
+
+
+def test_spawn_game_seeds_independent_of_order():
+    ids = ["2025-04-17-LAD@SF", "2025-04-17-NYY@BOS"]
+    first = fsr.spawn_game_seeds(ids, 7)
+    second = fsr.spawn_game_seeds(ids, 7)
+    for gid in ids:
+        assert first[gid].generate_state(4).tolist() == second[gid].generate_state(4).tolist()
+    assert first[ids[0]].generate_state(4).tolist() != first[ids[1]].generate_state(4).tolist()
+    assert fsr.spawn_game_seeds(ids) == {gid: None for gid in ids}
+
+
+def test_run_parallel_isolates_failures(monkeypatch):
+    monkeypatch.setattr(fsr, "simulate_distribution", fake_simulate_distribution)
+    stats = ({"batter": 1}, {"pitcher": 2})
+    game_ids = ["2025-04-17-NYY@BOS", "2025-04-17-BAD", "2025-04-17-LAD@SF"]
+    failed = fsr.run_parallel(game_ids, "2025-04-17", 2, stats, 9.5, False, False, None, None, True)
+    assert failed == ["2025-04-17-BAD"]
+
+
+def test_run_parallel_exits_without_safe_mode(monkeypatch):
+    monkeypatch.setattr(fsr, "simulate_distribution", fake_simulate_distribution)
+    stats = ({"batter": 1}, {"pitcher": 2})
+    with pytest.raises(SystemExit):
+        fsr.run_parallel(["2025-04-17-BAD"], "2025-04-17", 2, stats, 9.5, False, False, None, None, False)
+
+
+def test_parse_args_se_tolerance(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["full_slate_runner.py", "--se-tol=0.0075"])
+    args = fsr.parse_args()
+    assert args[-4] == 0.0075
+
+
+def test_parse_args_no_cache(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["full_slate_runner.py", "--no-cache"])
+    assert fsr.parse_args()[-5] is False
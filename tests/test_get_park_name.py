@@ -0,0 +1,15 @@
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from assets.env_builder import get_park_name
+
+
+def test_get_park_name_with_time_suffix():
+    assert get_park_name("2025-06-09-MIL@CIN-T1305") == "Great American Ball Park"
+    assert get_park_name("2025-05-05-CHW@KC-T1305-DH1") == "Kauffman Stadium"
+
+
+def test_get_park_name_unknown_team():
+    assert get_park_name("2025-06-09-MIL@XYZ-T1305") == "League Average"
+    assert get_park_name("2025-06-09") == "League Average"
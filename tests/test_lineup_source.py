@@ -0,0 +1,84 @@
+import os
+import sys
+import json
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from assets.lineup_source import fetch_lineups, parse_lineups_html, read_cached_lineups
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def fixture(name):
+    with open(os.path.join(FIXTURES, name)) as f:
+        return f.read()
+
+
+def test_parse_saved_page():
+    lineups = parse_lineups_html(fixture("fantasydata_lineups.html"), verbose=False)
+    assert list(lineups) == ["MIL", "CIN", "NYY", "BOS"]
+    assert [len(lineups[team]) for team in lineups] == [9, 9, 9, 7]
+    assert lineups["MIL"][0]["handedness"] == "L" and lineups["MIL"][1]["handedness"] == "S"
+    assert lineups["BOS"][-1]["name"] == "sox hitter7"
+    assert all(set(b) == {"name", "handedness"} for team in lineups.values() for b in team)
+
+    # The unrendered JavaScript shell has no lineup blocks
+    assert parse_lineups_html(fixture("fantasydata_lineups_shell.html"), verbose=False) == {}
+
+
+def test_browser_only_when_http_has_no_lineups(tmp_path):
+    calls = []
+
+    def http_fetch(for_date, session=None):
+        calls.append("http")
+        return parse_lineups_html(fixture("fantasydata_lineups_shell.html"), verbose=False)
+
+    def browser_fetch(for_date):
+        calls.append("browser")
+        return parse_lineups_html(fixture("fantasydata_lineups.html"), verbose=False)
+
+    lineups = fetch_lineups("2025-06-09", cache_dir=str(tmp_path), http_fetch=http_fetch, browser_fetch=browser_fetch)
+    assert calls == ["http", "browser"] and len(lineups) == 4
+    assert read_cached_lineups("2025-06-09", str(tmp_path))["source"] == "browser"
+
+    calls.clear()
+    served = parse_lineups_html(fixture("fantasydata_lineups.html"), verbose=False)
+    lineups = fetch_lineups("2025-06-10", cache_dir=str(tmp_path), http_fetch=lambda d, session=None: calls.append("http") or served, browser_fetch=browser_fetch)
+    assert calls == ["http"] and lineups == served
+
+
+def test_cache_ttl_and_hash(tmp_path):
+    pages = [fixture("fantasydata_lineups.html")]
+    calls = []
+
+    def http_fetch(for_date, session=None):
+        calls.append(for_date)
+        return parse_lineups_html(pages[-1], verbose=False)
+
+    def browser_fetch(for_date):
+        raise AssertionError("browser should not start")
+
+    kwargs = dict(cache_dir=str(tmp_path), http_fetch=http_fetch, browser_fetch=browser_fetch)
+    first = fetch_lineups("2025-06-09", ttl=600, **kwargs)
+    assert fetch_lineups("2025-06-09", ttl=600, **kwargs) == first and len(calls) == 1
+    entry = read_cached_lineups("2025-06-09", str(tmp_path))
+
+    # Past the TTL an identical page refetches but keeps its hash and change time
+    path = tmp_path / "2025-06-09.json"
+    path.write_text(json.dumps(dict(entry, fetched_at=time.time() - 900, changed_at=123.0)))
+    assert fetch_lineups("2025-06-09", ttl=600, **kwargs) == first and len(calls) == 2
+    refetched = read_cached_lineups("2025-06-09", str(tmp_path))
+    assert refetched["hash"] == entry["hash"] and refetched["changed_at"] == 123.0
+
+    # A swapped batter changes the hash
+    pages.append(pages[0].replace("Reds Hitter4", "Reds Callup"))
+    assert fetch_lineups("2025-06-09", ttl=0, **kwargs) != first
+    assert read_cached_lineups("2025-06-09", str(tmp_path))["hash"] != entry["hash"]
+
+    # Both sources down: the stale cache is served
+    def down(for_date, session=None):
+        raise ConnectionError("FantasyData down")
+
+    lineups = fetch_lineups("2025-06-09", ttl=0, cache_dir=str(tmp_path), http_fetch=down, browser_fetch=down)
+    assert lineups["CIN"][3]["name"] == "reds callup"
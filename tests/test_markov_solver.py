@@ -0,0 +1,79 @@
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.markov_solver import (
+    _build_chain,
+    count_wraps,
+    half_inning_distribution,
+    solve_game,
+    analytic_market_probs,
+    compare_with_simulation,
+)
+from core.batch_game_simulator import build_matchup_tables, simulate_games_batch
+from core.game_simulator import build_sample_lineup, build_sample_pitcher
+
+
+ENV = {"umpire": {}}
+
+
+def _assets(n_relievers=1):
+    lineups = {"home": build_sample_lineup(), "away": build_sample_lineup()}
+    pitchers = {"home": build_sample_pitcher(), "away": build_sample_pitcher()}
+    bullpens = {
+        "home": [dict(build_sample_pitcher(), name=f"Home RP {i}") for i in range(n_relievers)],
+        "away": [dict(build_sample_pitcher(), name=f"Away RP {i}") for i in range(n_relievers)],
+    }
+    return lineups, pitchers, bullpens
+
+
+def test_chain_rows_sum_to_one():
+    move, absorb = _build_chain()
+    totals = move.sum(axis=(1, 3)) + absorb.sum(axis=2)
+    assert np.allclose(totals, 1.0)
+
+
+def test_count_wraps():
+    assert count_wraps(0, 9, 9) == 0
+    assert count_wraps(0, 10, 9) == 1
+    assert count_wraps(5, 4, 9) == 0
+    assert count_wraps(5, 5, 9) == 1
+    assert count_wraps(3, 0, 9) == 0
+
+
+def test_half_inning_distribution_is_normalized():
+    lineups, pitchers, bullpens = _assets()
+    table = build_matchup_tables(lineups["away"], pitchers["home"], bullpens["home"], ENV)
+    dist = half_inning_distribution(table)
+    assert abs(dist.sum() - 1.0) < 1e-9
+    assert dist[:3].sum() == 0.0  # at least three PAs per half
+
+
+def test_solution_is_normalized():
+    lineups, pitchers, bullpens = _assets()
+    solution = solve_game(lineups, pitchers, bullpens, ENV, max_innings=12)
+    total = solution["final"].sum() + solution["unresolved"] + solution["truncated"]
+    assert abs(total - 1.0) < 1e-9
+    assert solution["truncated"] < 1e-4
+    assert np.trace(solution["final"]) == 0.0
+    for joint in solution["segments"].values():
+        assert abs(joint.sum() - 1.0) < 1e-6
+
+
+def test_solution_matches_batch_engine():
+    lineups, pitchers, bullpens = _assets()
+    probs = analytic_market_probs(solve_game(lineups, pitchers, bullpens, ENV, max_innings=12))
+    batch = simulate_games_batch(40000, lineups, pitchers, bullpens, ENV, seed=21)
+    check = compare_with_simulation(probs, batch["home_score"], batch["away_score"])
+
+    for row in check.values():
+        p = row["analytic"]
+        se = np.sqrt(max(p * (1 - p), 1e-4) / 40000)
+        assert abs(row["diff"]) < 4 * se + 1e-4
+
+    f5_home = batch["inning_runs"][:, :5, 1].sum(axis=1)
+    f5_away = batch["inning_runs"][:, :5, 0].sum(axis=1)
+    p = probs["f5"]["tie"]
+    assert abs(np.mean(f5_home == f5_away) - p) < 4 * np.sqrt(p * (1 - p) / 40000)
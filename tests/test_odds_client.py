@@ -0,0 +1,136 @@
+import os
+import sys
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import core.odds_fetcher as of
+from core.odds_client import OddsApiClient
+
+
+EVENT_DELAY = 0.3
+TEAMS = [
+    ("Milwaukee Brewers", "Cincinnati Reds"),
+    ("New York Yankees", "Boston Red Sox"),
+    ("Los Angeles Dodgers", "San Francisco Giants"),
+    ("Houston Astros", "Texas Rangers"),
+    ("Chicago Cubs", "St. Louis Cardinals"),
+    ("Atlanta Braves", "Miami Marlins"),
+]
+
+
+def _event_odds(away, home):
+    return {
+        "bookmakers": [
+            {
+                "key": book,
+                "markets": [
+                    {
+                        "key": "h2h",
+                        "outcomes": [
+                            {"name": away, "price": 110 + i},
+                            {"name": home, "price": -130 - i},
+                        ],
+                    }
+                ],
+            }
+            for i, book in enumerate(["fanduel", "draftkings"])
+        ]
+    }
+
+
+class StubOddsApi(BaseHTTPRequestHandler):
+    remaining = 500
+    hits = {}
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        with StubOddsApi.lock:
+            StubOddsApi.remaining -= 1
+            self.send_header("x-requests-remaining", str(StubOddsApi.remaining))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        with StubOddsApi.lock:
+            StubOddsApi.hits[path] = StubOddsApi.hits.get(path, 0) + 1
+            hits = StubOddsApi.hits[path]
+        if path == "/events":
+            events = [
+                {"id": f"e{i}", "away_team": away, "home_team": home, "commence_time": f"2025-06-09T{17 + i}:05:00Z"}
+                for i, (away, home) in enumerate(TEAMS)
+            ]
+            return self._send(200, events)
+        if path == "/flaky" and hits == 1:
+            return self._send(503, {"message": "try again"})
+        if path == "/limited" and hits == 1:
+            return self._send(429, {"message": "slow down"}, {"Retry-After": "0"})
+        if path in ("/flaky", "/limited"):
+            return self._send(200, {"ok": True})
+        if path.startswith("/events/"):
+            index = int(path.split("/")[2][1:])
+            time.sleep(EVENT_DELAY)
+            return self._send(200, _event_odds(*TEAMS[index]))
+        return self._send(404, {"message": "unknown"})
+
+
+@pytest.fixture
+def stub_server():
+    StubOddsApi.remaining = 500
+    StubOddsApi.hits = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubOddsApi)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_retries_transient_statuses(stub_server):
+    client = OddsApiClient(backoff=0.01)
+    assert client.get(f"{stub_server}/flaky").status_code == 200
+    assert client.get(f"{stub_server}/limited").status_code == 200
+    assert StubOddsApi.hits["/flaky"] == 2
+    assert client.get(f"{stub_server}/missing").status_code == 404
+
+
+def test_quota_guard_stops_requests(stub_server):
+    StubOddsApi.remaining = 5
+    client = OddsApiClient(min_remaining=1)
+    client.get(f"{stub_server}/missing")
+    responses = client.get_many({i: (f"{stub_server}/missing", None) for i in range(5)})
+    assert client.requests_remaining == 1
+    assert sum(resp is None for resp in responses.values()) == 2
+    assert client.quota_exhausted()
+    assert client.get(f"{stub_server}/missing") is None
+
+
+def test_fetch_all_market_odds_is_concurrent(stub_server, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(of, "EVENTS_URL", f"{stub_server}/events")
+    monkeypatch.setattr(of, "EVENT_ODDS_URL", f"{stub_server}/events/{{event_id}}/odds")
+    client = OddsApiClient(max_workers=len(TEAMS))
+
+    start = time.perf_counter()
+    odds = of.fetch_all_market_odds(client=client)
+    elapsed = time.perf_counter() - start
+
+    assert len(odds) == len(TEAMS)
+    assert all(game["h2h"] for game in odds.values())
+    assert elapsed < EVENT_DELAY * len(TEAMS) / 2
+    assert client.requests_remaining == 500 - len(TEAMS) - 1
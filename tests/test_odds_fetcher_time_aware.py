@@ -6,6 +6,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import core.odds_fetcher as of
 import core.consensus_pricer as cp
+from core.odds_client import OddsApiClient
 
 class DummyResp:
     def __init__(self, data, status=200):
@@ -16,6 +17,14 @@ class DummyResp:
         return self._data
 
 
+class StubSession:
+    """Routes ``OddsApiClient`` requests to a plain ``fake_get`` function."""
+    def __init__(self, fake_get):
+        self.fake_get = fake_get
+    def get(self, url, params=None, timeout=None):
+        return self.fake_get(url, params=params)
+
+
 def _patch_common(monkeypatch):
     # avoid file writes
     monkeypatch.setattr(os, "makedirs", lambda *a, **k: None)
@@ -72,7 +81,7 @@ def test_fetch_market_odds_time_aware(monkeypatch):
     monkeypatch.setattr(of.requests, "get", fake_get)
 
     gid = "2025-06-09-MIL@CIN-T1305"
-    result = of.fetch_market_odds_from_api([gid])
+    result = of.fetch_market_odds_from_api([gid], client=OddsApiClient(session=StubSession(fake_get)))
     assert gid in result
     assert odds_calls == ["e1"]
 
@@ -0,0 +1,73 @@
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.pa_tables import build_pa_table, sample_pa_outcome, tto_bucket, fatigue_bucket, OUTCOMES
+from core.pa_simulator import simulate_pa
+from core.fatigue_modeling import apply_fatigue_modifiers
+from core.half_inning_simulator import simulate_half_inning
+from core.game_simulator import build_sample_lineup, build_sample_pitcher
+
+
+def test_table_rows_are_cumulative():
+    table = build_pa_table(build_sample_lineup(), [build_sample_pitcher()])
+    cum = table["cum_probs"]
+    assert cum.shape[-1] == len(OUTCOMES)
+    assert np.all(np.diff(cum, axis=-1) >= 0)
+    assert np.allclose(cum[..., -1], 1.0)
+
+
+def test_buckets():
+    assert tto_bucket(1) == 0
+    assert tto_bucket(6) == 3
+    assert fatigue_bucket(10) == 0
+    assert fatigue_bucket(80) == 5
+    assert fatigue_bucket(500) == fatigue_bucket(1000)
+
+
+def test_sample_extremes():
+    pitcher = build_sample_pitcher()
+    table = build_pa_table(build_sample_lineup(), [pitcher])
+    assert sample_pa_outcome(table, 0, 0, 1, 0, 0.0) == "K"
+    assert sample_pa_outcome(table, 0, 0, 1, 0, 0.999999) == "OUT"
+
+
+def test_table_matches_simulate_pa_with_noise():
+    batter = build_sample_lineup(1)[0]
+    pitcher = build_sample_pitcher()
+    state = {"pitch_count": 95, "tto_count": 3}
+    table = build_pa_table([batter], [pitcher])
+    row = table["cum_probs"][0, 0, tto_bucket(3), fatigue_bucket(95)]
+    expected = dict(zip(OUTCOMES, np.diff(np.concatenate([[0.0], row]))))
+
+    rng = np.random.default_rng(12)
+    adj = apply_fatigue_modifiers(pitcher, state)
+    n = 20000
+    counts = dict.fromkeys(OUTCOMES, 0)
+    for _ in range(n):
+        counts[simulate_pa(batter, adj, use_noise=True, rng=rng)] += 1
+
+    for outcome in OUTCOMES:
+        p = expected[outcome]
+        se = np.sqrt(p * (1 - p) / n)
+        assert abs(counts[outcome] / n - p) < 4 * se + 1e-3
+
+
+def test_half_inning_with_table_is_reproducible():
+    lineup = build_sample_lineup()
+    pitcher = build_sample_pitcher()
+    table = build_pa_table(lineup, [pitcher])
+    runs = []
+    for _ in range(2):
+        result = simulate_half_inning(
+            lineup,
+            pitcher,
+            context={"umpire": {}},
+            rng=np.random.default_rng(8),
+            pa_table=table,
+        )
+        runs.append([e["outcome"] for e in result["events"]])
+    assert runs[0] == runs[1]
+    assert result["outs"] >= 3
@@ -0,0 +1,60 @@
+import os
+import sys
+import numpy as np
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.batch_game_simulator import simulate_games_batch
+from core.param_sweep import apply_point, expand_grid, league_average_assets, run_sweep
+
+
+def test_expand_grid_and_apply_point():
+    points = expand_grid({"pitcher.k_rate": [0.2, 0.25], "env.umpire.k_mod": [1.0, 1.1, 1.2]})
+    assert len(points) == 6
+    assert points[1] == {"pitcher.k_rate": 0.2, "env.umpire.k_mod": 1.1}
+    with pytest.raises(ValueError):
+        expand_grid({"umpire.k_mod": [1.0]})
+
+    base = league_average_assets()
+    base["bullpens"]["home"] = [dict(base["pitchers"]["home"], name="RP")]
+    assets = apply_point(base, {"pitcher.location_plus": 130, "batter.iso": 0.2, "env.umpire.k_mod": 1.1})
+    assert assets["bullpens"]["home"][0]["location_plus"] == 130
+    assert all(b["iso"] == 0.2 for lineup in assets["lineups"].values() for b in lineup)
+    assert assets["env"]["umpire"] == {"k_mod": 1.1, "bb_mod": 1.0}
+    # hr_pa is re-projected from the swept inputs; the base assets are untouched
+    assert assets["pitchers"]["home"]["hr_pa"]["hr_pa_projected"] > base["pitchers"]["home"]["hr_pa"]["hr_pa_projected"]
+    assert base["pitchers"]["home"]["location_plus"] == 100
+
+
+def test_common_streams_track_pa():
+    assets = league_average_assets()
+    args = (400, assets["lineups"], assets["pitchers"], assets["bullpens"], assets["env"])
+    first = simulate_games_batch(*args, seed=9, common_streams=True, track_pa=True)
+    again = simulate_games_batch(*args, seed=9, common_streams=True, track_pa=True)
+    assert np.array_equal(first["home_score"], again["home_score"])
+    # Every half inning needs at least three PAs; the away side always bats 9+ innings
+    assert (first["pa_counts"][:, 0].sum(axis=1) >= 27).all()
+    assert "pa_counts" not in simulate_games_batch(*args, seed=9)
+
+
+def test_sweep_deltas_use_common_random_numbers():
+    rows = run_sweep(
+        {"pitcher.k_rate": [0.2, 0.225, 0.25], "batter.iso": [0.14]},
+        n_sims=1500,
+        seed=4,
+        workers=1,
+        reference=1,
+    )
+    by_metric = {}
+    for row in rows:
+        by_metric.setdefault(row["metric"], []).append(row)
+
+    k_rates = [row["value"] for row in by_metric["K_rate"]]
+    assert k_rates == sorted(k_rates)
+    runs = by_metric["runs_per_game"]
+    assert runs[1]["delta"] == 0 and runs[1]["delta_se"] == 0
+    for row in runs[::2]:
+        assert row["delta_se"] < row["independent_delta_se"] / 3
+        assert row["ci_low"] < row["value"] < row["ci_high"]
+    assert runs[0]["delta_ci_low"] > 0 > runs[2]["delta_ci_high"]
@@ -0,0 +1,77 @@
+import os
+import sys
+import tracemalloc
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core import perf
+
+
+@pytest.fixture
+def perf_on(monkeypatch):
+    monkeypatch.setenv(perf.PERF_ENV, "0")
+    monkeypatch.setenv(perf.CYCLE_ENV, "cycle-1")
+    yield perf.configure
+    perf.configure("0")
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def test_disabled_spans_are_noops(monkeypatch):
+    monkeypatch.setenv(perf.PERF_ENV, "0")
+    perf.configure()
+    with perf.span("stage"):
+        pass
+    perf.begin("other").end()
+    assert not perf.enabled() and perf.drain() == []
+    assert perf.parse_modes("all") == {"timing", "tracemalloc", "cprofile"}
+    assert perf.parse_modes("1,cprofile") == {"timing", "cprofile"}
+
+
+def test_spans_nest_and_summarize(perf_on, tmp_path):
+    perf_on("timing")
+
+    @perf.traced("simulate", game_arg="game_id")
+    def simulate(game_id, fail=False):
+        perf.begin("sim_loop", game_id)  # left open: closed with its parent
+        if fail:
+            raise RuntimeError("boom")
+
+    with perf.span("load_all_stats"):
+        pass
+    simulate("G1")
+    simulate(game_id="G2")
+    with pytest.raises(RuntimeError):
+        simulate("G3", fail=True)
+    perf.merge([{"stage": "simulate", "game_id": "G4", "game_root": True, "wall_s": 9.0, "cpu_s": 1.0}])
+
+    spans = perf.drain()
+    assert [s["stage"] for s in spans[:3]] == ["load_all_stats", "sim_loop", "simulate"]
+    assert spans[1]["parent"] == "simulate" and not spans[1]["game_root"] and spans[2]["game_root"]
+    assert spans[-2]["error"] == "RuntimeError"
+
+    stages, games = perf.summarize(spans)
+    assert stages["simulate"]["count"] == 4 and stages["sim_loop"]["count"] == 3
+    assert list(games)[0] == "G4"
+    assert set(games["G1"]["stages"]) == {"simulate", "sim_loop"}
+
+    perf.merge(spans)
+    path = perf.write_report(out_dir=str(tmp_path))
+    assert perf.write_report(out_dir=str(tmp_path)) is None
+    (report,) = perf.load_reports(str(tmp_path), cycle="cycle-1")
+    assert report["modes"] == ["timing"] and os.path.basename(path).endswith(f"_{report['pid']}.json")
+    assert report["stages"]["simulate"]["count"] == 4
+    assert perf.load_reports(str(tmp_path), cycle="other") == []
+
+
+def test_tracemalloc_and_cprofile(perf_on):
+    perf_on("tracemalloc,cprofile")
+    with perf.span("outer"):
+        with perf.span("inner"):
+            block = bytearray(8 * 2 ** 20)
+            del block
+    inner, outer = perf.drain()
+    assert inner["peak_traced_mb"] >= 8
+    assert outer["peak_traced_mb"] >= inner["peak_traced_mb"]
+    assert "profile" in outer and "profile" not in inner
@@ -0,0 +1,59 @@
+import os
+import sys
+import numpy as np
+from scipy.special import logit, expit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.pricing_engine import MLBPricingEngine
+
+CALIBRATION = {
+    "run_scaling_factor": 1.0094,
+    "stddev_scaling_factor": 1.0328,
+    "run_diff_scaling_factor": 0.7055,
+    "team_total_scaling": {"home_mean_factor": 1.0338, "home_std_factor": 1.0663},
+    "logit_win_pct_calibration": {"a": -0.0827, "b": 0.8327},
+}
+
+
+def _samples():
+    rng = np.random.default_rng(8)
+    return rng.poisson(8.7, 4000).tolist(), (rng.poisson(4.4, 4000) - rng.poisson(4.3, 4000)).tolist()
+
+
+def test_scaling_matches_per_sample_formula():
+    engine = MLBPricingEngine(CALIBRATION)
+    totals, diffs = _samples()
+    mean = np.mean(totals)
+    expected = [((t - mean) * 1.0328 + mean) * 1.0094 for t in totals]
+    assert engine.apply_total_scaling(totals).tolist() == expected
+    mean = np.mean(diffs)
+    assert engine.apply_runline_scaling(diffs).tolist() == [(d - mean) * 0.7055 + mean for d in diffs]
+    mean = np.mean(totals)
+    assert engine.apply_team_total_scaling(totals).tolist() == [((s - mean) * 1.0663 + mean) * 1.0338 for s in totals]
+
+
+def test_multi_line_pricing_matches_per_line():
+    engine = MLBPricingEngine(CALIBRATION)
+    totals, diffs = _samples()
+    lines = [6.5, 7, 7.5, 8, 8.5, 9, 9.5, 10.5]
+    summary = engine.summarize_alt_totals(totals, lines)
+    scaled = engine.apply_total_scaling(totals)
+    for line in lines:
+        over = np.mean([1 if x > line else 0 for x in scaled])
+        push = np.mean([1 if round(x) == line else 0 for x in scaled])
+        assert summary[line] == {"over": over, "under": 1 - over - push, "push": push}
+
+    runlines = engine.summarize_alt_runlines(diffs, [-1.5, 1.5])
+    scaled = engine.apply_runline_scaling(diffs)
+    assert runlines[1.5] == np.mean([1 if x > 1.5 else 0 for x in scaled])
+    assert engine.calc_prob(scaled, lambda x: x > -1.5) == runlines[-1.5]
+
+
+def test_moneyline_calibration_on_arrays():
+    engine = MLBPricingEngine(CALIBRATION)
+    pcts = [0.35, 0.5, 0.62]
+    odds = engine.price_moneyline(np.array(pcts))
+    assert odds.tolist() == [engine.price_moneyline(p) for p in pcts]
+    calibrated = float(expit(-0.0827 + 0.8327 * logit(0.62)))
+    assert engine.price_moneyline(0.62) == -100 * (calibrated / (1 - calibrated))
@@ -0,0 +1,49 @@
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.game_simulator import simulate_game, build_sample_lineup, build_sample_pitcher
+from core.bip_resolution import resolve_bip
+from assets.bullpen_utils import simulate_reliever_chain, reset_reliever_usage
+
+
+def _play(seed):
+    reset_reliever_usage()
+    lineup = build_sample_lineup()
+    pitcher = build_sample_pitcher()
+    bullpen = [dict(build_sample_pitcher(), name=f"RP {i}") for i in range(4)]
+    return simulate_game(
+        lineup,
+        lineup,
+        pitcher,
+        pitcher,
+        {"umpire": {"K": 1.0, "BB": 1.0}},
+        home_bullpen=bullpen,
+        away_bullpen=bullpen,
+        rng=np.random.default_rng(seed),
+    )
+
+
+def test_simulate_game_is_bit_identical_with_seed():
+    first = [_play(seed) for seed in range(5)]
+    second = [_play(seed) for seed in range(5)]
+    for a, b in zip(first, second):
+        assert a["innings"] == b["innings"]
+        assert a["used_home_relievers"] == b["used_home_relievers"]
+
+
+def test_resolve_bip_uses_given_rng():
+    draws_a = [resolve_bip("GB", rng=np.random.default_rng(9)) for _ in range(3)]
+    draws_b = [resolve_bip("GB", rng=np.random.default_rng(9)) for _ in range(3)]
+    assert draws_a == draws_b
+
+
+def test_reliever_chain_uses_given_rng():
+    bullpen = [{"name": f"RP {i}", "IP": 10 + i} for i in range(5)]
+    reset_reliever_usage()
+    picks_a = [simulate_reliever_chain(bullpen, rng=np.random.default_rng(4))[0]["name"] for _ in range(3)]
+    reset_reliever_usage()
+    picks_b = [simulate_reliever_chain(bullpen, rng=np.random.default_rng(4))[0]["name"] for _ in range(3)]
+    assert picks_a == picks_b
@@ -0,0 +1,43 @@
+import os
+import sys
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import cli.run_distribution_simulator as rds
+
+GAME_ID = "2025-06-09-MIL@CIN-T1905"
+
+
+def test_sim_options_parsed(monkeypatch):
+    monkeypatch.setattr(sys, "argv", [
+        "run_distribution_simulator.py", GAME_ID, "8.5", "--seed=7", "--se-tol=0.01",
+        "--legacy-engine", "--analytic", "--variance-reduction=antithetic,control", "--no-cache",
+    ])
+    args = rds.resolve_game_id_from_args()
+    assert args[0] == GAME_ID and args[3] == 8.5
+    assert args[7:] == (7, 0.01, "legacy", True, "antithetic,control", False)
+
+
+def test_sim_option_defaults(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["run_distribution_simulator.py", GAME_ID])
+    assert rds.resolve_game_id_from_args()[7:] == (None, None, "batch", False, None, True)
+
+
+@pytest.mark.parametrize("bad", ["--no-cahce", "--seed=x", "--se-tol", "--variance-reduction=importance"])
+def test_bad_options_exit_with_usage(monkeypatch, capsys, bad):
+    monkeypatch.setattr(sys, "argv", ["run_distribution_simulator.py", GAME_ID, bad])
+    with pytest.raises(SystemExit) as exc:
+        rds.resolve_game_id_from_args()
+    assert exc.value.code == 2
+    assert "Usage:" in capsys.readouterr().out
+
+
+def test_help_lists_sim_options(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["run_distribution_simulator.py", "--help"])
+    with pytest.raises(SystemExit) as exc:
+        rds.resolve_game_id_from_args()
+    assert exc.value.code == 0
+    out = capsys.readouterr().out
+    for flag in ("--legacy-engine", "--analytic", "--variance-reduction=", "--no-cache", "--seed=", "--se-tol="):
+        assert flag in out
@@ -0,0 +1,35 @@
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from cli.run_distribution_simulator import cumulative_runs, segment_scores, compute_partial_derivatives
+
+
+def _inning_runs():
+    # (sims, innings, [away, home])
+    return np.array(
+        [
+            [[1, 0], [0, 2], [0, 0], [3, 1], [0, 0], [0, 0], [1, 0], [0, 0], [0, 1]],
+            [[0, 0], [0, 0], [2, 0], [0, 0], [0, 1], [0, 0], [0, 0], [1, 0], [0, 0]],
+        ],
+        dtype=np.int8,
+    )
+
+
+def test_segment_scores_read_cumulative_matrix():
+    cum = cumulative_runs(_inning_runs())
+    home, away = segment_scores(cum, 1)
+    assert home.tolist() == [0, 0] and away.tolist() == [1, 0]
+    home, away = segment_scores(cum, 5)
+    assert home.tolist() == [3, 1] and away.tolist() == [4, 2]
+    home, away = segment_scores(cum, 12)
+    assert home.tolist() == [4, 1] and away.tolist() == [5, 3]
+
+
+def test_partial_derivatives_from_cumulative_matrix():
+    stats = compute_partial_derivatives(cumulative_runs(_inning_runs()), 3)
+    assert stats["moneyline"] == {"home": 0.5, "away": 0.5, "push": 0.0}
+    assert stats["avg_total"] == 2.5
+    assert stats["runline"]["away_plus_half"] == 0.5
@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+import numpy as np
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.sim_cache import ROOT_DIR, sim_fingerprint, is_cached_export, touch_export, code_version, sim_code_files
+from core.sim_export import write_sim_export, sidecar_path
+from core.game_simulator import build_sample_lineup, build_sample_pitcher
+
+
+def _assets():
+    return {
+        "lineups": {"home": build_sample_lineup(), "away": build_sample_lineup()},
+        "pitchers": {"home": build_sample_pitcher(), "away": build_sample_pitcher()},
+        "bullpens": {"home": [], "away": []},
+    }
+
+
+ENV = {"park_hr_mult": 1.05, "umpire": {"K": 1.0, "BB": 1.0}}
+
+
+def test_fingerprint_tracks_inputs():
+    base = sim_fingerprint(_assets(), ENV, {"run_scaling_factor": 1.0}, 10000, {"seed": None})
+    assert base == sim_fingerprint(_assets(), dict(ENV), {"run_scaling_factor": 1.0}, 10000, {"seed": None})
+    assert base != sim_fingerprint(_assets(), dict(ENV, park_hr_mult=1.1), {"run_scaling_factor": 1.0}, 10000, {"seed": None})
+    assert base != sim_fingerprint(_assets(), ENV, {"run_scaling_factor": 1.02}, 10000, {"seed": None})
+    assert base != sim_fingerprint(_assets(), ENV, {"run_scaling_factor": 1.0}, 5000, {"seed": None})
+
+    changed = _assets()
+    changed["pitchers"]["home"]["k_rate"] = 0.3
+    assert base != sim_fingerprint(changed, ENV, {"run_scaling_factor": 1.0}, 10000, {"seed": None})
+    assert len(code_version()) == 16
+
+
+def test_fingerprint_handles_seed_sequences():
+    seeds = np.random.SeedSequence(7).spawn(2)
+    again = np.random.SeedSequence(7).spawn(2)
+    first = sim_fingerprint(_assets(), ENV, {}, 10000, {"seed": seeds[0]})
+    assert first == sim_fingerprint(_assets(), ENV, {}, 10000, {"seed": again[0]})
+    assert first != sim_fingerprint(_assets(), ENV, {}, 10000, {"seed": seeds[1]})
+
+
+def test_cached_export_lookup_and_touch(tmp_path):
+    path = str(tmp_path / "game.json")
+    output = {
+        "markets": [],
+        "raw_distributions": {"totals": {"values": [7, 9, 11], "mean": 9.0}},
+        "sim_fingerprint": "abc",
+    }
+    assert not is_cached_export(path, "abc")
+    write_sim_export(output, path)
+    assert is_cached_export(path, "abc")
+    assert not is_cached_export(path, "def")
+
+    os.utime(path, (1_000_000, 1_000_000))
+    touch_export(path)
+    assert os.path.getmtime(path) > 1_000_000
+
+    os.remove(sidecar_path(path))
+    assert not is_cached_export(path, "abc")
+
+
+def test_code_version_covers_sim_modules():
+    files = set(sim_code_files())
+    for rel_path in (
+        "core/bip_resolution.py",
+        "assets/bullpen_utils.py",
+        "core/pa_tables.py",
+        "core/stats_tools.py",
+        "cli/__init__.py",
+        "core/__init__.py",
+    ):
+        assert rel_path in files
+
+
+@pytest.mark.parametrize("entry", ["core.batch_game_simulator", "cli.run_distribution_simulator"])
+def test_code_version_covers_imported_modules(entry):
+    # Import in a fresh interpreter so modules loaded by other tests don't count
+    script = (
+        "import os, sys\n"
+        f"import {entry}\n"
+        "root = os.getcwd() + os.sep\n"
+        "for mod in list(sys.modules.values()):\n"
+        "    path = getattr(mod, '__file__', None) or ''\n"
+        "    if path.startswith(root):\n"
+        "        print(os.path.relpath(path, root).replace(os.sep, '/'))\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", script], cwd=ROOT_DIR, capture_output=True, text=True)
+    if proc.returncode:
+        pytest.skip(f"{entry} does not import here: {proc.stderr.strip().splitlines()[-1]}")
+    loaded = set(proc.stdout.split())
+    assert loaded and loaded <= set(sim_code_files())
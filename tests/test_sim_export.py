@@ -0,0 +1,55 @@
+import os
+import sys
+import json
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.sim_export import write_sim_export, load_sim_distributions, sidecar_path
+from core.snapshot_core import load_simulations
+
+
+def _output():
+    raw = [9, 4, 12, 7, 9]
+    return {
+        "markets": [{"market": "totals", "side": "Over 8.5", "sim_prob": 0.6}],
+        "summary_metrics": {"full_game": {"mean_total": 8.2}},
+        "raw_distributions": {"totals": {"values": raw, "mean": 8.2, "std": 2.6}},
+        "scaled_distributions": {
+            "totals": {"values": [x * 1.1 + 0.3 for x in raw], "mean": 9.32, "std": 2.9},
+            "run_diffs": {"values": list(np.linspace(-3, 3, 70000)), "std": 1.7},
+        },
+    }
+
+
+def test_manifest_drops_values_and_roundtrips(tmp_path):
+    path = str(tmp_path / "2025-04-17-NYY@BOS-T1905.json")
+    output = _output()
+    write_sim_export(output, path)
+
+    with open(path) as fh:
+        manifest = json.load(fh)
+    assert manifest["markets"] == output["markets"]
+    assert manifest["raw_distributions"]["totals"] == {"mean": 8.2, "std": 2.6}
+    assert manifest["distributions_file"] == os.path.basename(sidecar_path(path))
+
+    loaded = load_sim_distributions(path)
+    for group in ("raw_distributions", "scaled_distributions"):
+        for name, dist in output[group].items():
+            assert np.array_equal(loaded[group][name]["values"], np.asarray(dist["values"]))
+            assert loaded[group][name]["std"] == dist["std"]
+    assert "values" in output["raw_distributions"]["totals"]
+
+
+def test_load_simulations_reads_manifests_only(tmp_path):
+    write_sim_export(_output(), str(tmp_path / "2025-04-17-NYY@BOS-T1905.json"))
+    sims = load_simulations(str(tmp_path))
+    assert list(sims) == ["2025-04-17-NYY@BOS-T1905"]
+    assert "values" not in sims["2025-04-17-NYY@BOS-T1905"]["raw_distributions"]["totals"]
+
+
+def test_legacy_inline_values(tmp_path):
+    path = tmp_path / "legacy.json"
+    path.write_text(json.dumps(_output()))
+    loaded = load_sim_distributions(str(path))
+    assert loaded["raw_distributions"]["totals"]["values"] == [9, 4, 12, 7, 9]
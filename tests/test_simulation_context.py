@@ -0,0 +1,79 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import assets.bullpen_utils as bu
+import core.pa_simulator as pas
+from core.simulation_context import DEFAULT_CONTEXT, PA_OUTCOMES, SimulationContext
+from core.game_simulator import (
+    build_sample_lineup,
+    build_sample_pitcher,
+    simulate_games_summary,
+)
+
+
+def _bullpen(prefix):
+    return [
+        {"name": f"{prefix} RP{i}", "role": "RP", "k_rate": 0.24, "bb_rate": 0.08, "hr_rate": 0.03}
+        for i in range(4)
+    ]
+
+
+def _run(seed, context=None):
+    return simulate_games_summary(
+        25,
+        lineups={"home": build_sample_lineup(), "away": build_sample_lineup()},
+        pitchers={"home": build_sample_pitcher(), "away": build_sample_pitcher()},
+        bullpens={"home": _bullpen("H"), "away": _bullpen("A")},
+        env={"umpire": {}, "weather_hr": 1.0},
+        rng=seed,
+        sim_context=context,
+    )
+
+
+def test_contexts_do_not_share_counters():
+    before = {team: dict(recap) for team, recap in pas.PA_RECAP_LOG.items()}
+    first, second = SimulationContext(), SimulationContext()
+    result = _run(3, first)
+    _run(4, second)
+
+    assert first.pa_counts().sum() > 0
+    assert not np.array_equal(first.pa_counts(), second.pa_counts())
+    assert np.array_equal(result["pa_counts"], first.pa_counts())
+    assert first.counters["games"] == 25
+    # Relievers are charged to the side that used them
+    assert all(name.startswith("H") for name in first.reliever_counts("home"))
+    assert all(name.startswith("A") for name in first.reliever_counts("away"))
+    assert sum(first.reliever_counts("home").values()) == result["home_reliever_usage"].sum()
+
+    # The legacy module globals are untouched by explicit contexts
+    assert {team: dict(recap) for team, recap in pas.PA_RECAP_LOG.items()} == before
+
+
+def test_same_seed_reproduces_counts():
+    a, b = SimulationContext(), SimulationContext()
+    _run(11, a)
+    _run(11, b)
+    assert np.array_equal(a.pa_counts(), b.pa_counts())
+    assert a.reliever_usage == b.reliever_usage
+
+
+def test_default_context_backs_module_globals():
+    assert pas.PA_RECAP_LOG is DEFAULT_CONTEXT.pa_recap
+    assert bu.RELIEVER_USAGE_COUNTS is DEFAULT_CONTEXT.reliever_usage
+
+    ctx = SimulationContext()
+    pas.log_pa_outcome("HOME", "HR", ctx)
+    pas.log_pa_outcome("AWAY", "K", ctx)
+    pas.log_pa_outcome("AWAY", "K", ctx)
+    counts = ctx.pa_counts()
+    assert counts.shape == (2, len(PA_OUTCOMES))
+    assert counts[0, PA_OUTCOMES.index("K")] == 2
+    assert counts[1, PA_OUTCOMES.index("HR")] == 1
+
+    ctx.reliever_counts("home")["X"] = 2
+    bu.reset_reliever_usage(ctx)
+    assert ctx.reliever_usage["home"] == {}
@@ -0,0 +1,72 @@
+import os
+import sys
+import json
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import assets.bullpen_utils as bullpen_utils
+import core.game_asset_builder as gab
+from core.utils import normalize_team_abbr_to_name
+
+GAMES = ["2025-06-09-MIL@CIN-T1305", "2025-06-09-NYY@BOS-T1910"]
+TEAMS = ["MIL", "CIN", "NYY", "BOS"]
+
+
+def _pitcher(name, stuff):
+    return {"name": name, "k_rate": 0.25, "bb_rate": 0.08, "hr_fb_rate": 0.1, "stuff_plus": stuff, "TBF": 200, "HR": 5}
+
+
+def test_slate_fetches_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = {"schedule": 0, "lineups": 0, "bullpens": []}
+
+    def fake_schedule(days_ahead=1):
+        calls["schedule"] += 1
+        return {gid: {"home": {"name": f"{gid[-9:-6]} Starter"}, "away": {"name": f"{gid[-13:-10]} Starter"}} for gid in GAMES}
+
+    def fake_lineups(for_date=None):
+        calls["lineups"] += 1
+        return {team: [{"name": f"{team} Batter{i}"} for i in range(9)] for team in TEAMS}
+
+    real_build = bullpen_utils.build_bullpen_for_team
+
+    def counting_build(team_abbr, *args, **kwargs):
+        calls["bullpens"].append(team_abbr)
+        return real_build(team_abbr, *args, **kwargs)
+
+    monkeypatch.setattr(gab, "fetch_probable_pitchers", fake_schedule)
+    monkeypatch.setattr(bullpen_utils, "fetch_probable_pitchers", fake_schedule)
+    monkeypatch.setattr(gab, "fetch_lineups", fake_lineups)
+    monkeypatch.setattr(gab, "build_bullpen_for_team", counting_build)
+    monkeypatch.setattr(gab, "suggest_missing_aliases_from_lineup", lambda *a: None)
+
+    pitcher_stats = {}
+    depth_chart = {}
+    for team in TEAMS:
+        relievers = [_pitcher(f"{team} Reliever{i}", 95 + i) for i in range(3)]
+        # A starter listed in the depth chart stays out of the bullpen
+        relievers.append(_pitcher(f"{team} Starter", 130))
+        pitcher_stats.update({r["name"].lower(): r for r in relievers})
+        depth_chart[normalize_team_abbr_to_name(team)] = [{"name": r["name"], "role": "RP"} for r in relievers]
+    chart_path = tmp_path / "depth_chart.json"
+    chart_path.write_text(json.dumps(depth_chart))
+    monkeypatch.setattr(gab, "RELIEVER_DEPTH_CHART_PATH", str(chart_path))
+    batter_stats = {f"{team} batter{i}".lower(): {"k_rate": 0.2, "bb_rate": 0.1, "iso": 0.2, "avg": 0.27, "woba": 0.34} for team in TEAMS for i in range(9)}
+
+    slate = gab.build_slate_context("2025-06-09", batter_stats, pitcher_stats)
+    slate.warm_bullpens()
+    assert slate.teams() == sorted(TEAMS)
+    assert slate.park_factors_for("Great American Ball Park") == gab.DEFAULT_PARK_FACTORS
+
+    built = [gab.build_game_assets(gid, batter_stats, pitcher_stats, slate=slate) for gid in GAMES]
+    assert calls["schedule"] == 1 and calls["lineups"] == 1
+    assert sorted(calls["bullpens"]) == sorted(TEAMS)
+
+    home = built[0]["bullpens"]["home"]
+    assert [rp["name"] for rp in home] == ["CIN Reliever2", "CIN Reliever1", "CIN Reliever0"]
+    assert all(rp["role"] == "RP" and rp["hr_pa"]["hr_pa_projected"] > 0 for rp in home)
+    assert built[0]["lineups"]["away"][0]["woba"] == 0.34
+
+    # Each game gets its own copy of the shared bullpen
+    home[0]["name"] = "changed"
+    assert slate.bullpen("CIN")[0]["name"] == "CIN Reliever2"
@@ -0,0 +1,111 @@
+import os
+import sys
+import json
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from assets.stats_loader import enrich_pitchers, load_batter_stats, load_pitcher_stats, pitcher_table
+from core.data_loader import load_all_stats
+from core.project_hr_pa import project_hr_pa
+
+
+def write_sources(root, hr=(20, 12, 5)):
+    data = root / "data"
+    data.mkdir(exist_ok=True)
+    pd.DataFrame({
+        "Name": ["Zack Wheeler", "José Berríos", "Logan Webb", "Zack Wheeler"],
+        "K%": [0.28, 0.22, "n/a", 0.29],
+        "BB%": [0.06, 0.08, 0.05, 0.07],
+        "HR/FB": [0.1, 0.6, 0.09, 0.11],
+        "HR": [*hr, 21],
+        "TBF": [700, 0, 800, 720],
+        "IP": [190, 170, 200, 195],
+    }).to_csv(data / "Pitchers.csv", index=False)
+    pd.DataFrame({
+        "Name ": ["Zack Wheeler", "Jose Berrios"],
+        "Stuff+": [110, 95],
+        "Location+": [104, 99],
+    }).to_csv(data / "Stuff+_Location+.csv", index=False)
+    pd.DataFrame({
+        "first_name": ["Zack", "Jose"],
+        "last_name": ["Wheeler", "B"],
+        "barrel_batted_rate": [7.5, 0.001],
+        "exit_velocity_avg": [88.0, 100.0],
+        "launch_angle_avg": [11.0, None],
+        "xiso": [0.13, 0.16],
+    }).to_csv(data / "statcast.csv", index=False)
+    pd.DataFrame({
+        "Name": ["Aaron Judge", "B. Rocchio", "Juan Soto", "Aaron Judge"],
+        "K%": [0.3, 0.18, 0.2, 0.28],
+        "BB%": [0.15, 0.07, "x", 0.16],
+        "ISO": [0.3, 0.12, 0.25, 0.31],
+        "AVG": [0.28, 0.25, 0.27, 0.29],
+        "wOBA": [0.41, 0.3, 0.39, 0.42],
+    }).to_csv(data / "Batters.csv", index=False)
+    (root / "pitcher_alias_map.json").write_text(json.dumps({"Jose B": "Jose Berrios"}))
+    (root / "batter_alias_map.json").write_text(json.dumps({"Brayan Rocchio": "Brayan Rocchio Jr."}))
+    return data
+
+
+def test_vectorized_loaders(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    data = write_sources(tmp_path)
+    pitchers = load_pitcher_stats(data / "Pitchers.csv", data / "Stuff+_Location+.csv", data / "statcast.csv")
+
+    # Rows without a numeric K% are dropped; a repeated name keeps its first position and last values
+    assert list(pitchers) == ["zack wheeler", "jose berrios"]
+    wheeler, berrios = pitchers["zack wheeler"], pitchers["jose berrios"]
+    assert wheeler["k_rate"] == 0.29 and wheeler["HR"] == 21.0
+    assert wheeler["barrel_batted_rate"] == 0.075 and wheeler["stuff_plus"] == 110.0
+    assert wheeler["hardhit_percent"] == 0.35 and wheeler["iso_allowed"] == 0.13
+
+    # Alias-matched Statcast row: barrel floor, derived hard-hit clamped, missing LA falls back
+    assert berrios["barrel_batted_rate"] == 0.005
+    assert berrios["hardhit_percent"] == 0.5
+    assert berrios["launch_angle_avg"] == 13.0 and berrios["TBF"] == 1.0
+    assert berrios["xwobacon"] == 0.32 and berrios["FIP"] == 4.0
+
+    expected = {key: value for key, value in berrios.items() if key not in ("hr_pa", "enriched")}
+    assert berrios["hr_pa"] == project_hr_pa(dict(expected)) and berrios["enriched"]
+
+    batters = load_batter_stats(data / "Batters.csv")
+    assert list(batters) == ["aaron judge", "brayan rocchio"]
+    assert batters["aaron judge"] == {"k_rate": 0.28, "bb_rate": 0.16, "iso": 0.31, "avg": 0.29, "woba": 0.42}
+
+
+def test_enrich_reuses_unchanged_rows(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    data = write_sources(tmp_path)
+    files = (data / "Pitchers.csv", data / "Stuff+_Location+.csv", data / "statcast.csv")
+    stats, rows, n_enriched = enrich_pitchers(pitcher_table(*files))
+    assert n_enriched == 2
+
+    write_sources(tmp_path, hr=(20, 30, 5))
+    updated, _, n_enriched = enrich_pitchers(pitcher_table(*files), previous={"stats": stats, "rows": rows})
+    assert n_enriched == 1
+    assert updated["zack wheeler"] is stats["zack wheeler"]
+    assert updated == load_pitcher_stats(*files)
+
+
+def test_load_all_stats_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    data = write_sources(tmp_path)
+    cache_path = str(tmp_path / "cache" / "stats.pkl")
+    batters, pitchers = load_all_stats(cache_path=cache_path)
+    assert len(batters) == 2 and len(pitchers) == 2
+    assert os.path.exists(cache_path)
+
+    # Unchanged sources (even if touched) deserialize without re-reading the CSVs
+    os.utime(data / "Pitchers.csv")
+    monkeypatch.setattr("core.data_loader.pitcher_table", lambda *a, **k: pytest.fail("pitchers rebuilt"))
+    monkeypatch.setattr("core.data_loader.load_batter_stats", lambda *a, **k: pytest.fail("batters rebuilt"))
+    assert load_all_stats(cache_path=cache_path) == (batters, pitchers)
+    monkeypatch.undo()
+    monkeypatch.chdir(tmp_path)
+
+    # An alias map edit invalidates the batter table
+    (tmp_path / "batter_alias_map.json").write_text(json.dumps({"Aaron Judge": "Aaron J"}))
+    batters, _ = load_all_stats(cache_path=cache_path)
+    assert list(batters) == ["aaron j", "brayan rocchio"]
@@ -2,15 +2,17 @@ import os
 import sys
 import pytest
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT)
 
 from core.theme_exposure_tracker import load_tracker, TRACKER_PATH
 from scripts.reconcile_theme_exposure import compute_csv_totals
 
 
 def test_theme_exposure_matches_csv():
-    tracker = load_tracker(TRACKER_PATH)
-    csv_totals = compute_csv_totals(os.path.join("logs", "market_evals.csv"))
+    # Checks the repo's own state, so read it from the root rather than the scratch cwd
+    tracker = load_tracker(os.path.join(ROOT, TRACKER_PATH))
+    csv_totals = compute_csv_totals(os.path.join(ROOT, "logs", "market_evals.csv"))
 
     for key, exposure in tracker.items():
         if exposure <= 0:
@@ -0,0 +1,99 @@
+import os
+import sys
+import numpy as np
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.batch_game_simulator import AntitheticUniforms, build_matchup_tables
+from core.game_simulator import build_sample_lineup, build_sample_pitcher
+from core.markov_solver import half_inning_distribution, solve_game
+from core.stats_tools import DiscretePMF
+import core.variance_reduction as vr
+from core.variance_reduction import RunExpectancy, parse_methods, simulate_games_vr
+
+
+ENV = {"umpire": {}}
+
+
+def _assets():
+    lineups = {"home": build_sample_lineup(), "away": build_sample_lineup()}
+    pitchers = {"home": build_sample_pitcher(), "away": build_sample_pitcher()}
+    bullpens = {
+        side: [dict(build_sample_pitcher(), name=f"{side} RP {i}", IP=10 + i) for i in range(3)]
+        for side in ("home", "away")
+    }
+    return lineups, pitchers, bullpens
+
+
+def test_parse_methods():
+    assert parse_methods(None) == ()
+    assert parse_methods("control,antithetic") == ("antithetic", "control")
+    assert parse_methods("all") == ("antithetic", "stratified", "control")
+    with pytest.raises(ValueError):
+        parse_methods("antithetic,importance")
+
+
+def test_antithetic_uniforms_mirror_pairs():
+    draws = AntitheticUniforms(10, np.random.default_rng(3))
+    u = np.concatenate([draws.random(4, np.arange(10)) for _ in range(50)])
+    assert np.allclose(u[:, 5:], 1.0 - u[:, :5])
+    assert 0.45 < u.mean() < 0.55
+    assert u.min() >= 0.0 and u.max() < 1.0
+    # Drawing a subset of sims returns the same per-sim streams
+    again = AntitheticUniforms(10, np.random.default_rng(3))
+    assert np.array_equal(again.random(4, np.array([2, 7])), u[:4, [2, 7]])
+
+
+def test_run_expectancy_matches_half_inning_distribution():
+    lineups, pitchers, bullpens = _assets()
+    tables = build_matchup_tables(lineups["home"], pitchers["away"], bullpens["away"], ENV)
+    expectancy = RunExpectancy(tables)
+    slots = np.array([0, 4, 8])
+    pitcher = np.array([0, 1, 0])
+    tto = np.array([1, 2, 3])
+    pitch_count = np.array([0, 0, 95])
+    values = expectancy(slots, pitcher, tto, pitch_count)
+    for i in range(slots.size):
+        runs = half_inning_distribution(tables, slots[i], pitcher[i], pitch_count[i], tto[i]).sum(axis=0)
+        assert values[i] == pytest.approx(runs @ np.arange(runs.size) / runs.sum(), abs=1e-6)
+
+
+def test_vr_estimates_are_unbiased_and_tighter():
+    lineups, pitchers, bullpens = _assets()
+    solution = solve_game(lineups, pitchers, bullpens, ENV)
+    joint = solution["final"] / solution["final"].sum()
+    away, home = np.indices(joint.shape)
+    exact = {"h2h_home": joint[home > away].sum(), "over_8.5": joint[away + home > 8.5].sum()}
+
+    batch = simulate_games_vr(4001, lineups, pitchers, bullpens, ENV, seed=11, methods="all")
+    report = batch["variance_reduction"]
+    assert report["n_simulations"] == 4002 == len(batch["weights"])
+    assert report["clipped_weights"] == 0 and report["methods"] == ["antithetic", "stratified", "control"]
+    assert batch["weights"].min() >= 0 and batch["weights"].mean() == pytest.approx(1.0)
+    assert report["median_variance_reduction"] > 1.5
+    for key, p in exact.items():
+        market = report["markets"][key]
+        assert abs(market["probability"] - p) < 4 * market["standard_error"]
+        assert market["standard_error"] < market["plain_standard_error"]
+
+    # Weighted PMFs reproduce the report's estimate
+    totals = DiscretePMF.from_values(batch["home_score"] + batch["away_score"], weights=batch["weights"])
+    assert totals.over(8.5) == pytest.approx(report["markets"]["over_8.5"]["probability"], abs=1e-5)
+
+
+def test_negative_weights_fall_back_to_plain_estimates(monkeypatch):
+    lineups, pitchers, bullpens = _assets()
+
+    def weights_with_negatives(controls, means):
+        weights = np.ones(controls.shape[0])
+        weights[:2] = [-0.5, 2.5]
+        return weights
+
+    monkeypatch.setattr(vr, "regression_weights", weights_with_negatives)
+    batch = simulate_games_vr(400, lineups, pitchers, bullpens, ENV, seed=5, methods="antithetic,control")
+    report = batch["variance_reduction"]
+    assert batch["weights"] is None
+    assert report["clipped_weights"] == 1 and report["methods"] == ["antithetic"]
+    for market in report["markets"].values():
+        assert market["probability"] == market["plain_probability"]
@@ -0,0 +1,82 @@
+import os
+import sys
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.weather_cache import WeatherCache, parse_ttl_schedule, slate_first_pitches, weather_ttl
+
+SUNNY = {"wind_direction": "out", "wind_speed": 12, "temperature": 84, "humidity": 50}
+
+
+def test_ttl_schedule():
+    assert weather_ttl(1) == 30 * 60
+    assert weather_ttl(-2) == 30 * 60  # already underway
+    assert weather_ttl(30) == 6 * 3600
+    assert weather_ttl(200) == 12 * 3600
+    schedule = parse_ttl_schedule("6=60,1=10")
+    assert [weather_ttl(h, schedule) for h in (0.5, 3, 48)] == [600, 3600, 3600]
+
+    starts = slate_first_pitches(["2025-06-09-MIL@CIN-T1905", "2025-06-09-MIL@CIN-T1305", "2025-06-09-NYY@BOS-T1910"])
+    assert starts["Great American Ball Park"].hour == 13 and len(starts) == 2
+
+
+def test_get_uses_ttl_and_stale_fallback(tmp_path):
+    calls = []
+
+    def fetch(park_name, session=None):
+        calls.append(park_name)
+        if len(calls) > 1:
+            raise ConnectionError("NOAA down")
+        return dict(SUNNY)
+
+    cache = WeatherCache(cache_dir=str(tmp_path), fetch=fetch)
+    now = time.time()
+    soon = datetime.fromtimestamp(now, timezone.utc) + timedelta(hours=2)
+    later = datetime.fromtimestamp(now, timezone.utc) + timedelta(hours=30)
+
+    assert cache.get("Fenway Park", soon, now=now) == SUNNY
+    assert cache.get("Fenway Park", soon, now=now + 600) == SUNNY
+    assert calls == ["Fenway Park"]
+    # 45 minutes old is stale two hours out; the failed refetch serves the cached forecast
+    assert cache.get("Fenway Park", soon, now=now + 2700) == SUNNY
+    assert len(calls) == 2
+    # ...but fresh for a game tomorrow
+    assert cache.get("Fenway Park", later, now=now + 2700) == SUNNY and len(calls) == 2
+    assert cache.get("Rogers Centre", soon)["temperature"] == 72
+
+    # Bare profiles from the old cache format are aged by file mtime
+    legacy = tmp_path / "Wrigley_Field.json"
+    legacy.write_text(json.dumps(SUNNY))
+    os.utime(legacy, (now - 7200, now - 7200))
+    assert not cache.is_fresh(cache.read("Wrigley Field"), soon, now=now)
+    assert cache.is_fresh(cache.read("Wrigley Field"), later, now=now)
+
+
+def test_prefetch_is_concurrent(tmp_path):
+    sessions, active, peak = set(), [0], [0]
+    lock = threading.Lock()
+
+    def fetch(park_name, session=None):
+        sessions.add(id(session))
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.1)
+        with lock:
+            active[0] -= 1
+        return dict(SUNNY, park=park_name)
+
+    cache = WeatherCache(cache_dir=str(tmp_path), fetch=fetch, max_workers=4)
+    cache.write("Fenway Park", dict(SUNNY, park="cached"))
+    parks = {name: None for name in ("Fenway Park", "Wrigley Field", "Citi Field", "Coors Field", "Truist Park", "Chase Field")}
+    weather = cache.prefetch(parks)
+
+    assert weather["Fenway Park"]["park"] == "cached"
+    assert weather["Chase Field"]["temperature"] == 72  # dome, never fetched
+    assert weather["Coors Field"]["park"] == "Coors Field"
+    assert peak[0] > 1 and len(sessions) == 1
+    assert cache.read("Truist Park")["weather"]["park"] == "Truist Park"
@@ -0,0 +1,137 @@
+import sys
+import os
+import csv
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.param_sweep import run_sweep, DEFAULT_SIMS
+
+PLUS_RANGE = [70, 85, 100, 115, 130]
+
+# Presets replace the old one-off test_*_sensitivity.py scripts
+PRESETS = {
+    "stuff_plus": {
+        "grid": {"pitcher.stuff_plus": PLUS_RANGE},
+        "reference": 2,
+        "metrics": ["K_rate", "BB_rate", "HR_rate", "OUT_rate", "runs_per_game"],
+    },
+    "command_plus": {
+        "grid": {"pitcher.command_plus": PLUS_RANGE},
+        "reference": 2,
+        "metrics": ["K_rate", "BB_rate", "HR_rate", "OUT_rate", "runs_per_game"],
+    },
+    "location_plus": {
+        "grid": {"pitcher.location_plus": PLUS_RANGE},
+        "reference": 2,
+        "metrics": ["K_rate", "BB_rate", "HR_rate", "2B_rate", "OUT_rate", "runs_per_game"],
+    },
+    "hr_fb_rate": {
+        "grid": {"pitcher.hr_fb_rate": [0.05, 0.09, 0.115, 0.14, 0.18]},
+        "reference": 2,
+        "metrics": ["HR_rate", "runs_per_game"],
+    },
+    "iso": {
+        "grid": {"batter.iso": [0.08, 0.12, 0.16, 0.20, 0.25, 0.30]},
+        "reference": 2,
+        "metrics": ["HR_rate", "2B_rate", "3B_rate", "runs_per_game"],
+    },
+}
+
+
+def print_help():
+    print(f"""
+Usage: python {os.path.basename(__file__)} [--preset=NAME | --grid=TARGET.FIELD=V1,V2,...] [options]
+
+Options:
+  --preset=NAME        One of: {", ".join(PRESETS)}
+  --grid=KEY=VALUES    Sweep KEY (pitcher.*, batter.* or env.*) over comma-separated VALUES; repeatable
+  --sims=INT           Simulated games per grid point (default: {DEFAULT_SIMS})
+  --seed=INT           Seed shared by every grid point (default: random)
+  --workers=INT        Processes to spread grid points over (default: one per point, up to the CPU count)
+  --reference=INT      Index of the grid point deltas are measured against (default: 0, or the preset's)
+  --metrics=A,B        Metrics to print (default: the preset's, or all)
+  --csv=PATH           Write the full tidy table to PATH
+  --help               Show this help message and exit
+
+Examples:
+  python {os.path.basename(__file__)} --preset=stuff_plus
+  python {os.path.basename(__file__)} --grid=pitcher.k_rate=0.20,0.225,0.25 --grid=env.weather_hr=0.9,1.1 --csv=sweep.csv
+""")
+
+
+def _parse_value(text):
+    try:
+        return float(text) if any(c in text for c in ".eE") else int(text)
+    except ValueError:
+        return text
+
+
+def parse_args(args):
+    if "--help" in args:
+        print_help()
+        sys.exit(0)
+
+    options = {"grid": {}, "sims": DEFAULT_SIMS, "seed": None, "workers": None, "reference": None, "metrics": None, "csv": None}
+    for arg in args:
+        if arg.startswith("--preset="):
+            name = arg.split("=", 1)[1]
+            if name not in PRESETS:
+                sys.exit(f"Unknown preset {name!r}; choose from {', '.join(PRESETS)}")
+            preset = PRESETS[name]
+            options["grid"].update(preset["grid"])
+            options["reference"] = options["reference"] if options["reference"] is not None else preset["reference"]
+            options["metrics"] = options["metrics"] or preset["metrics"]
+        elif arg.startswith("--grid="):
+            key, _, values = arg.split("=", 1)[1].partition("=")
+            options["grid"][key] = [_parse_value(v) for v in values.split(",") if v]
+        elif arg.startswith("--sims="):
+            options["sims"] = int(arg.split("=", 1)[1])
+        elif arg.startswith("--seed="):
+            options["seed"] = int(arg.split("=", 1)[1])
+        elif arg.startswith("--workers="):
+            options["workers"] = int(arg.split("=", 1)[1])
+        elif arg.startswith("--reference="):
+            options["reference"] = int(arg.split("=", 1)[1])
+        elif arg.startswith("--metrics="):
+            options["metrics"] = arg.split("=", 1)[1].split(",")
+        elif arg.startswith("--csv="):
+            options["csv"] = arg.split("=", 1)[1]
+    if not options["grid"]:
+        print_help()
+        sys.exit(1)
+    return options
+
+
+def print_table(rows, keys, metrics=None):
+    for metric in metrics or dict.fromkeys(row["metric"] for row in rows):
+        print(f"\n📊 {metric}")
+        for row in rows:
+            if row["metric"] != metric:
+                continue
+            label = ", ".join(f"{key}={row[key]}" for key in keys)
+            half = row["ci_high"] - row["value"]
+            delta_half = row["delta_ci_high"] - row["delta"]
+            print(
+                f"  {label:<32} {row['value']:8.4f} ± {half:.4f}   "
+                f"Δ {row['delta']:+8.4f} ± {delta_half:.4f}  (independent ± {1.96 * row['independent_delta_se']:.4f})"
+            )
+
+
+if __name__ == "__main__":
+    options = parse_args(sys.argv[1:])
+    rows = run_sweep(
+        options["grid"],
+        n_sims=options["sims"],
+        seed=options["seed"],
+        workers=options["workers"],
+        reference=options["reference"] or 0,
+    )
+    print(f"\n🔬 Parameter sweep ({options['sims']} sims per point, common random numbers, 95% bands)")
+    print_table(rows, list(options["grid"]), options["metrics"])
+
+    if options["csv"]:
+        with open(options["csv"], "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"\n💾 Wrote {len(rows)} rows to {options['csv']}")
@@ -0,0 +1,67 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.perf import PERF_DIR, load_reports, summarize
+
+
+def print_help():
+    print(f"""
+Usage: python {os.path.basename(__file__)} [options]
+
+Summarizes the stage timings written to {PERF_DIR}/ by runs with MLB_PERF set (or --profile).
+
+Options:
+  --cycle=ID           Only reports from loop cycle ID (default: the latest cycle)
+  --all                Every report in the folder
+  --games=INT          Slowest games to list (default: 10)
+  --folder=PATH        Report folder (default: {PERF_DIR})
+  --help               Show this help message and exit
+""")
+
+
+def parse_args(args):
+    if "--help" in args:
+        print_help()
+        sys.exit(0)
+
+    options = {"cycle": None, "all": False, "games": 10, "folder": PERF_DIR}
+    for arg in args:
+        if arg.startswith("--cycle="):
+            options["cycle"] = arg.split("=", 1)[1]
+        elif arg == "--all":
+            options["all"] = True
+        elif arg.startswith("--games="):
+            options["games"] = int(arg.split("=", 1)[1])
+        elif arg.startswith("--folder="):
+            options["folder"] = arg.split("=", 1)[1]
+    return options
+
+
+if __name__ == "__main__":
+    options = parse_args(sys.argv[1:])
+    reports = load_reports(options["folder"])
+    if not options["all"]:
+        cycle = options["cycle"] or next((r.get("cycle") for r in reversed(reports) if r.get("cycle")), None)
+        reports = [r for r in reports if r.get("cycle") == cycle]
+    if not reports:
+        sys.exit(f"No performance reports found in {options['folder']}")
+
+    spans = [span for report in reports for span in report.get("spans", [])]
+    stages, games = summarize(spans)
+    label = "all reports" if options["all"] else f"cycle {reports[0].get('cycle')}"
+    print(f"\n⏱️ {len(reports)} report(s), {len(spans)} spans — {label}")
+    print(f"  {'process':<28} {'elapsed':>9} {'max RSS':>9}")
+    for report in reports:
+        print(f"  {report['process'] + ' #' + str(report['pid']):<28} {report['elapsed_s']:>8.1f}s {report['max_rss_mb']:>7.0f}MB")
+
+    print(f"\n  {'stage':<32} {'calls':>6} {'wall':>9} {'cpu':>9} {'max':>8}")
+    for stage, row in sorted(stages.items(), key=lambda item: item[1]["wall_s"], reverse=True):
+        print(f"  {stage:<32} {row['count']:>6} {row['wall_s']:>8.2f}s {row['cpu_s']:>8.2f}s {row['max_wall_s']:>7.2f}s")
+
+    if games:
+        print(f"\n🐢 Slowest games")
+        for game_id, row in list(games.items())[: options["games"]]:
+            breakdown = ", ".join(f"{stage} {wall:.2f}s" for stage, wall in row["stages"].items())
+            print(f"  {game_id:<28} {row['wall_s']:>7.2f}s  ({breakdown})")
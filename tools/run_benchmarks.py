@@ -0,0 +1,93 @@
+import sys
+import os
+import json
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.benchmarks import (
+    BASELINE_PATH,
+    BENCHMARKS,
+    DEFAULT_REPEAT,
+    DEFAULT_THRESHOLD,
+    compare_to_baseline,
+    load_baseline,
+    run_benchmarks,
+    save_baseline,
+)
+
+
+def print_help():
+    print(f"""
+Usage: python {os.path.basename(__file__)} [options]
+
+Runs the fixed-seed benchmark suite and compares it with the stored baseline.
+Exits with status 1 when any metric is slower than its baseline by more than the threshold.
+
+Options:
+  --only=A,B           Benchmarks to run (default: all of {", ".join(BENCHMARKS)})
+  --repeat=INT         Timings per benchmark; the best is kept (default: {DEFAULT_REPEAT})
+  --threshold=FLOAT    Allowed slowdown before a metric counts as regressed (default: {DEFAULT_THRESHOLD})
+  --baseline=PATH      Baseline JSON (default: {os.path.relpath(BASELINE_PATH)})
+  --update-baseline    Store this run as the new baseline instead of failing on regressions
+  --json=PATH          Also write this run's results to PATH
+  --help               Show this help message and exit
+""")
+
+
+def parse_args(args):
+    if "--help" in args:
+        print_help()
+        sys.exit(0)
+
+    options = {"only": None, "repeat": DEFAULT_REPEAT, "threshold": DEFAULT_THRESHOLD, "baseline": BASELINE_PATH,
+               "update": False, "json": None}
+    for arg in args:
+        if arg.startswith("--only="):
+            options["only"] = [name for name in arg.split("=", 1)[1].split(",") if name]
+        elif arg.startswith("--repeat="):
+            options["repeat"] = int(arg.split("=", 1)[1])
+        elif arg.startswith("--threshold="):
+            options["threshold"] = float(arg.split("=", 1)[1])
+        elif arg.startswith("--baseline="):
+            options["baseline"] = arg.split("=", 1)[1]
+        elif arg == "--update-baseline":
+            options["update"] = True
+        elif arg.startswith("--json="):
+            options["json"] = arg.split("=", 1)[1]
+    return options
+
+
+if __name__ == "__main__":
+    options = parse_args(sys.argv[1:])
+    try:
+        results = run_benchmarks(options["only"], repeat=options["repeat"])
+    except ValueError as e:
+        sys.exit(f"❌ {e}")
+
+    baseline = load_baseline(options["baseline"])
+    rows = compare_to_baseline(results, baseline, options["threshold"])
+
+    print(f"\n⏱️ Benchmarks (best of {options['repeat']})")
+    for row in rows:
+        base = f"{row['baseline']:>12,.2f}" if row["baseline"] is not None else f"{'—':>12}"
+        change = f"{row['change']:+7.1%}" if row["change"] is not None else f"{'new':>7}"
+        flag = "  🔴 REGRESSION" if row["regressed"] else ""
+        print(f"  {row['metric']:<14} {row['current']:>12,.2f} {row['unit']:<15} baseline {base}  {change}{flag}")
+
+    if options["json"]:
+        with open(options["json"], "w") as f:
+            json.dump(results, f, indent=2)
+
+    if options["update"]:
+        save_baseline(results, options["baseline"])
+        print(f"\n💾 Baseline updated → {options['baseline']}")
+        sys.exit(0)
+
+    regressed = [row["metric"] for row in rows if row["regressed"]]
+    if baseline is None:
+        print(f"\n⚠️ No baseline at {options['baseline']} — run with --update-baseline to create one")
+    elif regressed:
+        print(f"\n❌ {len(regressed)} metric(s) regressed by more than {options['threshold']:.0%}: {', '.join(regressed)}")
+        sys.exit(1)
+    else:
+        print(f"\n✅ No metric regressed by more than {options['threshold']:.0%}")